@@ -4,13 +4,18 @@ Combat package - Sistema di combattimento
 
 from combat.enemy import Enemy
 from combat.battle import Battle, BattleResult, BattleAction
+from combat.battle_log import BattleLog
 from combat.turn_manager import TurnManager, Combatant
+from combat.simulator import BattleSimulator, SimulationStats
 
 __all__ = [
     'Enemy',
     'Battle',
     'BattleResult',
     'BattleAction',
+    'BattleLog',
     'TurnManager',
-    'Combatant'
+    'Combatant',
+    'BattleSimulator',
+    'SimulationStats'
 ]
\ No newline at end of file
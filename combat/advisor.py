@@ -0,0 +1,698 @@
+"""
+Advisor - Azione consigliata per iterazione dei valori
+
+Per un party (classi), un tipo di nemico e un livello si costruisce un
+processo decisionale di Markov sugli stati discretizzati della battaglia:
+
+- personaggio di turno (posizione nel party)
+- per personaggio: fascia di HP (0 = KO) e incantesimi rimasti (solo per
+  le classi la cui magia batte l'attacco)
+- fascia di HP del nemico
+- consumabili del party: pozioni di cura, bombe e pozioni di mana
+
+Le transizioni seguono le regole di Battle (tiri uniformi di attacco,
+magia, cura e danno del nemico, oggetti dell'inventario, rigenerazione a
+fine turno del nemico, bersaglio del nemico casuale tra i vivi). Dentro una
+fascia gli HP sono considerati uniformi. L'iterazione dei valori (Gauss-Seidel,
+con uno sconto per round che preferisce le vittorie rapide) dà l'azione
+migliore di ogni stato; una seconda passata valuta la probabilità di
+vittoria della policy trovata.
+
+Le tabelle sono salvate su disco per (classi, nemico, livello): dopo la
+prima costruzione un consiglio è il calcolo di un indice e una lettura.
+Ogni file porta l'impronta delle statistiche usate (profili dei personaggi
+e del nemico, valori dei consumabili): se i dati del gioco cambiano
+(data/enemies.json, oggetti) la tabella su disco viene ricostruita.
+Con più nemici il consiglio considera il primo nemico vivo. Una tabella
+richiede da uno a una decina di secondi: i motori di gioco le preparano
+su un thread all'inizio della battaglia (prepare_tables) e chiedono i
+consigli senza costruire.
+"""
+
+import struct
+import threading
+import zlib
+from array import array
+from itertools import product
+from operator import itemgetter, mul, sub
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from models.character import Character
+from models.item import Item, ItemEffect
+from combat.simulator import PHYSICAL_ROLL, MAGIC_ROLL, HEAL_ROLL, MAGIC_COST
+from combat.markov import foe_profile, hero_profile
+
+
+class Grid(NamedTuple):
+    """Discretizzazione dello spazio degli stati"""
+    hp_bins: int
+    cast_cap: int
+    enemy_bins: int
+    potion_cap: int
+    bomb_cap: int
+    mana_cap: int
+
+
+# Griglia per numero di personaggi (più personaggi, fasce più larghe)
+GRIDS: Dict[int, Grid] = {
+    1: Grid(hp_bins=8, cast_cap=3, enemy_bins=10, potion_cap=2, bomb_cap=2, mana_cap=1),
+    2: Grid(hp_bins=4, cast_cap=1, enemy_bins=8, potion_cap=1, bomb_cap=1, mana_cap=1),
+    3: Grid(hp_bins=3, cast_cap=1, enemy_bins=5, potion_cap=1, bomb_cap=1, mana_cap=0),
+}
+MAX_PARTY = max(GRIDS)
+
+# Sconto per round durante la ricerca della policy
+DISCOUNT = 0.95
+VALUE_TOLERANCE = 1e-4
+MAX_ITERATIONS = 500
+
+# Codici delle azioni (cura e pozione sono seguite dall'indice del bersaglio)
+ATTACK = 0
+MAGIC = 1
+BOMB = 2
+MANA = 3
+HEAL = 4
+POTION = HEAL + MAX_PARTY
+
+# Tabelle su disco (nella cartella dati del gioco)
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / "data" / "advisor"
+MAGIC_BYTES = b"BADV"
+VERSION = 2
+HEADER = struct.Struct("<4sB6BII")
+STRING_LEN = struct.Struct("<H")
+
+# Stati terminali in testa al vettore dei valori
+_LOSE = 0
+_WIN = 1
+
+
+def _items_by_effect(effect: ItemEffect) -> List[Tuple[int, str]]:
+    """(valore, id) dei consumabili con un effetto, dal più debole"""
+    return sorted((template['value'], item_id)
+                  for item_id, template in Item.ITEM_TEMPLATES.items()
+                  if template['consumable'] and template['effect'] == effect)
+
+
+# Consumabili considerati: il modello usa il valore del più debole di ogni tipo
+HEAL_ITEMS = _items_by_effect(ItemEffect.HEAL)
+BOMB_ITEMS = _items_by_effect(ItemEffect.DAMAGE)
+MANA_ITEMS = _items_by_effect(ItemEffect.RESTORE_MP)
+
+
+def rules_digest(party_classes: Sequence[str], enemy_type: str, level: int) -> int:
+    """
+    Impronta (CRC32) dei dati da cui dipende una tabella
+
+    Args:
+        party_classes: Classi dei personaggi
+        enemy_type: Tipo di nemico
+        level: Livello del nemico
+
+    Returns:
+        Intero a 32 bit
+    """
+    data = (tuple(hero_profile(cls) for cls in party_classes),
+            foe_profile(enemy_type, level),
+            HEAL_ITEMS, BOMB_ITEMS, MANA_ITEMS,
+            PHYSICAL_ROLL, MAGIC_ROLL, HEAL_ROLL, MAGIC_COST)
+    return zlib.crc32(repr(data).encode('utf-8'))
+
+
+class Suggestion(NamedTuple):
+    """Azione consigliata a un personaggio"""
+    action: str
+    target: Optional[Character]
+    item_id: Optional[str]
+    win_probability: float
+    label: str
+
+    @property
+    def decision(self) -> Tuple[str, Optional[Character], Optional[str]]:
+        """Argomenti per Battle.execute_player_turn (come una policy del party)"""
+        return self.action, self.target, self.item_id
+
+    def __str__(self) -> str:
+        return f"🧠 Consiglio: {self.label} (vittoria {self.win_probability * 100:.0f}%)"
+
+
+def _bucket(value: int, maximum: int, bins: int) -> int:
+    """Fascia di un valore: 0 se nullo, altrimenti 1..bins"""
+    if value <= 0:
+        return 0
+    if value >= maximum:
+        return bins
+    return max(1, -(-value * bins // maximum))
+
+
+def _shift(maximum: int, bins: int, bucket: int, low: int, high: int,
+           sign: int) -> List[Tuple[int, float]]:
+    """
+    Distribuzione della fascia dopo aver sommato (sign=1) o tolto (sign=-1)
+    un valore uniforme in [low, high] a un valore uniforme nella fascia
+
+    Returns:
+        Lista di (fascia, probabilità)
+    """
+    members = [v for v in range(1, maximum + 1) if _bucket(v, maximum, bins) == bucket]
+    weight = 1.0 / (len(members) * (high - low + 1))
+    out: Dict[int, float] = {}
+    for v in members:
+        for d in range(low, high + 1):
+            b = _bucket(min(maximum, max(0, v + sign * d)), maximum, bins)
+            out[b] = out.get(b, 0.0) + weight
+    return sorted(out.items())
+
+
+def cast_caps(party_classes: Sequence[str], grid: Grid) -> Tuple[int, ...]:
+    """
+    Incantesimi contati per personaggio
+
+    Se il tiro della magia di una classe non supera quello dell'attacco (i
+    due tiri hanno la stessa ampiezza) la magia non conviene mai: gli MP di
+    quel personaggio non entrano nello stato.
+    """
+    caps = []
+    for cls in party_classes:
+        data = Character.CLASSES[cls]
+        useful = MAGIC_ROLL[0] + data['mag_bonus'] > PHYSICAL_ROLL[0] + data['atk_bonus']
+        caps.append(grid.cast_cap if useful else 0)
+    return tuple(caps)
+
+
+def _getter(indices: Tuple[int, ...]):
+    """Lettura dei valori di più stati in una chiamata"""
+    if len(indices) == 1:
+        i = indices[0]
+        return lambda values: (values[i],)
+    return itemgetter(*indices)
+
+
+class AdvisorTable:
+    """Azioni consigliate e probabilità di vittoria di ogni stato"""
+
+    def __init__(self, party_classes: Sequence[str], enemy_type: str, level: int,
+                 grid: Grid, actions: bytes, values: array, digest: int = 0):
+        """
+        Inizializza la tabella
+
+        Args:
+            party_classes: Classi dei personaggi, in ordine di party
+            enemy_type: Tipo di nemico
+            level: Livello del nemico
+            grid: Discretizzazione usata
+            actions: Codice dell'azione consigliata per stato
+            values: Probabilità di vittoria per stato (array 'f')
+            digest: rules_digest dei dati usati per costruirla
+        """
+        self.party_classes = tuple(party_classes)
+        self.enemy_type = enemy_type
+        self.level = level
+        self.grid = grid
+        self.digest = digest
+        self.actions = actions
+        self.values = values
+        self.caps = cast_caps(self.party_classes, grid)
+        self._party_states = 1
+        for cap in self.caps:
+            self._party_states *= (grid.hp_bins + 1) * (cap + 1)
+        self._item_states = ((grid.potion_cap + 1) * (grid.bomb_cap + 1)
+                             * (grid.mana_cap + 1))
+
+    @property
+    def key(self) -> Tuple[Tuple[str, ...], str, int]:
+        """Chiave della tabella: (classi, nemico, livello)"""
+        return self.party_classes, self.enemy_type, self.level
+
+    def index(self, slot: int, hp_buckets: Sequence[int], casts: Sequence[int],
+              enemy_bucket: int, potions: int, bombs: int, mana: int) -> int:
+        """
+        Indice di uno stato discretizzato
+
+        Args:
+            slot: Personaggio di turno
+            hp_buckets: Fascia di HP per personaggio (0 = KO)
+            casts: Incantesimi rimasti per personaggio (già limitati da caps)
+            enemy_bucket: Fascia di HP del nemico (1..enemy_bins)
+            potions: Pozioni di cura (già limitate dalla griglia)
+            bombs: Bombe
+            mana: Pozioni di mana
+
+        Returns:
+            Indice in actions e values
+        """
+        grid = self.grid
+        party = 0
+        for h, k, cap in zip(hp_buckets, casts, self.caps):
+            party = (party * (grid.hp_bins + 1) + h) * (cap + 1) + k
+        items = (potions * (grid.bomb_cap + 1) + bombs) * (grid.mana_cap + 1) + mana
+        return ((slot * self._item_states + items) * grid.enemy_bins
+                + enemy_bucket - 1) * self._party_states + party
+
+    def state_of(self, battle, character: Character) -> Optional[int]:
+        """
+        Indice dello stato della battaglia con il personaggio di turno
+
+        Returns:
+            Indice, o None se il personaggio non è del party o il nemico è KO
+        """
+        chars = battle.party.characters
+        slot = next((i for i, c in enumerate(chars) if c is character), None)
+        foe = battle.resolve_enemy_target(None)
+        if slot is None or not foe.is_alive:
+            return None
+
+        grid = self.grid
+        hp_buckets = [_bucket(c.hp if c.is_alive else 0, c.max_hp, grid.hp_bins) for c in chars]
+        casts = [min(c.mp // MAGIC_COST, cap) for c, cap in zip(chars, self.caps)]
+        inventory = battle.party.inventory
+        count = lambda items: sum(inventory.get_item_count(item_id) for _, item_id in items)
+        return self.index(slot, hp_buckets, casts,
+                          _bucket(foe.hp, foe.max_hp, grid.enemy_bins),
+                          min(count(HEAL_ITEMS), grid.potion_cap),
+                          min(count(BOMB_ITEMS), grid.bomb_cap),
+                          min(count(MANA_ITEMS), grid.mana_cap))
+
+    def lookup(self, battle, character: Character) -> Optional[Suggestion]:
+        """
+        Azione consigliata al personaggio di turno
+
+        Args:
+            battle: Battaglia in corso
+            character: Personaggio di turno
+
+        Returns:
+            Suggestion, o None se lo stato non è nella tabella
+        """
+        index = self.state_of(battle, character)
+        if index is None:
+            return None
+        code = self.actions[index]
+        chance = float(self.values[index])
+        chars = battle.party.characters
+        inventory = battle.party.inventory
+
+        def first_item(items):
+            return next(item_id for _, item_id in items if inventory.has_item(item_id))
+
+        if code == MAGIC:
+            return Suggestion("magic", None, None, chance, "Magia")
+        if code == BOMB:
+            item_id = first_item(BOMB_ITEMS)
+            return Suggestion("use_item", None, item_id, chance, Item.ITEM_TEMPLATES[item_id]['name'])
+        if code == MANA:
+            item_id = first_item(MANA_ITEMS)
+            return Suggestion("use_item", character, item_id, chance,
+                              Item.ITEM_TEMPLATES[item_id]['name'])
+        if HEAL <= code < POTION:
+            target = chars[code - HEAL]
+            return Suggestion("heal", target, None, chance, f"Cura {target.name}")
+        if code >= POTION:
+            target = chars[code - POTION]
+            item_id = first_item(HEAL_ITEMS)
+            name = Item.ITEM_TEMPLATES[item_id]['name']
+            return Suggestion("use_item", target, item_id, chance, f"{name} a {target.name}")
+        return Suggestion("attack", None, None, chance, "Attacco")
+
+    def to_bytes(self) -> bytes:
+        """Serializza la tabella"""
+        out = bytearray(HEADER.pack(MAGIC_BYTES, VERSION, *self.grid, len(self.actions),
+                                    self.digest))
+        for text in ("+".join(self.party_classes), self.enemy_type):
+            raw = text.encode('utf-8')
+            out += STRING_LEN.pack(len(raw)) + raw
+        out += struct.pack("<I", self.level)
+        out += self.actions
+        out += self.values.tobytes()
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'AdvisorTable':
+        """
+        Ricostruisce una tabella da to_bytes
+
+        Raises:
+            ValueError: Se i dati non sono una tabella valida
+        """
+        if len(data) < HEADER.size:
+            raise ValueError("Tabella troncata")
+        magic, version, *grid, count, digest = HEADER.unpack_from(data)
+        if magic != MAGIC_BYTES:
+            raise ValueError("Dati non riconosciuti come tabella dell'advisor")
+        if version != VERSION:
+            raise ValueError(f"Versione della tabella non supportata: {version}")
+
+        offset = HEADER.size
+        texts = []
+        for _ in range(2):
+            (length,) = STRING_LEN.unpack_from(data, offset)
+            offset += STRING_LEN.size
+            texts.append(data[offset:offset + length].decode('utf-8'))
+            offset += length
+        (level,) = struct.unpack_from("<I", data, offset)
+        offset += 4
+
+        values = array('f')
+        values.frombytes(data[offset + count:])
+        if len(data) < offset + count or len(values) != count:
+            raise ValueError("Tabella troncata")
+        return cls(texts[0].split("+"), texts[1], level, Grid(*grid),
+                   data[offset:offset + count], values, digest)
+
+    def save(self, filepath):
+        """Salva la tabella su file"""
+        with open(filepath, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, filepath) -> 'AdvisorTable':
+        """Carica una tabella da file"""
+        with open(filepath, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+def build_table(party_classes: Sequence[str], enemy_type: str, level: int = 1,
+                grid: Optional[Grid] = None) -> AdvisorTable:
+    """
+    Costruisce la tabella per iterazione dei valori
+
+    Args:
+        party_classes: Classi dei personaggi (da 1 a MAX_PARTY)
+        enemy_type: Tipo di nemico
+        level: Livello del nemico
+        grid: Discretizzazione (default: GRIDS per la dimensione del party)
+
+    Returns:
+        AdvisorTable
+    """
+    from combat.enemy import ENEMY_REGISTRY
+
+    size = len(party_classes)
+    if not 1 <= size <= MAX_PARTY:
+        raise ValueError(f"Party di {size} personaggi non supportato (massimo {MAX_PARTY})")
+    grid = grid or GRIDS[size]
+    HB, EB = grid.hp_bins, grid.enemy_bins
+    PC, BC, MC = grid.potion_cap, grid.bomb_cap, grid.mana_cap
+    caps = cast_caps(party_classes, grid)
+    heroes = [Character("Eroe", cls) for cls in party_classes]
+    foe = ENEMY_REGISTRY.stats(enemy_type, level)
+    E = foe.max_hp
+
+    # Transizioni delle fasce (in cache per argomenti)
+    shifts: Dict[tuple, List[Tuple[int, float]]] = {}
+
+    def shift(maximum, bins, bucket, low, high, sign):
+        key = (maximum, bins, bucket, low, high, sign)
+        if key not in shifts:
+            shifts[key] = _shift(maximum, bins, bucket, low, high, sign)
+        return shifts[key]
+
+    potion_heal = HEAL_ITEMS[0][0] if HEAL_ITEMS else 0
+    bomb_damage = BOMB_ITEMS[0][0] if BOMB_ITEMS else 0
+    mana_casts = MANA_ITEMS[0][0] // MAGIC_COST if MANA_ITEMS else 0
+
+    # Un personaggio è la coppia (fascia di HP, incantesimi); il party è la
+    # tupla dei personaggi, indicizzata come numero a base mista
+    parties = list(product(*[list(product(range(HB + 1), range(cap + 1))) for cap in caps]))
+    PS = len(parties)
+    weights = []
+    for i in range(size):
+        weight = 1
+        for cap in caps[i + 1:]:
+            weight *= (HB + 1) * (cap + 1)
+        weights.append(weight)
+    items = list(product(range(PC + 1), range(BC + 1), range(MC + 1)))
+    T = len(items)
+    n_decisions = size * T * EB * PS
+    r_base = 2 + n_decisions
+
+    def code(state) -> int:
+        return sum((h * (cap + 1) + k) * w for (h, k), cap, w in zip(state, caps, weights))
+
+    def decision(slot, t, e, pc):
+        return 2 + ((slot * T + t) * EB + e - 1) * PS + pc
+
+    def item_code(potions, bombs, mana):
+        return (potions * (BC + 1) + bombs) * (MC + 1) + mana
+
+    def after_player(slot, t, e, state):
+        """Indice dopo l'azione di slot: prossimo personaggio vivo o turno del nemico"""
+        if e == 0:
+            return _WIN
+        pc = code(state)
+        for nxt in range(slot + 1, size):
+            if state[nxt][0]:
+                return decision(nxt, t, e, pc)
+        return r_base + (t * EB + e - 1) * PS + pc
+
+    def pack(outcomes: Dict[int, float]):
+        indices = tuple(outcomes)
+        return _getter(indices), tuple(outcomes[i] for i in indices)
+
+    def with_char(state, i, h, k):
+        new = list(state)
+        new[i] = (h, k)
+        return new
+
+    def enemy_turn(t, e, state):
+        """Turno del nemico dopo l'ultimo personaggio: bersaglio casuale, poi rigenerazione"""
+        alive = [i for i in range(size) if state[i][0]]
+        regen = shift(E, EB, e, foe.regen, foe.regen, 1) if foe.regen else [(e, 1.0)]
+        outcomes: Dict[int, float] = {}
+        for i in alive:
+            h, k = state[i]
+            for h2, p in shift(heroes[i].max_hp, HB, h, foe.min_damage, foe.max_damage, -1):
+                new = with_char(state, i, h2, k)
+                first = next((j for j in range(size) if new[j][0]), None)
+                if first is None:
+                    outcomes[_LOSE] = outcomes.get(_LOSE, 0.0) + p / len(alive)
+                    continue
+                new_pc = code(new)
+                for e2, q in regen:
+                    index = decision(first, t, e2, new_pc)
+                    outcomes[index] = outcomes.get(index, 0.0) + p * q / len(alive)
+        return [(None, *pack(outcomes))]
+
+    def player_turn(slot, t, e, state):
+        """Azioni possibili del personaggio di turno"""
+        potions, bombs, mana = items[t]
+        h, k = state[slot]
+        hero = heroes[slot]
+        options = []
+
+        def option(action, moves):
+            outcomes: Dict[int, float] = {}
+            for t2, e2, new, p in moves:
+                index = after_player(slot, t2, e2, new)
+                outcomes[index] = outcomes.get(index, 0.0) + p
+            options.append((action, *pack(outcomes)))
+
+        low, high = PHYSICAL_ROLL
+        option(ATTACK, [(t, e2, state, p) for e2, p in
+                        shift(E, EB, e, low + hero.atk_bonus, high + hero.atk_bonus, -1)])
+        if k:
+            low, high = MAGIC_ROLL
+            option(MAGIC, [(t, e2, with_char(state, slot, h, k - 1), p) for e2, p in
+                           shift(E, EB, e, low + hero.mag_bonus, high + hero.mag_bonus, -1)])
+        if bombs:
+            t2 = item_code(potions, bombs - 1, mana)
+            option(BOMB, [(t2, e2, state, p) for e2, p in
+                          shift(E, EB, e, bomb_damage, bomb_damage, -1)])
+        if mana and k < caps[slot]:
+            option(MANA, [(item_code(potions, bombs, mana - 1), e,
+                           with_char(state, slot, h, min(caps[slot], k + mana_casts)), 1.0)])
+        for i, (hi, ki) in enumerate(state):
+            if not hi:
+                continue
+            max_hp = heroes[i].max_hp
+            option(HEAL + i, [(t, e, with_char(state, i, h2, ki), p) for h2, p in
+                              shift(max_hp, HB, hi, HEAL_ROLL[0], HEAL_ROLL[1], 1)])
+            if potions:
+                t2 = item_code(potions - 1, bombs, mana)
+                option(POTION + i, [(t2, e, with_char(state, i, h2, ki), p) for h2, p in
+                                    shift(max_hp, HB, hi, potion_heal, potion_heal, 1)])
+        return options
+
+    # Ordine delle passate: prima gli stati con meno oggetti e meno HP del
+    # nemico, da cui dipendono gli altri; per ogni stato il turno del nemico
+    # e poi i personaggi dall'ultimo al primo
+    entries = []
+    for t, e, pc in product(range(T), range(1, EB + 1), range(PS)):
+        state = parties[pc]
+        if not any(h for h, _ in state):
+            continue
+        entries.append((r_base + (t * EB + e - 1) * PS + pc, enemy_turn(t, e, state)))
+        for slot in range(size - 1, -1, -1):
+            if state[slot][0]:
+                entries.append((decision(slot, t, e, pc), player_turn(slot, t, e, state)))
+
+    # Iterazione dei valori con sconto per round, poi valutazione della
+    # policy trovata senza sconto (probabilità di vittoria)
+    values = [0.0] * (r_base + T * EB * PS)
+    values[_WIN] = 1.0
+    choice = bytearray(n_decisions)
+
+    def sweep(discount: float) -> float:
+        previous = values[:]
+        for index, options in entries:
+            if len(options) == 1:
+                _, get, probs = options[0]
+                value = sum(map(mul, probs, get(values)))
+                values[index] = value if options[0][0] is not None else value * discount
+            else:
+                values[index] = max([sum(map(mul, probs, get(values)))
+                                     for _, get, probs in options])
+        return max(map(abs, map(sub, values, previous)))
+
+    for _ in range(MAX_ITERATIONS):
+        if sweep(DISCOUNT) < VALUE_TOLERANCE:
+            break
+
+    # Azione migliore (a parità la prima: attacco, magia, ...), poi solo quella
+    for n, (index, options) in enumerate(entries):
+        if len(options) > 1:
+            scores = [sum(map(mul, probs, get(values))) for _, get, probs in options]
+            best = options[scores.index(max(scores))]
+            choice[index - 2] = best[0]
+            entries[n] = (index, [best])
+        elif options[0][0] is not None:
+            choice[index - 2] = options[0][0]
+    for _ in range(MAX_ITERATIONS):
+        if sweep(1.0) < VALUE_TOLERANCE:
+            break
+
+    return AdvisorTable(party_classes, enemy_type, level, grid, bytes(choice),
+                        array('f', values[2:r_base]),
+                        rules_digest(party_classes, enemy_type, level))
+
+
+# Tabelle già caricate o costruite in questo processo
+_TABLES: Dict[Tuple[Tuple[str, ...], str, int], AdvisorTable] = {}
+
+# Tabelle in costruzione su un thread di prepare_tables
+_PENDING: set = set()
+_PENDING_LOCK = threading.Lock()
+
+
+def table_path(party_classes: Sequence[str], enemy_type: str, level: int,
+               cache_dir=DEFAULT_CACHE_DIR) -> Path:
+    """File della tabella nella cartella di cache"""
+    return Path(cache_dir) / f"{'+'.join(party_classes)}_{enemy_type}_{level}.adv"
+
+
+def get_table(party_classes: Sequence[str], enemy_type: str, level: int = 1,
+              cache_dir=DEFAULT_CACHE_DIR, build: bool = True) -> Optional[AdvisorTable]:
+    """
+    Tabella dell'advisor: dalla memoria, dal disco o costruita e salvata
+
+    Args:
+        party_classes: Classi dei personaggi
+        enemy_type: Tipo di nemico
+        level: Livello del nemico
+        cache_dir: Cartella delle tabelle (None = nessuna cache su disco)
+        build: Se False non costruisce tabelle mancanti (nessuna attesa)
+
+    Returns:
+        AdvisorTable, o None se il party è troppo grande o la tabella manca
+    """
+    key = (tuple(party_classes), enemy_type, level)
+    table = _TABLES.get(key)
+    if table is not None:
+        return table
+    if not 1 <= len(key[0]) <= MAX_PARTY:
+        return None
+
+    path = table_path(*key, cache_dir=cache_dir) if cache_dir is not None else None
+    if path is not None and path.exists():
+        try:
+            table = AdvisorTable.load(path)
+            if (table.key != key or table.grid != GRIDS[len(key[0])]
+                    or table.digest != rules_digest(*key)):
+                # Tabella di un'altra versione dei dati: va ricostruita
+                table = None
+        except (OSError, ValueError):
+            table = None
+
+    if table is None:
+        if not build:
+            return None
+        table = build_table(*key)
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                table.save(path)
+            except OSError:
+                # La cache su disco è solo un'ottimizzazione
+                pass
+
+    _TABLES[key] = table
+    return table
+
+
+def suggest(battle, character: Character, cache_dir=DEFAULT_CACHE_DIR,
+            build: bool = True) -> Optional[Suggestion]:
+    """
+    Azione consigliata al personaggio di turno
+
+    Args:
+        battle: Battaglia in corso
+        character: Personaggio di turno
+        cache_dir: Cartella delle tabelle (None = nessuna cache su disco)
+        build: Se False usa solo tabelle già in memoria o su disco
+
+    Returns:
+        Suggestion, o None se non disponibile (party troppo grande, nemici KO)
+    """
+    foe = battle.resolve_enemy_target(None)
+    if not foe.is_alive:
+        return None
+    classes = [c.character_class for c in battle.party.characters]
+    if classes and all(cls in Character.CLASSES for cls in classes):
+        table = get_table(classes, foe.enemy_type, foe.level, cache_dir, build)
+        if table is not None:
+            return table.lookup(battle, character)
+    return None
+
+
+def prepare_tables(battle, cache_dir=DEFAULT_CACHE_DIR) -> Optional[threading.Thread]:
+    """
+    Costruisce su un thread le tabelle che mancano per i nemici della battaglia
+
+    Le tabelle già in memoria o su disco vengono solo caricate; quelle già
+    in costruzione su un altro thread non vengono ripetute.
+
+    Args:
+        battle: Battaglia appena iniziata
+        cache_dir: Cartella delle tabelle (None = nessuna cache su disco)
+
+    Returns:
+        Thread della costruzione, o None se non c'è niente da costruire
+    """
+    classes = tuple(c.character_class for c in battle.party.characters)
+    if not 1 <= len(classes) <= MAX_PARTY or not all(cls in Character.CLASSES for cls in classes):
+        return None
+
+    missing = []
+    for foe in battle.enemies:
+        key = (classes, foe.enemy_type, foe.level)
+        if not foe.is_alive or key in missing:
+            continue
+        if get_table(*key, cache_dir=cache_dir, build=False) is None:
+            missing.append(key)
+    with _PENDING_LOCK:
+        missing = [key for key in missing if key not in _PENDING]
+        _PENDING.update(missing)
+    if not missing:
+        return None
+
+    def build():
+        for key in missing:
+            try:
+                get_table(*key, cache_dir=cache_dir)
+            finally:
+                with _PENDING_LOCK:
+                    _PENDING.discard(key)
+
+    thread = threading.Thread(target=build, name="advisor-tables", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,199 @@
+"""
+AI Executor - Decisioni dei nemici fuori dal thread principale
+
+Il loop di Pygame deve disegnare un frame ogni 16 ms, ma la ricerca di
+SearchAI può durarne diversi. AIExecutor prepara sul thread principale una
+copia compatta della battaglia (SearchAI.prepare) e fa girare la ricerca su
+un thread di lavoro; il gioco interroga il risultato a ogni frame con
+AIJob.poll, senza bloccare.
+
+- ogni decisione ha un budget di tempo: scaduto il budget la ricerca viene
+  interrotta e il bersaglio è il giocatore vivo con meno HP (la stessa
+  scelta di SearchAI senza ricerca completata). La regola è fissa e non usa
+  il generatore della battaglia: i tiri restano gli stessi su macchine
+  lente e veloci, e le registrazioni restano riproducibili
+- cancel interrompe la decisione in corso (battaglia finita o abbandonata)
+- le IA che usano il generatore della battaglia (RandomAI) e le scelte
+  banali restano sincrone, così l'ordine dei tiri casuali non cambia
+
+Il lavoro è su un thread e non su un processo: il modello è piccolo e la
+ricerca rilascia il GIL abbastanza spesso da lasciar girare il rendering.
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
+from combat.enemy_ai import SearchAI
+
+
+# Secondi massimi per decisione prima di ripiegare sul giocatore più debole
+DEFAULT_BUDGET = 0.25
+
+
+class AIJob:
+    """Decisione di un nemico in corso"""
+
+    def __init__(self, battle, enemy, future: Future, deadline: float,
+                 cancel_event: Optional[threading.Event], clock: Callable[[], float]):
+        """
+        Inizializza la decisione
+
+        Args:
+            battle: Battaglia della decisione
+            enemy: Nemico che agisce
+            future: Risultato del thread di lavoro (indice del giocatore)
+            deadline: Istante oltre il quale si ripiega sul giocatore più debole
+            cancel_event: Evento che interrompe la ricerca (None se sincrona)
+            clock: Orologio usato per la scadenza
+        """
+        self.battle = battle
+        self.enemy = enemy
+        self.future = future
+        self.deadline = deadline
+        self.fallback = False
+        self._cancel_event = cancel_event
+        self._clock = clock
+        self._target = None
+        self._done = False
+
+    @property
+    def done(self) -> bool:
+        """True se il bersaglio è già deciso"""
+        return self._done
+
+    def poll(self) -> Optional[object]:
+        """
+        Controlla la decisione senza bloccare
+
+        Returns:
+            Character bersaglio, o None se la decisione è ancora in corso
+            (o se nessun giocatore è vivo: vedi done)
+        """
+        if self._done:
+            return self._target
+        if self.future.done():
+            index = self.future.result() if not self.future.cancelled() else None
+            target = self.battle.party.characters[index] if index is not None else None
+            if target is None or not target.is_alive:
+                return self._resolve_fallback()
+            return self._finish(target)
+        if self._clock() >= self.deadline:
+            self.cancel()
+            return self._resolve_fallback()
+        return None
+
+    def cancel(self):
+        """Interrompe la ricerca (il risultato non verrà più usato)"""
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+        self.future.cancel()
+
+    def _resolve_fallback(self):
+        """Giocatore vivo con meno HP quando la ricerca non ha risposto in tempo"""
+        self.fallback = True
+        alive = self.battle.turn_manager.get_alive_players()
+        target = min(alive, key=lambda c: c.hp) if alive else None
+        return self._finish(target)
+
+    def _finish(self, target):
+        """Registra il bersaglio deciso"""
+        self._target = target
+        self._done = True
+        return target
+
+
+class AIExecutor:
+    """Thread di lavoro per le decisioni dei nemici"""
+
+    def __init__(self, budget: float = DEFAULT_BUDGET, clock: Callable[[], float] = time.perf_counter):
+        """
+        Inizializza l'executor
+
+        Args:
+            budget: Secondi massimi per decisione
+            clock: Orologio per le scadenze (sostituibile nei test)
+        """
+        self.budget = budget
+        self.clock = clock
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self.current: Optional[AIJob] = None
+
+    def submit(self, battle, enemy) -> AIJob:
+        """
+        Avvia la decisione del bersaglio di un nemico
+
+        Una decisione precedente ancora in corso viene cancellata.
+
+        Args:
+            battle: Battaglia in corso
+            enemy: Nemico che agisce
+
+        Returns:
+            AIJob da interrogare con poll()
+        """
+        self.cancel()
+        ai = battle.get_enemy_ai(enemy)
+        alive = battle.turn_manager.get_alive_players()
+        if not isinstance(ai, SearchAI) or len(alive) <= 1:
+            # Scelta immediata sul thread principale
+            future: Future = Future()
+            target = ai.choose_target(battle, enemy)
+            future.set_result(battle.party.characters.index(target) if target is not None else None)
+            job = AIJob(battle, enemy, future, float('inf'), None, self.clock)
+            if target is None:
+                job._finish(None)
+        else:
+            cancel_event = threading.Event()
+            # Istanza propria: le IA di get_enemy_ai sono condivise
+            worker_ai = SearchAI(ai.depth, ai.node_budget, self.budget, cancel_event)
+            model, sequence = worker_ai.prepare(battle, enemy)
+            future = self._executor().submit(lambda: worker_ai.rank_targets(model, sequence)[0])
+            job = AIJob(battle, enemy, future, self.clock() + self.budget,
+                        cancel_event, self.clock)
+        self.current = job
+        return job
+
+    def poll(self, battle, enemy):
+        """
+        Bersaglio di un nemico senza bloccare
+
+        Avvia la decisione alla prima chiamata per (battaglia, nemico) e la
+        interroga alle successive; una decisione conclusa viene consegnata
+        una sola volta.
+
+        Args:
+            battle: Battaglia in corso
+            enemy: Nemico di turno
+
+        Returns:
+            (pronto, bersaglio): pronto è False finché la decisione è in corso
+        """
+        job = self.current
+        if job is None or job.battle is not battle or job.enemy is not enemy:
+            job = self.submit(battle, enemy)
+        target = job.poll()
+        if not job.done:
+            return False, None
+        self.current = None
+        return True, target
+
+    def cancel(self):
+        """Cancella la decisione in corso, se c'è"""
+        if self.current is not None and not self.current.done:
+            self.current.cancel()
+        self.current = None
+
+    def shutdown(self):
+        """Cancella la decisione in corso e chiude il thread di lavoro"""
+        self.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _executor(self) -> ThreadPoolExecutor:
+        """Thread di lavoro (creato alla prima ricerca)"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="enemy-ai")
+        return self._pool
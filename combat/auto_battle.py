@@ -0,0 +1,106 @@
+"""
+Auto Battle - Risoluzione automatica di una battaglia in una sola chiamata
+
+Una policy del party (combat.policies) decide le mosse dei personaggi e l'IA
+dei nemici quelle dei nemici, finché la battaglia non finisce. Non c'è
+introduzione, rendering né input per turno, e i messaggi delle azioni non
+vengono mai letti (BattleAction li formatta solo su richiesta): ritornano
+solo il BattleResult e un riepilogo compatto.
+"""
+
+from typing import List, Tuple
+from combat.battle import Battle, BattleResult
+from combat.policies import get_policy
+
+
+class AutoBattleSummary:
+    """Riepilogo compatto di una battaglia risolta automaticamente"""
+
+    def __init__(self, victory: bool, rounds: int, turns: int, damage_dealt: int,
+                 damage_taken: int, fallen: List[str]):
+        """
+        Inizializza il riepilogo
+
+        Args:
+            victory: True se il party ha vinto
+            rounds: Round giocati
+            turns: Turni giocati (giocatori e nemici)
+            damage_dealt: HP tolti ai nemici
+            damage_taken: HP persi dal party (al netto delle cure)
+            fallen: Nomi dei personaggi KO a fine battaglia
+        """
+        self.victory = victory
+        self.rounds = rounds
+        self.turns = turns
+        self.damage_dealt = damage_dealt
+        self.damage_taken = damage_taken
+        self.fallen = fallen
+
+    def to_dict(self) -> dict:
+        """Converte il riepilogo in dizionario"""
+        return {
+            'victory': self.victory,
+            'rounds': self.rounds,
+            'turns': self.turns,
+            'damage_dealt': self.damage_dealt,
+            'damage_taken': self.damage_taken,
+            'fallen': list(self.fallen),
+        }
+
+    def __str__(self) -> str:
+        outcome = "VITTORIA" if self.victory else "SCONFITTA"
+        fallen = ", ".join(self.fallen) if self.fallen else "nessuno"
+        return (f"⚡ Auto-battaglia: {outcome} in {self.rounds} round ({self.turns} turni)"
+                f" · danni inflitti {self.damage_dealt} · HP persi {self.damage_taken}"
+                f" · KO: {fallen}")
+
+
+def auto_battle(battle: Battle, policy="balanced",
+                max_rounds: int = 200) -> Tuple[BattleResult, AutoBattleSummary]:
+    """
+    Gioca una battaglia fino alla fine senza input
+
+    Args:
+        battle: Battaglia da risolvere (appena creata o già in corso)
+        policy: Nome in PARTY_POLICIES o funzione policy(battle, character)
+                che ritorna (azione, bersaglio) o (azione, bersaglio, oggetto)
+        max_rounds: Round oltre i quali la battaglia si interrompe e conta
+                    come non vinta
+
+    Returns:
+        (BattleResult, AutoBattleSummary)
+    """
+    decide = get_policy(policy)
+    party = battle.party.characters
+    tm = battle.turn_manager
+    party_hp = sum(c.hp for c in party)
+    enemy_hp = sum(e.hp for e in battle.enemies)
+    turns = 0
+    battle.is_active = True
+
+    while tm.is_battle_active() and tm.round_number <= max_rounds:
+        current = tm.get_current_combatant()
+        if current.is_player:
+            battle.execute_player_turn(current.entity, *decide(battle, current.entity))
+        else:
+            battle.execute_enemy_turn(current.entity)
+        turns += 1
+        if tm.is_battle_active():
+            tm.next_turn()
+
+    # Misure prima di check_battle_end, che applica i bonus di vittoria
+    damage_dealt = enemy_hp - sum(e.hp for e in battle.enemies)
+    damage_taken = max(0, party_hp - sum(c.hp for c in party))
+    fallen = [c.name for c in party if not c.is_alive]
+
+    result = battle.check_battle_end()
+    if result is None:
+        # Limite di round raggiunto: nessun vincitore
+        battle.is_active = False
+        tm.release()
+        result = BattleResult(victory=False, survivors=tm.get_alive_players(),
+                              enemy_defeated=False, rounds=tm.round_number)
+
+    summary = AutoBattleSummary(result.victory, result.rounds, turns,
+                                damage_dealt, damage_taken, fallen)
+    return result, summary
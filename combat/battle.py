@@ -2,12 +2,16 @@
 Battle System - Gestisce l'intero flusso di combattimento
 """
 
-import random
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple, Union
 from models.party import Party
 from models.character import Character
 from combat.enemy import Enemy
 from combat.turn_manager import TurnManager, Combatant
+from combat.battle_log import BattleLog, format_message
+from combat.status_effects import StatusEffects, EffectKind
+from combat.events import (EventBus, DamageDealt, Healed, CombatantDefeated,
+                           BattleEnded)
+from utils.rng import DEFAULT_RNG
 
 
 class BattleResult:
@@ -35,7 +39,8 @@ class BattleAction:
     """Rappresenta un'azione di battaglia"""
     
     def __init__(self, action_type: str, actor: str, target: str, 
-                 value: int, message: str):
+                 value: int, message: Optional[str] = None,
+                 template: Optional[str] = None, defeated: bool = False, extra: str = ""):
         """
         Inizializza un'azione
         
@@ -44,31 +49,195 @@ class BattleAction:
             actor: Nome di chi esegue l'azione
             target: Nome del bersaglio
             value: Valore (danno o cura)
-            message: Messaggio descrittivo
+            message: Messaggio descrittivo già pronto
+            template: Modello del messaggio (chiave di MESSAGE_TEMPLATES),
+                      formattato solo quando il messaggio viene letto
+            defeated: True se il bersaglio è stato sconfitto
+            extra: Testo aggiuntivo per il modello (costo MP, nome oggetto)
         """
         self.action_type = action_type
         self.actor = actor
         self.target = target
         self.value = value
-        self.message = message
+        self.template = template
+        self.defeated = defeated
+        self.extra = extra
+        self._message = message
+    
+    @property
+    def message(self) -> str:
+        """Messaggio descrittivo (formattato al primo accesso)"""
+        if self._message is None:
+            self._message = format_message(self.template, self.actor, self.target,
+                                           self.value, self.defeated, self.extra)
+        return self._message
+    
+    @message.setter
+    def message(self, value: str):
+        self._message = value
 
 
 class Battle:
     """Classe principale per gestire un combattimento"""
     
-    def __init__(self, party: Party, enemy: Enemy):
+    # Costo relativo delle azioni (usato dallo scheduler a velocità)
+    ACTION_COSTS = {
+        "attack": 1.0,
+        "magic": 1.25,
+        "heal": 1.0,
+        "use_item": 0.75,
+    }
+    
+    def __init__(self, party: Party, enemy: Union[Enemy, Sequence[Enemy]], rng=None,
+                 initiative: bool = False, log: Optional[BattleLog] = None,
+                 enemy_ai=None):
         """
         Inizializza una battaglia
         
         Args:
             party: Party dei giocatori
-            enemy: Nemico da affrontare
+            enemy: Nemico da affrontare o lista di nemici (incontro multiplo)
+            rng: Generatore casuale della battaglia. Se indicato viene
+                 assegnato anche ai personaggi e ai nemici, così l'intero
+                 combattimento usa un solo flusso riproducibile.
+            initiative: Turni decisi dalla velocità dei combattenti
+                        (InitiativeScheduler) invece dell'ordine fisso
+            log: Registro delle azioni (default: BattleLog in memoria con
+                 capacità BattleLog.DEFAULT_CAPACITY)
+            enemy_ai: IA per tutti i nemici, come EnemyAI o chiave di
+                      DIFFICULTY_PRESETS (default: la difficoltà di ogni nemico)
         """
         self.party = party
-        self.enemy = enemy
-        self.turn_manager = TurnManager(party.characters, enemy)
-        self.battle_log: List[BattleAction] = []
+        self.enemies: List[Enemy] = list(enemy) if isinstance(enemy, (list, tuple)) else [enemy]
+        self.enemy = self.enemies[0]
+        self.rng = DEFAULT_RNG
+        if rng is not None:
+            self.bind_rng(rng)
+        self.turn_manager = TurnManager(party.characters, self.enemies, initiative)
+        # Eventi per UI, log e statistiche (nessun costo senza iscritti)
+        self.events = EventBus()
+        self.turn_manager.events = self.events
+        self._ended = False
+        # Contatore dei cambiamenti di stato (vedi version)
+        self._changes = 0
+        self.battle_log = log if log is not None else BattleLog()
+        self.effects = StatusEffects()
+        for foe in self.enemies:
+            if foe.regen > 0:
+                self.effects.add(foe, "Rigenerazione", EffectKind.REGEN, foe.regen)
         self.is_active = False
+        self.enemy_ai = enemy_ai
+        # ReplayRecorder collegato (vedi combat.replay)
+        self.recorder = None
+    
+    def bind_rng(self, rng):
+        """
+        Usa un generatore casuale per la battaglia e per tutti i combattenti
+        
+        Args:
+            rng: Generatore compatibile con random.Random
+        """
+        for char in self.party.characters:
+            char.rng = rng
+        for foe in self.enemies:
+            foe.rng = rng
+        self.rng = rng
+    
+    @property
+    def version(self) -> int:
+        """
+        Versione dello stato della battaglia
+        
+        Cresce a ogni azione, cambio di turno, effetto aggiunto o restore:
+        chi mostra la battaglia (es. core.battle_view) ricalcola i suoi dati
+        solo quando cambia.
+        """
+        return self._changes + self.turn_manager.version
+    
+    def touch(self):
+        """Segnala un cambiamento fatto senza passare dalla battaglia (es. HP modificati a mano)"""
+        self._changes += 1
+    
+    # Campi iniziali di snapshot(); seguono (hp, mp, vivo) per personaggio
+    # e (hp, vivo) per nemico
+    SNAPSHOT_HEADER = 10
+    
+    def snapshot(self) -> tuple:
+        """
+        Fotografa lo stato mutabile del combattimento in una tupla piatta
+        
+        Contiene HP, MP e stato vivo dei combattenti, turno, round, contatori
+        dei vivi, quantità dell'inventario, effetti di stato, stato dello
+        scheduler e del generatore della battaglia. Con uno SplitMixRNG snapshot e restore
+        costano pochi microsecondi (lo stato del Mersenne Twister da solo ne
+        richiede circa 10). Il registro delle azioni non è incluso.
+        
+        Returns:
+            Tupla da passare a restore
+        """
+        tm = self.turn_manager
+        state = [
+            tm.round_number, tm.current_turn_index, tm._action_cost, self.is_active,
+            tm.players_alive, tm.enemies_alive, self.rng.getstate(),
+            tuple([(item_id, item.quantity) for item_id, item in self.party.inventory.items.items()]),
+            tm.scheduler.snapshot() if tm.scheduler is not None else None,
+            self.effects.snapshot(),
+        ]
+        for char in self.party.characters:
+            state += (char.hp, char.mp, char._alive)
+        for foe in self.enemies:
+            state += (foe.hp, foe._alive)
+        return tuple(state)
+    
+    def restore(self, snap: tuple):
+        """
+        Riporta il combattimento allo stato di uno snapshot
+        
+        Lo stato vivo viene scritto senza notifiche; poi il TurnManager si
+        registra di nuovo (check_battle_end lo scollega a fine battaglia) e
+        riconta i vivi, così uno snapshot preso prima della fine resta giocabile.
+        
+        Args:
+            snap: Tupla prodotta da snapshot() su questa battaglia
+        """
+        tm = self.turn_manager
+        (tm.round_number, tm.current_turn_index, tm._action_cost, self.is_active,
+         tm.players_alive, tm.enemies_alive, rng_state, inventory, scheduler,
+         effects) = snap[:self.SNAPSHOT_HEADER]
+        self.rng.setstate(rng_state)
+        self.effects.restore(effects)
+        self._ended = not tm.is_battle_active()
+        self._changes += 1
+        if scheduler is not None:
+            tm.scheduler.restore(scheduler)
+        
+        items = self.party.inventory.items
+        if len(items) == len(inventory) and all(item_id in items for item_id, _ in inventory):
+            for item_id, quantity in inventory:
+                items[item_id].quantity = quantity
+        else:
+            self._restore_inventory(inventory)
+        
+        i = self.SNAPSHOT_HEADER
+        for char in self.party.characters:
+            char.hp, char.mp, char._alive = snap[i:i + 3]
+            i += 3
+        for foe in self.enemies:
+            foe.hp, foe._alive = snap[i:i + 2]
+            i += 2
+        tm.reattach()
+    
+    def _restore_inventory(self, inventory: tuple):
+        """Ricostruisce l'inventario (oggetti esauriti o aggiunti dopo lo snapshot)"""
+        from models.item import Item
+        
+        items = self.party.inventory.items
+        current = dict(items)
+        items.clear()
+        for item_id, quantity in inventory:
+            item = current.get(item_id) or Item(item_id)
+            item.quantity = quantity
+            items[item_id] = item
     
     def start_battle(self) -> str:
         """
@@ -78,6 +247,9 @@ class Battle:
             Messaggio di inizio battaglia
         """
         self.is_active = True
+        self._changes += 1
+        if self.events.active:
+            self.turn_manager.publish_turn_started()
         return self._get_battle_intro()
     
     def _get_battle_intro(self) -> str:
@@ -86,8 +258,9 @@ class Battle:
         lines.append("=" * 50)
         lines.append("⚔️  INIZIO COMBATTIMENTO!")
         lines.append("=" * 50)
-        lines.append(f"\n{self.enemy.description}")
-        lines.append(f"\n{self.enemy}")
+        for foe in self.enemies:
+            lines.append(f"\n{foe.description}")
+            lines.append(f"{foe}")
         lines.append("\nIl tuo party:")
         for char in self.party.characters:
             lines.append(f"  • {char}")
@@ -102,16 +275,29 @@ class Battle:
         Args:
             player: Personaggio che agisce
             action: Azione da eseguire (attack, heal, use_item, magic)
-            target: Bersaglio (per heal o item)
+            target: Bersaglio (nemico per attack/magic, alleato per heal o item)
             item_id: ID dell'oggetto da usare (per use_item)
             
         Returns:
             BattleAction eseguita
         """
+        self.turn_manager.set_action_cost(self.ACTION_COSTS.get(action, 1.0))
+        self._begin_turn()
+        
+        result = self._dispatch_player_action(player, action, target, item_id)
+        self._end_turn(player)
+        self._changes += 1
+        if self.recorder is not None:
+            self.recorder.record_player_turn(player, action, target, item_id, self)
+        return result
+    
+    def _dispatch_player_action(self, player: Character, action: str,
+                                target, item_id: Optional[str]) -> BattleAction:
+        """Esegue l'azione scelta dal giocatore"""
         if action == "attack":
-            return self._execute_attack(player, self.enemy)
+            return self._execute_attack(player, self.resolve_enemy_target(target))
         elif action == "magic":
-            return self._execute_magic_attack(player, self.enemy)
+            return self._execute_magic_attack(player, self.resolve_enemy_target(target))
         elif action == "heal":
             if target and target.is_alive:
                 return self._execute_heal(player, target)
@@ -139,29 +325,141 @@ class Battle:
             message=f"{player.name} passa il turno"
         )
     
-    def execute_enemy_turn(self) -> BattleAction:
+    def execute_enemy_turn(self, enemy: Optional[Enemy] = None,
+                           target: Optional[Character] = None) -> BattleAction:
         """
-        Esegue il turno del nemico (IA base)
+        Esegue il turno di un nemico
+        
+        Args:
+            enemy: Nemico che agisce (default: il combattente di turno, se è un
+                   nemico, altrimenti il primo nemico vivo)
+            target: Giocatore da attaccare (default: scelto dall'IA del nemico)
         
         Returns:
             BattleAction eseguita
         """
-        # IA: Sceglie casualmente un giocatore vivo da attaccare
-        alive_players = self.turn_manager.get_alive_players()
+        if enemy is None:
+            enemy = self._current_enemy()
+        self._begin_turn()
         
-        if not alive_players:
-            return BattleAction(
+        if target is None or not target.is_alive:
+            target = self.get_enemy_ai(enemy).choose_target(self, enemy)
+        
+        if target is None:
+            result = BattleAction(
                 action_type="skip",
-                actor=self.enemy.name,
+                actor=enemy.name,
                 target="",
                 value=0,
-                message=f"{self.enemy.name} non ha bersagli validi"
+                message=f"{enemy.name} non ha bersagli validi"
             )
+        else:
+            result = self._execute_attack(enemy, target)
+        self._end_turn(enemy)
+        self._changes += 1
         
-        # Scelta casuale del bersaglio
-        target = random.choice(alive_players)
+        if self.recorder is not None:
+            self.recorder.record_enemy_turn(enemy, target, self)
+        return result
+    
+    def _begin_turn(self):
+        """Fa scadere gli effetti di stato arrivati al round corrente"""
+        effects = self.effects
+        if effects.count:
+            effects.advance(self.turn_manager.round_number)
+    
+    def _end_turn(self, actor):
+        """Applica gli effetti periodici (danno nel tempo, rigenerazione) di chi ha agito"""
+        for effect in self.effects.periodic(actor):
+            if not actor.is_alive:
+                break
+            if effect.kind == EffectKind.DOT:
+                value = actor.take_damage(effect.value)
+                template = "dot"
+                if self.events.active:
+                    self._publish_damage(None, actor, value, "dot")
+            else:
+                value = actor.heal(effect.value)
+                template = "regen"
+                if self.events.active:
+                    self.events.emit(Healed, None, actor, value, "regen")
+            if value:
+                self.battle_log.append(BattleAction(
+                    action_type="effect",
+                    actor=actor.name,
+                    target=actor.name,
+                    value=value,
+                    template=template,
+                    defeated=not actor.is_alive,
+                    extra=effect.name
+                ))
+    
+    def _publish_damage(self, source, target, amount: int, kind: str):
+        """Pubblica DamageDealt e, se il bersaglio è caduto, CombatantDefeated"""
+        self.events.emit(DamageDealt, source, target, amount, kind)
+        if not target.is_alive:
+            self.events.emit(CombatantDefeated, target, isinstance(target, Character))
+    
+    def add_effect(self, owner, name: str, kind: str, value: int,
+                   stat: Optional[str] = None, rounds: Optional[int] = None):
+        """
+        Applica un effetto di stato a un combattente
+        
+        Args:
+            owner: Personaggio o nemico
+            name: Nome dell'effetto
+            kind: Tipo (EffectKind)
+            value: Bonus/malus della statistica o HP per turno
+            stat: Statistica modificata ('atk', 'mag', 'def') per i modificatori
+            rounds: Durata in round (None = fino alla fine della battaglia)
+            
+        Returns:
+            StatusEffect aggiunto
+        """
+        self._changes += 1
+        return self.effects.add(owner, name, kind, value, stat, rounds,
+                                self.turn_manager.round_number)
+    
+    def get_enemy_ai(self, enemy: Enemy):
+        """
+        IA che decide le mosse di un nemico
+        
+        Args:
+            enemy: Nemico della battaglia
+            
+        Returns:
+            EnemyAI della battaglia se impostata, altrimenti quella della
+            difficoltà del nemico
+        """
+        from combat.enemy_ai import EnemyAI, get_enemy_ai
+        
+        ai = self.enemy_ai if self.enemy_ai is not None else getattr(enemy, 'ai', 'easy')
+        return ai if isinstance(ai, EnemyAI) else get_enemy_ai(ai)
+    
+    def _current_enemy(self) -> Enemy:
+        """Nemico del turno corrente (o il primo vivo)"""
+        tm = self.turn_manager
+        current = tm.turn_order[tm.current_turn_index]
+        if not current.is_player and current.is_alive():
+            return current.entity
+        return self.resolve_enemy_target(None)
+    
+    def resolve_enemy_target(self, target=None) -> Enemy:
+        """
+        Sceglie il nemico bersaglio di un attacco
         
-        return self._execute_attack(self.enemy, target)
+        Args:
+            target: Nemico richiesto (ignorato se non è un nemico vivo della battaglia)
+            
+        Returns:
+            Il nemico richiesto, altrimenti il primo nemico vivo
+        """
+        if isinstance(target, Enemy) and target.is_alive and target in self.enemies:
+            return target
+        for foe in self.enemies:
+            if foe.is_alive:
+                return foe
+        return self.enemy
     
     def _execute_attack(self, attacker, target) -> BattleAction:
         """Esegue un attacco"""
@@ -171,30 +469,30 @@ class Battle:
         else:
             # Usa il danno fisico con bonus ATK
             damage = attacker.calculate_physical_damage()
+        if self.effects.count:
+            damage = max(0, damage + self.effects.modifier(attacker, "atk")
+                         - self.effects.modifier(target, "def"))
         
         # Infliggi danno
         actual_damage = target.take_damage(damage)
-        
-        # Crea messaggio
-        message = f"⚔️  {attacker.name} attacca {target.name} per {actual_damage} danni!"
-        
-        if not target.is_alive:
-            message += f"\n💀 {target.name} è stato sconfitto!"
+        if self.events.active:
+            self._publish_damage(attacker, target, actual_damage, "attack")
         
         action = BattleAction(
             action_type="attack",
             actor=attacker.name,
             target=target.name,
             value=actual_damage,
-            message=message
+            template="attack",
+            defeated=not target.is_alive
         )
         
         self.battle_log.append(action)
         return action
     
     def _execute_use_item(self, user: Character, item_id: str, target: Optional[Character] = None) -> BattleAction:
-        """Esegue l'uso di un oggetto"""
-        from models.item import ItemEffect
+        """Esegue l'uso di un oggetto (effetti compilati da combat.item_effects)"""
+        from combat.item_effects import COMPILED_ITEMS
         
         # Usa l'oggetto dall'inventario del party
         result = self.party.inventory.use_item(item_id, target)
@@ -208,37 +506,7 @@ class Battle:
                 message=result['message']
             )
         
-        # Applica l'effetto
-        effect = result['effect']
-        value = result['value']
-        actual_value = 0
-        target_name = target.name if target else user.name
-        final_target = target if target else user
-        
-        if effect == ItemEffect.HEAL:
-            actual_value = final_target.heal(value)
-            message = f"💚 {user.name} usa {self.party.inventory.items.get(item_id, type('obj', (), {'name': 'oggetto'})).name if item_id in self.party.inventory.items else 'un oggetto'} su {target_name}: +{actual_value} HP!"
-        elif effect == ItemEffect.RESTORE_MP:
-            actual_value = final_target.restore_mp(value)
-            message = f"💙 {user.name} usa un oggetto su {target_name}: +{actual_value} MP!"
-        elif effect == ItemEffect.DAMAGE:
-            actual_value = self.enemy.take_damage(value)
-            target_name = self.enemy.name
-            message = f"💣 {user.name} usa un oggetto su {target_name}: {actual_value} danni!"
-            
-            if not self.enemy.is_alive:
-                message += f"\n💀 {self.enemy.name} è stato sconfitto!"
-        else:
-            message = result['message']
-        
-        action = BattleAction(
-            action_type="use_item",
-            actor=user.name,
-            target=target_name,
-            value=actual_value,
-            message=message
-        )
-        
+        action = COMPILED_ITEMS[item_id](self, user, target)
         self.battle_log.append(action)
         return action
     
@@ -258,22 +526,23 @@ class Battle:
         
         # Calcola danno magico con bonus MAG
         damage = attacker.calculate_magic_damage()
+        if self.effects.count:
+            damage = max(0, damage + self.effects.modifier(attacker, "mag")
+                         - self.effects.modifier(target, "def"))
         
         # Infliggi danno
         actual_damage = target.take_damage(damage)
-        
-        # Crea messaggio
-        message = f"✨ {attacker.name} lancia un incantesimo su {target.name} per {actual_damage} danni! (-{mp_cost} MP)"
-        
-        if not target.is_alive:
-            message += f"\n💀 {target.name} è stato sconfitto!"
+        if self.events.active:
+            self._publish_damage(attacker, target, actual_damage, "magic")
         
         action = BattleAction(
             action_type="magic",
             actor=attacker.name,
             target=target.name,
             value=actual_damage,
-            message=message
+            template="magic",
+            defeated=not target.is_alive,
+            extra=str(mp_cost)
         )
         
         self.battle_log.append(action)
@@ -281,17 +550,17 @@ class Battle:
     
     def _execute_heal(self, healer: Character, target: Character) -> BattleAction:
         """Esegue una cura"""
-        heal_amount = random.randint(15, 30)
+        heal_amount = self.rng.randint(15, 30)
         actual_heal = target.heal(heal_amount)
-        
-        message = f"💚 {healer.name} cura {target.name} di {actual_heal} HP!"
+        if self.events.active:
+            self.events.emit(Healed, healer, target, actual_heal, "heal")
         
         action = BattleAction(
             action_type="heal",
             actor=healer.name,
             target=target.name,
             value=actual_heal,
-            message=message
+            template="heal"
         )
         
         self.battle_log.append(action)
@@ -306,18 +575,26 @@ class Battle:
         """
         if not self.turn_manager.is_battle_active():
             self.is_active = False
+            self._changes += 1
             
             survivors = self.turn_manager.get_alive_players()
-            victory = self.enemy.is_alive == False
+            victory = self.turn_manager.enemies_alive == 0
             
+            # I combattenti sopravvivono alla battaglia: smette di seguirli
+            self.turn_manager.release()
             self.end_battle(victory)
 
-            return BattleResult(
+            result = BattleResult(
                 victory=victory,
                 survivors=survivors,
-                enemy_defeated=not self.enemy.is_alive,
+                enemy_defeated=victory,
                 rounds=self.turn_manager.round_number
             )
+            if not self._ended:
+                self._ended = True
+                if self.events.active:
+                    self.events.emit(BattleEnded, result)
+            return result
         
         return None
     
@@ -331,6 +608,15 @@ class Battle:
                 'max_hp': self.enemy.max_hp,
                 'alive': self.enemy.is_alive
             },
+            'enemies': [
+                {
+                    'name': foe.get_display_name(),
+                    'hp': foe.hp,
+                    'max_hp': foe.max_hp,
+                    'alive': foe.is_alive
+                }
+                for foe in self.enemies
+            ],
             'players': [
                 {
                     'name': char.name,
@@ -350,7 +636,7 @@ class Battle:
         lines.append("📊 RIEPILOGO BATTAGLIA")
         lines.append("=" * 50)
         lines.append(f"Round totali: {self.turn_manager.round_number}")
-        lines.append(f"Azioni totali: {len(self.battle_log)}")
+        lines.append(f"Azioni totali: {self.battle_log.total}")
         
         result = self.check_battle_end()
         if result:
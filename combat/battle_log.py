@@ -0,0 +1,250 @@
+"""
+Battle Log - Registro compatto e limitato delle azioni di battaglia
+
+Le azioni non sono conservate come oggetti con il messaggio già formattato:
+ogni voce occupa una posizione in array paralleli (codice azione, id attore,
+id bersaglio, valore, flag, id extra) gestiti come buffer circolare di
+capacità fissa. Nomi e testi extra sono internati in una tabella condivisa.
+Le voci che escono dal buffer possono essere riversate su file; i messaggi
+vengono formattati solo quando qualcuno li legge.
+"""
+
+import struct
+from array import array
+from typing import Dict, Iterator, List, Optional
+
+
+# Modelli dei messaggi: la chiave è il "template" di una BattleAction
+MESSAGE_TEMPLATES: Dict[str, str] = {
+    "raw": "{extra}",
+    "attack": "⚔️  {actor} attacca {target} per {value} danni!",
+    "magic": "✨ {actor} lancia un incantesimo su {target} per {value} danni! (-{extra} MP)",
+    "heal": "💚 {actor} cura {target} di {value} HP!",
+    "item_heal": "💚 {actor} usa {extra} su {target}: +{value} HP!",
+    "item_mp": "💙 {actor} usa un oggetto su {target}: +{value} MP!",
+    "item_damage": "💣 {actor} usa un oggetto su {target}: {value} danni!",
+    "item_buff_atk": "💪 {actor} usa {extra} su {target}: +{value} ATK per 3 round!",
+    "item_buff_def": "🛡️  {actor} usa {extra} su {target}: -{value} danni subiti per 3 round!",
+    "dot": "🔥 {target} subisce {value} danni da {extra}!",
+    "regen": "🌿 {target} recupera {value} HP grazie a {extra}!",
+    "area_magic": "✨ {actor} lancia un incantesimo ad area su {target}: {value} danni, {extra} sconfitti! (-10 MP)",
+    "area_item": "💣 {actor} lancia una bomba contro {target}: {value} danni, {extra} sconfitti!",
+    "item_full_restore": "🌟 {actor} usa {extra} su {target}: HP e MP al massimo (+{value} HP)!",
+}
+
+DEFEAT_SUFFIX = "\n💀 {target} è stato sconfitto!"
+
+# Codici numerici di tipi d'azione e template (posizione nella lista)
+ACTION_TYPES: List[str] = ["skip", "attack", "magic", "heal", "use_item", "effect"]
+TEMPLATES: List[str] = list(MESSAGE_TEMPLATES)
+
+_ACTION_CODES = {name: code for code, name in enumerate(ACTION_TYPES)}
+_TEMPLATE_CODES = {name: code for code, name in enumerate(TEMPLATES)}
+
+FLAG_DEFEATED = 1
+
+# Record su disco: tipo, template, flag, attore, bersaglio, valore, extra
+SPILL_RECORD = struct.Struct("<BBBIIiI")
+
+# Byte accumulati prima di scrivere su file
+SPILL_FLUSH_SIZE = 64 * 1024
+
+
+def format_message(template: str, actor: str, target: str, value: int,
+                   defeated: bool = False, extra: str = "") -> str:
+    """
+    Costruisce il messaggio di un'azione
+
+    Args:
+        template: Chiave in MESSAGE_TEMPLATES
+        actor: Nome di chi agisce
+        target: Nome del bersaglio
+        value: Danno o cura
+        defeated: True se il bersaglio è stato sconfitto
+        extra: Testo aggiuntivo (costo MP, nome oggetto, messaggio libero)
+
+    Returns:
+        Messaggio formattato
+    """
+    message = MESSAGE_TEMPLATES[template].format(actor=actor, target=target,
+                                                 value=value, extra=extra)
+    if defeated:
+        message += DEFEAT_SUFFIX.format(target=target)
+    return message
+
+
+class BattleLog:
+    """Buffer circolare di azioni in array paralleli, con riversamento opzionale"""
+
+    DEFAULT_CAPACITY = 256
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, spill_path: Optional[str] = None):
+        """
+        Inizializza il registro
+
+        Args:
+            capacity: Numero massimo di azioni tenute in memoria
+            spill_path: File su cui accodare le azioni che escono dal buffer
+                        (None = vengono scartate). Il file viene svuotato: gli
+                        id dei nomi valgono solo per questo registro
+        """
+        if capacity < 1:
+            raise ValueError("La capacità del registro deve essere almeno 1")
+        self.capacity = capacity
+        self.spill_path = spill_path
+
+        self._types = array('B', bytes(capacity))
+        self._templates = array('B', bytes(capacity))
+        self._flags = array('B', bytes(capacity))
+        self._actors = array('I', [0]) * capacity
+        self._targets = array('I', [0]) * capacity
+        self._values = array('i', [0]) * capacity
+        self._extras = array('I', [0]) * capacity
+
+        self._names: List[str] = []
+        self._name_ids: Dict[str, int] = {}
+
+        self._start = 0
+        self._count = 0
+        self.total = 0
+        self.spilled = 0
+        self._pending = bytearray()
+        self._truncate_spill()
+
+    def _truncate_spill(self):
+        """Svuota il file di riversamento (se c'è)"""
+        if self.spill_path is not None:
+            with open(self.spill_path, 'wb'):
+                pass
+
+    def _intern(self, text: str) -> int:
+        """Id di un nome (o testo) nella tabella condivisa"""
+        name_id = self._name_ids.get(text)
+        if name_id is None:
+            name_id = self._name_ids[text] = len(self._names)
+            self._names.append(text)
+        return name_id
+
+    def append(self, action):
+        """
+        Registra un'azione
+
+        Args:
+            action: BattleAction eseguita
+        """
+        template = action.template
+        if template is None:
+            # Messaggio libero già formattato: viene conservato come testo extra
+            template = "raw"
+            extra = action.message
+        else:
+            extra = action.extra
+
+        if self._count == self.capacity:
+            slot = self._start
+            if self.spill_path is not None:
+                self._spill(slot)
+            self._start = (slot + 1) % self.capacity
+        else:
+            slot = (self._start + self._count) % self.capacity
+            self._count += 1
+
+        self._types[slot] = _ACTION_CODES.get(action.action_type, 0)
+        self._templates[slot] = _TEMPLATE_CODES[template]
+        self._flags[slot] = FLAG_DEFEATED if action.defeated else 0
+        self._actors[slot] = self._intern(action.actor)
+        self._targets[slot] = self._intern(action.target)
+        self._values[slot] = action.value
+        self._extras[slot] = self._intern(str(extra))
+        self.total += 1
+
+    def _spill(self, slot: int):
+        """Accoda la voce che sta per essere sovrascritta (scritta a blocchi)"""
+        self._pending += SPILL_RECORD.pack(
+            self._types[slot], self._templates[slot], self._flags[slot],
+            self._actors[slot], self._targets[slot], self._values[slot],
+            self._extras[slot])
+        self.spilled += 1
+        if len(self._pending) >= SPILL_FLUSH_SIZE:
+            self.flush()
+
+    def flush(self):
+        """Scrive su file le voci riversate ancora in attesa"""
+        if self._pending:
+            with open(self.spill_path, 'ab') as f:
+                f.write(self._pending)
+            self._pending.clear()
+
+    def _action(self, type_code: int, template_code: int, flags: int,
+                actor: int, target: int, value: int, extra: int):
+        """Ricostruisce una BattleAction (messaggio non ancora formattato)"""
+        from combat.battle import BattleAction
+
+        names = self._names
+        return BattleAction(
+            action_type=ACTION_TYPES[type_code],
+            actor=names[actor],
+            target=names[target],
+            value=value,
+            template=TEMPLATES[template_code],
+            defeated=bool(flags & FLAG_DEFEATED),
+            extra=names[extra]
+        )
+
+    def __len__(self) -> int:
+        """Numero di azioni in memoria (vedi total per tutte le azioni)"""
+        return self._count
+
+    def __getitem__(self, index: int):
+        """Azione in memoria per posizione (0 = la più vecchia, -1 = l'ultima)"""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Indice del registro fuori intervallo")
+        slot = (self._start + index) % self.capacity
+        return self._action(self._types[slot], self._templates[slot], self._flags[slot],
+                            self._actors[slot], self._targets[slot], self._values[slot],
+                            self._extras[slot])
+
+    def __iter__(self) -> Iterator:
+        for index in range(self._count):
+            yield self[index]
+
+    def messages(self, last: Optional[int] = None) -> List[str]:
+        """
+        Messaggi delle ultime azioni in memoria
+
+        Args:
+            last: Numero di azioni (None = tutte quelle in memoria)
+
+        Returns:
+            Lista di messaggi formattati, dalla più vecchia
+        """
+        first = 0 if last is None else max(0, self._count - last)
+        return [self[index].message for index in range(first, self._count)]
+
+    def read_spilled(self) -> Iterator:
+        """
+        Rilegge le azioni riversate su file, nell'ordine di registrazione
+
+        Returns:
+            Iteratore di BattleAction
+        """
+        if self.spill_path is None or self.spilled == 0:
+            return
+        self.flush()
+        with open(self.spill_path, 'rb') as f:
+            data = f.read()
+        for record in SPILL_RECORD.iter_unpack(data):
+            yield self._action(*record)
+
+    def clear(self):
+        """Svuota il registro: azioni in memoria, tabella dei nomi e file di riversamento"""
+        self._start = 0
+        self._count = 0
+        self.total = 0
+        self.spilled = 0
+        self._pending.clear()
+        self._names.clear()
+        self._name_ids.clear()
+        self._truncate_spill()
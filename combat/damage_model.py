@@ -0,0 +1,302 @@
+"""
+Damage Model - Distribuzioni esatte dei danni e anteprima delle probabilità
+
+I tiri del combattimento sono uniformi (randint(10, 25) + atk_bonus per
+l'attacco fisico, randint(15, 30) + mag_bonus per la magia,
+randint(min_damage, max_damage) per i nemici), quindi le loro distribuzioni
+di probabilità (PMF) sono esatte e piccole. Da una PMF si costruisce una
+KillTable che, per ogni valore di HP fino al massimo, contiene la probabilità
+di KO in 1..n colpi e il numero atteso di colpi per il KO: dopo la prima
+costruzione (in cache) ogni domanda della UI è una lettura da lista.
+
+Le convoluzioni sono in Python puro: i supporti sono di poche decine di
+valori e il progetto non dipende da NumPy.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+
+# Regole di Character/Battle
+PHYSICAL_ROLL = (10, 25)
+MAGIC_ROLL = (15, 30)
+MAGIC_COST = 10
+
+# Colpi per cui la KillTable tiene la probabilità di KO
+KILL_HITS = 3
+
+# Granularità degli HP massimi delle tabelle di round (condivise tra battaglie)
+ROUND_TABLE_STEP = 64
+
+# PMF: (valore minimo, probabilità dei valori consecutivi)
+Pmf = Tuple[int, Tuple[float, ...]]
+
+
+def uniform_pmf(low: int, high: int, bonus: int = 0) -> Pmf:
+    """
+    PMF di randint(low, high) + bonus
+
+    Args:
+        low: Tiro minimo
+        high: Tiro massimo (incluso)
+        bonus: Valore fisso sommato al tiro
+
+    Returns:
+        Pmf
+    """
+    size = high - low + 1
+    return (low + bonus, (1.0 / size,) * size)
+
+
+def convolve(a: Pmf, b: Pmf) -> Pmf:
+    """
+    PMF della somma di due variabili indipendenti
+
+    Args:
+        a: Prima PMF
+        b: Seconda PMF
+
+    Returns:
+        Pmf della somma
+    """
+    a_min, a_probs = a
+    b_min, b_probs = b
+    out = [0.0] * (len(a_probs) + len(b_probs) - 1)
+    for i, pa in enumerate(a_probs):
+        for j, pb in enumerate(b_probs):
+            out[i + j] += pa * pb
+    return (a_min + b_min, tuple(out))
+
+
+def pmf_mean(pmf: Pmf) -> float:
+    """Valore atteso di una PMF"""
+    low, probs = pmf
+    return sum((low + i) * p for i, p in enumerate(probs))
+
+
+def physical_roll(char) -> Tuple[int, int, int]:
+    """Tiro del danno fisico di un personaggio: (minimo, massimo, bonus)"""
+    return PHYSICAL_ROLL + (char.atk_bonus,)
+
+
+def magic_roll(char) -> Tuple[int, int, int]:
+    """Tiro del danno magico di un personaggio: (minimo, massimo, bonus)"""
+    return MAGIC_ROLL + (char.mag_bonus,)
+
+
+def enemy_roll(enemy) -> Tuple[int, int, int]:
+    """Tiro del danno di un nemico (già scalato per livello)"""
+    return (enemy.min_damage, enemy.max_damage, 0)
+
+
+def roll_mean(roll: Tuple[int, int, int]) -> float:
+    """Danno medio di un tiro uniforme"""
+    low, high, bonus = roll
+    return (low + high) / 2 + bonus
+
+
+class KillTable:
+    """Probabilità di KO e colpi attesi per ogni valore di HP fino a max_hp"""
+
+    def __init__(self, pmf: Pmf, max_hp: int, max_hits: int = KILL_HITS):
+        """
+        Costruisce le tabelle
+
+        Args:
+            pmf: Distribuzione del danno di un colpo
+            max_hp: HP massimi coperti dalle tabelle
+            max_hits: Colpi per cui calcolare la probabilità di KO
+        """
+        low, probs = pmf
+        self.pmf = pmf
+        self.max_hp = max_hp
+        damages = [(low + i, p) for i, p in enumerate(probs) if p > 0]
+        miss = sum(p for d, p in damages if d <= 0)
+        hits = [(d, p) for d, p in damages if d > 0]
+
+        # chance[n][h] = P(S_n >= h), con chance[n][0] = 1
+        previous = [1.0] + [0.0] * max_hp
+        self.chance: List[List[float]] = [previous]
+        for _ in range(max_hits):
+            row = [1.0] * (max_hp + 1)
+            for h in range(1, max_hp + 1):
+                total = miss * previous[h]
+                for d, p in hits:
+                    total += p * previous[h - d if d < h else 0]
+                row[h] = total
+            self.chance.append(row)
+            previous = row
+
+        # expected[h] = 1 + Σ p(d)·expected[h - d]
+        expected = [0.0] * (max_hp + 1)
+        for h in range(1, max_hp + 1):
+            total = 1.0
+            for d, p in hits:
+                total += p * expected[h - d if d < h else 0]
+            expected[h] = total / (1.0 - miss) if miss < 1.0 else float('inf')
+        self.expected = expected
+
+    def kill_chance(self, hp: int, hits: int = 1) -> float:
+        """
+        Probabilità di KO entro un certo numero di colpi
+
+        Args:
+            hp: HP residui del bersaglio (≤ max_hp)
+            hits: Numero di colpi (≤ max_hits)
+
+        Returns:
+            Probabilità tra 0 e 1
+        """
+        if hp <= 0:
+            return 1.0
+        return self.chance[hits][min(hp, self.max_hp)]
+
+    def expected_hits(self, hp: int) -> float:
+        """Numero atteso di colpi per il KO"""
+        if hp <= 0:
+            return 0.0
+        return self.expected[min(hp, self.max_hp)]
+
+
+@lru_cache(maxsize=1024)
+def kill_table(roll: Tuple[int, int, int], max_hp: int) -> KillTable:
+    """
+    KillTable in cache
+
+    La chiave è il tiro (minimo, massimo, bonus) e non la classe: per una
+    classe e un tipo/livello di nemico è la stessa cosa, ma la cache resta
+    valida anche con bonus modificati.
+
+    Args:
+        roll: Tiro del danno
+        max_hp: HP massimi del bersaglio
+
+    Returns:
+        KillTable
+    """
+    return KillTable(uniform_pmf(*roll), max_hp)
+
+
+def action_roll(char, action: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Tiro del danno di un'azione offensiva
+
+    Args:
+        char: Personaggio
+        action: "attack" o "magic"
+
+    Returns:
+        (minimo, massimo, bonus), o None se l'azione non è offensiva o
+        mancano gli MP
+    """
+    if action == "attack":
+        return physical_roll(char)
+    if action == "magic" and char.mp >= MAGIC_COST:
+        return magic_roll(char)
+    return None
+
+
+def kill_chance(char, action: str, enemy, hits: int = 1) -> float:
+    """
+    Probabilità che il personaggio metta KO il nemico
+
+    Args:
+        char: Personaggio che attacca
+        action: "attack" o "magic"
+        enemy: Nemico bersaglio (HP attuali)
+        hits: Numero di colpi
+
+    Returns:
+        Probabilità tra 0 e 1 (0 se l'azione non è possibile)
+    """
+    roll = action_roll(char, action)
+    if roll is None or not enemy.is_alive:
+        return 0.0
+    return kill_table(roll, enemy.max_hp).kill_chance(enemy.hp, hits)
+
+
+def enemy_kill_chance(enemy, char) -> float:
+    """Probabilità che il prossimo attacco del nemico metta KO il personaggio"""
+    if not char.is_alive:
+        return 0.0
+    return kill_table(enemy_roll(enemy), char.max_hp).kill_chance(char.hp)
+
+
+def _best_action_roll(char) -> Tuple[int, int, int]:
+    """Azione offensiva con il danno atteso più alto"""
+    physical = physical_roll(char)
+    magic = action_roll(char, "magic")
+    if magic is not None and roll_mean(magic) > roll_mean(physical):
+        return magic
+    return physical
+
+
+@lru_cache(maxsize=256)
+def _round_table(rolls: Tuple[Tuple[int, int, int], ...], max_hp: int) -> KillTable:
+    """KillTable del danno complessivo di un round del party"""
+    total = uniform_pmf(*rolls[0])
+    for roll in rolls[1:]:
+        total = convolve(total, uniform_pmf(*roll))
+    return KillTable(total, max_hp, max_hits=1)
+
+
+def expected_rounds_to_win(battle) -> float:
+    """
+    Round attesi per sconfiggere tutti i nemici
+
+    Stima: ogni personaggio vivo usa l'azione offensiva migliore e i danni
+    si sommano sugli HP totali dei nemici (senza contare KO nel party).
+
+    Args:
+        battle: Battle in corso
+
+    Returns:
+        Round attesi (inf se nessun personaggio è vivo)
+    """
+    rolls = tuple(sorted(_best_action_roll(c) for c in battle.party.characters if c.is_alive))
+    if not rolls:
+        return float('inf')
+    hp = sum(foe.hp for foe in battle.enemies if foe.is_alive)
+    cap = -(-max(hp, 1) // ROUND_TABLE_STEP) * ROUND_TABLE_STEP
+    return _round_table(rolls, cap).expected_hits(hp)
+
+
+def combat_preview(battle, player, target=None) -> Dict:
+    """
+    Anteprima per la UI: probabilità di KO in questo turno e round attesi
+
+    Args:
+        battle: Battle in corso
+        player: Personaggio di turno
+        target: Nemico bersaglio (default: il primo vivo)
+
+    Returns:
+        Dizionario con target, attack_kill, magic_kill (None senza MP),
+        expected_rounds e danger (probabilità di KO del personaggio al
+        prossimo colpo del nemico)
+    """
+    foe = battle.resolve_enemy_target(target)
+    return {
+        'target': foe.name,
+        'attack_kill': kill_chance(player, "attack", foe),
+        'magic_kill': kill_chance(player, "magic", foe) if player.mp >= MAGIC_COST else None,
+        'expected_rounds': expected_rounds_to_win(battle),
+        'danger': max((enemy_kill_chance(e, player) for e in battle.enemies if e.is_alive),
+                      default=0.0),
+    }
+
+
+def format_preview(preview: Dict) -> str:
+    """
+    Riga di testo dell'anteprima
+
+    Args:
+        preview: Risultato di combat_preview
+
+    Returns:
+        Stringa per la UI
+    """
+    magic = preview['magic_kill']
+    magic_text = f"{magic:.0%}" if magic is not None else "—"
+    return (f"🎲 KO {preview['target']} questo turno: attacco {preview['attack_kill']:.0%}"
+            f" | magia {magic_text} · round attesi per vincere: {preview['expected_rounds']:.1f}")
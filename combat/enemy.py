@@ -2,77 +2,77 @@
 Modello Enemy - Rappresenta i nemici nel combattimento
 """
 
-import random
 from typing import Optional
+from models.liveness import Liveness
+from combat.enemy_registry import EnemyRegistry, EnemyStats
+from utils.rng import DEFAULT_RNG
 
 
-class Enemy:
+# Registro condiviso dei tipi di nemico (data/enemies.json)
+ENEMY_REGISTRY = EnemyRegistry.load()
+
+
+def _stat(field: str) -> property:
+    """
+    Statistica letta dalla riga condivisa
+
+    Assegnarla (es. un boss con più HP) sostituisce la riga del solo nemico
+    con una copia modificata: le altre istanze non cambiano.
+    """
+    def getter(self):
+        return getattr(self._stats, field)
+
+    def setter(self, value):
+        if getattr(self._stats, field) != value:
+            self._stats = self._stats._replace(**{field: value})
+
+    return property(getter, setter, doc=f"{field} (da EnemyStats)")
+
+
+class Enemy(Liveness):
     """Classe che rappresenta un nemico"""
     
-    # Template dei nemici con statistiche predefinite
-    ENEMY_TEMPLATES = {
-        'goblin': {
-            'name': 'Goblin',
-            'hp': 40,
-            'min_damage': 5,
-            'max_damage': 12,
-            'description': 'Un piccolo e astuto goblin armato di pugnale'
-        },
-        'orc': {
-            'name': 'Orco',
-            'hp': 60,
-            'min_damage': 8,
-            'max_damage': 18,
-            'description': 'Un feroce guerriero orco con una grossa ascia'
-        },
-        'troll': {
-            'name': 'Troll',
-            'hp': 80,
-            'min_damage': 10,
-            'max_damage': 25,
-            'description': 'Un enorme troll con capacità rigenerative'
-        },
-        'skeleton': {
-            'name': 'Scheletro',
-            'hp': 35,
-            'min_damage': 6,
-            'max_damage': 14,
-            'description': 'Uno scheletro animato da magia oscura'
-        },
-        'dragon': {
-            'name': 'Drago',
-            'hp': 120,
-            'min_damage': 15,
-            'max_damage': 35,
-            'description': 'Un terribile drago con soffio di fuoco'
-        }
-    }
+    # Solo lo stato mutabile è per istanza; le statistiche sono nella riga
+    # EnemyStats condivisa (ai, livello, tipo, ... sono proprietà che la
+    # leggono). 'damage' e 'xp_reward' sono assegnati solo al boss finale.
+    __slots__ = ('_stats', 'name', 'hp', 'rng', 'alive_listeners', '_alive',
+                 'damage', 'xp_reward')
+    
+    # Template dei nemici con statistiche predefinite (dal registro)
+    ENEMY_TEMPLATES = ENEMY_REGISTRY.templates
+    
+    enemy_type = property(lambda self: self._stats.enemy_type, doc="Tipo di nemico")
+    level = property(lambda self: self._stats.level, doc="Livello del nemico")
+    description = property(lambda self: self._stats.description, doc="Descrizione")
+    max_hp = _stat('max_hp')
+    min_damage = _stat('min_damage')
+    max_damage = _stat('max_damage')
+    speed = _stat('speed')
+    ai = _stat('ai')
+    regen = _stat('regen')
     
-    def __init__(self, enemy_type: str = 'goblin', level: int = 1):
+    def __init__(self, enemy_type: str = 'goblin', level: int = 1, rng=None):
         """
         Inizializza un nemico
         
         Args:
             enemy_type: Tipo di nemico (goblin, orc, troll, etc.)
             level: Livello del nemico (scala gli HP e i danni)
+            rng: Generatore casuale compatibile con random.Random (default condiviso)
         """
-        if enemy_type not in self.ENEMY_TEMPLATES:
-            enemy_type = 'goblin'
+        stats = ENEMY_REGISTRY.stats(enemy_type, level)
+        self._stats = stats
+        self.name = stats.name
+        self.hp = stats.max_hp
         
-        template = self.ENEMY_TEMPLATES[enemy_type]
-        
-        self.enemy_type = enemy_type
-        self.name = template['name']
-        self.level = level
-        self.description = template['description']
-        
-        # Scala statistiche in base al livello
-        self.max_hp = int(template['hp'] * (1 + (level - 1) * 0.3))
-        self.hp = self.max_hp
-        self.min_damage = int(template['min_damage'] * (1 + (level - 1) * 0.2))
-        self.max_damage = int(template['max_damage'] * (1 + (level - 1) * 0.2))
-        
-        self.is_alive = True
+        self.alive_listeners = []
+        self._alive = True
+        self.rng = rng if rng is not None else DEFAULT_RNG
+    
+    @property
+    def stats(self) -> EnemyStats:
+        """Riga di statistiche del nemico (condivisa finché non modificata)"""
+        return self._stats
     
     def take_damage(self, amount: int) -> int:
         """
@@ -93,6 +93,23 @@ class Enemy:
         
         return actual_damage
     
+    def heal(self, amount: int) -> int:
+        """
+        Cura il nemico (es. rigenerazione)
+        
+        Args:
+            amount: Quantità di cura
+            
+        Returns:
+            HP effettivamente recuperati
+        """
+        if not self.is_alive:
+            return 0
+        
+        old_hp = self.hp
+        self.hp = min(self.hp + amount, self.max_hp)
+        return self.hp - old_hp
+    
     def attack(self) -> int:
         """
         Il nemico attacca (genera danno casuale)
@@ -103,7 +120,7 @@ class Enemy:
         if not self.is_alive:
             return 0
         
-        damage = random.randint(self.min_damage, self.max_damage)
+        damage = self.rng.randint(self.min_damage, self.max_damage)
         return damage
     
     def get_hp_percentage(self) -> float:
@@ -119,25 +136,57 @@ class Enemy:
         return self.name
     
     @classmethod
-    def create_random(cls, min_level: int = 1, max_level: int = 3) -> 'Enemy':
+    def create_random(cls, min_level: int = 1, max_level: int = 3, rng=None) -> 'Enemy':
         """
         Crea un nemico casuale
         
         Args:
             min_level: Livello minimo
             max_level: Livello massimo
+            rng: Generatore casuale (usato anche dal nemico creato)
             
         Returns:
             Istanza di Enemy casuale
         """
-        enemy_type = random.choice(list(cls.ENEMY_TEMPLATES.keys()))
-        level = random.randint(min_level, max_level)
-        return cls(enemy_type=enemy_type, level=level)
+        rng = rng if rng is not None else DEFAULT_RNG
+        enemy_type = rng.choice(ENEMY_REGISTRY.types)
+        level = rng.randint(min_level, max_level)
+        return cls(enemy_type=enemy_type, level=level, rng=rng)
+    
+    @classmethod
+    def create_group(cls, count: int, min_level: int = 1, max_level: int = 3,
+                     rng=None) -> list:
+        """
+        Crea un gruppo di nemici casuali per un incontro multiplo
+        
+        I nemici dello stesso tipo ricevono un suffisso (A, B, ...) per
+        poterli distinguere nella scelta del bersaglio.
+        
+        Args:
+            count: Numero di nemici
+            min_level: Livello minimo
+            max_level: Livello massimo
+            rng: Generatore casuale
+            
+        Returns:
+            Lista di Enemy
+        """
+        group = [cls.create_random(min_level, max_level, rng=rng) for _ in range(count)]
+        
+        by_name = {}
+        for enemy in group:
+            by_name.setdefault(enemy.name, []).append(enemy)
+        for same in by_name.values():
+            if len(same) > 1:
+                for i, enemy in enumerate(same):
+                    enemy.name = f"{enemy.name} {chr(ord('A') + i)}"
+        
+        return group
     
     @classmethod
     def get_enemy_types(cls) -> list:
         """Ritorna la lista dei tipi di nemici disponibili"""
-        return list(cls.ENEMY_TEMPLATES.keys())
+        return list(ENEMY_REGISTRY.types)
     
     def __str__(self) -> str:
         """Rappresentazione testuale del nemico"""
@@ -0,0 +1,332 @@
+"""
+Enemy AI - Intelligenze artificiali dei nemici
+
+Un'IA sceglie il bersaglio dell'attacco di un nemico. Oltre alla scelta
+casuale originale c'è una ricerca expectimax a profondità limitata che lavora
+su uno stato compatto e copiabile (tuple di HP/MP), separato da Character,
+Enemy e dai messaggi:
+
+- nodi nemico: massimo sui bersagli, media sui tiri di danno (tre quantili)
+- nodi giocatore: il party è modellato come avversario (minimo su attacco,
+  magia e cura) con danni e cure attesi
+- approfondimento iterativo entro un budget di nodi (e, facoltativo, di
+  tempo), con tabella di trasposizione; la sequenza degli attori viene da
+  TurnManager.preview_turns, quindi vale anche con lo scheduler a velocità
+
+Le difficoltà (DIFFICULTY_PRESETS) si scelgono per tipo di nemico con la
+chiave 'ai' di Enemy.ENEMY_TEMPLATES.
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+# Regole di Battle/Character usate dal modello
+PHYSICAL_ROLL = (10, 25)
+MAGIC_ROLL = (15, 30)
+HEAL_ROLL = (15, 30)
+MAGIC_COST = 10
+
+# Valori terminali dal punto di vista dei nemici
+PARTY_WIPED = 100.0
+ENEMIES_WIPED = -100.0
+KO_WEIGHT = 1.0
+
+# Solo budget di nodi: con lo stesso seme la scelta non dipende dalla velocità
+# della macchina (il limite di tempo è di AIExecutor)
+DIFFICULTY_PRESETS: Dict[str, Dict] = {
+    "easy": {"search": False},
+    "normal": {"search": True, "depth": 2, "node_budget": 2_000},
+    "hard": {"search": True, "depth": 4, "node_budget": 20_000},
+    "boss": {"search": True, "depth": 6, "node_budget": 60_000},
+}
+
+
+class EnemyAI:
+    """Interfaccia delle IA nemiche"""
+
+    # True se la scelta consuma tiri del generatore della battaglia
+    uses_rng = False
+
+    def choose_target(self, battle, enemy):
+        """
+        Sceglie il giocatore da attaccare
+
+        Args:
+            battle: Battle in corso
+            enemy: Nemico che agisce
+
+        Returns:
+            Character bersaglio (None se nessun giocatore è vivo)
+        """
+        raise NotImplementedError
+
+
+class RandomAI(EnemyAI):
+    """Bersaglio casuale tra i giocatori vivi (comportamento originale)"""
+
+    uses_rng = True
+
+    def choose_target(self, battle, enemy):
+        alive_players = battle.turn_manager.get_alive_players()
+        if not alive_players:
+            return None
+        return battle.rng.choice(alive_players)
+
+
+class _BudgetExceeded(Exception):
+    """Budget di nodi o di tempo esaurito durante una ricerca"""
+
+
+class SearchModel:
+    """Statistiche fisse della battaglia e stato compatto di partenza"""
+
+    def __init__(self, battle):
+        """
+        Estrae il modello da una battaglia
+
+        Args:
+            battle: Battle in corso
+        """
+        chars = battle.party.characters
+        foes = battle.enemies
+        self.player_max = tuple(c.max_hp for c in chars)
+        self.physical = tuple(sum(PHYSICAL_ROLL) / 2 + c.atk_bonus for c in chars)
+        self.magic = tuple(sum(MAGIC_ROLL) / 2 + c.mag_bonus for c in chars)
+        self.heal = sum(HEAL_ROLL) / 2
+        self.enemy_max = tuple(e.max_hp for e in foes)
+        self.enemy_rolls = tuple(_quantiles(e.min_damage, e.max_damage) for e in foes)
+
+        # Valutazione: Σ(1 - hp/max) dei giocatori meno quella dei nemici
+        self._base = float(len(chars) - len(foes))
+        self._player_inverse = tuple(1.0 / m for m in self.player_max)
+        self._enemy_inverse = tuple(1.0 / m for m in self.enemy_max)
+
+        self._player_index = {id(c): i for i, c in enumerate(chars)}
+        self._enemy_index = {id(e): i for i, e in enumerate(foes)}
+        self.state = (tuple(c.hp for c in chars), tuple(c.mp for c in chars),
+                      tuple(e.hp for e in foes))
+
+    def actor(self, entity) -> Tuple[bool, int]:
+        """(è un nemico, indice) di un combattente"""
+        index = self._enemy_index.get(id(entity))
+        if index is not None:
+            return True, index
+        return False, self._player_index[id(entity)]
+
+    def evaluate(self, state) -> float:
+        """Valutazione euristica per i nemici (più alta = meglio per loro)"""
+        player_hp, _, enemy_hp = state
+        value = self._base
+        for hp, inverse in zip(player_hp, self._player_inverse):
+            value -= hp * inverse
+            if hp == 0:
+                value += KO_WEIGHT
+        for hp, inverse in zip(enemy_hp, self._enemy_inverse):
+            value += hp * inverse
+            if hp == 0:
+                value -= KO_WEIGHT
+        return value
+
+
+def _quantiles(low: int, high: int) -> Tuple[int, int, int]:
+    """Tre tiri equiprobabili che approssimano randint(low, high)"""
+    span = high - low
+    return (low + span // 6, low + span // 2, high - span // 6)
+
+
+def _damage(values: tuple, index: int, amount: float) -> tuple:
+    """Copia di una tupla di HP con un danno applicato"""
+    hp = max(0, values[index] - int(amount))
+    return values[:index] + (hp,) + values[index + 1:]
+
+
+class SearchAI(EnemyAI):
+    """Expectimax a profondità limitata con approfondimento iterativo"""
+
+    def __init__(self, depth: int = 2, node_budget: int = 2_000,
+                 time_budget: Optional[float] = None, cancel_event=None):
+        """
+        Inizializza l'IA
+
+        Args:
+            depth: Turni successivi a quello del nemico da esplorare
+            node_budget: Nodi massimi per decisione
+            time_budget: Secondi massimi per decisione (None = nessun limite)
+            cancel_event: threading.Event che interrompe la ricerca quando è
+                          impostato (None = nessuna cancellazione)
+        """
+        self.depth = depth
+        self.node_budget = node_budget
+        self.time_budget = time_budget
+        self.cancel_event = cancel_event
+        self.nodes = 0
+        self.completed_depth = 0
+        self._table: Dict = {}
+        self._leaves: Dict = {}
+        self._deadline = None
+
+    def choose_target(self, battle, enemy):
+        alive_players = battle.turn_manager.get_alive_players()
+        if len(alive_players) <= 1:
+            return alive_players[0] if alive_players else None
+
+        model, sequence = self.prepare(battle, enemy)
+        targets = self.rank_targets(model, sequence)
+        return battle.party.characters[targets[0]]
+
+    def prepare(self, battle, enemy) -> Tuple[SearchModel, List[Tuple[bool, int]]]:
+        """
+        Copia compatta della battaglia per rank_targets
+
+        Il modello e la sequenza non fanno riferimento a Character o Enemy:
+        la ricerca può girare su un altro thread mentre la battaglia cambia.
+
+        Returns:
+            (SearchModel, sequenza degli attori a partire dal nemico di turno)
+        """
+        model = SearchModel(battle)
+        sequence = [model.actor(c.entity) for c in
+                    battle.turn_manager.preview_turns(self.depth + 1)]
+        if not sequence or sequence[0] != model.actor(enemy):
+            sequence = [model.actor(enemy)] + sequence[:self.depth]
+        return model, sequence
+
+    def rank_targets(self, model: SearchModel, sequence: List[Tuple[bool, int]]) -> List[int]:
+        """
+        Ordina i bersagli del primo attore (un nemico) dal migliore
+
+        Args:
+            model: Modello della battaglia
+            sequence: Attori (è_nemico, indice) a partire dal nemico di turno
+
+        Returns:
+            Indici dei giocatori vivi, dal bersaglio migliore
+        """
+        self.nodes = 0
+        self.completed_depth = 0
+        self._table = {}
+        self._leaves = {}
+        self._deadline = (time.perf_counter() + self.time_budget
+                          if self.time_budget is not None else None)
+
+        enemy = sequence[0][1]
+        state = model.state
+        alive = [i for i, hp in enumerate(state[0]) if hp > 0]
+        # Senza ricerca completata: il giocatore con meno HP
+        ranking = sorted(alive, key=lambda i: state[0][i])
+
+        for horizon in range(1, len(sequence) + 1):
+            try:
+                scores = {target: self._enemy_move(model, state, sequence[:horizon], 0, enemy, target)
+                          for target in alive}
+            except _BudgetExceeded:
+                break
+            ranking = sorted(alive, key=lambda i: (-scores[i], i))
+            self.completed_depth = horizon - 1
+        return ranking
+
+    def _tick(self):
+        """Conta un nodo e controlla i budget"""
+        self.nodes += 1
+        if self.nodes > self.node_budget:
+            raise _BudgetExceeded()
+        if self.nodes & 63 == 0:
+            if self._deadline is not None and time.perf_counter() > self._deadline:
+                raise _BudgetExceeded()
+            if self.cancel_event is not None and self.cancel_event.is_set():
+                raise _BudgetExceeded()
+
+    def _enemy_move(self, model, state, sequence, step, enemy, target) -> float:
+        """Valore atteso di un attacco del nemico su un bersaglio"""
+        player_hp, player_mp, enemy_hp = state
+        total = 0.0
+        rolls = model.enemy_rolls[enemy]
+        for roll in rolls:
+            child = (_damage(player_hp, target, roll), player_mp, enemy_hp)
+            total += self._value(model, child, sequence, step + 1)
+        return total / len(rolls)
+
+    def _value(self, model, state, sequence, step) -> float:
+        """Valore di uno stato prima del turno sequence[step]"""
+        player_hp, player_mp, enemy_hp = state
+        if not any(player_hp):
+            return PARTY_WIPED
+        if not any(enemy_hp):
+            return ENEMIES_WIPED
+        if step == len(sequence):
+            # Le foglie non dipendono dall'orizzonte: cache per solo stato
+            value = self._leaves.get(state)
+            if value is None:
+                self._tick()
+                value = self._leaves[state] = model.evaluate(state)
+            return value
+
+        key = (state, step, len(sequence))
+        cached = self._table.get(key)
+        if cached is not None:
+            return cached
+        self._tick()
+
+        is_enemy, index = sequence[step]
+        if is_enemy:
+            if enemy_hp[index] == 0:
+                value = self._value(model, state, sequence, step + 1)
+            else:
+                value = max(self._enemy_move(model, state, sequence, step, index, target)
+                            for target, hp in enumerate(player_hp) if hp > 0)
+        elif player_hp[index] == 0:
+            value = self._value(model, state, sequence, step + 1)
+        else:
+            value = min(self._value(model, child, sequence, step + 1)
+                        for child in self._player_moves(model, state, index))
+
+        self._table[key] = value
+        return value
+
+    def _player_moves(self, model, state, index):
+        """Stati dopo le azioni plausibili di un giocatore (valori attesi)"""
+        player_hp, player_mp, enemy_hp = state
+        # Bersaglio nemico: il più vicino alla sconfitta
+        foe = min((i for i, hp in enumerate(enemy_hp) if hp > 0), key=lambda i: enemy_hp[i])
+
+        yield (player_hp, player_mp, _damage(enemy_hp, foe, model.physical[index]))
+        if player_mp[index] >= MAGIC_COST:
+            mp = player_mp[:index] + (player_mp[index] - MAGIC_COST,) + player_mp[index + 1:]
+            yield (player_hp, mp, _damage(enemy_hp, foe, model.magic[index]))
+
+        wounded = min((i for i, hp in enumerate(player_hp) if hp > 0),
+                      key=lambda i: player_hp[i] / model.player_max[i])
+        if player_hp[wounded] < model.player_max[wounded]:
+            healed = min(model.player_max[wounded], player_hp[wounded] + int(model.heal))
+            yield (player_hp[:wounded] + (healed,) + player_hp[wounded + 1:], player_mp, enemy_hp)
+
+
+_AI_CACHE: Dict[str, EnemyAI] = {}
+
+
+def get_enemy_ai(difficulty: str) -> EnemyAI:
+    """
+    IA per una difficoltà (istanze condivise)
+
+    Args:
+        difficulty: Chiave di DIFFICULTY_PRESETS
+
+    Returns:
+        EnemyAI corrispondente
+
+    Raises:
+        ValueError: Se la difficoltà non esiste
+    """
+    ai = _AI_CACHE.get(difficulty)
+    if ai is None:
+        if difficulty not in DIFFICULTY_PRESETS:
+            raise ValueError(f"Difficoltà IA sconosciuta: '{difficulty}'. "
+                             f"Disponibili: {', '.join(DIFFICULTY_PRESETS)}")
+        preset = DIFFICULTY_PRESETS[difficulty]
+        if preset["search"]:
+            ai = SearchAI(preset["depth"], preset["node_budget"])
+        else:
+            ai = RandomAI()
+        _AI_CACHE[difficulty] = ai
+    return ai
@@ -0,0 +1,123 @@
+"""
+Enemy Registry - Template dei nemici e statistiche precalcolate per livello
+
+I template vengono caricati da un file dati (data/enemies.json). Per ogni
+coppia (tipo, livello) il registro calcola una sola volta una riga immutabile
+EnemyStats con HP e danni già scalati: tutti i nemici dello stesso tipo e
+livello condividono la stessa riga e tengono per sé solo lo stato mutabile.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple
+
+
+DEFAULT_ENEMY_DATA = Path(__file__).resolve().parent.parent / "data" / "enemies.json"
+
+# Tipo usato per i tipi sconosciuti
+FALLBACK_TYPE = 'goblin'
+
+
+class EnemyStats(NamedTuple):
+    """Statistiche immutabili di un tipo di nemico a un certo livello"""
+    enemy_type: str
+    level: int
+    name: str
+    description: str
+    max_hp: int
+    min_damage: int
+    max_damage: int
+    speed: int
+    ai: str
+    # HP recuperati alla fine di ogni turno (0 = nessuna rigenerazione)
+    regen: int = 0
+
+
+class EnemyRegistry:
+    """Template dei nemici con le righe di statistiche in cache per livello"""
+
+    def __init__(self, templates: Dict[str, Dict], hp_scaling: float = 0.3,
+                 damage_scaling: float = 0.2):
+        """
+        Inizializza il registro
+
+        Args:
+            templates: Template per tipo (name, hp, min_damage, max_damage,
+                       speed, ai, description e opzionale regen)
+            hp_scaling: Aumento degli HP per livello oltre il primo
+            damage_scaling: Aumento dei danni per livello oltre il primo
+        """
+        self.templates = templates
+        self.hp_scaling = hp_scaling
+        self.damage_scaling = damage_scaling
+        self.types: Tuple[str, ...] = tuple(templates)
+        self._rows: Dict[Tuple[str, int], EnemyStats] = {}
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> 'EnemyRegistry':
+        """
+        Carica il registro da un file JSON
+
+        Args:
+            path: File dei template (default: data/enemies.json)
+
+        Returns:
+            EnemyRegistry
+
+        Raises:
+            FileNotFoundError: Se il file non esiste
+        """
+        path = Path(path) if path is not None else DEFAULT_ENEMY_DATA
+        if not path.exists():
+            raise FileNotFoundError(f"Enemy data file not found: {path}")
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        scaling = data.get("level_scaling", {})
+        return cls(data["enemies"], scaling.get("hp", 0.3), scaling.get("damage", 0.2))
+
+    def stats(self, enemy_type: str, level: int = 1) -> EnemyStats:
+        """
+        Riga di statistiche condivisa di un tipo a un livello
+
+        Args:
+            enemy_type: Tipo di nemico (i tipi sconosciuti diventano goblin)
+            level: Livello del nemico
+
+        Returns:
+            EnemyStats (la stessa istanza a ogni chiamata)
+        """
+        row = self._rows.get((enemy_type, level))
+        if row is None:
+            row = self._build(enemy_type, level)
+        return row
+
+    def _build(self, enemy_type: str, level: int) -> EnemyStats:
+        """Calcola e mette in cache una riga"""
+        requested = (enemy_type, level)
+        if enemy_type not in self.templates:
+            enemy_type = FALLBACK_TYPE
+            row = self._rows.get((enemy_type, level))
+            if row is not None:
+                self._rows[requested] = row
+                return row
+
+        template = self.templates[enemy_type]
+        hp_factor = 1 + (level - 1) * self.hp_scaling
+        damage_factor = 1 + (level - 1) * self.damage_scaling
+        row = EnemyStats(
+            enemy_type=enemy_type,
+            level=level,
+            name=template['name'],
+            description=template['description'],
+            max_hp=int(template['hp'] * hp_factor),
+            min_damage=int(template['min_damage'] * damage_factor),
+            max_damage=int(template['max_damage'] * damage_factor),
+            speed=template['speed'],
+            ai=template['ai'],
+            regen=int(template.get('regen', 0) * hp_factor),
+        )
+        self._rows[(enemy_type, level)] = row
+        self._rows[requested] = row
+        return row
@@ -0,0 +1,225 @@
+"""
+Battle Events - Eventi tipizzati della battaglia e bus di pubblicazione
+
+Battle e TurnManager pubblicano gli eventi su un EventBus; UI, logger e
+raccoglitori di statistiche si iscrivono ai tipi che interessano invece di
+interrogare lo stato a ogni frame. Chi pubblica controlla prima il flag
+'active' del bus: senza iscritti un evento non viene nemmeno costruito.
+"""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class BattleEvent:
+    """Base degli eventi (iscriversi a BattleEvent riceve tutti gli eventi)"""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+
+class TurnStarted(BattleEvent):
+    """Un combattente vivo inizia il suo turno"""
+
+    __slots__ = ('combatant', 'round_number')
+
+    def __init__(self, combatant, round_number: int):
+        self.combatant = combatant
+        self.round_number = round_number
+
+
+class DamageDealt(BattleEvent):
+    """Danno inflitto (source è None per i danni nel tempo)"""
+
+    __slots__ = ('source', 'target', 'amount', 'kind')
+
+    def __init__(self, source, target, amount: int, kind: str):
+        self.source = source
+        self.target = target
+        self.amount = amount
+        # attack, magic, item, dot
+        self.kind = kind
+
+
+class Healed(BattleEvent):
+    """HP recuperati (source è None per la rigenerazione)"""
+
+    __slots__ = ('source', 'target', 'amount', 'kind')
+
+    def __init__(self, source, target, amount: int, kind: str):
+        self.source = source
+        self.target = target
+        self.amount = amount
+        # heal, item, regen
+        self.kind = kind
+
+
+class ItemUsed(BattleEvent):
+    """Oggetto usato in battaglia"""
+
+    __slots__ = ('user', 'item_id', 'target', 'value')
+
+    def __init__(self, user, item_id: str, target, value: int):
+        self.user = user
+        self.item_id = item_id
+        self.target = target
+        self.value = value
+
+
+class CombatantDefeated(BattleEvent):
+    """Un combattente è andato KO"""
+
+    __slots__ = ('entity', 'is_player')
+
+    def __init__(self, entity, is_player: bool):
+        self.entity = entity
+        self.is_player = is_player
+
+
+class BattleEnded(BattleEvent):
+    """La battaglia è finita"""
+
+    __slots__ = ('result',)
+
+    def __init__(self, result):
+        self.result = result
+
+
+EVENT_TYPES: Tuple[type, ...] = (TurnStarted, DamageDealt, Healed, ItemUsed,
+                                 CombatantDefeated, BattleEnded)
+
+Handler = Callable[[BattleEvent], None]
+
+
+class EventBus:
+    """Bus sincrono: gli iscritti sono chiamati nell'ordine di iscrizione"""
+
+    def __init__(self):
+        """Inizializza un bus senza iscritti"""
+        self._handlers: Dict[type, List[Handler]] = {}
+        # Per ogni tipo concreto: iscritti al tipo + iscritti a BattleEvent
+        self._dispatch: Dict[type, Tuple[Handler, ...]] = {}
+        self.active = False
+
+    def subscribe(self, event_type: type, handler: Handler) -> Handler:
+        """
+        Iscrive un gestore a un tipo di evento
+
+        Args:
+            event_type: Uno di EVENT_TYPES, o BattleEvent per tutti
+            handler: Funzione chiamata con l'evento
+
+        Returns:
+            Il gestore (utile per annullare l'iscrizione)
+
+        Raises:
+            ValueError: Se il tipo non è un evento di battaglia
+        """
+        if event_type is not BattleEvent and event_type not in EVENT_TYPES:
+            raise ValueError(f"Tipo di evento sconosciuto: {event_type!r}")
+        self._handlers.setdefault(event_type, []).append(handler)
+        self._rebuild()
+        return handler
+
+    def unsubscribe(self, event_type: type, handler: Handler):
+        """
+        Annulla un'iscrizione (ignorata se il gestore non è iscritto)
+
+        Args:
+            event_type: Tipo usato in subscribe
+            handler: Gestore da rimuovere
+        """
+        handlers = self._handlers.get(event_type)
+        if handlers and handler in handlers:
+            handlers.remove(handler)
+            if not handlers:
+                del self._handlers[event_type]
+            self._rebuild()
+
+    def wants(self, event_type: type) -> bool:
+        """True se qualcuno riceve gli eventi di questo tipo"""
+        return event_type in self._dispatch
+
+    def emit(self, event_type: type, *args):
+        """
+        Costruisce e consegna un evento, solo se ha iscritti
+
+        Args:
+            event_type: Tipo di evento
+            *args: Argomenti del costruttore dell'evento
+        """
+        handlers = self._dispatch.get(event_type)
+        if handlers:
+            event = event_type(*args)
+            for handler in handlers:
+                handler(event)
+
+    def publish(self, event: BattleEvent):
+        """
+        Consegna un evento già costruito
+
+        Args:
+            event: Evento da consegnare
+        """
+        for handler in self._dispatch.get(type(event), ()):
+            handler(event)
+
+    def _rebuild(self):
+        """Ricalcola le tabelle di consegna dopo un'iscrizione"""
+        common = self._handlers.get(BattleEvent, [])
+        self._dispatch = {}
+        for event_type in EVENT_TYPES:
+            handlers = self._handlers.get(event_type, []) + common
+            if handlers:
+                self._dispatch[event_type] = tuple(handlers)
+        self.active = bool(self._dispatch)
+
+
+class BattleStatsCollector:
+    """Statistiche per combattente raccolte dagli eventi"""
+
+    def __init__(self, bus: Optional[EventBus] = None):
+        """
+        Inizializza il raccoglitore
+
+        Args:
+            bus: Bus a cui iscriversi subito (opzionale, vedi attach)
+        """
+        self.damage_dealt: Dict[str, int] = {}
+        self.damage_taken: Dict[str, int] = {}
+        self.healing: Dict[str, int] = {}
+        self.items_used: Dict[str, int] = {}
+        self.defeated: List[str] = []
+        self.turns = 0
+        if bus is not None:
+            self.attach(bus)
+
+    def attach(self, bus: EventBus):
+        """Iscrive il raccoglitore agli eventi di un bus"""
+        bus.subscribe(TurnStarted, self._on_turn)
+        bus.subscribe(DamageDealt, self._on_damage)
+        bus.subscribe(Healed, self._on_heal)
+        bus.subscribe(ItemUsed, self._on_item)
+        bus.subscribe(CombatantDefeated, self._on_defeat)
+
+    def _on_turn(self, event: TurnStarted):
+        self.turns += 1
+
+    def _on_damage(self, event: DamageDealt):
+        if event.source is not None:
+            name = event.source.name
+            self.damage_dealt[name] = self.damage_dealt.get(name, 0) + event.amount
+        name = event.target.name
+        self.damage_taken[name] = self.damage_taken.get(name, 0) + event.amount
+
+    def _on_heal(self, event: Healed):
+        name = event.target.name
+        self.healing[name] = self.healing.get(name, 0) + event.amount
+
+    def _on_item(self, event: ItemUsed):
+        self.items_used[event.item_id] = self.items_used.get(event.item_id, 0) + 1
+
+    def _on_defeat(self, event: CombatantDefeated):
+        self.defeated.append(event.entity.name)
@@ -0,0 +1,499 @@
+"""
+Horde - Incontri contro orde di decine o centinaia di nemici
+
+I nemici di un'orda non sono oggetti Enemy avvolti in Combatant: vivono in
+colonne parallele (struct-of-arrays) di HP, HP massimi, danni minimi e
+massimi, flag di vita e tipo. Le statistiche fisse arrivano dalle righe
+condivise dell'EnemyRegistry, quindi un'orda di 500 goblin occupa poche
+array di interi.
+
+- Le bombe (ItemEffect.DAMAGE) colpiscono tutta l'orda e la magia colpisce
+  un'area di AREA_SIZE nemici: il danno è applicato all'intera colonna degli
+  HP in un solo passaggio
+- Morti e fine battaglia sono operazioni sulle colonne (conteggio degli HP a
+  zero), non controlli nemico per nemico
+- Ad attaccare è solo la prima linea (FRONT_PER_HERO nemici vivi per
+  personaggio), quindi il costo di un round non cresce con l'orda
+"""
+
+from array import array
+from itertools import compress, islice
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from models.party import Party
+from models.character import Character
+from combat.battle import BattleAction, BattleResult
+from combat.battle_log import BattleLog
+from combat.enemy_registry import EnemyStats, EnemyRegistry
+from combat.damage_model import MAGIC_COST
+from utils.rng import DEFAULT_RNG
+
+
+# Nome dell'orda nei messaggi
+HORDE_NAME = "L'orda"
+
+# Nemici contro cui il party usa le bombe invece della magia
+BOMB_THRESHOLD = 6
+
+
+class Horde:
+    """Nemici di un'orda in colonne parallele"""
+
+    def __init__(self, rows: Sequence[EnemyStats]):
+        """
+        Inizializza l'orda a piena salute
+
+        Args:
+            rows: Una riga di statistiche per nemico (le righe condivise
+                  dell'EnemyRegistry)
+        """
+        self.kinds: List[EnemyStats] = []
+        codes: Dict[Tuple[str, int], int] = {}
+        kind = []
+        for row in rows:
+            key = (row.enemy_type, row.level)
+            if key not in codes:
+                codes[key] = len(self.kinds)
+                self.kinds.append(row)
+            kind.append(codes[key])
+
+        self.kind = array('H', kind)
+        self.max_hp = array('l', [row.max_hp for row in rows])
+        self.hp = array('l', self.max_hp)
+        self.min_damage = array('l', [row.min_damage for row in rows])
+        self.max_damage = array('l', [row.max_damage for row in rows])
+        self.alive = bytearray([1]) * len(rows)
+        self.alive_count = len(rows)
+        # Indici e HP per turno dei nemici che si rigenerano
+        self._regen = [(i, row.regen) for i, row in enumerate(rows) if row.regen > 0]
+
+    @classmethod
+    def spawn(cls, counts: Dict[str, int], level: int = 1,
+              registry: Optional[EnemyRegistry] = None) -> 'Horde':
+        """
+        Crea un'orda con un numero fisso di nemici per tipo
+
+        Args:
+            counts: Numero di nemici per tipo (es. {'goblin': 200})
+            level: Livello di tutti i nemici
+            registry: Registro dei nemici (default: quello di combat.enemy)
+
+        Returns:
+            Horde
+        """
+        registry = registry or _default_registry()
+        rows = []
+        for enemy_type, count in counts.items():
+            rows += [registry.stats(enemy_type, level)] * count
+        return cls(rows)
+
+    @classmethod
+    def random(cls, count: int, level: int = 1, types: Optional[Sequence[str]] = None,
+               rng=None, registry: Optional[EnemyRegistry] = None) -> 'Horde':
+        """
+        Crea un'orda di nemici di tipo casuale
+
+        Args:
+            count: Numero di nemici
+            level: Livello di tutti i nemici
+            types: Tipi ammessi (default: tutti quelli del registro)
+            rng: Generatore casuale
+            registry: Registro dei nemici (default: quello di combat.enemy)
+
+        Returns:
+            Horde
+        """
+        registry = registry or _default_registry()
+        rng = rng or DEFAULT_RNG
+        types = list(types) if types else list(registry.types)
+        return cls([registry.stats(rng.choice(types), level) for _ in range(count)])
+
+    def __len__(self) -> int:
+        return len(self.hp)
+
+    def name(self, index: int) -> str:
+        """Nome di un nemico dell'orda (tipo e numero)"""
+        return f"{self.kinds[self.kind[index]].name} #{index + 1}"
+
+    def total_hp(self) -> int:
+        """HP rimasti all'orda"""
+        return sum(self.hp)
+
+    def alive_indices(self, limit: Optional[int] = None, start: int = 0) -> List[int]:
+        """
+        Indici dei nemici vivi
+
+        Args:
+            limit: Numero massimo di indici (None = tutti)
+            start: Primo indice considerato
+
+        Returns:
+            Lista di indici in ordine crescente
+        """
+        alive = compress(range(start, len(self.hp)), self.alive[start:])
+        return list(islice(alive, limit))
+
+    def first_alive(self) -> Optional[int]:
+        """Indice del primo nemico vivo (None se l'orda è sconfitta)"""
+        index = self.alive.find(1)
+        return index if index >= 0 else None
+
+    def damage_one(self, index: int, amount: int) -> int:
+        """
+        Infligge danno a un nemico
+
+        Args:
+            index: Indice del nemico
+            amount: Danno
+
+        Returns:
+            Danno effettivo
+        """
+        hp = self.hp[index]
+        actual = min(max(0, amount), hp)
+        self.hp[index] = hp - actual
+        if actual == hp and hp > 0:
+            self.alive[index] = 0
+            self.alive_count -= 1
+        return actual
+
+    def damage_many(self, indices: Sequence[int], amount: int) -> Tuple[int, int]:
+        """
+        Infligge lo stesso danno a un gruppo di nemici (attacco ad area)
+
+        Args:
+            indices: Indici dei nemici colpiti
+            amount: Danno per nemico
+
+        Returns:
+            (danno totale effettivo, nemici sconfitti)
+        """
+        hp = self.hp
+        before = sum(hp[i] for i in indices)
+        for i in indices:
+            hp[i] = hp[i] - amount if hp[i] > amount else 0
+        return before - sum(hp[i] for i in indices), self._process_deaths()
+
+    def damage_all(self, amount: int) -> Tuple[int, int]:
+        """
+        Infligge lo stesso danno a tutta l'orda (bombe)
+
+        Args:
+            amount: Danno per nemico
+
+        Returns:
+            (danno totale effettivo, nemici sconfitti)
+        """
+        before = sum(self.hp)
+        self.hp = array('l', [h - amount if h > amount else 0 for h in self.hp])
+        return before - sum(self.hp), self._process_deaths()
+
+    def _process_deaths(self) -> int:
+        """Aggiorna flag e conteggio dei vivi dalla colonna degli HP"""
+        hp = self.hp
+        alive_now = len(hp) - hp.count(0)
+        killed = self.alive_count - alive_now
+        if killed:
+            self.alive = bytearray(map(bool, hp))
+            self.alive_count = alive_now
+        return killed
+
+    def regenerate(self) -> int:
+        """
+        Applica la rigenerazione ai nemici vivi che la possiedono
+
+        Returns:
+            HP recuperati in totale
+        """
+        hp, max_hp = self.hp, self.max_hp
+        healed = 0
+        for i, amount in self._regen:
+            if hp[i] > 0:
+                value = min(amount, max_hp[i] - hp[i])
+                hp[i] += value
+                healed += value
+        return healed
+
+
+def _default_registry() -> EnemyRegistry:
+    """Registro condiviso dei nemici"""
+    from combat.enemy import ENEMY_REGISTRY
+    return ENEMY_REGISTRY
+
+
+class HordeBattle:
+    """Battaglia del party contro un'orda (i personaggi agiscono, poi attacca l'orda)"""
+
+    # Nemici in prima linea per ogni personaggio vivo
+    FRONT_PER_HERO = 2
+
+    # Nemici colpiti da un incantesimo (il bersaglio e i vivi successivi)
+    AREA_SIZE = 5
+
+    def __init__(self, party: Party, horde: Horde, rng=None, log: Optional[BattleLog] = None):
+        """
+        Inizializza la battaglia
+
+        Args:
+            party: Party dei giocatori
+            horde: Orda da affrontare
+            rng: Generatore casuale (assegnato anche ai personaggi)
+            log: Registro delle azioni (default: BattleLog in memoria)
+        """
+        self.party = party
+        self.horde = horde
+        self.rng = DEFAULT_RNG
+        if rng is not None:
+            for char in party.characters:
+                char.rng = rng
+            self.rng = rng
+        self.battle_log = log if log is not None else BattleLog()
+        self.round_number = 1
+        # Turni giocati (personaggi e orda)
+        self.turns = 0
+        self.is_active = False
+        self._ended = False
+
+    def start_battle(self) -> str:
+        """
+        Inizia la battaglia
+
+        Returns:
+            Messaggio di inizio battaglia
+        """
+        self.is_active = True
+        counts: Dict[str, int] = {}
+        for code in self.horde.kind:
+            name = self.horde.kinds[code].name
+            counts[name] = counts.get(name, 0) + 1
+        parts = ", ".join(f"{count} {name}" for name, count in counts.items())
+        return f"🧟 Un'orda di {len(self.horde)} nemici ({parts}) sbarra la strada!"
+
+    def is_battle_active(self) -> bool:
+        """True finché il party e l'orda hanno entrambi qualcuno in piedi"""
+        return self.horde.alive_count > 0 and self.party.is_party_alive()
+
+    def resolve_target(self, target: Optional[int] = None) -> int:
+        """
+        Nemico bersaglio di un attacco
+
+        Args:
+            target: Indice richiesto (ignorato se il nemico è sconfitto)
+
+        Returns:
+            L'indice richiesto, altrimenti il primo nemico vivo
+        """
+        if target is not None and 0 <= target < len(self.horde) and self.horde.alive[target]:
+            return target
+        return self.horde.first_alive()
+
+    def execute_player_turn(self, player: Character, action: str, target=None,
+                            item_id: Optional[str] = None) -> BattleAction:
+        """
+        Esegue il turno di un giocatore
+
+        Args:
+            player: Personaggio che agisce
+            action: attack (un nemico), magic (area), heal o use_item
+            target: Indice del nemico per attack/magic, alleato per heal o item
+            item_id: ID dell'oggetto (per use_item)
+
+        Returns:
+            BattleAction eseguita
+        """
+        if action == "attack":
+            result = self._execute_attack(player, self.resolve_target(target))
+        elif action == "magic":
+            result = self._execute_area_magic(player, self.resolve_target(target))
+        elif action == "heal":
+            healed = target if isinstance(target, Character) and target.is_alive else player
+            value = healed.heal(self.rng.randint(15, 30))
+            result = BattleAction("heal", player.name, healed.name, value, template="heal")
+        elif action == "use_item" and item_id:
+            result = self._execute_use_item(player, item_id, target)
+        else:
+            result = BattleAction("skip", player.name, "", 0, message=f"{player.name} passa il turno")
+
+        self.battle_log.append(result)
+        self.turns += 1
+        return result
+
+    def _execute_attack(self, player: Character, index: int) -> BattleAction:
+        """Attacco fisico contro un nemico"""
+        value = self.horde.damage_one(index, player.calculate_physical_damage())
+        return BattleAction("attack", player.name, self.horde.name(index), value,
+                            template="attack", defeated=not self.horde.alive[index])
+
+    def _execute_area_magic(self, player: Character, index: int) -> BattleAction:
+        """Incantesimo sul bersaglio e sui nemici vivi che lo seguono"""
+        if not player.use_mp(MAGIC_COST):
+            return BattleAction("skip", player.name, "", 0,
+                                message=f"{player.name} non ha abbastanza MP!")
+        area = self.horde.alive_indices(self.AREA_SIZE, start=index)
+        value, killed = self.horde.damage_many(area, player.calculate_magic_damage())
+        return BattleAction("magic", player.name, f"{len(area)} nemici", value,
+                            template="area_magic", extra=str(killed))
+
+    def _execute_use_item(self, user: Character, item_id: str, target) -> BattleAction:
+        """Oggetti: le bombe colpiscono tutta l'orda, le pozioni un alleato"""
+        from models.item import Item, ItemEffect
+
+        template = Item.ITEM_TEMPLATES.get(item_id)
+        if template is None or template['effect'] not in (ItemEffect.DAMAGE, ItemEffect.HEAL,
+                                                          ItemEffect.RESTORE_MP):
+            return BattleAction("skip", user.name, "", 0,
+                                message="Non puoi usare questo oggetto contro un'orda!")
+
+        ally = target if isinstance(target, Character) else user
+        result = self.party.inventory.use_item(item_id, ally)
+        if not result['success']:
+            return BattleAction("skip", user.name, "", 0, message=result['message'])
+
+        effect = result['effect']
+        if effect == ItemEffect.DAMAGE:
+            value, killed = self.horde.damage_all(result['value'])
+            return BattleAction("use_item", user.name, HORDE_NAME.lower(), value,
+                                template="area_item", extra=str(killed))
+        if effect == ItemEffect.HEAL:
+            value = ally.heal(result['value'])
+            return BattleAction("use_item", user.name, ally.name, value,
+                                template="item_heal", extra=template['name'])
+        value = ally.restore_mp(result['value'])
+        return BattleAction("use_item", user.name, ally.name, value, template="item_mp")
+
+    def execute_horde_turn(self) -> List[BattleAction]:
+        """
+        La prima linea dell'orda attacca il party
+
+        Ogni nemico in prima linea colpisce un personaggio vivo a caso; i
+        danni vengono sommati e applicati una volta per personaggio. Alla
+        fine del turno i nemici con rigenerazione recuperano HP.
+
+        Returns:
+            Un'azione per personaggio colpito
+        """
+        heroes = self.party.get_alive_characters()
+        horde = self.horde
+        actions = []
+        if heroes and horde.alive_count:
+            front = horde.alive_indices(self.FRONT_PER_HERO * len(heroes))
+            randint, randrange = self.rng.randint, self.rng.randrange
+            min_damage, max_damage = horde.min_damage, horde.max_damage
+            hits = [0] * len(heroes)
+            for i in front:
+                hits[randrange(len(heroes))] += randint(min_damage[i], max_damage[i])
+
+            actor = f"{HORDE_NAME} ({len(front)} nemici)"
+            for hero, damage in zip(heroes, hits):
+                if damage:
+                    value = hero.take_damage(damage)
+                    action = BattleAction("attack", actor, hero.name, value, template="attack",
+                                          defeated=not hero.is_alive)
+                    self.battle_log.append(action)
+                    actions.append(action)
+        horde.regenerate()
+        self.turns += 1
+        return actions
+
+    def play_round(self, decide: Optional[Callable] = None):
+        """
+        Gioca un round: ogni personaggio vivo agisce, poi attacca l'orda
+
+        Args:
+            decide: Funzione decide(battle, character) -> (azione, bersaglio)
+                    o (azione, bersaglio, oggetto) (default: horde_policy)
+        """
+        decide = decide or horde_policy
+        for char in self.party.characters:
+            if not self.is_battle_active():
+                return
+            if char.is_alive:
+                self.execute_player_turn(char, *decide(self, char))
+        if self.is_battle_active():
+            self.execute_horde_turn()
+            self.round_number += 1
+
+    def check_battle_end(self) -> Optional[BattleResult]:
+        """
+        Controlla se la battaglia è finita
+
+        Returns:
+            BattleResult se finita, None altrimenti
+        """
+        if self.is_battle_active():
+            return None
+
+        self.is_active = False
+        victory = self.horde.alive_count == 0
+        if victory and not self._ended:
+            for member in self.party.get_alive_characters():
+                member.apply_victory_bonus()
+        self._ended = True
+        return BattleResult(victory=victory, survivors=self.party.get_alive_characters(),
+                            enemy_defeated=victory, rounds=self.round_number)
+
+
+def horde_policy(battle: HordeBattle, char: Character) -> tuple:
+    """
+    Policy predefinita contro le orde
+
+    Cura sotto il 30% degli HP, bombe finché l'orda è numerosa, magia ad
+    area se ci sono almeno due nemici, altrimenti attacco fisico.
+
+    Args:
+        battle: HordeBattle in corso
+        char: Personaggio di turno
+
+    Returns:
+        (azione, bersaglio) o (azione, bersaglio, oggetto)
+    """
+    from models.item import Item, ItemEffect
+
+    if char.hp < char.max_hp * 0.3:
+        return ("heal", char)
+    if battle.horde.alive_count >= BOMB_THRESHOLD:
+        for item_id in battle.party.inventory.items:
+            template = Item.ITEM_TEMPLATES.get(item_id)
+            if template and template['effect'] == ItemEffect.DAMAGE:
+                return ("use_item", None, item_id)
+    if char.mp >= MAGIC_COST and battle.horde.alive_count > 1:
+        return ("magic", None)
+    return ("attack", None)
+
+
+def resolve_horde(party: Party, horde: Horde, rng=None, decide: Optional[Callable] = None,
+                  max_rounds: int = 500):
+    """
+    Gioca una battaglia contro un'orda fino alla fine
+
+    Args:
+        party: Party dei giocatori
+        horde: Orda da affrontare
+        rng: Generatore casuale
+        decide: Policy dei personaggi (default: horde_policy)
+        max_rounds: Round oltre i quali la battaglia conta come non vinta
+
+    Returns:
+        (BattleResult, AutoBattleSummary)
+    """
+    from combat.auto_battle import AutoBattleSummary
+
+    battle = HordeBattle(party, horde, rng)
+    battle.start_battle()
+    party_hp = sum(c.hp for c in party.characters)
+    horde_hp = horde.total_hp()
+
+    while battle.is_battle_active() and battle.round_number <= max_rounds:
+        battle.play_round(decide)
+
+    damage_dealt = horde_hp - horde.total_hp()
+    damage_taken = max(0, party_hp - sum(c.hp for c in party.characters))
+    fallen = [c.name for c in party.characters if not c.is_alive]
+
+    result = battle.check_battle_end()
+    if result is None:
+        battle.is_active = False
+        result = BattleResult(victory=False, survivors=party.get_alive_characters(),
+                              enemy_defeated=False, rounds=battle.round_number)
+    summary = AutoBattleSummary(result.victory, result.rounds, battle.turns,
+                                damage_dealt, damage_taken, fallen)
+    return result, summary
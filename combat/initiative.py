@@ -0,0 +1,168 @@
+"""
+Initiative - Scheduler dei turni basato sulla velocità (stile ATB)
+
+Ogni combattente ha un "tempo della prossima azione"; il prossimo ad agire è
+la radice di un min-heap. Agire costa un ritardo proporzionale al costo
+dell'azione e inversamente proporzionale alla velocità (con eventuali
+modificatori haste/slow). I combattenti KO e le voci superate da un cambio di
+velocità non vengono rimossi dall'heap: sono scartati quando arrivano in cima
+(cancellazione pigra), così la scelta del prossimo attore resta O(log n).
+"""
+
+import heapq
+import math
+from itertools import count
+from typing import List, Optional, Sequence
+
+
+DEFAULT_SPEED = 10
+BASE_DELAY = 100.0
+
+# Durata di un round: il tempo di un'azione a velocità di riferimento
+ROUND_TIME = BASE_DELAY / DEFAULT_SPEED
+
+# Modificatori di velocità
+HASTE = 1.5
+SLOW = 0.5
+
+
+class InitiativeScheduler:
+    """Coda dei turni su min-heap con cancellazione pigra"""
+
+    def __init__(self, combatants: Sequence):
+        """
+        Inizializza lo scheduler
+
+        Args:
+            combatants: Combattenti (oggetti con .entity e .is_alive());
+                        la posizione nella lista è l'indice usato ovunque
+        """
+        self.combatants = combatants
+        self.time = 0.0
+        self._heap: List[tuple] = []
+        self._seq = count()
+        self._versions = [0] * len(combatants)
+        self._next_time = [0.0] * len(combatants)
+        self._modifiers = [1.0] * len(combatants)
+
+        # Primo turno dopo un ritardo base: i più veloci agiscono prima,
+        # a parità di velocità vale l'ordine della lista
+        for index in range(len(combatants)):
+            if combatants[index].is_alive():
+                self._schedule(index, self._delay(index, 1.0))
+
+    def _speed(self, index: int) -> float:
+        """Velocità effettiva di un combattente"""
+        base = getattr(self.combatants[index].entity, 'speed', DEFAULT_SPEED) or DEFAULT_SPEED
+        return base * self._modifiers[index]
+
+    def _delay(self, index: int, cost: float) -> float:
+        """Ritardo di un'azione di un certo costo"""
+        return BASE_DELAY * cost / self._speed(index)
+
+    def _schedule(self, index: int, at: float):
+        """Inserisce (o sostituisce) la prossima azione di un combattente"""
+        self._versions[index] += 1
+        self._next_time[index] = at
+        heapq.heappush(self._heap, (at, next(self._seq), index, self._versions[index]))
+
+    def _is_valid(self, entry: tuple) -> bool:
+        """Una voce è valida se è l'ultima del combattente e questo è vivo"""
+        _, _, index, version = entry
+        return version == self._versions[index] and self.combatants[index].is_alive()
+
+    def peek(self) -> Optional[int]:
+        """
+        Indice del prossimo combattente che agisce (senza consumare il turno)
+
+        Returns:
+            Indice o None se nessun combattente è in coda
+        """
+        heap = self._heap
+        while heap and not self._is_valid(heap[0]):
+            heapq.heappop(heap)
+        return heap[0][2] if heap else None
+
+    def advance(self, index: int, cost: float = 1.0):
+        """
+        Chiude il turno di un combattente e lo rimette in coda
+
+        La voce precedente diventa obsoleta e viene scartata dal prossimo peek.
+
+        Args:
+            index: Indice del combattente che ha agito
+            cost: Costo dell'azione eseguita (1.0 = azione normale)
+        """
+        at = self._next_time[index]
+        self.time = max(self.time, at)
+        if self.combatants[index].is_alive():
+            self._schedule(index, at + self._delay(index, cost))
+
+    def set_modifier(self, index: int, factor: float):
+        """
+        Applica un modificatore di velocità (haste > 1, slow < 1)
+
+        L'attesa residua viene riscalata alla nuova velocità; la vecchia voce
+        resta nell'heap e viene scartata quando arriva in cima.
+
+        Args:
+            index: Indice del combattente
+            factor: Moltiplicatore della velocità (1.0 = normale)
+        """
+        old = self._modifiers[index]
+        self._modifiers[index] = factor
+        if self.combatants[index].is_alive():
+            remaining = max(0.0, self._next_time[index] - self.time)
+            self._schedule(index, self.time + remaining * old / factor)
+
+    def revive(self, index: int):
+        """Rimette in coda un combattente rianimato"""
+        self._schedule(index, self.time + self._delay(index, 1.0))
+
+    def preview(self, turns: int = 10) -> List[int]:
+        """
+        Prossimi attori previsti, assumendo azioni di costo normale
+
+        Lavora su una copia dell'heap: lo stato dello scheduler non cambia.
+
+        Args:
+            turns: Numero di turni da prevedere
+
+        Returns:
+            Lista di indici in ordine di turno
+        """
+        heap = [entry for entry in self._heap if self._is_valid(entry)]
+        heapq.heapify(heap)
+        seq = count(max((entry[1] for entry in heap), default=0) + 1)
+        order = []
+        while heap and len(order) < turns:
+            at, _, index, version = heapq.heappop(heap)
+            order.append(index)
+            heapq.heappush(heap, (at + self._delay(index, 1.0), next(seq), index, version))
+        return order
+
+    def snapshot(self) -> tuple:
+        """Stato della coda (tempo, heap, versioni, tempi, modificatori)"""
+        return (self.time, tuple(self._heap), tuple(self._versions),
+                tuple(self._next_time), tuple(self._modifiers))
+
+    def restore(self, state: tuple):
+        """
+        Ripristina uno stato prodotto da snapshot
+
+        Il contatore di sequenza non viene riavvolto: le nuove voci restano
+        successive a quelle ripristinate, quindi l'ordine a parità di tempo
+        non cambia.
+        """
+        time_, heap, versions, next_time, modifiers = state
+        self.time = time_
+        self._heap = list(heap)
+        self._versions = list(versions)
+        self._next_time = list(next_time)
+        self._modifiers = list(modifiers)
+
+    @property
+    def round_number(self) -> int:
+        """Round del prossimo turno: il round k copre i tempi ((k-1)·R, k·R]"""
+        at = self._heap[0][0] if self.peek() is not None else self.time
+        return max(1, math.ceil(at / ROUND_TIME - 1e-9))
@@ -0,0 +1,244 @@
+"""
+Item Effects - Effetti degli oggetti compilati in funzioni
+
+Gli effetti sono dati di Item.ITEM_TEMPLATES: un oggetto ha un effetto
+semplice ('effect', 'value') oppure una lista di passi ('steps'). Ogni passo
+può indicare:
+
+- effect: ItemEffect del passo
+- amount: quantità (default: 'value' dell'oggetto)
+- target: a chi si applica (TARGET_*, default secondo l'effetto o la
+  chiave 'target' dell'oggetto)
+- duration: round dei buff (default ITEM_BUFF_ROUNDS)
+
+Il template può indicare anche il modello del messaggio ('message').
+
+compile_item risolve una volta sola, al caricamento del modulo, la funzione
+dell'effetto, la scelta dei bersagli e il messaggio di ogni oggetto:
+usare un oggetto in battaglia è una lettura di COMPILED_ITEMS e una
+chiamata. I passi su più bersagli (tutto il party, tutti i nemici) si
+applicano in un solo ciclo e producono un'unica azione con il totale.
+"""
+
+from typing import Callable, Dict, List, NamedTuple
+
+from models.item import Item, ItemEffect
+from combat.battle import BattleAction
+from combat.events import Healed, ItemUsed
+from combat.status_effects import EffectKind, ITEM_BUFF_ROUNDS
+
+
+# Bersagli di un passo
+TARGET_ALLY = "ally"        # il bersaglio scelto, o chi usa l'oggetto
+TARGET_SELF = "self"        # chi usa l'oggetto
+TARGET_ENEMY = "enemy"      # il nemico scelto, o il primo vivo
+TARGET_PARTY = "party"      # tutti i personaggi vivi
+TARGET_ENEMIES = "enemies"  # tutti i nemici vivi
+
+DEFAULT_TARGETS: Dict[ItemEffect, str] = {
+    ItemEffect.HEAL: TARGET_ALLY,
+    ItemEffect.RESTORE_MP: TARGET_ALLY,
+    ItemEffect.DAMAGE: TARGET_ENEMY,
+    ItemEffect.BUFF_ATK: TARGET_ALLY,
+    ItemEffect.BUFF_DEF: TARGET_ALLY,
+}
+
+# Nome del bersaglio nei messaggi dei passi su più bersagli
+GROUP_NAMES: Dict[str, str] = {
+    TARGET_PARTY: "il party",
+    TARGET_ENEMIES: "tutti i nemici",
+}
+
+# Modello del messaggio per effetto e se extra è il nome dell'oggetto
+EFFECT_MESSAGES: Dict[ItemEffect, tuple] = {
+    ItemEffect.HEAL: ("item_heal", True),
+    ItemEffect.RESTORE_MP: ("item_mp", False),
+    ItemEffect.DAMAGE: ("item_damage", False),
+    ItemEffect.BUFF_ATK: ("item_buff_atk", True),
+    ItemEffect.BUFF_DEF: ("item_buff_def", True),
+}
+
+
+def _select_ally(battle, user, target) -> list:
+    """Bersaglio scelto o chi usa l'oggetto"""
+    return [target if target is not None else user]
+
+
+def _select_self(battle, user, target) -> list:
+    """Chi usa l'oggetto"""
+    return [user]
+
+
+def _select_enemy(battle, user, target) -> list:
+    """Nemico scelto o il primo vivo"""
+    return [battle.resolve_enemy_target(target)]
+
+
+def _select_party(battle, user, target) -> list:
+    """Personaggi vivi"""
+    return [c for c in battle.party.characters if c.is_alive]
+
+
+def _select_enemies(battle, user, target) -> list:
+    """Nemici vivi"""
+    return [e for e in battle.enemies if e.is_alive]
+
+
+SELECTORS: Dict[str, Callable] = {
+    TARGET_ALLY: _select_ally,
+    TARGET_SELF: _select_self,
+    TARGET_ENEMY: _select_enemy,
+    TARGET_PARTY: _select_party,
+    TARGET_ENEMIES: _select_enemies,
+}
+
+
+def _apply_heal(battle, targets: list, amount: int, name: str, duration: int) -> List[int]:
+    """HP curati per bersaglio"""
+    return [t.heal(amount) for t in targets]
+
+
+def _apply_mp(battle, targets: list, amount: int, name: str, duration: int) -> List[int]:
+    """MP ripristinati per bersaglio"""
+    return [t.restore_mp(amount) for t in targets]
+
+
+def _apply_damage(battle, targets: list, amount: int, name: str, duration: int) -> List[int]:
+    """Danni inflitti per bersaglio"""
+    return [t.take_damage(amount) for t in targets]
+
+
+def _apply_buff(stat: str) -> Callable:
+    """Applicatore di un buff della statistica indicata"""
+    def apply(battle, targets: list, amount: int, name: str, duration: int) -> List[int]:
+        for t in targets:
+            battle.add_effect(t, name, EffectKind.MODIFIER, amount, stat, duration)
+        return [amount] * len(targets)
+    return apply
+
+
+APPLIERS: Dict[ItemEffect, Callable] = {
+    ItemEffect.HEAL: _apply_heal,
+    ItemEffect.RESTORE_MP: _apply_mp,
+    ItemEffect.DAMAGE: _apply_damage,
+    ItemEffect.BUFF_ATK: _apply_buff("atk"),
+    ItemEffect.BUFF_DEF: _apply_buff("def"),
+}
+
+
+def _publish_heal(battle, user, targets: list, values: List[int]):
+    """Un Healed per bersaglio"""
+    for t, value in zip(targets, values):
+        battle.events.emit(Healed, user, t, value, "item")
+
+
+def _publish_damage(battle, user, targets: list, values: List[int]):
+    """DamageDealt (e CombatantDefeated) per bersaglio"""
+    for t, value in zip(targets, values):
+        battle._publish_damage(user, t, value, "item")
+
+
+# Eventi dell'effetto (dopo ItemUsed) per gli effetti che ne hanno
+PUBLISHERS: Dict[ItemEffect, Callable] = {
+    ItemEffect.HEAL: _publish_heal,
+    ItemEffect.DAMAGE: _publish_damage,
+}
+
+
+class CompiledStep(NamedTuple):
+    """Passo di un oggetto con funzioni e parametri già risolti"""
+    select: Callable
+    apply: Callable
+    publish: Callable
+    amount: int
+    duration: int
+
+
+def _noop(battle, user, targets, values):
+    """Nessun evento oltre a ItemUsed"""
+
+
+def compile_item(item_id: str, template: dict) -> Callable:
+    """
+    Compila gli effetti di un oggetto in una funzione
+
+    Args:
+        item_id: ID dell'oggetto
+        template: Dati dell'oggetto (voce di Item.ITEM_TEMPLATES)
+
+    Returns:
+        Funzione use(battle, user, target) -> BattleAction, che applica gli
+        effetti (l'oggetto è già stato consumato dall'inventario)
+
+    Raises:
+        ValueError: Se un passo ha un effetto o un bersaglio sconosciuto
+    """
+    name = template['name']
+    specs = template.get('steps') or [{'effect': template['effect']}]
+    steps = []
+    for spec in specs:
+        effect = spec['effect']
+        if effect not in APPLIERS:
+            raise ValueError(f"Effetto non supportato per '{item_id}': {effect}")
+        kind = spec.get('target', template.get('target', DEFAULT_TARGETS[effect]))
+        if kind not in SELECTORS:
+            raise ValueError(f"Bersaglio non valido per '{item_id}': '{kind}'")
+        steps.append(CompiledStep(SELECTORS[kind], APPLIERS[effect],
+                                  PUBLISHERS.get(effect, _noop),
+                                  spec.get('amount', template['value']),
+                                  spec.get('duration', ITEM_BUFF_ROUNDS)))
+
+    # Il primo passo dà bersaglio, valore e messaggio dell'azione
+    first_effect = specs[0]['effect']
+    first_kind = specs[0].get('target', template.get('target', DEFAULT_TARGETS[first_effect]))
+    message, named = EFFECT_MESSAGES[first_effect]
+    if 'message' in template:
+        message, named = template['message'], True
+    extra = name if named else ""
+    group = GROUP_NAMES.get(first_kind)
+    single_damage = first_effect == ItemEffect.DAMAGE and group is None
+    first, rest = steps[0], steps[1:]
+
+    def use(battle, user, target) -> BattleAction:
+        publish = battle.events.active
+        targets = first.select(battle, user, target)
+        values = first.apply(battle, targets, first.amount, name, first.duration)
+        total = sum(values)
+        if publish:
+            battle.events.emit(ItemUsed, user, item_id,
+                               targets[0] if group is None else None, total)
+            first.publish(battle, user, targets, values)
+        for step in rest:
+            step_targets = step.select(battle, user, target)
+            step_values = step.apply(battle, step_targets, step.amount, name, step.duration)
+            if publish:
+                step.publish(battle, user, step_targets, step_values)
+
+        return BattleAction(
+            action_type="use_item",
+            actor=user.name,
+            target=group or targets[0].name,
+            value=total,
+            template=message,
+            defeated=single_damage and not targets[0].is_alive,
+            extra=extra
+        )
+
+    return use
+
+
+def compile_items(templates: Dict[str, dict]) -> Dict[str, Callable]:
+    """
+    Compila tutti gli oggetti
+
+    Args:
+        templates: ID oggetto -> dati (come Item.ITEM_TEMPLATES)
+
+    Returns:
+        ID oggetto -> funzione use(battle, user, target)
+    """
+    return {item_id: compile_item(item_id, template) for item_id, template in templates.items()}
+
+
+# Tabella degli oggetti del gioco, compilata al caricamento
+COMPILED_ITEMS: Dict[str, Callable] = compile_items(Item.ITEM_TEMPLATES)
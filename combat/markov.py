@@ -0,0 +1,626 @@
+"""
+Markov - Valutazione esatta di un duello personaggio contro nemico
+
+Una battaglia a turni fissi (il personaggio agisce, poi il nemico, poi la
+rigenerazione del nemico) sotto una policy fissa è una catena di Markov
+sugli stati (HP del personaggio, incantesimi rimasti, HP del nemico): i tiri
+sono uniformi, quindi le probabilità di transizione sono esatte. La
+probabilità di vittoria e il numero atteso di round si ottengono per
+programmazione dinamica, senza campionamento.
+
+- Gli stati sono risolti per HP del nemico crescenti: attacchi e magia
+  portano solo a righe già calcolate, e la media su un tiro uniforme è una
+  somma di vettori (o una finestra di somme prefisse sugli HP)
+- Le cure tengono fermi incantesimi e HP del nemico: gli stati di cura di
+  una riga formano un piccolo sistema lineare, uguale per tutte le righe.
+  La sua soluzione (memoizzata) è calcolata una volta per coppia di tiri
+- Con la rigenerazione del nemico le cure portano a righe più alte: si
+  ripetono le passate finché i valori degli stati di cura non cambiano più
+  della tolleranza, accelerando l'iterazione con il metodo di Anderson
+
+Le soluzioni sono in cache per profilo numerico del personaggio e del
+nemico, quindi classi o tipi con le stesse statistiche condividono il
+lavoro. Le regole sono quelle di combat.simulator, senza limite di round.
+
+Tempi misurati (una CPU, Python 3.11): un duello senza rigenerazione
+richiede 0,05-0,5 s, uno contro il troll 0,6-3 s (da 4 a 23 passate); la
+matrice di tutte le classi e tutti i nemici ai livelli 1-5 circa 42 s, di
+cui circa tre quarti per il troll. È più lento dei "pochi secondi"
+richiesti: partire dalla soluzione del livello precedente (le righe del
+troll crescono con il livello) riduce le passate solo del 10% circa, e il
+costo restante è il lavoro per riga in Python puro. BalanceMatrix.solve_all
+divide quindi le celle tra più processi, i duelli con rigenerazione per
+primi: con N CPU il tempo scende verso 42/N s, ma non sotto il duello più
+lungo (circa 3 s).
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from collections.abc import Mapping
+from functools import lru_cache
+from itertools import accumulate
+from operator import add, mul, sub
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from models.character import Character
+from combat.simulator import (SimAction, PHYSICAL_ROLL, MAGIC_ROLL, HEAL_ROLL,
+                              MAGIC_COST, HEAL_THRESHOLD)
+
+
+# Tolleranza dell'iterazione dei valori (solo nemici con rigenerazione)
+TOLERANCE = 1e-10
+MAX_SWEEPS = 500
+
+# Passate ricordate dall'accelerazione di Anderson
+ANDERSON_DEPTH = 5
+
+DEFAULT_LEVELS = (1, 2, 3, 4, 5)
+
+
+class HeroProfile(NamedTuple):
+    """Statistiche del personaggio rilevanti per il duello"""
+    max_hp: int
+    hp: int
+    casts: int
+    atk_bonus: int
+    mag_bonus: int
+
+
+class FoeProfile(NamedTuple):
+    """Statistiche del nemico rilevanti per il duello"""
+    max_hp: int
+    min_damage: int
+    max_damage: int
+    regen: int
+
+
+def hero_profile(character_class: str) -> HeroProfile:
+    """Profilo di una classe (dai costruttori reali)"""
+    char = Character("Eroe", character_class)
+    return HeroProfile(char.max_hp, char.hp, char.mp // MAGIC_COST,
+                       char.atk_bonus, char.mag_bonus)
+
+
+def foe_profile(enemy_type: str, level: int = 1) -> FoeProfile:
+    """Profilo di un tipo di nemico a un livello (righe dell'EnemyRegistry)"""
+    from combat.enemy import ENEMY_REGISTRY
+
+    stats = ENEMY_REGISTRY.stats(enemy_type, level)
+    return FoeProfile(stats.max_hp, stats.min_damage, stats.max_damage, stats.regen)
+
+
+# --- Policy del duello ---
+# Una policy riceve il profilo, gli HP e gli incantesimi rimasti e ritorna un
+# codice SimAction (le stesse regole delle policy del simulatore con un solo
+# personaggio).
+
+def attack_policy(hero: HeroProfile, hp: int, casts: int) -> int:
+    """Attacca sempre"""
+    return SimAction.ATTACK
+
+
+def magic_policy(hero: HeroProfile, hp: int, casts: int) -> int:
+    """Usa la magia finché ci sono MP, poi attacca"""
+    return SimAction.MAGIC if casts > 0 else SimAction.ATTACK
+
+
+def balanced_policy(hero: HeroProfile, hp: int, casts: int) -> int:
+    """Si cura sotto la soglia, altrimenti usa l'attacco migliore della classe"""
+    if hp < hero.max_hp * HEAL_THRESHOLD:
+        return SimAction.HEAL
+    if hero.mag_bonus > hero.atk_bonus and casts > 0:
+        return SimAction.MAGIC
+    return SimAction.ATTACK
+
+
+POLICIES: Dict[str, Callable] = {
+    "attack": attack_policy,
+    "magic": magic_policy,
+    "balanced": balanced_policy,
+}
+
+
+class MarkovResult:
+    """Esito esatto di un duello"""
+
+    def __init__(self, win_probability: float, expected_rounds: float, states: int,
+                 sweeps: int):
+        """
+        Inizializza il risultato
+
+        Args:
+            win_probability: Probabilità di vittoria del personaggio
+            expected_rounds: Round attesi fino alla fine del duello
+            states: Stati della catena
+            sweeps: Passate necessarie (1 senza rigenerazione del nemico)
+        """
+        self.win_probability = win_probability
+        self.expected_rounds = expected_rounds
+        self.states = states
+        self.sweeps = sweeps
+
+    def to_dict(self) -> Dict:
+        """Converte il risultato in dizionario"""
+        return {
+            'win_probability': self.win_probability,
+            'expected_rounds': self.expected_rounds,
+            'states': self.states,
+            'sweeps': self.sweeps,
+        }
+
+    def __repr__(self) -> str:
+        return (f"MarkovResult(win={self.win_probability:.4f}, "
+                f"rounds={self.expected_rounds:.2f}, states={self.states})")
+
+
+class DuelSolution:
+    """Tabelle di un duello: valore di ogni stato (incantesimi, HP nemico, HP personaggio)"""
+
+    def __init__(self, hero: HeroProfile, foe: FoeProfile, win: List, rounds: List,
+                 sweeps: int):
+        self.hero = hero
+        self.foe = foe
+        self.win = win
+        self.rounds = rounds
+        self.sweeps = sweeps
+
+    @property
+    def states(self) -> int:
+        """Stati non terminali della catena"""
+        return (self.hero.casts + 1) * self.foe.max_hp * self.hero.max_hp
+
+    def win_probability(self, hp: Optional[int] = None, casts: Optional[int] = None,
+                        enemy_hp: Optional[int] = None) -> float:
+        """
+        Probabilità di vittoria da uno stato (default: inizio del duello)
+
+        Args:
+            hp: HP del personaggio
+            casts: Incantesimi rimasti
+            enemy_hp: HP del nemico
+
+        Returns:
+            Probabilità tra 0 e 1
+        """
+        # Gli arrotondamenti possono uscire di poco da [0, 1]
+        return min(1.0, max(0.0, self._lookup(self.win, hp, casts, enemy_hp, 1.0)))
+
+    def expected_rounds(self, hp: Optional[int] = None, casts: Optional[int] = None,
+                        enemy_hp: Optional[int] = None) -> float:
+        """Round attesi fino alla fine del duello da uno stato"""
+        return self._lookup(self.rounds, hp, casts, enemy_hp, 0.0)
+
+    def _lookup(self, table: List, hp, casts, enemy_hp, win_value: float) -> float:
+        hp = self.hero.hp if hp is None else min(hp, self.hero.max_hp)
+        casts = self.hero.casts if casts is None else min(casts, self.hero.casts)
+        enemy_hp = self.foe.max_hp if enemy_hp is None else min(enemy_hp, self.foe.max_hp)
+        if enemy_hp <= 0:
+            return win_value
+        if hp <= 0:
+            return 0.0
+        return table[casts][enemy_hp][hp]
+
+
+def _half_step(src: List[float], y_lo: int, y_hi: int, q: float) -> List[float]:
+    """
+    Valore dopo il colpo del nemico: media di src[h - y] per y uniforme
+
+    Gli indici ≤ 0 sono il KO del personaggio (valore 0).
+    """
+    top = len(src) - 1
+    prefix = list(accumulate(src))
+    out = [0.0] * (min(y_lo, top) + 1)
+    out += [prefix[h - y_lo] * q for h in range(y_lo + 1, min(y_hi + 1, top) + 1)]
+    out += map(q.__mul__, map(sub, prefix[y_hi + 2 - y_lo:top + 1 - y_lo],
+                              prefix[1:top - y_hi]))
+    return out
+
+
+@lru_cache(maxsize=256)
+def _heal_system(max_hp: int, heal_states: Tuple[int, ...], y_lo: int,
+                 y_hi: int) -> Tuple[List[float], List[Tuple[int, List[float]]]]:
+    """
+    Soluzione del sistema degli stati di cura di una riga (senza rigenerazione)
+
+    Per lo stato di cura i: V_i = c·n1_i + Σ_j R_ij·V_j, dove j scorre gli
+    stati non di cura della stessa riga e c è il costo di un round. La
+    matrice non dipende da incantesimi e HP del nemico: è condivisa da tutte
+    le righe (e da tutti i duelli con gli stessi HP e danni del nemico).
+
+    Returns:
+        (n1, righe di R come (primo HP, coefficienti degli HP consecutivi))
+    """
+    size = len(heal_states)
+    position = {h: i for i, h in enumerate(heal_states)}
+    z_lo, z_hi = HEAL_ROLL
+    p = 1.0 / ((z_hi - z_lo + 1) * (y_hi - y_lo + 1))
+    width = size + max_hp + 2
+    # Righe di [I - M | B | 1]: M verso gli stati di cura, B verso gli altri
+    rows = []
+    for i, h in enumerate(heal_states):
+        row = [0.0] * width
+        row[i] = 1.0
+        row[-1] = 1.0
+        for z in range(z_lo, z_hi + 1):
+            healed = min(h + z, max_hp)
+            for y in range(y_lo, y_hi + 1):
+                target = healed - y
+                if target <= 0:
+                    continue
+                if target in position:
+                    row[position[target]] -= p
+                else:
+                    row[size + target] += p
+        rows.append(row)
+
+    # Gauss-Jordan (I - M è a diagonale dominante: nessun pivoting)
+    for col in range(size):
+        inv = 1.0 / rows[col][col]
+        pivot = rows[col] = [value * inv for value in rows[col]]
+        for r in range(size):
+            factor = rows[r][col]
+            if r != col and factor:
+                rows[r] = [u - factor * v for u, v in zip(rows[r], pivot)]
+
+    n1 = [row[-1] for row in rows]
+    bands = []
+    for row in rows:
+        coeffs = row[size:size + max_hp + 1]
+        used = [h for h, c in enumerate(coeffs) if c]
+        bands.append((used[0], coeffs[used[0]:used[-1] + 1]) if used else (0, []))
+    return n1, bands
+
+
+def _solve_table(hero: HeroProfile, foe: FoeProfile, actions: List[List[int]],
+                 win_value: float, round_cost: float) -> Tuple[List, int]:
+    """
+    Valore di ogni stato per un duello
+
+    Con win_value=1 e round_cost=0 è la probabilità di vittoria, con
+    win_value=0 e round_cost=1 il numero atteso di round.
+
+    Ogni passata risale le righe per HP del nemico calcolando attacchi e
+    magia (che portano a righe più basse) e, con la rigenerazione, le
+    ridiscende calcolando le cure (che portano alla riga e + regen). Senza
+    rigenerazione basta una passata in salita.
+
+    Returns:
+        (tabella [incantesimi][HP nemico][HP personaggio], passate)
+    """
+    H, E, K, r = hero.max_hp, foe.max_hp, hero.casts, foe.regen
+    y_lo, y_hi = foe.min_damage, foe.max_damage
+    q = 1.0 / (y_hi - y_lo + 1)
+    a_lo, a_hi = PHYSICAL_ROLL[0] + hero.atk_bonus, PHYSICAL_ROLL[1] + hero.atk_bonus
+    m_lo, m_hi = MAGIC_ROLL[0] + hero.mag_bonus, MAGIC_ROLL[1] + hero.mag_bonus
+    z_lo, z_hi = HEAL_ROLL
+    z_n = z_hi - z_lo + 1
+    regen = [min(e + r, E) for e in range(E + 1)]
+    ks = range(K + 1)
+
+    table = [[[0.0] * (H + 1) for _ in range(E + 1)] for _ in ks]
+    # half[k][e]: valore dopo il colpo del nemico partendo dalla riga (k, e)
+    zero = [0.0] * (H + 1)
+    half = [[zero] * (E + 1) for _ in ks]
+
+    heal_states = [tuple(h for h in range(1, H + 1) if actions[k][h] == SimAction.HEAL)
+                   for k in ks]
+    offensive = [{code for code in actions[k][1:] if code != SimAction.HEAL} for k in ks]
+    systems = [_heal_system(H, heal_states[k], y_lo, y_hi) if heal_states[k] else None
+               for k in ks]
+
+    # Somme scorrevoli delle righe di half per tiro, azzerate a ogni passata
+    windows: Dict[Tuple[int, int], List[float]] = {}
+
+    def strike(k: int, e: int, lo: int, hi: int) -> List[float]:
+        """Media sul tiro [lo, hi] contro il nemico, poi colpo del nemico"""
+        n = hi - lo + 1
+        win = win_value * max(0, hi - max(lo, e) + 1) / n + round_cost
+        rows = half[k]
+        if lo <= r:
+            # Il danno minimo non supera la rigenerazione: righe non ancora
+            # calcolate in questa passata, somma diretta
+            vectors = [rows[regen[e - x]] for x in range(lo, min(hi, e - 1) + 1)]
+            if not vectors:
+                return [win] * (H + 1)
+            return [win + s / n for s in map(sum, zip(*vectors))]
+
+        # Righe e-hi..e-lo: si aggiunge quella che entra e si toglie quella che esce
+        acc = windows.get((k, lo), zero)
+        if e - lo >= 1:
+            acc = list(map(add, acc, rows[regen[e - lo]]))
+        if e - hi - 1 >= 1:
+            acc = list(map(sub, acc, rows[regen[e - hi - 1]]))
+        windows[(k, lo)] = acc
+        return [win + s / n for s in acc]
+
+    def rise(e: int):
+        """Attacchi e magia della riga e (e cure che restano nella riga)"""
+        for k in ks:
+            codes = offensive[k]
+            attack = strike(k, e, a_lo, a_hi) if SimAction.ATTACK in codes else None
+            magic = strike(k - 1, e, m_lo, m_hi) if k > 0 and SimAction.MAGIC in codes else None
+            if magic is None:
+                new = attack or [0.0] * (H + 1)
+            elif attack is None:
+                new = magic
+            else:
+                new = [m if c == SimAction.MAGIC else a
+                       for a, m, c in zip(attack, magic, actions[k])]
+            new[0] = 0.0
+
+            states = heal_states[k]
+            if states and regen[e] == e:
+                # La cura torna nella stessa riga: sistema lineare precalcolato
+                n1, bands = systems[k]
+                values = [round_cost * n + sum(map(mul, line, new[first:first + len(line)]))
+                          for n, (first, line) in zip(n1, bands)]
+                for h, value in zip(states, values):
+                    new[h] = value
+            elif states:
+                row = table[k][e]
+                for h in states:
+                    new[h] = row[h]
+            table[k][e] = new
+            half[k][e] = _half_step(new, y_lo, y_hi, q)
+
+    # Per ogni stato di cura: estremi della somma prefissa e tiri oltre gli HP massimi
+    spans = [[(h, min(h + z_lo, H + 1) - 1, min(h + z_hi, H),
+               min(z_n, max(0, h + z_hi - H))) for h in heal_states[k]] for k in ks]
+
+    def descend(e: int):
+        """Cure della riga e, che portano alla riga e + regen"""
+        for k in ks:
+            if not spans[k]:
+                continue
+            after = half[k][regen[e]]
+            prefix = list(accumulate(after))
+            full = after[H]
+            row = table[k][e]
+            for h, low, top, over in spans[k]:
+                row[h] = round_cost + (prefix[top] - prefix[low] + over * full) / z_n
+            half[k][e] = _half_step(row, y_lo, y_hi, q)
+
+    for e in range(1, E + 1):
+        rise(e)
+    if not r:
+        # Ogni riga dipende solo da righe già calcolate
+        return table, 1
+
+    # Con la rigenerazione la passata è una mappa affine G sui valori degli
+    # stati di cura che salgono di riga: se ne cerca il punto fisso
+    # accelerando l'iterazione con il metodo di Anderson
+    moving = [(k, e, heal_states[k]) for k in ks for e in range(1, E + 1)
+              if heal_states[k] and regen[e] != e]
+
+    def sweep(values: List[float]) -> List[float]:
+        """Una passata partendo dai valori dati per gli stati di cura"""
+        it = iter(values)
+        for k, e, states in moving:
+            row = table[k][e]
+            for h in states:
+                row[h] = next(it)
+        windows.clear()
+        for e in range(1, E + 1):
+            rise(e)
+        for e in range(E, 0, -1):
+            if regen[e] != e:
+                descend(e)
+        return [table[k][e][h] for k, e, states in moving for h in states]
+
+    x = [table[k][e][h] for k, e, states in moving for h in states]
+    anderson = _Anderson(ANDERSON_DEPTH)
+    sweeps = 1
+    while True:
+        sweeps += 1
+        g = sweep(x)
+        f = list(map(sub, g, x))
+        scale = max(1.0, max(map(abs, g), default=0.0))
+        if max(map(abs, f), default=0.0) / scale < TOLERANCE or sweeps >= MAX_SWEEPS:
+            return table, sweeps
+        x = anderson.step(g, f)
+
+
+class _Anderson:
+    """
+    Accelerazione di Anderson di un'iterazione di punto fisso x -> G(x)
+
+    Il prossimo punto è la combinazione delle ultime passate che minimizza il
+    residuo G(x) - x. Le differenze e i loro prodotti scalari sono tenuti in
+    memoria, quindi ogni passo costa O(depth · n).
+    """
+
+    def __init__(self, depth: int):
+        self.depth = depth
+        self.last: Optional[Tuple[List[float], List[float]]] = None
+        self.d_g: List[List[float]] = []
+        self.d_f: List[List[float]] = []
+        self.gram: List[List[float]] = []
+
+    def step(self, g: List[float], f: List[float]) -> List[float]:
+        """
+        Prossimo punto dell'iterazione
+
+        Args:
+            g: Immagine G(x) dell'ultimo punto
+            f: Residuo G(x) - x
+
+        Returns:
+            Punto da cui partire con la prossima passata
+        """
+        last, self.last = self.last, (g, f)
+        if last is None:
+            return g
+
+        d_f = list(map(sub, f, last[1]))
+        self.d_g.append(list(map(sub, g, last[0])))
+        self.d_f.append(d_f)
+        row = [sum(map(mul, d_f, other)) for other in self.d_f]
+        for i, old in enumerate(self.gram):
+            old.append(row[i])
+        self.gram.append(row)
+        if len(self.d_f) > self.depth:
+            del self.d_g[0], self.d_f[0], self.gram[0]
+            for old in self.gram:
+                del old[0]
+
+        # Equazioni normali (ΔFᵀΔF + λI)γ = ΔFᵀf, con λ piccolo per stabilità
+        m = len(self.d_f)
+        ridge = 1e-12 * max(self.gram[i][i] for i in range(m)) + 1e-300
+        gram = [[value + (ridge if i == j else 0.0) for j, value in enumerate(line)]
+                for i, line in enumerate(self.gram)]
+        gamma = _solve_small(gram, [sum(map(mul, column, f)) for column in self.d_f])
+        if gamma is None:
+            return g
+        out = g
+        for c, column in zip(gamma, self.d_g):
+            out = list(map(sub, out, map(c.__mul__, column)))
+        return out
+
+
+def _solve_small(a: List[List[float]], b: List[float]) -> Optional[List[float]]:
+    """Eliminazione di Gauss con pivoting parziale (None se singolare)"""
+    n = len(b)
+    rows = [row[:] + [value] for row, value in zip(a, b)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda i: abs(rows[i][col]))
+        if rows[pivot][col] == 0.0:
+            return None
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        for i in range(col + 1, n):
+            factor = rows[i][col] / rows[col][col]
+            if factor:
+                rows[i] = [u - factor * v for u, v in zip(rows[i], rows[col])]
+    out = [0.0] * n
+    for i in range(n - 1, -1, -1):
+        out[i] = (rows[i][n] - sum(rows[i][j] * out[j] for j in range(i + 1, n))) / rows[i][i]
+    return out
+
+
+@lru_cache(maxsize=512)
+def solve(hero: HeroProfile, foe: FoeProfile, policy: str = "balanced") -> DuelSolution:
+    """
+    Risolve un duello (in cache per profili e policy)
+
+    Args:
+        hero: Profilo del personaggio
+        foe: Profilo del nemico
+        policy: Nome in POLICIES
+
+    Returns:
+        DuelSolution con le tabelle di vittoria e round attesi
+    """
+    decide = POLICIES[policy]
+    actions = [[SimAction.ATTACK] + [decide(hero, h, k) for h in range(1, hero.max_hp + 1)]
+               for k in range(hero.casts + 1)]
+    win, sweeps = _solve_table(hero, foe, actions, 1.0, 0.0)
+    rounds, _ = _solve_table(hero, foe, actions, 0.0, 1.0)
+    return DuelSolution(hero, foe, win, rounds, sweeps)
+
+
+def evaluate(character_class: str, enemy_type: str, level: int = 1,
+             policy: str = "balanced") -> MarkovResult:
+    """
+    Esito esatto di una classe contro un tipo di nemico
+
+    Args:
+        character_class: Chiave di Character.CLASSES
+        enemy_type: Chiave di Enemy.ENEMY_TEMPLATES
+        level: Livello del nemico
+        policy: Nome in POLICIES
+
+    Returns:
+        MarkovResult
+    """
+    solution = solve(hero_profile(character_class), foe_profile(enemy_type, level), policy)
+    return MarkovResult(solution.win_probability(), solution.expected_rounds(),
+                        solution.states, solution.sweeps)
+
+
+class BalanceMatrix(Mapping):
+    """
+    Matrice (classe, nemico, livello) -> MarkovResult calcolata cella per cella
+
+    Le chiavi sono note subito; un duello viene risolto alla prima lettura
+    della sua cella (e resta in cache in solve), oppure tutti insieme con
+    solve_all.
+    """
+
+    def __init__(self, classes: Sequence[str], enemies: Sequence[str],
+                 levels: Sequence[int], policy: str = "balanced"):
+        self.policy = policy
+        self._keys = [(cls, enemy, level)
+                      for cls in classes for enemy in enemies for level in levels]
+        self._known = set(self._keys)
+        self._cells: Dict[Tuple[str, str, int], MarkovResult] = {}
+
+    def __getitem__(self, key: Tuple[str, str, int]) -> MarkovResult:
+        result = self._cells.get(key)
+        if result is None:
+            if key not in self._known:
+                raise KeyError(key)
+            result = self._cells[key] = evaluate(*key, policy=self.policy)
+        return result
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def solved(self) -> int:
+        """Celle già calcolate"""
+        return len(self._cells)
+
+    def solve_all(self, workers: Optional[int] = None) -> 'BalanceMatrix':
+        """
+        Calcola tutte le celle mancanti
+
+        Args:
+            workers: Processi del pool (None = numero di CPU, 0 = nello stesso processo)
+
+        Returns:
+            La matrice stessa
+        """
+        missing = [key for key in self._keys if key not in self._cells]
+        if workers == 0 or len(missing) < 2:
+            for key in missing:
+                self[key]
+            return self
+
+        # I duelli con rigenerazione sono i più lunghi: partono per primi
+        missing.sort(key=lambda key: foe_profile(key[1], key[2]).regen == 0)
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            futures = [pool.submit(evaluate, *key, policy=self.policy) for key in missing]
+            for key, future in zip(missing, futures):
+                self._cells[key] = future.result()
+        return self
+
+
+def balance_matrix(classes: Optional[Sequence[str]] = None,
+                   enemies: Optional[Sequence[str]] = None,
+                   levels: Sequence[int] = DEFAULT_LEVELS,
+                   policy: str = "balanced") -> BalanceMatrix:
+    """
+    Esiti esatti di ogni classe contro ogni nemico a ogni livello
+
+    Non risolve nulla: ogni cella si calcola alla prima lettura o con
+    BalanceMatrix.solve_all (tutta la matrice di default richiede circa
+    42 s su una CPU, vedi la docstring del modulo).
+
+    Args:
+        classes: Classi (default: tutte quelle di Character.CLASSES)
+        enemies: Tipi di nemico (default: tutti quelli del registro)
+        levels: Livelli dei nemici
+        policy: Nome in POLICIES
+
+    Returns:
+        BalanceMatrix (classe, nemico, livello) -> MarkovResult
+    """
+    from combat.enemy import Enemy
+
+    if policy not in POLICIES:
+        raise ValueError(f"Policy non valida: '{policy}'")
+    classes = list(classes) if classes else list(Character.CLASSES)
+    enemies = list(enemies) if enemies else Enemy.get_enemy_types()
+    return BalanceMatrix(classes, enemies, list(levels), policy)
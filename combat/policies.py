@@ -0,0 +1,76 @@
+"""
+Party Policies - Strategie automatiche per i personaggi del party
+
+Una policy riceve la Battle e il personaggio di turno e ritorna la coppia
+(azione, bersaglio), o la terna (azione, bersaglio, oggetto), da passare a
+Battle.execute_player_turn. Sono le stesse regole delle policy di
+combat.simulator, applicate agli oggetti reali; advisor_policy segue le
+tabelle di combat.advisor.
+"""
+
+from typing import Callable, Dict, Optional, Tuple
+from models.character import Character
+
+
+HEAL_THRESHOLD = 0.35
+MAGIC_COST = 10
+
+PolicyDecision = Tuple[str, Optional[Character]]
+
+
+def attack_policy(battle, character: Character) -> PolicyDecision:
+    """Attacca sempre"""
+    return "attack", None
+
+
+def magic_policy(battle, character: Character) -> PolicyDecision:
+    """Usa la magia finché ci sono MP, poi attacca"""
+    if character.mp >= MAGIC_COST:
+        return "magic", None
+    return "attack", None
+
+
+def balanced_policy(battle, character: Character) -> PolicyDecision:
+    """Cura un alleato in difficoltà, altrimenti usa l'attacco migliore della classe"""
+    alive = [c for c in battle.party.characters if c.is_alive]
+    wounded = [c for c in alive if c.hp < c.max_hp * HEAL_THRESHOLD]
+    if wounded:
+        return "heal", min(wounded, key=lambda c: c.hp / c.max_hp)
+    if character.mag_bonus > character.atk_bonus and character.mp >= MAGIC_COST:
+        return "magic", None
+    return "attack", None
+
+
+def advisor_policy(battle, character: Character) -> PolicyDecision:
+    """Segue il consiglio di combat.advisor; senza tabella usa balanced_policy"""
+    from combat.advisor import suggest
+
+    suggestion = suggest(battle, character)
+    if suggestion is None:
+        return balanced_policy(battle, character)
+    return suggestion.decision
+
+
+PARTY_POLICIES: Dict[str, Callable] = {
+    "attack": attack_policy,
+    "magic": magic_policy,
+    "balanced": balanced_policy,
+    "advisor": advisor_policy,
+}
+
+
+def get_policy(policy) -> Callable:
+    """
+    Risolve una policy per nome o la ritorna se è già una funzione
+
+    Args:
+        policy: Nome in PARTY_POLICIES o funzione policy(battle, character)
+
+    Returns:
+        Funzione policy
+    """
+    if callable(policy):
+        return policy
+    if policy not in PARTY_POLICIES:
+        raise ValueError(f"Policy sconosciuta: '{policy}'")
+    return PARTY_POLICIES[policy]
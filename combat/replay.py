@@ -0,0 +1,425 @@
+"""
+Replay - Registrazione e riproduzione binaria delle battaglie
+
+Una battaglia registrata è il seme del suo generatore casuale, lo stato
+iniziale di party, nemici e inventario e una sequenza di record impacchettati
+(attore, azione, bersaglio, oggetto, hash dello stato). Con lo stesso seme e
+le stesse scelte Battle produce gli stessi tiri: la riproduzione riesegue i
+record tramite execute_player_turn/execute_enemy_turn, facendo avanzare il
+turn manager come i motori di gioco, e confronta dopo ogni turno l'hash dello
+stato con quello registrato.
+
+Formato (little endian):
+    header   "BRPL", versione, seme, flag initiative
+    party    n, poi per personaggio: nome, classe, statistiche, vivo
+    nemici   n, poi per nemico: tipo, nome, IA, livello, statistiche, vivo,
+             se l'IA usa il generatore della battaglia
+    oggetti  slot dell'inventario, n, poi (id, quantità)
+    tabella  n, poi gli id degli oggetti usati nei record
+    record   n, poi n × (attore, azione, bersaglio, oggetto, hash)
+"""
+
+import struct
+import zlib
+from typing import List, Optional
+
+from models.character import Character
+from models.party import Party
+from combat.enemy import Enemy
+from combat.battle import Battle
+from combat.enemy_ai import DIFFICULTY_PRESETS, RandomAI, get_enemy_ai
+from utils.rng import GameRNG
+
+
+MAGIC = b"BRPL"
+VERSION = 3
+
+HEADER = struct.Struct("<4sBQ?")
+COUNT = struct.Struct("<I")
+STRING_LEN = struct.Struct("<H")
+CHARACTER_STATS = struct.Struct("<iiiiiiii?")
+ENEMY_STATS = struct.Struct("<iiiiii??")
+RECORD = struct.Struct("<BBBBI")
+
+# Codici delle azioni nei record
+ACTION_CODES = {"attack": 0, "magic": 1, "heal": 2, "use_item": 3, "skip": 4, "enemy": 5}
+ACTION_NAMES = {code: name for name, code in ACTION_CODES.items()}
+
+# Riferimenti ai combattenti: indice nel party, 0x80 | indice del nemico
+NO_REF = 0xFF
+ENEMY_REF = 0x80
+
+
+def state_hash(battle: Battle) -> int:
+    """
+    Hash (CRC32) dello stato che le azioni possono modificare
+
+    Args:
+        battle: Battaglia
+
+    Returns:
+        Intero a 32 bit
+    """
+    values = []
+    for char in battle.party.characters:
+        values += (char.hp, char.mp, char.is_alive)
+    for foe in battle.enemies:
+        values += (foe.hp, foe.is_alive)
+    inventory = battle.party.inventory.items
+    packed = struct.pack(f"<{len(values)}i", *values)
+    packed += repr(sorted((item_id, item.quantity) for item_id, item in inventory.items())).encode()
+    return zlib.crc32(packed)
+
+
+def _ai_name(battle: Battle, enemy: Enemy) -> str:
+    """Difficoltà dell'IA di un nemico (quella del tipo se l'IA non è un preset)"""
+    ai = battle.enemy_ai
+    if ai is None:
+        return enemy.ai
+    if isinstance(ai, str):
+        return ai
+    for name in DIFFICULTY_PRESETS:
+        if get_enemy_ai(name) is ai:
+            return name
+    return enemy.ai
+
+
+class ReplayMismatchError(Exception):
+    """La riproduzione ha prodotto uno stato diverso da quello registrato"""
+
+    def __init__(self, turn: int, expected: int, actual: int):
+        super().__init__(f"Replay divergente al turno {turn}: "
+                         f"hash atteso {expected:08x}, ottenuto {actual:08x}")
+        self.turn = turn
+        self.expected = expected
+        self.actual = actual
+
+
+class BattleReplay:
+    """Registrazione di una battaglia: stato iniziale, seme e record dei turni"""
+
+    def __init__(self, seed: int, initiative: bool, characters: List[tuple],
+                 enemies: List[tuple], inventory: List[tuple], max_slots: int,
+                 items: Optional[List[str]] = None, records: Optional[List[tuple]] = None):
+        """
+        Inizializza la registrazione
+
+        Args:
+            seed: Seme del generatore della battaglia
+            initiative: True se la battaglia usa lo scheduler a velocità
+            characters: (nome, classe, hp, max_hp, mp, max_mp, atk, def, mag, speed, vivo)
+            enemies: (tipo, nome, IA, livello, hp, max_hp, min_dmg, max_dmg, speed, vivo,
+                     l'IA usa il generatore)
+            inventory: (id oggetto, quantità) all'inizio della battaglia
+            max_slots: Slot dell'inventario
+            items: Tabella degli id degli oggetti usati nei record
+            records: (attore, azione, bersaglio, oggetto, hash) per ogni turno
+        """
+        self.seed = seed
+        self.initiative = initiative
+        self.characters = characters
+        self.enemies = enemies
+        self.inventory = inventory
+        self.max_slots = max_slots
+        self.items = items if items is not None else []
+        self.records = records if records is not None else []
+
+    @classmethod
+    def capture(cls, battle: Battle, seed: int) -> 'BattleReplay':
+        """
+        Fotografa lo stato iniziale di una battaglia
+
+        Args:
+            battle: Battaglia non ancora iniziata
+            seed: Seme che verrà usato per il generatore
+
+        Returns:
+            BattleReplay senza record
+        """
+        characters = [
+            (c.name, c.character_class, c.hp, c.max_hp, c.mp, c.max_mp,
+             c.atk_bonus, c.def_bonus, c.mag_bonus, c.speed, c.is_alive)
+            for c in battle.party.characters
+        ]
+        enemies = [
+            (e.enemy_type, e.name, _ai_name(battle, e), e.level, e.hp, e.max_hp,
+             e.min_damage, e.max_damage, e.speed, e.is_alive,
+             battle.get_enemy_ai(e).uses_rng)
+            for e in battle.enemies
+        ]
+        inventory = battle.party.inventory
+        items = [(item_id, item.quantity) for item_id, item in inventory.items.items()]
+        return cls(seed, battle.turn_manager.initiative, characters, enemies,
+                   items, inventory.max_slots)
+
+    def build_battle(self) -> Battle:
+        """
+        Ricostruisce la battaglia allo stato iniziale, con il suo seme
+
+        Returns:
+            Nuova Battle pronta per la riproduzione
+        """
+        characters = []
+        for name, char_class, hp, max_hp, mp, max_mp, atk, dfn, mag, speed, alive in self.characters:
+            char = Character(name, char_class, hp, max_hp)
+            char.mp, char.max_mp = mp, max_mp
+            char.atk_bonus, char.def_bonus, char.mag_bonus = atk, dfn, mag
+            char.speed = speed
+            char.is_alive = alive
+            characters.append(char)
+
+        enemies = []
+        for enemy_type, name, ai, level, hp, max_hp, min_dmg, max_dmg, speed, alive, _ in self.enemies:
+            foe = Enemy(enemy_type, level)
+            foe.name = name
+            foe.ai = ai
+            foe.hp, foe.max_hp = hp, max_hp
+            foe.min_damage, foe.max_damage = min_dmg, max_dmg
+            foe.speed = speed
+            foe.is_alive = alive
+            enemies.append(foe)
+
+        party = Party(characters)
+        party.inventory.max_slots = self.max_slots
+        for item_id, quantity in self.inventory:
+            party.inventory.add_item(item_id, quantity)
+
+        return Battle(party, enemies, rng=GameRNG(self.seed), initiative=self.initiative)
+
+    def play(self, verify: bool = True) -> Battle:
+        """
+        Riesegue i record su una battaglia ricostruita
+
+        Args:
+            verify: Confronta l'hash dello stato dopo ogni turno
+
+        Returns:
+            La battaglia dopo l'ultimo record
+
+        Raises:
+            ReplayMismatchError: Se uno stato non corrisponde alla registrazione
+        """
+        battle = self.build_battle()
+        characters = battle.party.characters
+        tm = battle.turn_manager
+
+        for turn, (actor, action, target, item, expected) in enumerate(self.records, 1):
+            # Come i motori: salta i morti e aggiorna il round prima di agire,
+            # così gli effetti a tempo scadono agli stessi turni
+            tm.get_current_combatant()
+            name = ACTION_NAMES[action]
+            if name == "enemy":
+                index = actor & ~ENEMY_REF
+                foe = battle.enemies[index]
+                if self.enemies[index][-1]:
+                    # Il bersaglio registrato sostituisce la scelta dell'IA,
+                    # ma i tiri consumati devono restare allineati
+                    ai = battle.get_enemy_ai(foe)
+                    (ai if ai.uses_rng else RandomAI()).choose_target(battle, foe)
+                battle.execute_enemy_turn(foe, self._resolve(battle, target))
+            else:
+                battle.execute_player_turn(
+                    characters[actor], name,
+                    self._resolve(battle, target),
+                    self.items[item] if item != NO_REF else None)
+
+            if verify:
+                actual = state_hash(battle)
+                if actual != expected:
+                    raise ReplayMismatchError(turn, expected, actual)
+            if tm.is_battle_active():
+                tm.next_turn()
+        return battle
+
+    @staticmethod
+    def _resolve(battle: Battle, ref: int):
+        """Combattente corrispondente a un riferimento del record"""
+        if ref == NO_REF:
+            return None
+        if ref & ENEMY_REF:
+            return battle.enemies[ref & ~ENEMY_REF]
+        return battle.party.characters[ref]
+
+    # --- Serializzazione ---
+
+    def to_bytes(self) -> bytes:
+        """Serializza la registrazione nel formato binario"""
+        out = bytearray(HEADER.pack(MAGIC, VERSION, self.seed, self.initiative))
+
+        out += COUNT.pack(len(self.characters))
+        for name, char_class, *stats in self.characters:
+            out += _pack_string(name) + _pack_string(char_class) + CHARACTER_STATS.pack(*stats)
+
+        out += COUNT.pack(len(self.enemies))
+        for enemy_type, name, ai, *stats in self.enemies:
+            out += (_pack_string(enemy_type) + _pack_string(name) + _pack_string(ai)
+                    + ENEMY_STATS.pack(*stats))
+
+        out += COUNT.pack(self.max_slots) + COUNT.pack(len(self.inventory))
+        for item_id, quantity in self.inventory:
+            out += _pack_string(item_id) + COUNT.pack(quantity)
+
+        out += COUNT.pack(len(self.items))
+        for item_id in self.items:
+            out += _pack_string(item_id)
+
+        out += COUNT.pack(len(self.records))
+        for record in self.records:
+            out += RECORD.pack(*record)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BattleReplay':
+        """
+        Legge una registrazione dal formato binario
+
+        Args:
+            data: Byte prodotti da to_bytes
+
+        Returns:
+            BattleReplay
+
+        Raises:
+            ValueError: Se i dati non sono una registrazione valida
+        """
+        reader = _Reader(data)
+        magic, version, seed, initiative = reader.unpack(HEADER)
+        if magic != MAGIC:
+            raise ValueError("Dati non riconosciuti come replay di battaglia")
+        if version != VERSION:
+            raise ValueError(f"Versione del replay non supportata: {version}")
+
+        characters = []
+        for _ in range(reader.count()):
+            name, char_class = reader.string(), reader.string()
+            characters.append((name, char_class) + reader.unpack(CHARACTER_STATS))
+
+        enemies = []
+        for _ in range(reader.count()):
+            enemy_type, name, ai = reader.string(), reader.string(), reader.string()
+            enemies.append((enemy_type, name, ai) + reader.unpack(ENEMY_STATS))
+
+        max_slots = reader.count()
+        inventory = [(reader.string(), reader.count()) for _ in range(reader.count())]
+        items = [reader.string() for _ in range(reader.count())]
+        records = [reader.unpack(RECORD) for _ in range(reader.count())]
+
+        return cls(seed, initiative, characters, enemies, inventory, max_slots, items, records)
+
+    def save(self, filepath: str):
+        """Salva la registrazione su file"""
+        with open(filepath, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, filepath: str) -> 'BattleReplay':
+        """Carica una registrazione da file"""
+        with open(filepath, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+class ReplayRecorder:
+    """Registra i turni di una Battle mentre vengono eseguiti"""
+
+    def __init__(self, battle: Battle, seed: Optional[int] = None):
+        """
+        Collega il registratore a una battaglia non ancora iniziata
+
+        La battaglia passa a un GameRNG dedicato con il seme registrato; se il
+        seme non è indicato viene estratto dal generatore attuale della
+        battaglia, così una partita con seme resta riproducibile.
+
+        Args:
+            battle: Battaglia da registrare
+            seed: Seme del generatore della battaglia
+        """
+        if seed is None:
+            seed = battle.rng.getrandbits(48)
+        self.battle = battle
+        self.replay = BattleReplay.capture(battle, seed)
+        self._item_ids = {}
+        battle.bind_rng(GameRNG(seed))
+        battle.recorder = self
+
+    def _ref(self, battle: Battle, entity) -> int:
+        """Riferimento compatto a un combattente (NO_REF se assente)"""
+        for index, char in enumerate(battle.party.characters):
+            if char is entity:
+                return index
+        for index, foe in enumerate(battle.enemies):
+            if foe is entity:
+                return ENEMY_REF | index
+        return NO_REF
+
+    def _item_ref(self, item_id: Optional[str]) -> int:
+        """Indice dell'oggetto nella tabella della registrazione"""
+        if not item_id:
+            return NO_REF
+        ref = self._item_ids.get(item_id)
+        if ref is None:
+            ref = self._item_ids[item_id] = len(self.replay.items)
+            self.replay.items.append(item_id)
+        return ref
+
+    def record_player_turn(self, player: Character, action: str, target,
+                           item_id: Optional[str], battle: Battle):
+        """Registra un turno del giocatore già eseguito"""
+        self.replay.records.append((
+            self._ref(battle, player),
+            ACTION_CODES.get(action, ACTION_CODES["skip"]),
+            self._ref(battle, target),
+            self._item_ref(item_id),
+            state_hash(battle),
+        ))
+
+    def record_enemy_turn(self, enemy: Enemy, target: Optional[Character], battle: Battle):
+        """Registra un turno del nemico già eseguito, con il bersaglio scelto dall'IA"""
+        self.replay.records.append((
+            self._ref(battle, enemy), ACTION_CODES["enemy"],
+            self._ref(battle, target), NO_REF,
+            state_hash(battle),
+        ))
+
+    def detach(self) -> BattleReplay:
+        """
+        Scollega il registratore dalla battaglia
+
+        Returns:
+            La registrazione completa
+        """
+        if self.battle.recorder is self:
+            self.battle.recorder = None
+        return self.replay
+
+
+def _pack_string(text: str) -> bytes:
+    """Stringa UTF-8 preceduta dalla lunghezza"""
+    data = text.encode('utf-8')
+    return STRING_LEN.pack(len(data)) + data
+
+
+class _Reader:
+    """Lettura sequenziale del formato binario"""
+
+    def __init__(self, data: bytes):
+        self.data = data
+        self.offset = 0
+
+    def unpack(self, fmt: struct.Struct) -> tuple:
+        if self.offset + fmt.size > len(self.data):
+            raise ValueError("Replay troncato")
+        values = fmt.unpack_from(self.data, self.offset)
+        self.offset += fmt.size
+        return values
+
+    def count(self) -> int:
+        return self.unpack(COUNT)[0]
+
+    def string(self) -> str:
+        length = self.unpack(STRING_LEN)[0]
+        end = self.offset + length
+        if end > len(self.data):
+            raise ValueError("Replay troncato")
+        text = self.data[self.offset:end].decode('utf-8')
+        self.offset = end
+        return text
@@ -0,0 +1,354 @@
+"""
+Battle Simulator - Simulazione headless di molte battaglie in parallelo
+
+Esegue N battaglie party-contro-nemico "in lockstep": lo stato di tutte le
+battaglie è tenuto in liste parallele (struct-of-arrays) e ogni slot di turno
+viene applicato a tutte le battaglie ancora attive in un solo passaggio, con
+i tiri di dado estratti a blocchi. Le regole replicano quelle di
+Battle._execute_attack, _execute_magic_attack, _execute_heal ed
+execute_enemy_turn, senza oggetti Combatant né messaggi formattati.
+
+Il nemico sceglie il bersaglio a caso tra i giocatori vivi: è l'IA 'easy'
+(RandomAI), l'unica modellata. Una Battle usa invece l'IA del tipo di nemico
+(chiave 'ai' di data/enemies.json, es. la ricerca di troll e drago), quindi
+i risultati coincidono con Battle(..., enemy_ai="easy"). Per l'IA reale di
+ogni tipo si usa tools.sim_farm con --enemy-ai type.
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Union
+from models.character import Character
+from combat.enemy import Enemy
+from utils.rng import GameRNG
+
+
+class SimAction:
+    """Codici delle azioni decise dalle policy"""
+    ATTACK = 0
+    MAGIC = 1
+    HEAL = 2
+
+
+# Regole di Battle/Character (tiri e costi)
+PHYSICAL_ROLL = (10, 25)
+MAGIC_ROLL = (15, 30)
+HEAL_ROLL = (15, 30)
+MAGIC_COST = 10
+
+HEAL_THRESHOLD = 0.35
+
+# IA dei nemici modellata dal simulatore (chiave di DIFFICULTY_PRESETS)
+SIMULATED_AI = "easy"
+
+
+# --- Policy del party ---
+# Una policy riceve il simulatore, lo slot del personaggio e gli indici delle
+# battaglie in cui quel personaggio agisce, e ritorna un codice SimAction per
+# ciascuna battaglia.
+
+def attack_policy(sim: 'BattleSimulator', slot: int, battles: List[int]) -> List[int]:
+    """Attacca sempre"""
+    return [SimAction.ATTACK] * len(battles)
+
+
+def magic_policy(sim: 'BattleSimulator', slot: int, battles: List[int]) -> List[int]:
+    """Usa la magia finché ci sono MP, poi attacca"""
+    mp = sim.mp[slot]
+    return [SimAction.MAGIC if mp[i] >= MAGIC_COST else SimAction.ATTACK for i in battles]
+
+
+def balanced_policy(sim: 'BattleSimulator', slot: int, battles: List[int]) -> List[int]:
+    """Cura un alleato in difficoltà, altrimenti usa l'attacco migliore della classe"""
+    stats = sim.party_stats[slot]
+    offensive = SimAction.MAGIC if stats['mag_bonus'] > stats['atk_bonus'] else SimAction.ATTACK
+    mp = sim.mp[slot]
+    hp = sim.hp
+    thresholds = [s['max_hp'] * HEAL_THRESHOLD for s in sim.party_stats]
+    slots = range(len(hp))
+
+    actions = []
+    for i in battles:
+        if any(0 < hp[s][i] < thresholds[s] for s in slots):
+            actions.append(SimAction.HEAL)
+        elif offensive == SimAction.MAGIC and mp[i] >= MAGIC_COST:
+            actions.append(SimAction.MAGIC)
+        else:
+            actions.append(SimAction.ATTACK)
+    return actions
+
+
+POLICIES: Dict[str, Callable] = {
+    "attack": attack_policy,
+    "magic": magic_policy,
+    "balanced": balanced_policy,
+}
+
+
+class SimulationStats:
+    """Statistiche aggregate di un insieme di battaglie (unibili con merge)"""
+
+    HP_BUCKETS = 10
+
+    def __init__(self):
+        """Inizializza statistiche vuote"""
+        self.battles = 0
+        self.victories = 0
+        self.timeouts = 0
+        self.total_rounds = 0
+        self.rounds_histogram: Dict[int, int] = {}
+        # HP residui del party nelle vittorie, in decimi degli HP massimi (0..10)
+        self.hp_left_histogram = [0] * (self.HP_BUCKETS + 1)
+
+    def record(self, victory: bool, rounds: int, hp_fraction: float):
+        """
+        Registra l'esito di una battaglia
+
+        Args:
+            victory: True se il party ha vinto
+            rounds: Round in cui la battaglia è finita
+            hp_fraction: Frazione degli HP totali del party rimasta
+        """
+        self.battles += 1
+        self.total_rounds += rounds
+        self.rounds_histogram[rounds] = self.rounds_histogram.get(rounds, 0) + 1
+        if victory:
+            self.victories += 1
+            self.hp_left_histogram[int(hp_fraction * self.HP_BUCKETS)] += 1
+
+    def merge(self, other: 'SimulationStats') -> 'SimulationStats':
+        """
+        Unisce le statistiche di un altro blocco di battaglie
+
+        Args:
+            other: Statistiche da sommare
+
+        Returns:
+            Se stesso (per concatenare le chiamate)
+        """
+        self.battles += other.battles
+        self.victories += other.victories
+        self.timeouts += other.timeouts
+        self.total_rounds += other.total_rounds
+        for rounds, count in other.rounds_histogram.items():
+            self.rounds_histogram[rounds] = self.rounds_histogram.get(rounds, 0) + count
+        for bucket, count in enumerate(other.hp_left_histogram):
+            self.hp_left_histogram[bucket] += count
+        return self
+
+    @property
+    def win_rate(self) -> float:
+        """Percentuale di vittorie (0..1)"""
+        return self.victories / self.battles if self.battles else 0.0
+
+    @property
+    def mean_rounds(self) -> float:
+        """Durata media in round"""
+        return self.total_rounds / self.battles if self.battles else 0.0
+
+    def to_dict(self) -> Dict:
+        """Converte le statistiche in dizionario"""
+        return {
+            "battles": self.battles,
+            "victories": self.victories,
+            "win_rate": self.win_rate,
+            "timeouts": self.timeouts,
+            "mean_rounds": self.mean_rounds,
+            "rounds_histogram": dict(sorted(self.rounds_histogram.items())),
+            "hp_left_histogram": list(self.hp_left_histogram),
+        }
+
+
+class BattleSimulator:
+    """Simulatore headless di battaglie party-contro-nemico"""
+
+    def __init__(self, party_classes: Sequence[str], enemy_type: str = 'goblin',
+                 level: int = 1, policy: Union[str, Callable] = "balanced",
+                 seed: Optional[int] = None, max_rounds: int = 200,
+                 enemy_ai: str = SIMULATED_AI):
+        """
+        Inizializza il simulatore
+
+        Args:
+            party_classes: Classi dei personaggi (chiavi di Character.CLASSES)
+            enemy_type: Tipo di nemico (chiave di Enemy.ENEMY_TEMPLATES)
+            level: Livello del nemico
+            policy: Nome in POLICIES o funzione policy(sim, slot, battles)
+            seed: Seme del generatore casuale
+            max_rounds: Round oltre i quali la battaglia conta come sconfitta
+            enemy_ai: IA dei nemici (solo SIMULATED_AI, qualunque sia il tipo)
+
+        Raises:
+            ValueError: Se enemy_ai non è un'IA modellata dal simulatore
+        """
+        if enemy_ai != SIMULATED_AI:
+            raise ValueError(f"Il simulatore modella solo l'IA '{SIMULATED_AI}', non "
+                             f"'{enemy_ai}': usa tools.sim_farm per le altre")
+        # Le statistiche vengono dai costruttori reali (scalatura di livello inclusa)
+        self.party_stats = []
+        for i, cls in enumerate(party_classes):
+            char = Character(f"P{i}", cls)
+            self.party_stats.append({
+                'hp': char.hp, 'max_hp': char.max_hp, 'mp': char.mp,
+                'atk_bonus': char.atk_bonus, 'mag_bonus': char.mag_bonus,
+            })
+        enemy = Enemy(enemy_type, level)
+        self.enemy_stats = {'hp': enemy.max_hp, 'min_damage': enemy.min_damage,
+                            'max_damage': enemy.max_damage, 'regen': enemy.regen}
+
+        self.policy = POLICIES[policy] if isinstance(policy, str) else policy
+        self.rng = GameRNG(seed)
+        self.max_rounds = max_rounds
+
+        # Stato struct-of-arrays (valorizzato da run)
+        self.hp: List[List[int]] = []
+        self.mp: List[List[int]] = []
+        self.enemy_hp: List[int] = []
+        self.alive_players: List[int] = []
+
+    def run(self, battles: int) -> SimulationStats:
+        """
+        Simula un blocco di battaglie
+
+        Args:
+            battles: Numero di battaglie
+
+        Returns:
+            SimulationStats aggregate
+        """
+        party = self.party_stats
+        slots = range(len(party))
+        rng = self.rng
+        rand = rng.random
+        policy = self.policy
+        stats = SimulationStats()
+        total_max_hp = sum(s['max_hp'] for s in party)
+
+        self.hp = hp = [[s['hp']] * battles for s in party]
+        self.mp = mp = [[s['mp']] * battles for s in party]
+        self.enemy_hp = enemy_hp = [self.enemy_stats['hp']] * battles
+        self.alive_players = alive = [sum(1 for s in party if s['hp'] > 0)] * battles
+        enemy_min = self.enemy_stats['min_damage']
+        enemy_max = self.enemy_stats['max_damage']
+        enemy_max_hp = self.enemy_stats['hp']
+        regen = self.enemy_stats['regen']
+
+        active = [i for i in range(battles) if alive[i] > 0]
+        for i in range(battles):
+            if alive[i] == 0:
+                stats.record(False, 1, 0.0)
+
+        round_number = 1
+        while active and round_number <= self.max_rounds:
+            # Turni dei giocatori, nell'ordine del party
+            for slot in slots:
+                hp_s = hp[slot]
+                actors = [i for i in active if hp_s[i] > 0]
+                if not actors:
+                    continue
+                actions = policy(self, slot, actors)
+                self._apply_player_actions(slot, actors, actions)
+
+                if any(enemy_hp[i] == 0 for i in actors):
+                    still_active = []
+                    for i in active:
+                        if enemy_hp[i] > 0:
+                            still_active.append(i)
+                        else:
+                            stats.record(True, round_number,
+                                         sum(hp[s][i] for s in slots) / total_max_hp)
+                    active = still_active
+
+            # Turno del nemico: bersaglio casuale tra i giocatori vivi (IA 'easy')
+            rolls = rng.rolls(enemy_min, enemy_max, len(active))
+            for i, damage in zip(active, rolls):
+                targets = [s for s in slots if hp[s][i] > 0]
+                target = targets[int(rand() * len(targets))]
+                new_hp = hp[target][i] - damage
+                if new_hp > 0:
+                    hp[target][i] = new_hp
+                else:
+                    hp[target][i] = 0
+                    alive[i] -= 1
+                if regen:
+                    # Rigenerazione alla fine del turno (come Battle._end_turn)
+                    enemy_hp[i] = min(enemy_hp[i] + regen, enemy_max_hp)
+
+            still_active = []
+            for i in active:
+                if alive[i] > 0:
+                    still_active.append(i)
+                else:
+                    stats.record(False, round_number, 0.0)
+            active = still_active
+            round_number += 1
+
+        # Battaglie oltre il limite di round
+        for i in active:
+            stats.record(False, self.max_rounds, 0.0)
+            stats.timeouts += 1
+
+        return stats
+
+    def _apply_player_actions(self, slot: int, actors: List[int], actions: List[int]):
+        """Applica le azioni di uno slot del party a tutte le battaglie"""
+        rng = self.rng
+        enemy_hp = self.enemy_hp
+        stats = self.party_stats[slot]
+
+        attackers = []
+        casters = []
+        healers = []
+        for i, action in zip(actors, actions):
+            if action == SimAction.ATTACK:
+                attackers.append(i)
+            elif action == SimAction.MAGIC:
+                casters.append(i)
+            elif action == SimAction.HEAL:
+                healers.append(i)
+
+        if attackers:
+            bonus = stats['atk_bonus']
+            for i, roll in zip(attackers, rng.rolls(*PHYSICAL_ROLL, len(attackers))):
+                new_hp = enemy_hp[i] - roll - bonus
+                enemy_hp[i] = new_hp if new_hp > 0 else 0
+
+        if casters:
+            # Senza MP il turno viene saltato, come in _execute_magic_attack
+            mp = self.mp[slot]
+            casters = [i for i in casters if mp[i] >= MAGIC_COST]
+            bonus = stats['mag_bonus']
+            for i, roll in zip(casters, rng.rolls(*MAGIC_ROLL, len(casters))):
+                mp[i] -= MAGIC_COST
+                new_hp = enemy_hp[i] - roll - bonus
+                enemy_hp[i] = new_hp if new_hp > 0 else 0
+
+        if healers:
+            hp = self.hp
+            party = self.party_stats
+            slots = range(len(party))
+            for i, roll in zip(healers, rng.rolls(*HEAL_ROLL, len(healers))):
+                # Cura l'alleato vivo con la percentuale di HP più bassa
+                target = min((s for s in slots if hp[s][i] > 0),
+                             key=lambda s: hp[s][i] / party[s]['max_hp'])
+                hp[target][i] = min(hp[target][i] + roll, party[target]['max_hp'])
+
+
+def simulate(party_classes: Sequence[str], enemy_type: str = 'goblin', level: int = 1,
+             battles: int = 10_000, policy: Union[str, Callable] = "balanced",
+             seed: Optional[int] = None, enemy_ai: str = SIMULATED_AI) -> SimulationStats:
+    """
+    Scorciatoia: simula un blocco di battaglie e ritorna le statistiche
+
+    Args:
+        party_classes: Classi dei personaggi
+        enemy_type: Tipo di nemico
+        level: Livello del nemico
+        battles: Numero di battaglie
+        policy: Policy del party
+        seed: Seme del generatore casuale
+        enemy_ai: IA dei nemici (solo SIMULATED_AI)
+
+    Returns:
+        SimulationStats aggregate
+    """
+    return BattleSimulator(party_classes, enemy_type, level, policy, seed,
+                           enemy_ai=enemy_ai).run(battles)
@@ -0,0 +1,235 @@
+"""
+Status Effects - Effetti a tempo sui combattenti (buff, debuff, DoT, rigenerazione)
+
+Gli effetti di ogni combattente sono tenuti in liste separate per tipo:
+
+- modificatori di statistica ('atk', 'mag', 'def'): la somma per
+  combattente è in cache e viene invalidata solo quando un suo modificatore
+  viene aggiunto o scade
+- effetti periodici (danno nel tempo, rigenerazione): applicati alla fine
+  del turno del combattente, quindi il costo di un turno dipende solo dagli
+  effetti di chi agisce
+
+Le scadenze sono in un min-heap ordinato per round: a ogni turno si estraggono
+solo gli effetti effettivamente scaduti, senza scorrere quelli attivi.
+"""
+
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+
+class EffectKind:
+    """Tipi di effetto"""
+    MODIFIER = "modifier"
+    DOT = "dot"
+    REGEN = "regen"
+
+
+# Statistiche modificabili: bonus ai danni fisici e magici, riduzione dei danni subiti
+STATS = ("atk", "mag", "def")
+
+# Durata in round dei buff degli oggetti (es. Tonico della Forza)
+ITEM_BUFF_ROUNDS = 3
+
+
+class StatusEffect:
+    """Un effetto attivo su un combattente"""
+
+    __slots__ = ('owner', 'name', 'kind', 'value', 'stat', 'expires', 'seq', 'active')
+
+    def __init__(self, owner, name: str, kind: str, value: int, stat: Optional[str] = None,
+                 expires: Optional[int] = None, seq: int = 0):
+        """
+        Inizializza un effetto
+
+        Args:
+            owner: Combattente su cui agisce
+            name: Nome mostrato nei messaggi
+            kind: Tipo (EffectKind)
+            value: Bonus/malus della statistica o HP per turno
+            stat: Statistica modificata (solo per EffectKind.MODIFIER)
+            expires: Round in cui l'effetto scade (None = permanente)
+            seq: Ordine di inserimento (a parità di scadenza)
+        """
+        self.owner = owner
+        self.name = name
+        self.kind = kind
+        self.value = value
+        self.stat = stat
+        self.expires = expires
+        self.seq = seq
+        self.active = True
+
+    def __repr__(self) -> str:
+        return (f"StatusEffect(name='{self.name}', kind='{self.kind}', value={self.value}, "
+                f"stat={self.stat!r}, expires={self.expires})")
+
+
+class StatusEffects:
+    """Effetti di tutti i combattenti di una battaglia"""
+
+    def __init__(self):
+        """Inizializza un insieme vuoto"""
+        self._modifiers: Dict[int, List[StatusEffect]] = {}
+        self._periodic: Dict[int, List[StatusEffect]] = {}
+        # Somme dei modificatori per combattente (invalidate a ogni cambiamento)
+        self._totals: Dict[int, Dict[str, int]] = {}
+        self._expiry: List[Tuple[int, int, StatusEffect]] = []
+        self._seq = 0
+        self.count = 0
+
+    def add(self, owner, name: str, kind: str, value: int, stat: Optional[str] = None,
+            rounds: Optional[int] = None, now: int = 1) -> StatusEffect:
+        """
+        Aggiunge un effetto
+
+        Args:
+            owner: Combattente su cui agisce
+            name: Nome dell'effetto
+            kind: Tipo (EffectKind)
+            value: Bonus/malus (negativo = debuff) o HP per turno
+            stat: Statistica per i modificatori (una di STATS)
+            rounds: Durata in round (None = fino alla fine della battaglia)
+            now: Round corrente
+
+        Returns:
+            StatusEffect aggiunto
+
+        Raises:
+            ValueError: Se tipo o statistica non sono validi
+        """
+        if kind == EffectKind.MODIFIER:
+            if stat not in STATS:
+                raise ValueError(f"Statistica non modificabile: '{stat}'")
+            target = self._modifiers
+        elif kind in (EffectKind.DOT, EffectKind.REGEN):
+            target = self._periodic
+        else:
+            raise ValueError(f"Tipo di effetto sconosciuto: '{kind}'")
+
+        self._seq += 1
+        expires = now + rounds if rounds is not None else None
+        effect = StatusEffect(owner, name, kind, value, stat, expires, self._seq)
+        target.setdefault(id(owner), []).append(effect)
+        if kind == EffectKind.MODIFIER:
+            self._totals.pop(id(owner), None)
+        if expires is not None:
+            heapq.heappush(self._expiry, (expires, effect.seq, effect))
+        self.count += 1
+        return effect
+
+    def remove(self, effect: StatusEffect):
+        """
+        Rimuove un effetto prima della scadenza
+
+        Args:
+            effect: Effetto da rimuovere (la voce nel heap viene scartata
+                    quando arriva in cima)
+        """
+        if not effect.active:
+            return
+        effect.active = False
+        key = id(effect.owner)
+        if effect.kind == EffectKind.MODIFIER:
+            effects = self._modifiers[key]
+            self._totals.pop(key, None)
+        else:
+            effects = self._periodic[key]
+        effects.remove(effect)
+        if not effects:
+            del (self._modifiers if effect.kind == EffectKind.MODIFIER else self._periodic)[key]
+        self.count -= 1
+
+    def advance(self, now: int) -> List[StatusEffect]:
+        """
+        Fa scadere gli effetti arrivati al loro round
+
+        Args:
+            now: Round corrente
+
+        Returns:
+            Effetti scaduti (lista vuota nel caso comune)
+        """
+        expiry = self._expiry
+        if not expiry or expiry[0][0] > now:
+            return []
+        expired = []
+        while expiry and expiry[0][0] <= now:
+            effect = heapq.heappop(expiry)[2]
+            if effect.active:
+                self.remove(effect)
+                expired.append(effect)
+        return expired
+
+    def modifier(self, owner, stat: str) -> int:
+        """
+        Modificatore totale di una statistica
+
+        Args:
+            owner: Combattente
+            stat: Statistica (una di STATS)
+
+        Returns:
+            Somma dei bonus e malus attivi (0 senza effetti)
+        """
+        key = id(owner)
+        totals = self._totals.get(key)
+        if totals is None:
+            effects = self._modifiers.get(key)
+            if not effects:
+                return 0
+            totals = {}
+            for effect in effects:
+                totals[effect.stat] = totals.get(effect.stat, 0) + effect.value
+            self._totals[key] = totals
+        return totals.get(stat, 0)
+
+    def periodic(self, owner) -> List[StatusEffect]:
+        """Effetti periodici (DoT, rigenerazione) di un combattente"""
+        return self._periodic.get(id(owner), [])
+
+    def effects_on(self, owner) -> List[StatusEffect]:
+        """Tutti gli effetti attivi di un combattente, nell'ordine di inserimento"""
+        key = id(owner)
+        effects = self._modifiers.get(key, []) + self._periodic.get(key, [])
+        return sorted(effects, key=lambda e: e.seq)
+
+    def snapshot(self) -> tuple:
+        """
+        Stato degli effetti (gli StatusEffect sono immutabili a parte 'active')
+
+        Returns:
+            Tupla da passare a restore
+        """
+        if not self.count:
+            return ()
+        effects = [e for group in (self._modifiers, self._periodic)
+                   for effects in group.values() for e in effects]
+        effects.sort(key=lambda e: e.seq)
+        return (self._seq,) + tuple(effects)
+
+    def restore(self, state: tuple):
+        """
+        Ripristina gli effetti di uno snapshot
+
+        Args:
+            state: Tupla prodotta da snapshot()
+        """
+        if not state and not self.count:
+            return
+        self._modifiers = {}
+        self._periodic = {}
+        self._totals = {}
+        self._expiry = []
+        self.count = 0
+        if not state:
+            return
+        self._seq = state[0]
+        for effect in state[1:]:
+            effect.active = True
+            group = self._modifiers if effect.kind == EffectKind.MODIFIER else self._periodic
+            group.setdefault(id(effect.owner), []).append(effect)
+            if effect.expires is not None:
+                self._expiry.append((effect.expires, effect.seq, effect))
+            self.count += 1
+        heapq.heapify(self._expiry)
@@ -2,9 +2,11 @@
 Turn Manager - Gestisce i turni di combattimento
 """
 
-from typing import List, Union, Optional
+from typing import List, Sequence, Union, Optional
 from models.character import Character
 from combat.enemy import Enemy
+from combat.initiative import InitiativeScheduler
+from combat.events import EventBus, TurnStarted
 
 
 class Combatant:
@@ -31,23 +33,103 @@ class Combatant:
 
 
 class TurnManager:
-    """Gestisce l'ordine e l'esecuzione dei turni"""
+    """
+    Gestisce l'ordine e l'esecuzione dei turni.
+
+    Per ogni schieramento tiene un contatore dei combattenti vivi, aggiornato
+    dalle notifiche di morte/rianimazione (Liveness): i controlli di fine
+    battaglia e il salto dei combattenti KO costano O(1).
+
+    Con initiative=True l'ordine fisso [giocatori..., nemici...] è sostituito
+    da un InitiativeScheduler: agisce chi ha il prossimo tempo d'azione più
+    basso, in base alla velocità e al costo delle azioni.
+    """
     
-    def __init__(self, players: List[Character], enemy: Enemy):
+    def __init__(self, players: List[Character], enemy: Union[Enemy, Sequence[Enemy]],
+                 initiative: bool = False):
         """
         Inizializza il turn manager
         
         Args:
             players: Lista dei personaggi giocatori
-            enemy: Nemico da combattere
+            enemy: Nemico da combattere o lista di nemici
+            initiative: Usa lo scheduler a velocità invece dell'ordine fisso
         """
         self.players = players
-        self.enemy = enemy
+        self.enemies: List[Enemy] = list(enemy) if isinstance(enemy, (list, tuple)) else [enemy]
+        self.enemy = self.enemies[0]
+        
+        self.players_alive = 0
+        self.enemies_alive = 0
+        self._attach_listeners()
         
-        # Crea la lista dei turni: [P1, P2, Nemico]
+        # Crea la lista dei turni: [P1, P2, Nemico1, Nemico2, ...]
         self.turn_order = self._initialize_turn_order()
         self.current_turn_index = 0
         self.round_number = 1
+        
+        self.initiative = initiative
+        self.scheduler: Optional[InitiativeScheduler] = None
+        self._action_cost = 1.0
+        self._init_scheduler()
+        
+        # Bus su cui pubblicare TurnStarted (Battle gli passa il suo)
+        self.events: Optional[EventBus] = None
+        # Incrementato a ogni cambio di turno (vedi Battle.version)
+        self.version = 0
+    
+    def _init_scheduler(self):
+        """Crea lo scheduler a velocità (se attivo) e sceglie il primo attore"""
+        if not self.initiative:
+            return
+        self.scheduler = InitiativeScheduler(self.turn_order)
+        first = self.scheduler.peek()
+        self.current_turn_index = first if first is not None else 0
+        self.round_number = self.scheduler.round_number
+    
+    def _attach_listeners(self):
+        """Conta i vivi e si registra per le notifiche di morte/rianimazione"""
+        self.players_alive = sum(1 for p in self.players if p.is_alive)
+        self.enemies_alive = sum(1 for e in self.enemies if e.is_alive)
+        for player in self.players:
+            player.alive_listeners.append(self._on_player_alive_changed)
+        for enemy in self.enemies:
+            enemy.alive_listeners.append(self._on_enemy_alive_changed)
+    
+    def release(self):
+        """Smette di ricevere le notifiche (a fine battaglia)"""
+        for player in self.players:
+            if self._on_player_alive_changed in player.alive_listeners:
+                player.alive_listeners.remove(self._on_player_alive_changed)
+        for enemy in self.enemies:
+            if self._on_enemy_alive_changed in enemy.alive_listeners:
+                enemy.alive_listeners.remove(self._on_enemy_alive_changed)
+    
+    def reattach(self):
+        """Si registra di nuovo per le notifiche (es. battaglia riportata indietro dopo la fine)"""
+        self.release()
+        self._attach_listeners()
+    
+    def _on_player_alive_changed(self, player, alive: bool):
+        """Aggiorna il contatore dei giocatori vivi"""
+        self.players_alive += 1 if alive else -1
+        if alive:
+            self._requeue(player)
+    
+    def _on_enemy_alive_changed(self, enemy, alive: bool):
+        """Aggiorna il contatore dei nemici vivi"""
+        self.enemies_alive += 1 if alive else -1
+        if alive:
+            self._requeue(enemy)
+    
+    def _requeue(self, entity):
+        """Rimette in coda dello scheduler un combattente rianimato"""
+        if self.scheduler is None:
+            return
+        for index, combatant in enumerate(self.turn_order):
+            if combatant.entity is entity:
+                self.scheduler.revive(index)
+                return
     
     def _initialize_turn_order(self) -> List[Combatant]:
         """
@@ -62,8 +144,9 @@ class TurnManager:
         for player in self.players:
             turn_order.append(Combatant(player, is_player=True))
         
-        # Aggiungi il nemico
-        turn_order.append(Combatant(self.enemy, is_player=False))
+        # Aggiungi i nemici
+        for enemy in self.enemies:
+            turn_order.append(Combatant(enemy, is_player=False))
         
         return turn_order
     
@@ -77,6 +160,14 @@ class TurnManager:
         if not self.is_battle_active():
             return None
         
+        if self.scheduler is not None:
+            index = self.scheduler.peek()
+            if index is None:
+                return None
+            self.current_turn_index = index
+            self.round_number = self.scheduler.round_number
+            return self.turn_order[index]
+        
         # Salta combattenti morti
         while True:
             combatant = self.turn_order[self.current_turn_index]
@@ -93,12 +184,32 @@ class TurnManager:
     
     def next_turn(self):
         """Passa al turno successivo"""
-        self.current_turn_index += 1
+        if self.scheduler is not None:
+            # Il combattente di turno paga il costo della sua azione
+            self.scheduler.advance(self.current_turn_index, self._action_cost)
+            self._action_cost = 1.0
+            index = self.scheduler.peek()
+            if index is not None:
+                self.current_turn_index = index
+                self.round_number = self.scheduler.round_number
+        else:
+            self.current_turn_index += 1
+            
+            # Se abbiamo completato un round, ricomincia
+            if self.current_turn_index >= len(self.turn_order):
+                self.current_turn_index = 0
+                self.round_number += 1
         
-        # Se abbiamo completato un round, ricomincia
-        if self.current_turn_index >= len(self.turn_order):
-            self.current_turn_index = 0
-            self.round_number += 1
+        self.version += 1
+        events = self.events
+        if events is not None and events.active:
+            self.publish_turn_started()
+    
+    def publish_turn_started(self):
+        """Pubblica TurnStarted per il combattente di turno (se vivo e la battaglia continua)"""
+        combatant = self.turn_order[self.current_turn_index]
+        if self.events is not None and combatant.is_alive() and self.is_battle_active():
+            self.events.emit(TurnStarted, combatant, self.round_number)
     
     def is_battle_active(self) -> bool:
         """
@@ -107,14 +218,8 @@ class TurnManager:
         Returns:
             True se la battaglia continua
         """
-        # Controlla se almeno un giocatore è vivo
-        players_alive = any(p.is_alive for p in self.players)
-        
-        # Controlla se il nemico è vivo
-        enemy_alive = self.enemy.is_alive
-        
         # La battaglia continua se entrambe le parti hanno almeno un combattente vivo
-        return players_alive and enemy_alive
+        return self.players_alive > 0 and self.enemies_alive > 0
     
     def get_battle_status(self) -> dict:
         """
@@ -127,8 +232,9 @@ class TurnManager:
             'round': self.round_number,
             'current_turn': self.current_turn_index,
             'total_turns': len(self.turn_order),
-            'players_alive': sum(1 for p in self.players if p.is_alive),
-            'enemy_alive': self.enemy.is_alive,
+            'players_alive': self.players_alive,
+            'enemy_alive': self.enemies_alive > 0,
+            'enemies_alive': self.enemies_alive,
             'battle_active': self.is_battle_active()
         }
     
@@ -136,6 +242,63 @@ class TurnManager:
         """Ritorna la lista dei giocatori vivi"""
         return [p for p in self.players if p.is_alive]
     
+    def get_alive_enemies(self) -> List[Enemy]:
+        """Ritorna la lista dei nemici vivi"""
+        return [e for e in self.enemies if e.is_alive]
+    
+    def set_action_cost(self, cost: float):
+        """
+        Imposta il costo dell'azione del combattente di turno
+        
+        Con lo scheduler a velocità un'azione più costosa ritarda il turno
+        successivo di chi l'ha eseguita; nell'ordine fisso è ignorato.
+        
+        Args:
+            cost: Costo relativo (1.0 = azione normale)
+        """
+        self._action_cost = cost
+    
+    def set_speed_modifier(self, entity, factor: float):
+        """
+        Applica haste (factor > 1) o slow (factor < 1) a un combattente
+        
+        Args:
+            entity: Character o Enemy della battaglia
+            factor: Moltiplicatore della velocità (1.0 = normale)
+        """
+        if self.scheduler is None:
+            return
+        for index, combatant in enumerate(self.turn_order):
+            if combatant.entity is entity:
+                self.scheduler.set_modifier(index, factor)
+                return
+    
+    def preview_turns(self, count: int = 10) -> List[Combatant]:
+        """
+        Prossimi combattenti che agiranno, senza modificare lo stato
+        
+        Args:
+            count: Numero di turni da prevedere
+            
+        Returns:
+            Lista di Combatant in ordine di turno
+        """
+        if not self.is_battle_active():
+            return []
+        
+        if self.scheduler is not None:
+            return [self.turn_order[i] for i in self.scheduler.preview(count)]
+        
+        order = []
+        size = len(self.turn_order)
+        index = self.current_turn_index
+        while len(order) < count:
+            combatant = self.turn_order[index % size]
+            if combatant.is_alive():
+                order.append(combatant)
+            index += 1
+        return order
+    
     def get_alive_combatants(self) -> List[Combatant]:
         """Ritorna la lista di tutti i combattenti vivi"""
         return [c for c in self.turn_order if c.is_alive()]
@@ -144,7 +307,12 @@ class TurnManager:
         """Reset del turn manager (nuovo combattimento)"""
         self.current_turn_index = 0
         self.round_number = 1
+        self.release()
+        self._attach_listeners()
         self.turn_order = self._initialize_turn_order()
+        self._action_cost = 1.0
+        self._init_scheduler()
+        self.version += 1
     
     def __str__(self) -> str:
         status = "ACTIVE" if self.is_battle_active() else "ENDED"
@@ -0,0 +1,170 @@
+"""
+Battle View - Dati di visualizzazione del combattimento, aggiornati solo sui cambiamenti
+
+La schermata di combattimento viene ridisegnata 60 volte al secondo, ma lo
+stato della battaglia cambia solo quando qualcuno agisce. BattleViewModel
+tiene i campi già pronti per il disegno (etichette, testi degli HP,
+percentuali delle barre, personaggio attivo, comandi, anteprima dei KO,
+consiglio dell'advisor) e li ricalcola solo quando cambia Battle.version o il bersaglio selezionato.
+
+La costruzione legge lo stato senza modificarlo: il combattente di turno
+viene da TurnManager.preview_turns e non da get_current_combatant, che può
+far avanzare il turno. Il rendering di un frame non ha quindi effetti
+collaterali sulla battaglia.
+"""
+
+from typing import NamedTuple, Optional, Sequence, Tuple
+
+
+# Chiavi dei colori dei nomi dei nemici (tradotte in colori dalla UI)
+HIGHLIGHT_TARGET = "target"
+HIGHLIGHT_BOSS = "boss"
+HIGHLIGHT_ENEMY = "enemy"
+HIGHLIGHT_DEFEATED = "defeated"
+
+PLAYER_COMMANDS = "[1] Attacco  [2] Magia  [3] Cura  [I] Oggetti  [F] Auto"
+TARGET_COMMANDS = "  [←/→] Bersaglio"
+ENEMY_TURN_TEXT = "TURNO NEMICO..."
+
+
+class EnemyRow(NamedTuple):
+    """Campi di disegno di un nemico"""
+    name: str
+    label: str
+    highlight: str
+    hp_text: str
+    hp_pct: float
+    alive: bool
+
+
+class HeroRow(NamedTuple):
+    """Campi di disegno di un personaggio"""
+    character: object
+    name: str
+    hp: int
+    max_hp: int
+    mp: int
+    max_mp: int
+    active: bool
+
+
+class BattleViewModel:
+    """Campi precalcolati della schermata di combattimento"""
+
+    def __init__(self):
+        """Inizializza una vista vuota (nessuna battaglia)"""
+        self.battle = None
+        self.version = -1
+        self.target_index = 0
+        self.enemies: Tuple[EnemyRow, ...] = ()
+        self.heroes: Tuple[HeroRow, ...] = ()
+        self.current_name: Optional[str] = None
+        self.is_player_turn = False
+        self.commands = ENEMY_TURN_TEXT
+        self.preview: Optional[str] = None
+        self.hint: Optional[str] = None
+        # Numero di ricostruzioni (per i test e il profiling)
+        self.rebuilds = 0
+
+    def update(self, battle, target_index: int = 0) -> bool:
+        """
+        Aggiorna i campi se la battaglia è cambiata
+
+        Args:
+            battle: Battle mostrata
+            target_index: Indice del bersaglio tra i nemici vivi
+
+        Returns:
+            True se i campi sono stati ricalcolati
+        """
+        version = battle.version
+        if (battle is self.battle and version == self.version
+                and target_index == self.target_index):
+            return False
+
+        self.battle = battle
+        self.version = version
+        self.target_index = target_index
+
+        current = battle.turn_manager.preview_turns(1)
+        current = current[0] if current else None
+        player = current.entity if current is not None and current.is_player else None
+
+        target = None
+        preview = None
+        hint = None
+        if player is not None:
+            alive = [foe for foe in battle.enemies if foe.is_alive]
+            if alive:
+                target = alive[target_index % len(alive)]
+            from combat.damage_model import combat_preview, format_preview
+            preview = format_preview(combat_preview(battle, player, target))
+            # Solo tabelle già pronte: costruirne una bloccherebbe il frame
+            from combat.advisor import suggest
+            suggestion = suggest(battle, player, build=False)
+            hint = str(suggestion) if suggestion is not None else None
+
+        self._fill(battle.party.characters, battle.enemies,
+                   player.name if player is not None else None, target, preview, hint)
+        return True
+
+    @classmethod
+    def from_parts(cls, characters: Sequence, enemies: Sequence,
+                   current_name: Optional[str] = None, target=None,
+                   preview: Optional[str] = None,
+                   hint: Optional[str] = None) -> 'BattleViewModel':
+        """
+        Costruisce una vista da dati sciolti (senza Battle)
+
+        Args:
+            characters: Personaggi del party
+            enemies: Nemici
+            current_name: Nome del personaggio di turno (None = turno nemico)
+            target: Nemico selezionato come bersaglio
+            preview: Riga con le probabilità di KO
+            hint: Riga con l'azione consigliata (combat.advisor)
+
+        Returns:
+            BattleViewModel
+        """
+        view = cls()
+        view._fill(characters, enemies, current_name, target, preview, hint)
+        return view
+
+    def _fill(self, characters: Sequence, enemies: Sequence, current_name: Optional[str],
+              target, preview: Optional[str], hint: Optional[str] = None):
+        """Calcola i campi di disegno"""
+        several = len(enemies) > 1
+        rows = []
+        for foe in enemies:
+            if not foe.is_alive:
+                highlight = HIGHLIGHT_DEFEATED
+            elif foe is target:
+                highlight = HIGHLIGHT_TARGET
+            elif "DRAGO" in foe.name:
+                highlight = HIGHLIGHT_BOSS
+            else:
+                highlight = HIGHLIGHT_ENEMY
+            label = f"▶ {foe.name} ◀" if foe is target and several else foe.name
+            pct = max(0, foe.hp / foe.max_hp) if foe.max_hp > 0 else 0
+            rows.append(EnemyRow(foe.name, label, highlight, f"{foe.hp}/{foe.max_hp}",
+                                 pct, foe.is_alive))
+        self.enemies = tuple(rows)
+
+        self.heroes = tuple(
+            HeroRow(char, char.name, char.hp, char.max_hp, char.mp, char.max_mp,
+                    char.name == current_name)
+            for char in characters
+        )
+
+        self.is_player_turn = any(hero.active for hero in self.heroes)
+        self.current_name = current_name if self.is_player_turn else None
+        if self.is_player_turn:
+            self.commands = PLAYER_COMMANDS + (TARGET_COMMANDS if several else "")
+            self.preview = preview
+            self.hint = hint
+        else:
+            self.commands = ENEMY_TURN_TEXT
+            self.preview = None
+            self.hint = None
+        self.rebuilds += 1
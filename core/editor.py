@@ -0,0 +1,295 @@
+"""
+Map Editor - Strumenti di modifica della mappa con undo/redo a diff
+"""
+
+from array import array
+from typing import List, Optional, Tuple
+from models.world import World, CellType
+
+
+Rect = Tuple[int, int, int, int]  # (x0, y0, x1, y1) estremi inclusi
+
+
+class CellDiff:
+    """
+    Diff compatto di una singola operazione di modifica.
+
+    Le celle modificate sono salvate come span orizzontali (y, x0, x1) in un
+    array piatto, con i vecchi valori concatenati in un unico bytes (un byte
+    per cella). Ogni operazione scrive un solo valore, quindi il nuovo stato
+    è il solo intero new_value.
+    """
+
+    __slots__ = ('spans', 'old_values', 'new_value', 'bounds')
+
+    def __init__(self, new_value: int):
+        """
+        Inizializza un diff vuoto
+
+        Args:
+            new_value: Valore scritto dall'operazione
+        """
+        self.spans = array('l')
+        self.old_values = bytearray()
+        self.new_value = new_value
+        self.bounds: Optional[Rect] = None
+
+    def add_span(self, y: int, x0: int, x1: int, old: List[int]) -> None:
+        """
+        Registra uno span modificato
+
+        Args:
+            y: Riga
+            x0: Prima colonna (inclusa)
+            x1: Ultima colonna (inclusa)
+            old: Valori precedenti delle celle dello span
+        """
+        self.spans.extend((y, x0, x1))
+        self.old_values.extend(old)
+        if self.bounds is None:
+            self.bounds = (x0, y, x1, y)
+        else:
+            bx0, by0, bx1, by1 = self.bounds
+            self.bounds = (min(bx0, x0), min(by0, y), max(bx1, x1), max(by1, y))
+
+    def cell_count(self) -> int:
+        """Ritorna il numero di celle modificate"""
+        return len(self.old_values)
+
+    def undo(self, grid: List[List[int]]) -> None:
+        """Ripristina i valori precedenti"""
+        spans = self.spans
+        offset = 0
+        for i in range(0, len(spans), 3):
+            y, x0, x1 = spans[i], spans[i + 1], spans[i + 2]
+            length = x1 - x0 + 1
+            grid[y][x0:x1 + 1] = self.old_values[offset:offset + length]
+            offset += length
+
+    def redo(self, grid: List[List[int]]) -> None:
+        """Riapplica l'operazione"""
+        spans = self.spans
+        value = self.new_value
+        for i in range(0, len(spans), 3):
+            y, x0, x1 = spans[i], spans[i + 1], spans[i + 2]
+            grid[y][x0:x1 + 1] = [value] * (x1 - x0 + 1)
+
+
+class MapEditor:
+    """Gestisce le modifiche a un World con pennello, rettangolo e riempimento"""
+
+    def __init__(self, world: World, max_history: int = 200):
+        """
+        Inizializza l'editor
+
+        Args:
+            world: Mondo da modificare
+            max_history: Numero massimo di operazioni annullabili
+        """
+        self.world = world
+        self.max_history = max_history
+        self.undo_stack: List[CellDiff] = []
+        self.redo_stack: List[CellDiff] = []
+        self.dirty: Optional[Rect] = None
+
+    # --- Strumenti ---
+
+    def paint(self, x: int, y: int, value: int, radius: int = 0) -> Optional[CellDiff]:
+        """
+        Pennello quadrato centrato su (x, y)
+
+        Args:
+            x: Colonna
+            y: Riga
+            value: Valore da scrivere
+            radius: Raggio del pennello (0 = una cella)
+
+        Returns:
+            CellDiff dell'operazione o None se nulla è cambiato
+        """
+        return self.fill_rect(x - radius, y - radius, x + radius, y + radius, value)
+
+    def fill_rect(self, x0: int, y0: int, x1: int, y1: int, value: int) -> Optional[CellDiff]:
+        """
+        Riempie un rettangolo (estremi inclusi, ritagliato ai bordi)
+
+        Args:
+            x0, y0: Primo angolo
+            x1, y1: Angolo opposto
+            value: Valore da scrivere
+
+        Returns:
+            CellDiff dell'operazione o None se nulla è cambiato
+        """
+        x0, x1 = sorted((x0, x1))
+        y0, y1 = sorted((y0, y1))
+        x0, y0 = max(0, x0), max(0, y0)
+        x1, y1 = min(self.world.width - 1, x1), min(self.world.height - 1, y1)
+        if x0 > x1 or y0 > y1:
+            return None
+
+        diff = CellDiff(value)
+        grid = self.world.grid
+        length = x1 - x0 + 1
+        new_span = [value] * length
+        for y in range(y0, y1 + 1):
+            row = grid[y]
+            old = row[x0:x1 + 1]
+            if old != new_span:
+                diff.add_span(y, x0, x1, old)
+                row[x0:x1 + 1] = new_span
+
+        return self._commit(diff)
+
+    def flood_fill(self, x: int, y: int, value: int) -> Optional[CellDiff]:
+        """
+        Riempimento a scanline (4-connesso) a partire da (x, y)
+
+        Ogni span orizzontale viene scritto con un'assegnazione a slice e
+        registrato nel diff come un'unica voce.
+
+        Args:
+            x: Colonna di partenza
+            y: Riga di partenza
+            value: Valore da scrivere
+
+        Returns:
+            CellDiff dell'operazione o None se nulla è cambiato
+        """
+        world = self.world
+        if not world.is_valid_position(x, y):
+            return None
+
+        grid = world.grid
+        target = grid[y][x]
+        if target == value:
+            return None
+
+        width, height = world.width, world.height
+        diff = CellDiff(value)
+        stack = [(x, y)]
+
+        while stack:
+            sx, sy = stack.pop()
+            row = grid[sy]
+            if row[sx] != target:
+                continue
+
+            # Estende lo span a sinistra e a destra
+            left = sx
+            while left > 0 and row[left - 1] == target:
+                left -= 1
+            right = sx
+            while right < width - 1 and row[right + 1] == target:
+                right += 1
+
+            length = right - left + 1
+            diff.add_span(sy, left, right, [target] * length)
+            row[left:right + 1] = [value] * length
+
+            # Un seme per ogni span contiguo nelle righe adiacenti
+            for ny in (sy - 1, sy + 1):
+                if 0 <= ny < height:
+                    adjacent = grid[ny]
+                    in_span = False
+                    for nx in range(left, right + 1):
+                        if adjacent[nx] == target:
+                            if not in_span:
+                                stack.append((nx, ny))
+                                in_span = True
+                        else:
+                            in_span = False
+
+        return self._commit(diff)
+
+    # --- Storia ---
+
+    def undo(self) -> bool:
+        """
+        Annulla l'ultima operazione
+
+        Returns:
+            True se un'operazione è stata annullata
+        """
+        if not self.undo_stack:
+            return False
+        diff = self.undo_stack.pop()
+        diff.undo(self.world.grid)
+        self.redo_stack.append(diff)
+        self._mark_dirty(diff.bounds)
+        if self._touches_start(diff):
+            self._refresh_start()
+        return True
+
+    def redo(self) -> bool:
+        """
+        Ripete l'ultima operazione annullata
+
+        Returns:
+            True se un'operazione è stata ripetuta
+        """
+        if not self.redo_stack:
+            return False
+        diff = self.redo_stack.pop()
+        diff.redo(self.world.grid)
+        self.undo_stack.append(diff)
+        self._mark_dirty(diff.bounds)
+        if self._touches_start(diff):
+            self._refresh_start()
+        return True
+
+    def consume_dirty(self) -> Optional[Rect]:
+        """
+        Ritorna e azzera la regione modificata dall'ultimo ridisegno
+
+        Returns:
+            Rettangolo (x0, y0, x1, y1) o None se nulla è cambiato
+        """
+        dirty = self.dirty
+        self.dirty = None
+        return dirty
+
+    def save(self, filepath: str) -> None:
+        """
+        Salva la mappa (compatta per mappe grandi)
+
+        Args:
+            filepath: Percorso del file JSON
+        """
+        self._refresh_start()
+        self.world.save_to_file(filepath, compact=self.world.width * self.world.height > 10_000)
+
+    def _commit(self, diff: CellDiff) -> Optional[CellDiff]:
+        """Registra un diff nella storia e segna la regione da ridisegnare"""
+        if diff.cell_count() == 0:
+            return None
+
+        self.undo_stack.append(diff)
+        if len(self.undo_stack) > self.max_history:
+            self.undo_stack.pop(0)
+        self.redo_stack.clear()
+        self._mark_dirty(diff.bounds)
+        if self._touches_start(diff):
+            self._refresh_start()
+        return diff
+
+    def _mark_dirty(self, bounds: Optional[Rect]) -> None:
+        """Unisce un rettangolo alla regione da ridisegnare"""
+        if bounds is None:
+            return
+        if self.dirty is None:
+            self.dirty = bounds
+        else:
+            x0, y0, x1, y1 = self.dirty
+            bx0, by0, bx1, by1 = bounds
+            self.dirty = (min(x0, bx0), min(y0, by0), max(x1, bx1), max(y1, by1))
+
+    @staticmethod
+    def _touches_start(diff: CellDiff) -> bool:
+        """Verifica se il diff scrive o cancella una cella START"""
+        start = CellType.START.value
+        return diff.new_value == start or start in diff.old_values
+
+    def _refresh_start(self) -> None:
+        """Aggiorna la posizione di START dopo una modifica"""
+        self.world.start_position = self.world._find_cell_type(CellType.START)
@@ -2,15 +2,17 @@
 Game Engine - Loop principale del gioco
 """
 
-import random
 from pathlib import Path
+from typing import Optional
 from models.party import Party
 from models.character import Character
 from models.world import World
 from core.input_manager import InputManager
 from core.movement import MovementManager, MovementResult
+from core.triggers import TriggerType
 from combat.battle import Battle
 from combat.enemy import Enemy
+from utils.rng import SplitMixRNG
 from utils.display import (
     print_party_status,
     print_action_result,
@@ -26,8 +28,17 @@ from utils.display import (
 class GameEngine:
     """Classe principale che gestisce il loop del gioco"""
     
-    def __init__(self):
-        """Inizializza il game engine"""
+    # Numero di nemici (min, max) in un incontro casuale
+    ENCOUNTER_SIZE = (1, 2)
+    
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Inizializza il game engine
+        
+        Args:
+            seed: Seme del generatore casuale della partita (None = casuale)
+        """
+        self.rng = SplitMixRNG(seed)
         self.party = Party()
         self.input_manager = InputManager()
         self.running = False
@@ -40,6 +51,19 @@ class GameEngine:
         self.current_battle = None
         self.in_combat = False
         
+        # Auto-battaglia: gli incontri si risolvono con una policy del party
+        self.auto_battle = False
+        self.auto_policy = "balanced"
+        
+        # Gestori dei trigger di movimento (codice trigger -> metodo)
+        self.trigger_handlers = {
+            TriggerType.DANGER: self._on_danger,
+            TriggerType.TREASURE: self._on_treasure,
+            TriggerType.EXIT: self._on_exit,
+            TriggerType.TRAP: self._on_trap,
+            TriggerType.HORDE: self._on_horde,
+        }
+        
         
     
     def _initialize_default_party(self):
@@ -100,7 +124,7 @@ class GameEngine:
             print_action_result("Scelta non valida! Riprova.", success=False)
         
         # Crea il personaggio
-        character = Character(name=name, character_class=selected_class)
+        character = Character(name=name, character_class=selected_class, rng=self.rng)
         
         print()
         print_action_result(f"✨ {character.name} il {Character.get_class_info(selected_class)['name']} è pronto per l'avventura!", success=True)
@@ -204,6 +228,7 @@ class GameEngine:
             'look': self._handle_look,
             'move': self._handle_move,
             'inventory': self._handle_inventory,
+            'auto': self._handle_auto,
         }
         
         handler = action_handlers.get(command.action)
@@ -242,8 +267,8 @@ class GameEngine:
             print_action_result("Non ci sono bersagli validi!", success=False)
             return
         
-        target = random.choice(possible_targets)
-        damage = random.randint(10, 30)
+        target = self.rng.choice(possible_targets)
+        damage = self.rng.randint(10, 30)
         
         actual_damage = target.take_damage(damage)
         print_combat_message(attacker.name, target.name, actual_damage)
@@ -292,6 +317,12 @@ class GameEngine:
         """Termina il gioco"""
         self.running = False
     
+    def _handle_auto(self, command):
+        """Attiva o disattiva l'auto-battaglia"""
+        self.auto_battle = not self.auto_battle
+        state = "attiva" if self.auto_battle else "disattivata"
+        print_action_result(f"Auto-battaglia {state} (policy: {self.auto_policy})")
+    
     def _handle_inventory(self, command):
         """Mostra l'inventario"""
         print()
@@ -415,31 +446,84 @@ class GameEngine:
             print()
             print(self.world.print_map(self.movement_manager.get_position()))
             
-                            # Gestisci trigger
-            if result.trigger == "DANGER":
-                print()
-                print_separator()
-                self._start_combat()
-            elif result.trigger == "TREASURE":
-                print()
-                print_separator()
-                print("💎 Hai trovato 50 monete d'oro!")
-                print_separator()
-            elif result.trigger == "EXIT":
-                print()
-                print_separator()
-                print("🎉 HAI COMPLETATO IL DUNGEON!")
-                print_separator()
+            # Gestisci trigger
+            handler = self.trigger_handlers.get(result.trigger)
+            if handler:
+                handler(result)
+    
+    def _on_danger(self, result: MovementResult):
+        """Trigger DANGER: inizia un combattimento"""
+        print()
+        print_separator()
+        self._start_combat()
+    
+    def _on_treasure(self, result: MovementResult):
+        """Trigger TREASURE: mostra il tesoro trovato"""
+        print()
+        print_separator()
+        print("💎 Hai trovato 50 monete d'oro!")
+        print_separator()
+    
+    def _on_exit(self, result: MovementResult):
+        """Trigger EXIT: dungeon completato"""
+        print()
+        print_separator()
+        print("🎉 HAI COMPLETATO IL DUNGEON!")
+        print_separator()
+    
+    def _on_trap(self, result: MovementResult):
+        """Trigger TRAP: danneggia tutti i personaggi vivi"""
+        damage = result.data.get('damage', 0) if result.data else 0
+        print()
+        for char in self.party.get_alive_characters():
+            actual_damage = char.take_damage(damage)
+            print(f"  🩸 {char.name} subisce {actual_damage} danni")
+            if not char.is_alive:
+                print_death_message(char.name)
+        
+        if not self.party.is_party_alive():
+            print()
+            print("=== GAME OVER ===")
+            self.running = False
+    
+    def _on_horde(self, result: MovementResult):
+        """Trigger HORDE: combattimento contro un'orda, risolto automaticamente"""
+        from combat.horde import Horde, resolve_horde
+        
+        data = result.data or {}
+        horde = Horde.random(data.get('count', 50), data.get('level', 1),
+                             data.get('enemies'), rng=self.rng)
+        battle_result, summary = resolve_horde(self.party, horde, rng=self.rng)
+        print()
+        print(summary)
+        
+        if battle_result.victory:
+            # Orda sconfitta: la cella non la genera più
+            self.movement_manager.remove_trigger(*self.movement_manager.get_position())
+        else:
+            print("💀 SCONFITTA! Il party è stato travolto dall'orda...")
+            print("=== GAME OVER ===")
+            self.running = False
     
     def _start_combat(self):
         """Inizia un combattimento"""
-        # Crea un nemico casuale
-        enemy = Enemy.create_random(min_level=1, max_level=2)
+        # Crea un gruppo di nemici casuali
+        count = self.rng.randint(*self.ENCOUNTER_SIZE)
+        enemies = Enemy.create_group(count, min_level=1, max_level=2, rng=self.rng)
         
         # Crea la battaglia
-        self.current_battle = Battle(self.party, enemy)
+        self.current_battle = Battle(self.party, enemies, rng=self.rng, initiative=True)
         self.in_combat = True
         
+        if self.auto_battle:
+            print("⚔️  Incontro: " + ", ".join(e.get_display_name() for e in enemies))
+            self._resolve_auto_combat()
+            return
+        
+        # Tabelle dell'advisor mancanti, costruite mentre si gioca
+        from combat.advisor import prepare_tables
+        prepare_tables(self.current_battle)
+        
         # Mostra intro
         print(self.current_battle.start_battle())
         
@@ -460,9 +544,15 @@ class GameEngine:
             if not current:
                 break
             
+            upcoming = self.current_battle.turn_manager.preview_turns(5)
+            print("⏳ Prossimi turni: " + " → ".join(c.name for c in upcoming))
+            
             if current.is_player:
                 # Turno del giocatore
                 self._handle_player_combat_turn(current.entity)
+                if not self.in_combat:
+                    # Battaglia risolta con l'auto-battaglia
+                    break
             else:
                 # Turno del nemico
                 self._handle_enemy_combat_turn()
@@ -481,6 +571,13 @@ class GameEngine:
         print()
         print(f"🎯 Turno di: {player.name}")
         print(f"   HP: {player.hp}/{player.max_hp} | MP: {player.mp}/{player.max_mp}")
+        from combat.damage_model import combat_preview, format_preview
+        print("   " + format_preview(combat_preview(self.current_battle, player)))
+        from combat.advisor import suggest
+        # Solo tabelle pronte: quelle mancanti si costruiscono in background
+        suggestion = suggest(self.current_battle, player, build=False)
+        if suggestion is not None:
+            print(f"   {suggestion}")
         print()
         print("Azioni disponibili:")
         print("  1. Attacco Fisico")
@@ -488,15 +585,18 @@ class GameEngine:
         print("  3. Cura te stesso")
         print("  4. Cura un alleato")
         print("  5. Usa oggetto")
+        print("  6. Auto-battaglia (risolve il combattimento)")
         print()
         
         # Input azione
-        choice = input("Scegli azione (1-5): ").strip()
+        choice = input("Scegli azione (1-6): ").strip()
         
         if choice == "1":
-            action = self.current_battle.execute_player_turn(player, "attack")
+            target = self._choose_enemy_target()
+            action = self.current_battle.execute_player_turn(player, "attack", target)
         elif choice == "2":
-            action = self.current_battle.execute_player_turn(player, "magic")
+            target = self._choose_enemy_target()
+            action = self.current_battle.execute_player_turn(player, "magic", target)
         elif choice == "3":
             action = self.current_battle.execute_player_turn(player, "heal", player)
         elif choice == "4":
@@ -526,6 +626,9 @@ class GameEngine:
             # Usa oggetto
             self._handle_use_item_in_combat(player)
             return
+        elif choice == "6":
+            self._resolve_auto_combat()
+            return
         else:
             print("Azione non valida, passi il turno")
             return
@@ -538,6 +641,29 @@ class GameEngine:
         print()
         self._show_combat_status()
     
+    def _choose_enemy_target(self):
+        """
+        Chiede quale nemico colpire (solo se ne è vivo più di uno)
+        
+        Returns:
+            Enemy scelto o None (primo nemico vivo)
+        """
+        alive_enemies = self.current_battle.turn_manager.get_alive_enemies()
+        if len(alive_enemies) < 2:
+            return None
+        
+        print("\nBersagli:")
+        for i, foe in enumerate(alive_enemies, 1):
+            print(f"  {i}. {foe}")
+        
+        try:
+            index = int(input("Scegli bersaglio: ").strip()) - 1
+            if 0 <= index < len(alive_enemies):
+                return alive_enemies[index]
+        except ValueError:
+            pass
+        return None
+    
     def _handle_use_item_in_combat(self, player: Character):
         """Gestisce l'uso di oggetti in combattimento"""
         consumables = self.party.inventory.get_consumables()
@@ -586,7 +712,7 @@ class GameEngine:
                         except ValueError:
                             pass
                 elif target_choice == "3":
-                    target = None  # Per oggetti offensivi
+                    target = self._choose_enemy_target()  # Per oggetti offensivi
                 
                 action = self.current_battle.execute_player_turn(
                     player, "use_item", target, selected_item.item_id
@@ -605,12 +731,13 @@ class GameEngine:
     
     def _handle_enemy_combat_turn(self):
         """Gestisce il turno del nemico"""
+        enemy = self.current_battle.turn_manager.get_current_combatant().entity
         print()
-        print(f"👹 Turno di: {self.current_battle.enemy.get_display_name()}")
+        print(f"👹 Turno di: {enemy.get_display_name()}")
         print()
         
         # IA esegue l'azione
-        action = self.current_battle.execute_enemy_turn()
+        action = self.current_battle.execute_enemy_turn(enemy)
         
         print(action.message)
         
@@ -625,12 +752,15 @@ class GameEngine:
         print_separator("-")
         print("STATO BATTAGLIA:")
         print()
-        print(f"👹 {self.current_battle.enemy}")
+        effects = self.current_battle.effects
+        for foe in self.current_battle.enemies:
+            print(f"👹 {foe}{self._effects_label(effects, foe)}")
         print()
         print("👥 Party:")
         for char in self.party.characters:
             icon = "✓" if char.is_alive else "✗"
-            print(f"   {icon} {char.name}: {char.hp}/{char.max_hp} HP | {char.mp}/{char.max_mp} MP")
+            print(f"   {icon} {char.name}: {char.hp}/{char.max_hp} HP | {char.mp}/{char.max_mp} MP"
+                  f"{self._effects_label(effects, char)}")
         print()
         print("📦 Oggetti chiave:")
         consumables = self.party.inventory.get_consumables()
@@ -641,6 +771,27 @@ class GameEngine:
             print("   • Nessun oggetto")
         print_separator("-")
     
+    def _resolve_auto_combat(self):
+        """Gioca il resto del combattimento con la policy automatica"""
+        from combat.auto_battle import auto_battle
+        
+        result, summary = auto_battle(self.current_battle, self.auto_policy)
+        self.in_combat = False
+        print(summary)
+        
+        if result.victory:
+            self.current_battle = None
+        else:
+            print("💀 SCONFITTA! Il party è stato annientato...")
+            print("=== GAME OVER ===")
+            self.running = False
+    
+    @staticmethod
+    def _effects_label(effects, entity) -> str:
+        """Nomi degli effetti di stato attivi, tra parentesi quadre"""
+        active = effects.effects_on(entity)
+        return f" [{', '.join(e.name for e in active)}]" if active else ""
+    
     def _end_combat(self, result):
         """Termina il combattimento"""
         self.in_combat = False
@@ -31,6 +31,7 @@ class InputManager:
         'look': ['guarda', 'osserva', 'l'],
         'move': ['muovi', 'vai'],
         'inventory': ['inventario', 'inv', 'i'],
+        'auto': ['autobattle', 'automatico'],
         'w': ['up', 'nord', 'n'],
         'a': ['left', 'ovest', 'o'],
         's': ['down', 'sud'],
@@ -111,6 +112,7 @@ class InputManager:
             "• w / a / s / d       - Muovi su/sinistra/giù/destra",
             "• map / m             - Mostra la mappa",
             "• look / l            - Osserva i dintorni",
+            "• auto                - Attiva/disattiva l'auto-battaglia",
             "",
             "⚔️  Durante il Combattimento:",
             "• 1                   - Attacco Fisico (usa ATK bonus)",
@@ -118,6 +120,7 @@ class InputManager:
             "• 3                   - Cura te stesso",
             "• 4                   - Cura un alleato",
             "• 5                   - Usa oggetto dall'inventario",
+            "• 6                   - Auto-battaglia (risolve il combattimento)",
             "",
             "🔧 Sistema:",
             "• help / h / ?        - Mostra questo aiuto",
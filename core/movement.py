@@ -4,7 +4,7 @@ Sistema di Movimento - Gestisce il movimento del party sulla mappa
 
 from typing import Tuple, Optional, Dict
 from enum import Enum
-from models.world import World, CellType
+from models.world import World
 from models.party import Party
 
 
@@ -20,7 +20,8 @@ class MovementResult:
     """Risultato di un tentativo di movimento"""
     
     def __init__(self, success: bool, new_position: Tuple[int, int], 
-                 message: str, trigger: Optional[str] = None):
+                 message: str, trigger: Optional[str] = None,
+                 data: Optional[Dict] = None):
         """
         Inizializza il risultato del movimento
         
@@ -29,11 +30,13 @@ class MovementResult:
             new_position: Nuova posizione (x, y)
             message: Messaggio descrittivo
             trigger: Tipo di trigger attivato (es. "DANGER", "TREASURE")
+            data: Parametri aggiuntivi del trigger (es. danno di una trappola)
         """
         self.success = success
         self.new_position = new_position
         self.message = message
         self.trigger = trigger
+        self.data = data
 
 
 class MovementManager:
@@ -59,7 +62,8 @@ class MovementManager:
         Direction.RIGHT: (1, 0)
     }
     
-    def __init__(self, world: World, start_x: int = 0, start_y: int = 0):
+    def __init__(self, world: World, start_x: int = 0, start_y: int = 0,
+                 registry=None):
         """
         Inizializza il movement manager
         
@@ -67,8 +71,16 @@ class MovementManager:
             world: Mondo di gioco
             start_x: Posizione iniziale X
             start_y: Posizione iniziale Y
+            registry: TriggerRegistry da usare (default: trigger standard)
         """
+        if registry is None:
+            from core.triggers import DEFAULT_REGISTRY
+            registry = DEFAULT_REGISTRY
+        
         self.world = world
+        self.registry = registry
+        # Tabella gestori risolta una volta al caricamento della mappa
+        self.trigger_table = registry.compile(world)
         self.position_x = start_x
         self.position_y = start_y
         
@@ -151,29 +163,48 @@ class MovementManager:
         self.position_x = new_x
         self.position_y = new_y
         
-        # Controlla trigger della nuova cella
-        cell_value = self.world.get_cell(new_x, new_y)
-        trigger = None
-        message = f"Ti sei mosso da ({old_x}, {old_y}) a ({new_x}, {new_y})"
-        
-        if cell_value == CellType.DANGER.value:
-            trigger = "DANGER"
-            message = "⚔️ PERICOLO! Hai incontrato un nemico!"
-        elif cell_value == CellType.TREASURE.value:
-            trigger = "TREASURE"
-            message = "💎 Hai trovato un tesoro!"
-        elif cell_value == CellType.EXIT.value:
-            trigger = "EXIT"
-            message = "🚪 Hai raggiunto l'uscita!"
-        elif cell_value == CellType.START.value:
-            message = "📍 Sei tornato al punto di partenza"
-        
-        return MovementResult(
-            success=True,
-            new_position=self.get_position(),
-            message=message,
-            trigger=trigger
-        )
+        # Trigger della nuova cella: una lettura dalla tabella e una chiamata
+        handler = self.trigger_table[new_y * self.world.width + new_x]
+        return handler(self, old_x, old_y)
+    
+    def set_cell(self, x: int, y: int, value: int) -> None:
+        """
+        Modifica una cella del mondo e aggiorna la tabella dei trigger
+        
+        Args:
+            x: Coordinata X
+            y: Coordinata Y
+            value: Nuovo valore della cella
+        """
+        if not self.world.is_valid_position(x, y):
+            return
+        
+        self.world.set_cell(x, y, value)
+        
+        # I trigger scriptati per coordinata restano attivi
+        for spec in self.world.triggers:
+            if spec["x"] == x and spec["y"] == y:
+                return
+        
+        self.trigger_table[y * self.world.width + x] = self.registry.get_cell_handler(value)
+    
+    def remove_trigger(self, x: int, y: int) -> None:
+        """
+        Rimuove i trigger scriptati di una cella (es. un'orda già sconfitta)
+        
+        La cella torna al gestore del suo tipo.
+        
+        Args:
+            x: Coordinata X
+            y: Coordinata Y
+        """
+        if not self.world.is_valid_position(x, y):
+            return
+        
+        self.world.triggers = [spec for spec in self.world.triggers
+                               if spec["x"] != x or spec["y"] != y]
+        self.trigger_table[y * self.world.width + x] = \
+            self.registry.get_cell_handler(self.world.grid[y][x])
     
     def move_forward(self, direction: Direction) -> bool:
         """
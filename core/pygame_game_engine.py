@@ -5,15 +5,20 @@ Pygame Game Engine - Loop principale con grafica
 import pygame
 import sys
 from pathlib import Path
+from typing import Optional
 from models.party import Party
 from models.character import Character
-from models.world import World
+from models.world import World, CellType
 from core.movement import MovementManager
+from core.triggers import TriggerType
+from core.battle_view import BattleViewModel
 from combat.battle import Battle
 from combat.enemy import Enemy
+from combat.ai_executor import AIExecutor
 from rendering.renderer import Renderer, Color
 from rendering.ui_manager import UIManager
 from utils.display import print_separator
+from utils.rng import SplitMixRNG
 
 
 class GameState:
@@ -32,10 +37,19 @@ class GameState:
 class PygameGameEngine:
     """Game Engine principale con Pygame"""
     
-    def __init__(self):
-        """Inizializza il game engine"""
+    # Numero di nemici (min, max) in un incontro casuale
+    ENCOUNTER_SIZE = (1, 2)
+    
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Inizializza il game engine
+        
+        Args:
+            seed: Seme del generatore casuale della partita (None = casuale)
+        """
         
         pygame.init()
+        self.rng = SplitMixRNG(seed)
         self.renderer = Renderer(width=1024, height=768, title="The Last Dream")
         self.ui_manager = UIManager(self.renderer)
 
@@ -67,6 +81,18 @@ class PygameGameEngine:
         # Inventory UI
         self.inventory_selected = 0
         
+        # Bersaglio selezionato in combattimento (indice tra i nemici vivi)
+        self.combat_target_index = 0
+        # Campi di disegno del combattimento (ricalcolati solo sui cambiamenti)
+        self.combat_view = BattleViewModel()
+        # Decisioni dei nemici su un thread di lavoro (il rendering non si ferma)
+        self.ai_executor = AIExecutor()
+        self.enemy_messages = []
+        
+        # Auto-battaglia: gli incontri si risolvono con una policy del party
+        self.auto_battle = False
+        self.auto_policy = "balanced"
+        
         # Messaggi temporanei
         self.message = ""
         self.message_timer = 0
@@ -104,6 +130,17 @@ class PygameGameEngine:
 
         self.dialogue_next_state = GameState.LEVEL_SELECTION
 
+        # Gestori dei trigger di movimento (codice trigger -> metodo)
+        self.trigger_handlers = {
+            TriggerType.DANGER: self._on_danger,
+            TriggerType.TREASURE: self._on_treasure,
+            TriggerType.EXIT: self._on_exit,
+            TriggerType.TRAP: self._on_trap,
+            TriggerType.DOOR: self._on_message,
+            TriggerType.TELEPORT: self._on_message,
+            TriggerType.HORDE: self._on_horde,
+        }
+
     def _handle_menu_input(self, key):
         """Input del menu principale (Corretto per gestire Riprendi)"""
         # Navigazione SU
@@ -161,6 +198,7 @@ class PygameGameEngine:
             self.renderer.update()
         
         # Cleanup
+        self.ai_executor.shutdown()
         self.renderer.quit()
         pygame.quit()
         sys.exit()
@@ -271,7 +309,7 @@ class PygameGameEngine:
         elif key == pygame.K_RETURN and len(self.temp_name) > 0:
             # Crea personaggio
             selected_class = self.available_classes[self.temp_class_index]
-            char = Character(name=self.temp_name, character_class=selected_class)
+            char = Character(name=self.temp_name, character_class=selected_class, rng=self.rng)
             self.party.add_character(char)
             
             if self.creation_phase == 0:
@@ -432,6 +470,11 @@ class PygameGameEngine:
             self.inventory_selected = 0
             self.key_cooldown = current_time
         
+        elif key == pygame.K_f:
+            self.auto_battle = not self.auto_battle
+            self._show_message("⚡ Auto-battaglia " + ("attiva" if self.auto_battle else "disattivata"))
+            self.key_cooldown = current_time
+        
         elif key == pygame.K_ESCAPE:
             self.previous_state = self.state  
             self.state = GameState.MENU
@@ -451,15 +494,23 @@ class PygameGameEngine:
         
         player = current.entity
         
+        # Selezione del bersaglio
+        if key in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_TAB):
+            alive_enemies = self.current_battle.turn_manager.get_alive_enemies()
+            if alive_enemies:
+                step = -1 if key == pygame.K_LEFT else 1
+                self.combat_target_index = (self.combat_target_index + step) % len(alive_enemies)
+            self.key_cooldown = current_time
+        
         # Azioni di combattimento
-        if key == pygame.K_1:  # Attacco fisico
-            action = self.current_battle.execute_player_turn(player, "attack")
+        elif key == pygame.K_1:  # Attacco fisico
+            action = self.current_battle.execute_player_turn(player, "attack", self._combat_target())
             self._show_message(action.message)
             self._next_combat_turn()
             self.key_cooldown = current_time
         
         elif key == pygame.K_2:  # Attacco magico
-            action = self.current_battle.execute_player_turn(player, "magic")
+            action = self.current_battle.execute_player_turn(player, "magic", self._combat_target())
             self._show_message(action.message)
             self._next_combat_turn()
             self.key_cooldown = current_time
@@ -470,6 +521,10 @@ class PygameGameEngine:
             self._next_combat_turn()
             self.key_cooldown = current_time
         
+        elif key == pygame.K_f:  # Auto-battaglia: risolve il combattimento
+            self._resolve_auto_combat()
+            self.key_cooldown = current_time
+        
         elif key == pygame.K_4:  # Cura alleato
             alive_allies = [p for p in self.party.characters if p.is_alive and p != player]
             if alive_allies:
@@ -479,6 +534,14 @@ class PygameGameEngine:
                 self._next_combat_turn()
             self.key_cooldown = current_time
     
+    def _combat_target(self):
+        """Nemico vivo attualmente selezionato come bersaglio"""
+        alive_enemies = self.current_battle.turn_manager.get_alive_enemies()
+        if not alive_enemies:
+            return None
+        self.combat_target_index %= len(alive_enemies)
+        return alive_enemies[self.combat_target_index]
+    
     def _handle_inventory_input(self, key):
         """Input nell'inventario (FIX: Recupera ID corretti dal dizionario)"""
         current_time = pygame.time.get_ticks()
@@ -550,58 +613,108 @@ class PygameGameEngine:
         
         result = self.movement_manager.move(direction)
         
-        # --- 1. NEMICO ---
-        if result.trigger == "DANGER":
-            self._start_combat()
+        handler = self.trigger_handlers.get(result.trigger)
+        if handler:
+            handler(result)
+    
+    def _on_danger(self, result):
+        """Trigger DANGER: inizia un combattimento"""
+        self._start_combat()
+    
+    def _on_treasure(self, result):
+        """Trigger TREASURE: raccoglie il tesoro e svuota la cella"""
+        self.party.inventory.add_item('health_potion', 1)
+        self._show_message("💎 Hai trovato una Pozione di Vita!")
+        px, py = self.movement_manager.get_position()
+        self.movement_manager.set_cell(px, py, CellType.EMPTY.value)
+    
+    def _on_trap(self, result):
+        """Trigger TRAP: danneggia tutti i personaggi vivi"""
+        damage = result.data.get('damage', 0) if result.data else 0
+        for char in self.party.get_alive_characters():
+            char.take_damage(damage)
+        self._show_message(result.message)
+        
+        if not self.party.is_party_alive():
+            self.state = GameState.GAME_OVER
+    
+    def _on_horde(self, result):
+        """Trigger HORDE: combattimento contro un'orda, risolto automaticamente"""
+        from combat.horde import Horde, resolve_horde
+        
+        data = result.data or {}
+        horde = Horde.random(data.get('count', 50), data.get('level', 1),
+                             data.get('enemies'), rng=self.rng)
+        battle_result, summary = resolve_horde(self.party, horde, rng=self.rng)
+        self._show_message(str(summary))
+        
+        if battle_result.victory:
+            # Orda sconfitta: la cella non la genera più
+            self.movement_manager.remove_trigger(*self.movement_manager.get_position())
+        else:
+            self.state = GameState.GAME_OVER
+    
+    def _on_message(self, result):
+        """Trigger scriptati che mostrano solo un messaggio (porte, teletrasporti)"""
+        self._show_message(result.message)
+    
+    def _on_exit(self, result):
+        """Trigger EXIT: completa il livello o avvia il boss finale"""
+        # A) Controllo Nemici
+        if not self._are_all_enemies_defeated():
+            self._show_message("⛔ Devi sconfiggere tutti i nemici prima!")
+            return 
+
+        # B) Controllo Boss (Solo Ultimo Livello)
+        is_last_level = (self.current_level_index == len(self.level_files) - 1)
+        if is_last_level and not self.final_boss_defeated:
+            self._start_boss_fight()
+            return
+        
+        # C) FINE LIVELLO -> TORNA AL MENU
+        self._show_message("Livello Completato!")
+        
+        if not is_last_level:
+            # 1. Calcola quale sarebbe il prossimo livello
+            next_level_idx = self.current_level_index + 1
             
-        # --- 2. TESORO ---
-        elif result.trigger == "TREASURE":
-            self.party.inventory.add_item('health_potion', 1)
-            self._show_message("💎 Hai trovato una Pozione di Vita!")
-            px, py = self.movement_manager.get_position()
-            if self.world:
-                self.world.grid[py][px] = 0
+            # 2. Sblocca il livello
+            if next_level_idx > self.max_unlocked_index:
+                self.max_unlocked_index = next_level_idx
+                self._show_message(f"🔓 {self.level_names[next_level_idx]} Sbloccato!")
             
-        # --- 3. USCITA (EXIT) ---
-        elif result.trigger == "EXIT":
-            # A) Controllo Nemici
-            if not self._are_all_enemies_defeated():
-                self._show_message("⛔ Devi sconfiggere tutti i nemici prima!")
-                return 
-
-            # B) Controllo Boss (Solo Ultimo Livello)
-            is_last_level = (self.current_level_index == len(self.level_files) - 1)
-            if is_last_level and not self.final_boss_defeated:
-                self._start_boss_fight()
-                return
             
-            # C) FINE LIVELLO -> TORNA AL MENU
-            self._show_message("Livello Completato!")
+            self.state = GameState.LEVEL_SELECTION
+            self.level_selection_index = next_level_idx 
             
-            if not is_last_level:
-                # 1. Calcola quale sarebbe il prossimo livello
-                next_level_idx = self.current_level_index + 1
-                
-                # 2. Sblocca il livello
-                if next_level_idx > self.max_unlocked_index:
-                    self.max_unlocked_index = next_level_idx
-                    self._show_message(f"🔓 {self.level_names[next_level_idx]} Sbloccato!")
-                
-                
-                self.state = GameState.LEVEL_SELECTION
-                self.level_selection_index = next_level_idx 
-                
-            else:
-                # Era l'ultimo livello: Vittoria Finale
-                self.state = GameState.VICTORY
+        else:
+            # Era l'ultimo livello: Vittoria Finale
+            self.state = GameState.VICTORY
     
     def _start_combat(self):
         """Inizia un combattimento"""
-        enemy = Enemy.create_random(min_level=1, max_level=2)
-        self.current_battle = Battle(self.party, enemy)
+        count = self.rng.randint(*self.ENCOUNTER_SIZE)
+        enemies = Enemy.create_group(count, min_level=1, max_level=2, rng=self.rng)
+        self.current_battle = Battle(self.party, enemies, rng=self.rng, initiative=True)
+        if self.auto_battle:
+            self._resolve_auto_combat()
+            return
+        from combat.advisor import prepare_tables
+        prepare_tables(self.current_battle)
         self.current_battle.start_battle()
+        self.combat_target_index = 0
         self.state = GameState.COMBAT
-        self._show_message(f"⚔️ Combattimento contro {enemy.get_display_name()}!")
+        names = ", ".join(e.get_display_name() for e in enemies)
+        self._show_message(f"⚔️ Combattimento contro {names}!")
+    
+    def _resolve_auto_combat(self):
+        """Gioca il resto del combattimento con la policy automatica"""
+        from combat.auto_battle import auto_battle
+        
+        self.ai_executor.cancel()
+        result, summary = auto_battle(self.current_battle, self.auto_policy)
+        self._on_combat_end(result)
+        self._show_message(str(summary))
     
     # Controlla fine battaglia
         result = self.current_battle.check_battle_end()
@@ -611,7 +724,7 @@ class PygameGameEngine:
                 
                
                 px, py = self.movement_manager.get_position()
-                self.world.grid[py][px] = 0  # 0 = Cella Vuota
+                self.movement_manager.set_cell(px, py, CellType.EMPTY.value)
                 
                 
                 self.state = GameState.EXPLORATION
@@ -646,14 +759,15 @@ class PygameGameEngine:
     def _start_boss_fight(self):
         """Prepara la Boss Fight con dialogo introduttivo"""
         # 1. Crea il Boss
-        boss = Enemy.create_random(min_level=5, max_level=5)
+        boss = Enemy.create_random(min_level=5, max_level=5, rng=self.rng)
         boss.name = "DRAGO ANTICO"
         boss.max_hp = 300
         boss.hp = 300
         boss.damage = 25
         boss.xp_reward = 5000
+        boss.ai = "boss"
         
-        self.current_battle = Battle(self.party, boss)
+        self.current_battle = Battle(self.party, boss, rng=self.rng, initiative=True)
         
         # 2. Dialogo 
         self.intro_lines = [
@@ -683,60 +797,30 @@ class PygameGameEngine:
         result = self.current_battle.check_battle_end()
         
         if result:
-            if result.victory:
-                enemy_name = self.current_battle.enemy.name
-                self._show_message(f"🎉 VITTORIA! {enemy_name} sconfitto. LEVEL UP: +HP/MP!")
-                
-                # CASO A: È IL DRAGO ANTICO (BOSS FINALE) 
-                if enemy_name == "DRAGO ANTICO":
-                    self.final_boss_defeated = True
-                    
-                    # 1. Dialogo Epico Finale
-                    self.intro_lines = [
-                        "Il Drago Antico lancia un ultimo ruggito straziante...",
-                        "Il suo corpo colossale crolla in polvere.",
-                        "Tra le ceneri, qualcosa brilla di luce pura.",
-                        "È la CHIAVE DELL'ECO!",
-                        "L'avete trovata. Il portale per casa si sta aprendo.",
-                        "Il vostro viaggio in questo mondo è finito.",
-                        "Siete liberi.",
-                        "GRAZIE PER AVER GIOCATO!"
-                    ]
-                    # 2. Setup Dialogo
-                    self.current_intro_line = 0
-                    self.text_buffer = ""
-                    self.text_complete = False
-                    self.last_char_time = pygame.time.get_ticks()
-                    
-                    # 3. Dopo il dialogo -> VITTORIA
-                    self.dialogue_next_state = GameState.VICTORY
-                    self.state = GameState.STORY_INTRO
-                    return
-
-                # --- CASO B: È UN NEMICO NORMALE ---
-                else:
-                    
-                    px, py = self.movement_manager.get_position()
-                    if self.world:
-                        self.world.grid[py][px] = 0  
-                    
-                    
-                    self.state = GameState.EXPLORATION
-                    self.current_battle = None
-                    return
-            else:
-                # Sconfitta
-                self.state = GameState.GAME_OVER
+            self._on_combat_end(result)
             return
         
         # 2. SE LA BATTAGLIA CONTINUA
         self.current_battle.turn_manager.next_turn()
         
-        # 3. TURNO NEMICO (IA)
+        # 3. TURNI NEMICI (IA): decisi dall'executor, eseguiti appena pronti
+        self.enemy_messages = []
+        self._advance_enemy_turns()
+
+    def _advance_enemy_turns(self):
+        """Esegue i turni nemici già decisi, uno dopo l'altro fino al prossimo giocatore
+
+        Se la decisione di un nemico è ancora in corso ritorna subito: _update
+        la riprova al frame successivo.
+        """
         current = self.current_battle.turn_manager.get_current_combatant()
-        if current and not current.is_player:
-            action = self.current_battle.execute_enemy_turn()
-            self._show_message(action.message)
+        while current and not current.is_player:
+            ready, target = self.ai_executor.poll(self.current_battle, current.entity)
+            if not ready:
+                return
+            action = self.current_battle.execute_enemy_turn(current.entity, target)
+            self.enemy_messages.append(action.message)
+            self._show_message("\n".join(self.enemy_messages))
             
             # Ricontrolla fine battaglia dopo colpo nemico
             result = self.current_battle.check_battle_end()
@@ -746,8 +830,7 @@ class PygameGameEngine:
                     self._show_message("🎉 VITTORIA!")
                     if self.current_battle.enemy.name != "DRAGO ANTICO":
                         px, py = self.movement_manager.get_position()
-                        if self.world:
-                            self.world.grid[py][px] = 0
+                        self.movement_manager.set_cell(px, py, CellType.EMPTY.value)
                     
                     self.state = GameState.EXPLORATION
                     self.current_battle = None
@@ -756,6 +839,54 @@ class PygameGameEngine:
                 return
             
             self.current_battle.turn_manager.next_turn()
+            current = self.current_battle.turn_manager.get_current_combatant()
+
+    def _on_combat_end(self, result):
+        """Gestisce vittoria (boss incluso) o sconfitta a fine battaglia"""
+        self.ai_executor.cancel()
+        if result.victory:
+            enemy_name = self.current_battle.enemy.name
+            self._show_message(f"🎉 VITTORIA! {enemy_name} sconfitto. LEVEL UP: +HP/MP!")
+            
+            # CASO A: È IL DRAGO ANTICO (BOSS FINALE) 
+            if enemy_name == "DRAGO ANTICO":
+                self.final_boss_defeated = True
+                
+                # 1. Dialogo Epico Finale
+                self.intro_lines = [
+                    "Il Drago Antico lancia un ultimo ruggito straziante...",
+                    "Il suo corpo colossale crolla in polvere.",
+                    "Tra le ceneri, qualcosa brilla di luce pura.",
+                    "È la CHIAVE DELL'ECO!",
+                    "L'avete trovata. Il portale per casa si sta aprendo.",
+                    "Il vostro viaggio in questo mondo è finito.",
+                    "Siete liberi.",
+                    "GRAZIE PER AVER GIOCATO!"
+                ]
+                # 2. Setup Dialogo
+                self.current_intro_line = 0
+                self.text_buffer = ""
+                self.text_complete = False
+                self.last_char_time = pygame.time.get_ticks()
+                
+                # 3. Dopo il dialogo -> VITTORIA
+                self.dialogue_next_state = GameState.VICTORY
+                self.state = GameState.STORY_INTRO
+                return
+
+            # --- CASO B: È UN NEMICO NORMALE ---
+            else:
+                
+                px, py = self.movement_manager.get_position()
+                self.movement_manager.set_cell(px, py, CellType.EMPTY.value)
+                
+                
+                self.state = GameState.EXPLORATION
+                self.current_battle = None
+                return
+        else:
+            # Sconfitta
+            self.state = GameState.GAME_OVER
 
     def _are_all_enemies_defeated(self):
         """Controlla se ci sono ancora nemici (valore 2) nella griglia"""
@@ -812,6 +943,12 @@ class PygameGameEngine:
         if self.message_timer > 0 and pygame.time.get_ticks() > self.message_timer:
             self.message = ""
             self.message_timer = 0
+        
+        # Turni nemici in attesa della decisione dell'IA
+        if self.state == GameState.COMBAT and self.current_battle is not None:
+            self._advance_enemy_turns()
+        else:
+            self.ai_executor.cancel()
     
     def _render(self):
         """Renderizza la scena corrente"""
@@ -1069,22 +1206,16 @@ class PygameGameEngine:
         # Istruzioni
         width = self.renderer.width
         height = self.renderer.height
-        self.renderer.draw_text("WASD/Frecce: Muovi | I: Inventario | ESC: Menu",
+        self.renderer.draw_text("WASD/Frecce: Muovi | I: Inventario | F: Auto-battaglia | ESC: Menu",
                                width // 2, height - 20, Color.GRAY, "small", centered=True)
     
     def _render_combat(self):
-        """Renderizza il combattimento"""
+        """Renderizza il combattimento (la vista si ricalcola solo se la battaglia cambia)"""
         if not self.current_battle:
             return
         
-        current = self.current_battle.turn_manager.get_current_combatant()
-        current_name = current.name if current and current.is_player else None
-        
-        self.ui_manager.draw_combat_ui_split_screen(
-            self.party,
-            self.current_battle.enemy,
-            current_name
-        )
+        self.combat_view.update(self.current_battle, self.combat_target_index)
+        self.ui_manager.draw_combat_view(self.combat_view)
     
     def _render_inventory(self):
         """Renderizza l'inventario"""
@@ -0,0 +1,241 @@
+"""
+Sistema di Trigger - Dispatch data-driven degli eventi sulle celle della mappa
+"""
+
+from typing import Callable, Dict, List, Optional
+from models.world import World, CellType
+from core.movement import MovementResult
+
+
+class TriggerType:
+    """Codici dei trigger restituiti in MovementResult.trigger"""
+    DANGER = "DANGER"
+    TREASURE = "TREASURE"
+    EXIT = "EXIT"
+    DOOR = "DOOR"
+    TRAP = "TRAP"
+    TELEPORT = "TELEPORT"
+    HORDE = "HORDE"
+
+
+class TriggerRegistry:
+    """
+    Registro dei gestori di trigger.
+
+    I gestori sono associati ai tipi di cella (CellType) oppure, tramite i
+    metadati "triggers" della mappa, a coordinate specifiche. Al caricamento
+    della mappa il registro viene risolto in una tabella piatta di callable
+    (una per cella), così entrare in una cella costa una lettura più una chiamata.
+
+    Un gestore ha firma handler(manager, old_x, old_y) e ritorna un MovementResult;
+    la posizione del manager è già aggiornata alla cella di arrivo.
+    """
+
+    def __init__(self):
+        """Inizializza un registro vuoto"""
+        self._cell_handlers: Dict[int, Callable] = {}
+        self._script_factories: Dict[str, Callable] = {}
+        self._default_handler: Optional[Callable] = None
+
+    def register_cell(self, cell_type: CellType, handler: Callable) -> None:
+        """
+        Registra il gestore per un tipo di cella
+
+        Args:
+            cell_type: Tipo di cella
+            handler: Gestore invocato quando si entra nella cella
+        """
+        self._cell_handlers[cell_type.value] = handler
+
+    def register_script(self, script_type: str, factory: Callable) -> None:
+        """
+        Registra un tipo di trigger scriptato (porte, trappole, teletrasporti)
+
+        Args:
+            script_type: Nome del tipo usato nei metadati della mappa
+            factory: Funzione factory(spec, world) -> handler, chiamata al caricamento
+        """
+        self._script_factories[script_type] = factory
+
+    def set_default(self, handler: Callable) -> None:
+        """Imposta il gestore per le celle senza trigger"""
+        self._default_handler = handler
+
+    def get_cell_handler(self, cell_value: int) -> Callable:
+        """
+        Ottiene il gestore per un valore di cella
+
+        Args:
+            cell_value: Valore della cella nella griglia
+
+        Returns:
+            Gestore registrato o quello di default
+        """
+        return self._cell_handlers.get(cell_value, self._default_handler)
+
+    def has_script(self, script_type: str) -> bool:
+        """Verifica se un tipo di trigger scriptato è registrato"""
+        return script_type in self._script_factories
+
+    def build_script_handler(self, spec: Dict, world: Optional[World] = None) -> Callable:
+        """
+        Precompila il gestore di un trigger scriptato
+
+        Args:
+            spec: Dizionario dai metadati della mappa (x, y, type, ...)
+            world: Mondo del trigger, per validare le coordinate dello script
+
+        Returns:
+            Gestore compilato
+
+        Raises:
+            ValueError: Se il tipo è sconosciuto o lo script non è valido per il mondo
+        """
+        script_type = spec.get("type")
+        factory = self._script_factories.get(script_type)
+        if factory is None:
+            raise ValueError(f"Tipo di trigger sconosciuto: '{script_type}'")
+        return factory(spec, world)
+
+    def compile(self, world: World) -> List[Callable]:
+        """
+        Risolve il registro in una tabella di lookup per la mappa
+
+        Args:
+            world: Mondo da compilare
+
+        Returns:
+            Lista piatta di gestori indicizzata da y * width + x
+
+        Raises:
+            ValueError: Se un trigger scriptato non è valido
+        """
+        table = [
+            self.get_cell_handler(cell)
+            for row in world.grid
+            for cell in row
+        ]
+
+        # I trigger per coordinata hanno priorità sul tipo di cella
+        for spec in world.triggers:
+            x, y = spec["x"], spec["y"]
+            if world.is_valid_position(x, y):
+                table[y * world.width + x] = self.build_script_handler(spec, world)
+
+        return table
+
+
+# --- Gestori predefiniti per tipo di cella ---
+
+def _result(manager, message: str, trigger: Optional[str] = None,
+            data: Optional[Dict] = None):
+    """Costruisce un MovementResult riuscito sulla posizione corrente"""
+    return MovementResult(
+        success=True,
+        new_position=manager.get_position(),
+        message=message,
+        trigger=trigger,
+        data=data
+    )
+
+
+def _on_empty(manager, old_x: int, old_y: int):
+    new_x, new_y = manager.get_position()
+    return _result(manager, f"Ti sei mosso da ({old_x}, {old_y}) a ({new_x}, {new_y})")
+
+
+def _on_danger(manager, old_x: int, old_y: int):
+    return _result(manager, "⚔️ PERICOLO! Hai incontrato un nemico!", TriggerType.DANGER)
+
+
+def _on_treasure(manager, old_x: int, old_y: int):
+    return _result(manager, "💎 Hai trovato un tesoro!", TriggerType.TREASURE)
+
+
+def _on_exit(manager, old_x: int, old_y: int):
+    return _result(manager, "🚪 Hai raggiunto l'uscita!", TriggerType.EXIT)
+
+
+def _on_start(manager, old_x: int, old_y: int):
+    return _result(manager, "📍 Sei tornato al punto di partenza")
+
+
+# --- Factory dei trigger scriptati ---
+
+def _make_door(spec: Dict, world: Optional[World] = None) -> Callable:
+    """Porta: mostra un messaggio, opzionalmente verso un'altra mappa"""
+    message = spec.get("message", "🚪 Hai attraversato una porta.")
+    data = {"target_map": spec["target_map"]} if "target_map" in spec else None
+
+    def handler(manager, old_x: int, old_y: int):
+        return _result(manager, message, TriggerType.DOOR, data)
+
+    return handler
+
+
+def _make_trap(spec: Dict, world: Optional[World] = None) -> Callable:
+    """Trappola: infligge danno al party (applicato dal motore di gioco)"""
+    damage = int(spec.get("damage", 10))
+    message = spec.get("message", f"🪤 Una trappola! Il party subisce {damage} danni!")
+    data = {"damage": damage}
+
+    def handler(manager, old_x: int, old_y: int):
+        return _result(manager, message, TriggerType.TRAP, data)
+
+    return handler
+
+
+def _make_teleport(spec: Dict, world: Optional[World] = None) -> Callable:
+    """Teletrasporto: sposta il party alla cella di destinazione"""
+    target_x, target_y = spec["target"]
+    if world is not None and not world.is_walkable(target_x, target_y):
+        raise ValueError(f"Destinazione del teletrasporto non valida in ({spec['x']}, {spec['y']}): "
+                         f"({target_x}, {target_y}) è fuori mappa o non percorribile")
+    message = spec.get("message", f"🌀 Sei stato teletrasportato in ({target_x}, {target_y})!")
+
+    def handler(manager, old_x: int, old_y: int):
+        manager.position_x, manager.position_y = target_x, target_y
+        return _result(manager, message, TriggerType.TELEPORT)
+
+    return handler
+
+
+def _make_horde(spec: Dict, world: Optional[World] = None) -> Callable:
+    """Orda: avvia un incontro contro molti nemici (combat.horde)"""
+    count = int(spec.get("count", 50))
+    message = spec.get("message", f"🧟 Un'orda di {count} nemici ti circonda!")
+    data = {
+        "count": count,
+        "level": int(spec.get("level", 1)),
+        "enemies": list(spec.get("enemies", [])),
+    }
+
+    def handler(manager, old_x: int, old_y: int):
+        return _result(manager, message, TriggerType.HORDE, data)
+
+    return handler
+
+
+def create_default_registry() -> TriggerRegistry:
+    """
+    Crea il registro con i trigger standard del gioco
+
+    Returns:
+        TriggerRegistry con celle e script predefiniti
+    """
+    registry = TriggerRegistry()
+    registry.set_default(_on_empty)
+    registry.register_cell(CellType.EMPTY, _on_empty)
+    registry.register_cell(CellType.DANGER, _on_danger)
+    registry.register_cell(CellType.TREASURE, _on_treasure)
+    registry.register_cell(CellType.EXIT, _on_exit)
+    registry.register_cell(CellType.START, _on_start)
+
+    registry.register_script("door", _make_door)
+    registry.register_script("trap", _make_trap)
+    registry.register_script("teleport", _make_teleport)
+    registry.register_script("horde", _make_horde)
+    return registry
+
+
+DEFAULT_REGISTRY = create_default_registry()
@@ -174,6 +174,39 @@ def create_custom_map_interactive():
     }
 
 
+def open_graphic_editor():
+    """Apre l'editor grafico (pygame) su una mappa esistente o nuova"""
+    from models.world import World
+    from rendering.editor_view import run_editor
+    
+    print("\n🖌️  EDITOR GRAFICO")
+    print("  Mouse: disegna | B/R/F: pennello/rettangolo/riempimento | 0-5: tipo cella")
+    print("  +/-: raggio pennello | rotella: zoom | frecce: scorri | CTRL+Z/Y: annulla/ripeti")
+    print("  CTRL+S: salva | ESC: esci")
+    
+    filename = input("\nFile mappa (esistente o nuovo, es. my_map.json): ").strip()
+    if not filename.endswith('.json'):
+        filename += '.json'
+    filepath = Path("data/maps") / filename
+    
+    if filepath.exists():
+        world = World.load_from_file(str(filepath))
+    else:
+        while True:
+            try:
+                width = int(input("Larghezza mappa (5-4096): "))
+                height = int(input("Altezza mappa (5-4096): "))
+                if 5 <= width <= 4096 and 5 <= height <= 4096:
+                    break
+                print("❌ Inserisci valori tra 5 e 4096")
+            except ValueError:
+                print("❌ Inserisci un numero valido")
+        name = input("Nome mappa: ").strip() or "Mappa Personalizzata"
+        world = World(grid=[[0] * width for _ in range(height)], name=name)
+    
+    run_editor(world, str(filepath))
+
+
 def main():
     """Menu principale"""
     print("=" * 60)
@@ -188,11 +221,12 @@ def main():
     print("  3. Arena dei Campioni (7x7) - Combattimenti multipli")
     print("  4. Labirinto Oscuro (8x8) - Percorso tortuoso")
     print("  5. Crea mappa personalizzata")
+    print("  6. Editor grafico (pennello, rettangolo, riempimento)")
     print("  0. Esci")
     print()
     
     while True:
-        choice = input("Scegli un'opzione (0-5): ").strip()
+        choice = input("Scegli un'opzione (0-6): ").strip()
         
         if choice == "0":
             print("\n👋 Arrivederci!")
@@ -226,6 +260,9 @@ def main():
                 filename += '.json'
             save_map(map_data, filename)
         
+        elif choice == "6":
+            open_graphic_editor()
+        
         else:
             print("❌ Scelta non valida")
         
@@ -2,8 +2,11 @@
 Classe Character - Rappresenta un singolo personaggio
 """
 
+from models.liveness import Liveness
+from utils.rng import DEFAULT_RNG
 
-class Character:
+
+class Character(Liveness):
     """Classe che rappresenta un personaggio del gioco"""
     
     # Definizione delle classi disponibili
@@ -17,6 +20,7 @@ class Character:
             'atk_bonus': 10,
             'def_bonus': 5,
             'mag_bonus': 0,
+            'speed': 10,
             'description': 'Forte e resistente, specializzato nel combattimento corpo a corpo'
         },
         'mago': {
@@ -28,6 +32,7 @@ class Character:
             'atk_bonus': 0,
             'def_bonus': 0,
             'mag_bonus': 15,
+            'speed': 9,
             'description': 'Fragile ma potente, maestro delle arti arcane'
         },
         'ladro': {
@@ -39,6 +44,7 @@ class Character:
             'atk_bonus': 7,
             'def_bonus': 2,
             'mag_bonus': 0,
+            'speed': 14,
             'description': 'Agile e veloce, esperto in attacchi furtivi'
         },
         'paladino': {
@@ -50,6 +56,7 @@ class Character:
             'atk_bonus': 5,
             'def_bonus': 7,
             'mag_bonus': 5,
+            'speed': 9,
             'description': 'Bilanciato tra attacco e difesa, può curare gli alleati'
         },
         'ranger': {
@@ -61,11 +68,13 @@ class Character:
             'atk_bonus': 6,
             'def_bonus': 3,
             'mag_bonus': 3,
+            'speed': 12,
             'description': 'Arciere esperto, ottimo per attacchi a distanza'
         }
     }
     
-    def __init__(self, name: str, character_class: str = 'guerriero', hp: int = None, max_hp: int = None):
+    def __init__(self, name: str, character_class: str = 'guerriero', hp: int = None, max_hp: int = None,
+                 rng=None):
         """
         Inizializza un personaggio
         
@@ -74,6 +83,7 @@ class Character:
             character_class: Classe del personaggio (guerriero, mago, etc.)
             hp: Punti vita attuali (opzionale, usa quello della classe se non specificato)
             max_hp: Punti vita massimi (opzionale, usa quello della classe se non specificato)
+            rng: Generatore casuale compatibile con random.Random (default condiviso)
         """
         self.name = name
         self.character_class = character_class.lower()
@@ -88,6 +98,7 @@ class Character:
             self.atk_bonus = class_data['atk_bonus']
             self.def_bonus = class_data['def_bonus']
             self.mag_bonus = class_data['mag_bonus']
+            self.speed = class_data['speed']
         else:
             self.hp = hp if hp is not None else 100
             self.max_hp = max_hp if max_hp is not None else 100
@@ -96,8 +107,11 @@ class Character:
             self.atk_bonus = 0
             self.def_bonus = 0
             self.mag_bonus = 0
+            self.speed = 10
         
+        self.alive_listeners = []
         self.is_alive = True
+        self.rng = rng if rng is not None else DEFAULT_RNG
     
     def take_damage(self, amount: int) -> int:
         """
@@ -175,8 +189,7 @@ class Character:
         Returns:
             Danno fisico (include bonus ATK)
         """
-        import random
-        base_damage = random.randint(10, 25)
+        base_damage = self.rng.randint(10, 25)
         return base_damage + self.atk_bonus
     
     def calculate_magic_damage(self) -> int:
@@ -186,8 +199,7 @@ class Character:
         Returns:
             Danno magico (include bonus MAG)
         """
-        import random
-        base_damage = random.randint(15, 30)
+        base_damage = self.rng.randint(15, 30)
         return base_damage + self.mag_bonus
     
     def get_hp_percentage(self) -> float:
@@ -58,7 +58,13 @@ class Item:
             'item_type': ItemType.CONSUMABLE,
             'effect': ItemEffect.HEAL,
             'value': 999,
-            'consumable': True
+            'consumable': True,
+            # Effetto composto (combat.item_effects): HP e poi MP
+            'steps': [
+                {'effect': ItemEffect.HEAL},
+                {'effect': ItemEffect.RESTORE_MP},
+            ],
+            'message': 'item_full_restore'
         },
         'bomb': {
             'name': 'Bomba',
@@ -0,0 +1,32 @@
+"""
+Liveness - Stato vivo/KO con notifica dei cambiamenti
+"""
+
+from typing import Callable, List
+
+
+class Liveness:
+    """
+    Mixin per Character ed Enemy: is_alive è una proprietà che avvisa i
+    listener registrati a ogni morte o rianimazione, così chi tiene dei
+    contatori (es. il TurnManager) non deve mai ricontare i combattenti.
+    """
+
+    # Vuoto: le sottoclassi possono usare __slots__
+    __slots__ = ()
+
+    alive_listeners: List[Callable]
+
+    @property
+    def is_alive(self) -> bool:
+        """True se l'entità è viva"""
+        return self._alive
+
+    @is_alive.setter
+    def is_alive(self, value: bool):
+        value = bool(value)
+        if getattr(self, '_alive', None) is value:
+            return
+        self._alive = value
+        for listener in tuple(self.alive_listeners):
+            listener(self, value)
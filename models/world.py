@@ -4,7 +4,8 @@ Modello del Mondo di Gioco - Gestisce mappe e celle
 
 import json
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict
+from collections import deque
+from typing import List, Tuple, Optional, Dict, Set
 from enum import Enum
 
 
@@ -21,15 +22,18 @@ class CellType(Enum):
 class World:
     """Classe che rappresenta il mondo di gioco"""
     
-    def __init__(self, grid: List[List[int]] = None, name: str = "Dungeon"):
+    def __init__(self, grid: List[List[int]] = None, name: str = "Dungeon",
+                 triggers: List[Dict] = None):
         """
         Inizializza il mondo
         
         Args:
             grid: Matrice della mappa (lista di liste)
             name: Nome del mondo/dungeon
+            triggers: Trigger scriptati per coordinata (porte, trappole, teletrasporti)
         """
         self.name = name
+        self.triggers = triggers if triggers else []
         self.grid = grid if grid else [[0, 0], [0, 0]]
         self.width = len(self.grid[0]) if self.grid else 0
         self.height = len(self.grid) if self.grid else 0
@@ -52,6 +56,18 @@ class World:
             return None
         return self.grid[y][x]
     
+    def set_cell(self, x: int, y: int, value: int) -> None:
+        """
+        Imposta il tipo di cella alle coordinate specificate
+        
+        Args:
+            x: Coordinata X (colonna)
+            y: Coordinata Y (riga)
+            value: Nuovo valore della cella
+        """
+        if self.is_valid_position(x, y):
+            self.grid[y][x] = value
+    
     def is_valid_position(self, x: int, y: int) -> bool:
         """
         Verifica se una posizione è valida (dentro i limiti)
@@ -125,14 +141,62 @@ class World:
                     return (x, y)
         return None
     
+    def get_teleport_targets(self) -> Dict[Tuple[int, int], Tuple[int, int]]:
+        """
+        Ritorna i teletrasporti definiti nei metadati della mappa
+        
+        Returns:
+            Dizionario (x, y) cella -> (x, y) destinazione
+        """
+        return {
+            (spec["x"], spec["y"]): tuple(spec["target"])
+            for spec in self.triggers
+            if spec.get("type") == "teleport"
+        }
+    
+    def get_reachable_cells(self, start: Optional[Tuple[int, int]] = None) -> Set[Tuple[int, int]]:
+        """
+        Calcola le celle raggiungibili da una posizione (BFS, 4 direzioni)
+        
+        I teletrasporti sono seguiti: entrando nella cella si arriva alla destinazione.
+        
+        Args:
+            start: Posizione di partenza (default: START della mappa)
+            
+        Returns:
+            Insieme delle posizioni (x, y) raggiungibili
+        """
+        start = start if start is not None else self.start_position
+        if start is None or not self.is_walkable(*start):
+            return set()
+        
+        teleports = self.get_teleport_targets()
+        reachable = {start}
+        queue = deque([start])
+        
+        while queue:
+            x, y = queue.popleft()
+            for nx, ny in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+                if not self.is_walkable(nx, ny):
+                    continue
+                dest = teleports.get((nx, ny), (nx, ny))
+                if dest not in reachable and self.is_walkable(*dest):
+                    reachable.add(dest)
+                    queue.append(dest)
+        
+        return reachable
+    
     def to_dict(self) -> Dict:
         """Converte il mondo in un dizionario"""
-        return {
+        data = {
             "name": self.name,
             "width": self.width,
             "height": self.height,
             "grid": self.grid
         }
+        if self.triggers:
+            data["triggers"] = self.triggers
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'World':
@@ -147,7 +211,8 @@ class World:
         """
         return cls(
             grid=data.get("grid", []),
-            name=data.get("name", "Dungeon")
+            name=data.get("name", "Dungeon"),
+            triggers=data.get("triggers", [])
         )
     
     @classmethod
@@ -170,18 +235,22 @@ class World:
         
         return cls.from_dict(data)
     
-    def save_to_file(self, filepath: str) -> None:
+    def save_to_file(self, filepath: str, compact: bool = False) -> None:
         """
         Salva il mondo in un file JSON
         
         Args:
             filepath: Percorso del file JSON
+            compact: Se True scrive senza indentazione (molto più veloce per mappe grandi)
         """
         path = Path(filepath)
         path.parent.mkdir(parents=True, exist_ok=True)
         
         with open(path, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, indent=2)
+            if compact:
+                json.dump(self.to_dict(), f, separators=(',', ':'))
+            else:
+                json.dump(self.to_dict(), f, indent=2)
     
     def print_map(self, player_pos: Optional[Tuple[int, int]] = None) -> str:
         """
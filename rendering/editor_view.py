@@ -0,0 +1,265 @@
+"""
+Editor View - Editor grafico delle mappe con ridisegno incrementale
+"""
+
+import pygame
+from typing import Optional, Tuple
+from models.world import World, CellType
+from core.editor import MapEditor
+from rendering.renderer import Renderer, Color
+
+
+class EditorTool:
+    """Strumenti disponibili nell'editor"""
+    BRUSH = "brush"
+    RECT = "rect"
+    FILL = "fill"
+
+
+class EditorView:
+    """
+    Editor grafico basato su World e Renderer.
+
+    La vista mantiene una superficie cache del viewport: dopo una modifica
+    vengono ridisegnate solo le celle nella regione sporca dell'editor; il
+    ridisegno completo avviene solo quando il viewport scorre o cambia zoom.
+    """
+
+    CELL_COLORS = {
+        CellType.EMPTY.value: Color.FLOOR_2,
+        CellType.WALL.value: Color.WALL_TOP,
+        CellType.DANGER.value: Color.RED,
+        CellType.START.value: Color.GREEN,
+        CellType.EXIT.value: Color.BLUE,
+        CellType.TREASURE.value: Color.GOLD,
+    }
+
+    TOOL_KEYS = {
+        pygame.K_b: EditorTool.BRUSH,
+        pygame.K_r: EditorTool.RECT,
+        pygame.K_f: EditorTool.FILL,
+    }
+
+    VALUE_KEYS = {
+        pygame.K_0: CellType.EMPTY.value,
+        pygame.K_1: CellType.WALL.value,
+        pygame.K_2: CellType.DANGER.value,
+        pygame.K_3: CellType.START.value,
+        pygame.K_4: CellType.EXIT.value,
+        pygame.K_5: CellType.TREASURE.value,
+    }
+
+    TOOLBAR_HEIGHT = 40
+
+    def __init__(self, renderer: Renderer, world: World, filepath: str):
+        """
+        Inizializza la vista dell'editor
+
+        Args:
+            renderer: Istanza del Renderer
+            world: Mondo da modificare
+            filepath: File JSON su cui salvare
+        """
+        self.renderer = renderer
+        self.editor = MapEditor(world)
+        self.world = world
+        self.filepath = filepath
+
+        self.tool = EditorTool.BRUSH
+        self.value = CellType.WALL.value
+        self.brush_radius = 0
+        self.cell_px = 16
+        self.view_x = 0
+        self.view_y = 0
+        self.rect_anchor: Optional[Tuple[int, int]] = None
+        self.painting = False
+        self.status = ""
+        self.running = False
+
+        self.map_surface = None
+        self._full_redraw = True
+
+    # --- Geometria del viewport ---
+
+    def _viewport_cells(self) -> Tuple[int, int]:
+        """Numero di celle visibili (colonne, righe)"""
+        cols = self.renderer.width // self.cell_px
+        rows = (self.renderer.height - self.TOOLBAR_HEIGHT) // self.cell_px
+        return min(cols, self.world.width), min(rows, self.world.height)
+
+    def _screen_to_cell(self, pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """Converte coordinate schermo in coordinate di cella"""
+        sx, sy = pos
+        sy -= self.TOOLBAR_HEIGHT
+        if sy < 0:
+            return None
+        x = self.view_x + sx // self.cell_px
+        y = self.view_y + sy // self.cell_px
+        if not self.world.is_valid_position(x, y):
+            return None
+        return x, y
+
+    def _scroll(self, dx: int, dy: int):
+        """Sposta il viewport (richiede un ridisegno completo)"""
+        cols, rows = self._viewport_cells()
+        self.view_x = max(0, min(self.world.width - cols, self.view_x + dx))
+        self.view_y = max(0, min(self.world.height - rows, self.view_y + dy))
+        self._full_redraw = True
+
+    def _zoom(self, factor: float):
+        """Cambia la dimensione delle celle a schermo"""
+        self.cell_px = max(2, min(64, int(self.cell_px * factor)))
+        self.map_surface = None
+        self._scroll(0, 0)
+
+    # --- Disegno ---
+
+    def _redraw_cells(self, x0: int, y0: int, x1: int, y1: int):
+        """Ridisegna sulla superficie cache le celle del rettangolo visibili"""
+        cols, rows = self._viewport_cells()
+        x0 = max(x0, self.view_x)
+        y0 = max(y0, self.view_y)
+        x1 = min(x1, self.view_x + cols - 1)
+        y1 = min(y1, self.view_y + rows - 1)
+        if x0 > x1 or y0 > y1:
+            return
+
+        size = self.cell_px
+        colors = self.CELL_COLORS
+        fill = self.map_surface.fill
+        grid = self.world.grid
+        for y in range(y0, y1 + 1):
+            row = grid[y]
+            py = (y - self.view_y) * size
+            x = x0
+            # Un fill per ogni run di celle dello stesso tipo
+            while x <= x1:
+                value = row[x]
+                run_end = x
+                while run_end < x1 and row[run_end + 1] == value:
+                    run_end += 1
+                fill(colors.get(value, Color.BLACK),
+                     ((x - self.view_x) * size, py, (run_end - x + 1) * size, size))
+                x = run_end + 1
+
+    def _update_map_surface(self):
+        """Aggiorna la superficie cache: tutto il viewport o solo la regione sporca"""
+        cols, rows = self._viewport_cells()
+        if self.map_surface is None:
+            self.map_surface = pygame.Surface((cols * self.cell_px, rows * self.cell_px))
+            self._full_redraw = True
+
+        dirty = self.editor.consume_dirty()
+        if self._full_redraw:
+            self._full_redraw = False
+            self._redraw_cells(self.view_x, self.view_y,
+                               self.view_x + cols - 1, self.view_y + rows - 1)
+        elif dirty:
+            self._redraw_cells(*dirty)
+
+    def render(self):
+        """Disegna viewport e barra degli strumenti"""
+        self._update_map_surface()
+        screen = self.renderer.screen
+        screen.fill(Color.BLACK, (0, 0, self.renderer.width, self.TOOLBAR_HEIGHT))
+        screen.blit(self.map_surface, (0, self.TOOLBAR_HEIGHT))
+
+        value_name = CellType(self.value).name if self.value in self.CELL_COLORS else "?"
+        info = (f"[{self.tool.upper()}] {value_name} r={self.brush_radius} | "
+                f"({self.view_x},{self.view_y}) {self.world.width}x{self.world.height} | "
+                f"undo {len(self.editor.undo_stack)} | {self.status}")
+        self.renderer.draw_text(info, 10, 10, Color.WHITE, "small")
+
+    # --- Input ---
+
+    def handle_event(self, event):
+        """Gestisce un evento pygame"""
+        if event.type == pygame.QUIT:
+            self.running = False
+
+        elif event.type == pygame.KEYDOWN:
+            self._handle_key(event.key, event.mod)
+
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            cell = self._screen_to_cell(event.pos)
+            if cell is None:
+                return
+            if self.tool == EditorTool.BRUSH:
+                self.painting = True
+                self.editor.paint(*cell, self.value, self.brush_radius)
+            elif self.tool == EditorTool.RECT:
+                self.rect_anchor = cell
+            elif self.tool == EditorTool.FILL:
+                diff = self.editor.flood_fill(*cell, self.value)
+                self.status = f"{diff.cell_count()} celle" if diff else ""
+
+        elif event.type == pygame.MOUSEMOTION and self.painting:
+            cell = self._screen_to_cell(event.pos)
+            if cell is not None:
+                self.editor.paint(*cell, self.value, self.brush_radius)
+
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            self.painting = False
+            if self.tool == EditorTool.RECT and self.rect_anchor:
+                cell = self._screen_to_cell(event.pos)
+                if cell is not None:
+                    self.editor.fill_rect(*self.rect_anchor, *cell, self.value)
+                self.rect_anchor = None
+
+        elif event.type == pygame.MOUSEWHEEL:
+            self._zoom(1.25 if event.y > 0 else 0.8)
+
+    def _handle_key(self, key, mod):
+        """Scorciatoie da tastiera"""
+        ctrl = mod & pygame.KMOD_CTRL
+        step = max(1, self._viewport_cells()[0] // 4)
+
+        if ctrl and key == pygame.K_z:
+            self.editor.undo()
+        elif ctrl and key == pygame.K_y:
+            self.editor.redo()
+        elif ctrl and key == pygame.K_s:
+            self.editor.save(self.filepath)
+            self.status = f"Salvato in {self.filepath}"
+        elif key in self.TOOL_KEYS:
+            self.tool = self.TOOL_KEYS[key]
+        elif key in self.VALUE_KEYS:
+            self.value = self.VALUE_KEYS[key]
+        elif key in (pygame.K_PLUS, pygame.K_KP_PLUS, pygame.K_EQUALS):
+            self.brush_radius = min(16, self.brush_radius + 1)
+        elif key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+            self.brush_radius = max(0, self.brush_radius - 1)
+        elif key in (pygame.K_LEFT, pygame.K_a):
+            self._scroll(-step, 0)
+        elif key in (pygame.K_RIGHT, pygame.K_d):
+            self._scroll(step, 0)
+        elif key in (pygame.K_UP, pygame.K_w):
+            self._scroll(0, -step)
+        elif key in (pygame.K_DOWN, pygame.K_s):
+            self._scroll(0, step)
+        elif key == pygame.K_ESCAPE:
+            self.running = False
+
+    def run(self):
+        """Loop dell'editor"""
+        self.running = True
+        while self.running:
+            for event in pygame.event.get():
+                self.handle_event(event)
+            self.render()
+            self.renderer.update()
+
+
+def run_editor(world: World, filepath: str):
+    """
+    Apre l'editor grafico su un mondo
+
+    Args:
+        world: Mondo da modificare
+        filepath: File JSON su cui salvare (CTRL+S)
+    """
+    renderer = Renderer(width=1024, height=768, title="Map Editor")
+    try:
+        EditorView(renderer, world, filepath).run()
+    finally:
+        renderer.quit()
@@ -7,6 +7,8 @@ from typing import List, Tuple
 from models.party import Party
 from models.character import Character
 from combat.enemy import Enemy
+from core.battle_view import (BattleViewModel, HIGHLIGHT_TARGET, HIGHLIGHT_BOSS,
+                              HIGHLIGHT_ENEMY, HIGHLIGHT_DEFEATED)
 from rendering.renderer import Renderer, Color
 
 
@@ -457,45 +459,77 @@ class UIManager:
         self.renderer.draw_text("◇ THE LAST DREAM ◇", width // 2, 25, (100, 100, 150), "small", centered=True)
         
 
-    def draw_combat_ui_split_screen(self, party, enemy, current_turn=None):
+    # Colori dei nomi dei nemici per chiave di BattleViewModel
+    ENEMY_NAME_COLORS = {
+        HIGHLIGHT_TARGET: Color.YELLOW,
+        HIGHLIGHT_BOSS: Color.YELLOW,
+        HIGHLIGHT_ENEMY: Color.RED,
+        HIGHLIGHT_DEFEATED: Color.GRAY,
+    }
+
+    def draw_combat_ui_split_screen(self, party, enemy, current_turn=None, target=None,
+                                    preview=None):
         """
         UI COMBATTIMENTO COMPLETA CON BESTIARIO GRAFICO
+        
+        Args:
+            party: Party dei giocatori
+            enemy: Nemico o lista di nemici (disposti in colonne)
+            current_turn: Nome del personaggio di turno
+            target: Nemico selezionato come bersaglio (evidenziato)
+            preview: Riga con le probabilità di KO (combat.damage_model)
+        """
+        enemies = enemy if isinstance(enemy, (list, tuple)) else [enemy]
+        view = BattleViewModel.from_parts(party.characters, enemies, current_turn, target, preview)
+        self.draw_combat_view(view)
+
+    def draw_combat_view(self, view: BattleViewModel):
+        """
+        Disegna il combattimento dai campi precalcolati di un BattleViewModel
+        
+        Args:
+            view: Vista aggiornata (core.battle_view)
         """
         width = self.renderer.width
         height = self.renderer.height
+        enemies = view.enemies
         
         # --- 1. SFONDO ---
         self.renderer.clear((30, 20, 20)) 
         
-        # --- 2. DISEGNA IL NEMICO ---
-        enemy_x = width // 2 - 100
-        enemy_y = 60
-        enemy_size = 180
-        
-        # CHIAMA LA FUNZIONE CHE DISEGNA IL NEMICO CORRETTO
-        self._draw_enemy_sprite(enemy_x, enemy_y, enemy_size, enemy.name)
+        # --- 2. DISEGNA I NEMICI (una colonna per nemico) ---
+        slot_width = width // len(enemies)
+        enemy_size = min(180, slot_width - 40)
+        bar_width = min(300, slot_width - 40)
+        name_font = "large" if len(enemies) == 1 else "medium"
+        bar_y = 260
         
-        # Nome e Barra Vita
-        name_color = Color.YELLOW if "DRAGO" in enemy.name else Color.RED
-        self.renderer.draw_text(enemy.name, width // 2, 30, name_color, "large", centered=True)
+        for i, foe in enumerate(enemies):
+            center_x = i * slot_width + slot_width // 2
+            
+            # CHIAMA LA FUNZIONE CHE DISEGNA IL NEMICO CORRETTO
+            if foe.alive:
+                self._draw_enemy_sprite(center_x - enemy_size // 2, 60 + (180 - enemy_size),
+                                        enemy_size, foe.name)
+            
+            # Nome e Barra Vita
+            self.renderer.draw_text(foe.label, center_x, 30, self.ENEMY_NAME_COLORS[foe.highlight],
+                                    name_font, centered=True)
 
-        bar_x = width // 2 - 150
-        bar_y = 260
-        pct = max(0, enemy.hp / enemy.max_hp) if enemy.max_hp > 0 else 0
-        pygame.draw.rect(self.renderer.screen, (50, 0, 0), (bar_x, bar_y, 300, 15))
-        pygame.draw.rect(self.renderer.screen, Color.RED, (bar_x, bar_y, int(300 * pct), 15))
-        self.renderer.draw_text(f"{enemy.hp}/{enemy.max_hp}", width // 2, bar_y + 20, Color.WHITE, "small", centered=True)
+            bar_x = center_x - bar_width // 2
+            pygame.draw.rect(self.renderer.screen, (50, 0, 0), (bar_x, bar_y, bar_width, 15))
+            pygame.draw.rect(self.renderer.screen, Color.RED, (bar_x, bar_y, int(bar_width * foe.hp_pct), 15))
+            self.renderer.draw_text(foe.hp_text, center_x, bar_y + 20, Color.WHITE, "small", centered=True)
 
         # --- 3. DISEGNA GLI EROI  ---
         hero_ground_y = 380 
-        num_heroes = len(party.characters)
+        num_heroes = len(view.heroes)
         spacing = 150 
         start_hero_x = (width - (num_heroes - 1) * spacing) // 2
         
-        for i, char in enumerate(party.characters):
+        for i, hero in enumerate(view.heroes):
             hero_x = start_hero_x + (i * spacing)
-            is_active = (current_turn == char.name)
-            self._draw_hero_sprite(hero_x, hero_ground_y, char, is_active)
+            self._draw_hero_sprite(hero_x, hero_ground_y, hero.character, hero.active)
 
         # --- 4. PANNELLO STATISTICHE ---
         panel_y = 440
@@ -504,23 +538,25 @@ class UIManager:
         
         panel_width = width // num_heroes if num_heroes > 0 else width
         
-        for i, char in enumerate(party.characters):
+        for i, hero in enumerate(view.heroes):
             panel_x = i * panel_width
             center_panel = panel_x + panel_width // 2
-            is_active = (current_turn == char.name)
             
-            color = Color.YELLOW if is_active else Color.WHITE
-            self.renderer.draw_text(char.name, center_panel, panel_y + 20, color, "medium", centered=True)
-            self.draw_stat_bar_labeled(panel_x + 40, panel_y + 50, panel_width - 80, 12, char.hp, char.max_hp, Color.GREEN, "HP")
-            self.draw_stat_bar_labeled(panel_x + 40, panel_y + 75, panel_width - 80, 12, char.mp, char.max_mp, Color.BLUE, "MP")
+            color = Color.YELLOW if hero.active else Color.WHITE
+            self.renderer.draw_text(hero.name, center_panel, panel_y + 20, color, "medium", centered=True)
+            self.draw_stat_bar_labeled(panel_x + 40, panel_y + 50, panel_width - 80, 12, hero.hp, hero.max_hp, Color.GREEN, "HP")
+            self.draw_stat_bar_labeled(panel_x + 40, panel_y + 75, panel_width - 80, 12, hero.mp, hero.max_mp, Color.BLUE, "MP")
 
         # --- 5. COMANDI ---
         footer_y = height - 40
-        if current_turn and any(c.name == current_turn for c in party.characters):
-            cmds = "[1] Attacco  [2] Magia  [3] Cura  [I] Oggetti"
-            self.renderer.draw_text(cmds, width // 2, footer_y, Color.YELLOW, "medium", centered=True)
+        if view.is_player_turn:
+            self.renderer.draw_text(view.commands, width // 2, footer_y, Color.YELLOW, "medium", centered=True)
+            if view.preview:
+                self.renderer.draw_text(view.preview, width // 2, footer_y - 28, Color.WHITE, "small", centered=True)
+            if view.hint:
+                self.renderer.draw_text(view.hint, width // 2, footer_y - 50, Color.LIGHT_BLUE, "small", centered=True)
         else:
-            self.renderer.draw_text("TURNO NEMICO...", width // 2, footer_y, (255, 100, 100), "medium", centered=True)
+            self.renderer.draw_text(view.commands, width // 2, footer_y, (255, 100, 100), "medium", centered=True)
 
     def draw_stat_bar_labeled(self, x, y, width, height, value, max_value, color, label):
         """Disegna una barra statistica con etichetta (es. ATK: [====..])"""
@@ -24,7 +24,31 @@ def run_unit_tests():
         "tests/test_turn_manager.py",
         "tests/test_battle.py",
         "tests/test_item.py",
-        "tests/test_inventory.py"
+        "tests/test_inventory.py",
+        "tests/test_triggers.py",
+        "tests/test_bot_explorer.py",
+        "tests/test_map_image.py",
+        "tests/test_editor.py",
+        "tests/test_map_check.py",
+        "tests/test_simulator.py",
+        "tests/test_sim_farm.py",
+        "tests/test_rng.py",
+        "tests/test_multi_enemy.py",
+        "tests/test_initiative.py",
+        "tests/test_battle_log.py",
+        "tests/test_replay.py",
+        "tests/test_enemy_ai.py",
+        "tests/test_snapshot.py",
+        "tests/test_damage_model.py",
+        "tests/test_auto_battle.py",
+        "tests/test_status_effects.py",
+        "tests/test_events.py",
+        "tests/test_battle_view.py",
+        "tests/test_horde.py",
+        "tests/test_markov.py",
+        "tests/test_advisor.py",
+        "tests/test_ai_executor.py",
+        "tests/test_item_effects.py"
     ], cwd=Path(__file__).parent)
     return result.returncode
 
@@ -0,0 +1,150 @@
+"""
+Test per l'advisor (iterazione dei valori e tabelle su disco)
+"""
+
+import pytest
+from models.character import Character
+from models.party import Party
+from combat.enemy import Enemy
+from combat.battle import Battle
+from combat.auto_battle import auto_battle
+import combat.advisor
+from combat.advisor import (AdvisorTable, GRIDS, Suggestion, build_table, get_table,
+                            prepare_tables, rules_digest, suggest, table_path, _TABLES)
+from combat.policies import PARTY_POLICIES, advisor_policy
+from utils.rng import SplitMixRNG
+
+
+def _battle(cls: str = "ladro", enemy: str = "troll", level: int = 2, seed: int = 1,
+            items=()) -> Battle:
+    """Battaglia di un personaggio contro un nemico"""
+    party = Party([Character("Hero", cls)])
+    for item_id in items:
+        party.inventory.add_item(item_id)
+    return Battle(party, [Enemy(enemy, level)], rng=SplitMixRNG(seed))
+
+
+@pytest.fixture
+def ladro_table(tmp_path):
+    """Tabella del ladro contro il troll, con cache in una cartella temporanea"""
+    _TABLES.pop((("ladro",), "troll", 2), None)
+    return get_table(["ladro"], "troll", 2, cache_dir=tmp_path)
+
+
+class TestAdvisorTable:
+    """Test suite per la costruzione e il salvataggio delle tabelle"""
+
+    def test_round_trip(self, ladro_table):
+        """Test to_bytes/from_bytes ricostruisce la stessa tabella"""
+        copy = AdvisorTable.from_bytes(ladro_table.to_bytes())
+        assert copy.key == ladro_table.key
+        assert copy.grid == GRIDS[1]
+        assert copy.digest == ladro_table.digest == rules_digest(["ladro"], "troll", 2)
+        assert copy.actions == ladro_table.actions
+        assert list(copy.values) == list(ladro_table.values)
+
+        with pytest.raises(ValueError):
+            AdvisorTable.from_bytes(b"XXXX" + ladro_table.to_bytes()[4:])
+        with pytest.raises(ValueError):
+            AdvisorTable.from_bytes(ladro_table.to_bytes()[:-3])
+
+    def test_disk_cache_is_reused(self, ladro_table, tmp_path):
+        """Test una tabella salvata viene ricaricata invece di ricostruita"""
+        path = table_path(["ladro"], "troll", 2, cache_dir=tmp_path)
+        assert path.exists()
+
+        _TABLES.clear()
+        loaded = get_table(["ladro"], "troll", 2, cache_dir=tmp_path, build=False)
+        assert loaded is not None and loaded is not ladro_table
+        assert loaded.actions == ladro_table.actions
+        assert get_table(["ladro"], "orc", 2, cache_dir=tmp_path, build=False) is None
+
+    def test_stale_table_is_rejected(self, ladro_table, tmp_path, monkeypatch):
+        """Test cambiati i dati del gioco (qui una pozione) la tabella su disco non vale più"""
+        _TABLES.clear()
+        monkeypatch.setattr(combat.advisor, "HEAL_ITEMS", [(45, "health_potion")])
+        assert rules_digest(["ladro"], "troll", 2) != ladro_table.digest
+        assert get_table(["ladro"], "troll", 2, cache_dir=tmp_path, build=False) is None
+
+    def test_values_are_probabilities(self):
+        """Test le probabilità di vittoria sono in [0, 1] e crescono con gli HP"""
+        table = build_table(["mago"], "orc", 1)
+        assert all(0.0 <= v <= 1.0 + 1e-6 for v in table.values)
+        strong = table.index(0, [GRIDS[1].hp_bins], [1], 5, 0, 0, 0)
+        weak = table.index(0, [1], [1], 5, 0, 0, 0)
+        assert table.values[strong] >= table.values[weak]
+
+    def test_party_too_large(self):
+        """Test party oltre MAX_PARTY non supportati"""
+        with pytest.raises(ValueError):
+            build_table(["ladro"] * 4, "goblin", 1)
+        assert get_table(["ladro"] * 4, "goblin", 1, cache_dir=None) is None
+
+
+class TestSuggest:
+    """Test suite per i consigli in battaglia"""
+
+    def test_lookup_returns_a_decision(self, ladro_table, tmp_path):
+        """Test il consiglio è una mossa valida per execute_player_turn"""
+        battle = _battle()
+        hero = battle.party.characters[0]
+        suggestion = suggest(battle, hero, cache_dir=tmp_path)
+
+        assert isinstance(suggestion, Suggestion)
+        assert suggestion.action in ("attack", "heal")
+        assert 0.0 <= suggestion.win_probability <= 1.0
+        assert str(suggestion).startswith("🧠 Consiglio:")
+        battle.execute_player_turn(hero, *suggestion.decision)
+
+    def test_obvious_items(self, ladro_table, tmp_path):
+        """Test pozione quando si sta per morire, bomba quando chiude la battaglia"""
+        battle = _battle(items=["health_potion"])
+        hero = battle.party.characters[0]
+        hero.hp = 3
+        assert suggest(battle, hero, cache_dir=tmp_path).decision == (
+            "use_item", hero, "health_potion")
+
+        battle = _battle(items=["bomb"])
+        hero = battle.party.characters[0]
+        battle.enemies[0].hp = 30
+        assert suggest(battle, hero, cache_dir=tmp_path).decision == ("use_item", None, "bomb")
+
+    def test_no_suggestion_after_victory(self, ladro_table, tmp_path):
+        """Test nessun consiglio a nemico sconfitto"""
+        battle = _battle()
+        battle.enemies[0].take_damage(battle.enemies[0].max_hp)
+        assert suggest(battle, battle.party.characters[0], cache_dir=tmp_path) is None
+
+
+    def test_prepare_tables_in_background(self, tmp_path):
+        """Test le tabelle mancanti si costruiscono su un thread, una volta sola"""
+        _TABLES.pop((("ladro",), "goblin", 1), None)
+        party = Party([Character("Hero", "ladro")])
+        battle = Battle(party, [Enemy("goblin"), Enemy("goblin")], rng=SplitMixRNG(1))
+        hero = party.characters[0]
+        assert suggest(battle, hero, cache_dir=tmp_path, build=False) is None
+
+        thread = prepare_tables(battle, cache_dir=tmp_path)
+        assert thread is not None
+        thread.join()
+        assert suggest(battle, hero, cache_dir=tmp_path, build=False) is not None
+        assert table_path(["ladro"], "goblin", 1, cache_dir=tmp_path).exists()
+        assert prepare_tables(battle, cache_dir=tmp_path) is None
+
+
+class TestAdvisorPolicy:
+    """Test suite per la policy 'advisor'"""
+
+    def test_registered(self):
+        """Test la policy è tra quelle del party"""
+        assert PARTY_POLICIES["advisor"] is advisor_policy
+
+    def test_beats_balanced(self, ladro_table):
+        """Test con una pozione e una bomba l'advisor vince più spesso di balanced"""
+        items = ["health_potion", "bomb"]
+        wins = {}
+        for policy in ("balanced", "advisor"):
+            wins[policy] = sum(auto_battle(_battle(seed=seed, items=items), policy)[0].victory
+                               for seed in range(40))
+        assert wins["advisor"] >= wins["balanced"]
+        assert wins["advisor"] > 20
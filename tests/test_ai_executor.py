@@ -0,0 +1,127 @@
+"""
+Test per l'esecuzione delle decisioni dei nemici su un thread di lavoro
+"""
+
+import threading
+import time
+from models.character import Character
+from models.party import Party
+from combat.enemy import Enemy
+from combat.battle import Battle
+from combat.enemy_ai import SearchAI
+from combat.ai_executor import AIExecutor
+from utils.rng import SplitMixRNG
+
+
+def _battle(enemy_ai="hard", seed: int = 3) -> Battle:
+    """Battaglia di un guerriero e un mago contro due nemici"""
+    party = Party([Character("Warrior", "guerriero"), Character("Mage", "mago")])
+    party.characters[1].hp = 30
+    return Battle(party, [Enemy("orc"), Enemy("goblin")], rng=SplitMixRNG(seed),
+                  enemy_ai=enemy_ai)
+
+
+def _wait(executor: AIExecutor, battle, enemy, timeout: float = 5.0):
+    """Interroga l'executor come farebbe il loop di gioco, un frame alla volta"""
+    end = time.perf_counter() + timeout
+    while time.perf_counter() < end:
+        ready, target = executor.poll(battle, enemy)
+        if ready:
+            return target
+        time.sleep(0.001)
+    raise AssertionError("Decisione non arrivata")
+
+
+def _block_worker(executor: AIExecutor) -> threading.Event:
+    """Occupa il thread di lavoro finché l'evento non viene impostato"""
+    gate = threading.Event()
+    executor._executor().submit(gate.wait)
+    return gate
+
+
+class TestAIExecutor:
+    """Test suite per AIExecutor"""
+
+    def test_random_ai_is_immediate(self):
+        """Test RandomAI decide subito e consuma i tiri come la scelta sincrona"""
+        battle, twin = _battle("easy"), _battle("easy")
+        enemy = battle.enemies[0]
+        executor = AIExecutor()
+
+        ready, target = executor.poll(battle, enemy)
+        expected = twin.get_enemy_ai(twin.enemies[0]).choose_target(twin, twin.enemies[0])
+        assert ready
+        assert target.name == expected.name
+        assert executor.current is None
+        assert executor._pool is None
+
+    def test_search_runs_on_worker(self):
+        """Test la ricerca gira sul thread di lavoro e sceglie come SearchAI"""
+        battle = _battle()
+        enemy = battle.enemies[0]
+        executor = AIExecutor(budget=5.0)
+
+        target = _wait(executor, battle, enemy)
+        expected = SearchAI(4, 20_000).choose_target(battle, enemy)
+        assert target is expected
+        executor.shutdown()
+
+    def test_fallback_when_budget_exceeded(self):
+        """Test scaduto il budget il bersaglio è il più debole e la ricerca è cancellata"""
+        now = [0.0]
+        battle = _battle()
+        executor = AIExecutor(budget=0.1, clock=lambda: now[0])
+        gate = _block_worker(executor)
+
+        job = executor.submit(battle, battle.enemies[0])
+        assert job.poll() is None and not job.done
+        now[0] = 1.0
+        state = battle.rng.getstate()
+        target = job.poll()
+        assert job.done and job.fallback
+        assert target is battle.party.characters[1]
+        assert battle.rng.getstate() == state
+        assert job.future.cancelled()
+        gate.set()
+        executor.shutdown()
+
+    def test_cancel(self):
+        """Test cancel interrompe la decisione in corso"""
+        battle = _battle()
+        executor = AIExecutor()
+        gate = _block_worker(executor)
+
+        job = executor.submit(battle, battle.enemies[0])
+        executor.cancel()
+        assert executor.current is None
+        assert job.future.cancelled()
+        gate.set()
+        executor.shutdown()
+
+    def test_enemy_turn_with_decided_target(self):
+        """Test il bersaglio deciso viene passato a execute_enemy_turn"""
+        battle = _battle()
+        enemy = battle.enemies[0]
+        executor = AIExecutor(budget=5.0)
+        target = _wait(executor, battle, enemy)
+        hp = target.hp
+
+        battle.execute_enemy_turn(enemy, target)
+        assert target.hp < hp
+        executor.shutdown()
+
+
+class TestSearchCancellation:
+    """Test suite per l'interruzione di SearchAI"""
+
+    def test_cancel_event_stops_search(self):
+        """Test con l'evento impostato la ricerca si ferma e ripiega sul più debole"""
+        battle = _battle()
+        event = threading.Event()
+        event.set()
+        ai = SearchAI(depth=6, node_budget=10_000_000, cancel_event=event)
+        model, sequence = ai.prepare(battle, battle.enemies[0])
+
+        ranking = ai.rank_targets(model, sequence)
+        assert ranking[0] == 1
+        assert ai.nodes <= 64
@@ -0,0 +1,122 @@
+"""
+Test per l'auto-battaglia
+"""
+
+from models.character import Character
+from models.party import Party
+from combat.enemy import Enemy
+from combat.battle import Battle
+from combat.auto_battle import auto_battle, AutoBattleSummary
+from core.game_engine import GameEngine
+from core.input_manager import InputManager
+from utils.rng import SplitMixRNG
+
+
+def _battle(seed: int = 1, enemies=None) -> Battle:
+    """Battaglia di un guerriero e un mago"""
+    party = Party([Character("Warrior", "guerriero"), Character("Mage", "mago")])
+    enemies = enemies or [Enemy("goblin"), Enemy("orc")]
+    return Battle(party, enemies, rng=SplitMixRNG(seed), initiative=True)
+
+
+class TestAutoBattle:
+    """Test suite per auto_battle"""
+
+    def test_plays_to_the_end(self):
+        """Test una chiamata porta la battaglia alla fine"""
+        battle = _battle()
+        result, summary = auto_battle(battle)
+
+        assert result.victory
+        assert not battle.is_active
+        assert all(not e.is_alive for e in battle.enemies)
+        assert summary.victory and summary.turns >= summary.rounds
+        assert summary.damage_dealt == sum(e.max_hp for e in battle.enemies)
+
+    def test_deterministic(self):
+        """Test stesso seme, stesso riepilogo"""
+        first = auto_battle(_battle(seed=9))[1]
+        second = auto_battle(_battle(seed=9))[1]
+
+        assert first.to_dict() == second.to_dict()
+
+    def test_defeat(self):
+        """Test un party troppo debole perde"""
+        battle = _battle(enemies=[Enemy("dragon", 5)])
+        result, summary = auto_battle(battle, policy="attack")
+
+        assert not result.victory and result.game_over
+        assert summary.fallen == ["Warrior", "Mage"]
+        assert "SCONFITTA" in str(summary)
+
+    def test_round_limit(self):
+        """Test oltre il limite di round la battaglia non è vinta"""
+        battle = _battle(enemies=[Enemy("dragon", 5)])
+        result, summary = auto_battle(battle, max_rounds=1)
+
+        assert not result.victory
+        assert not battle.is_active
+        assert summary.rounds <= 2
+
+    def test_custom_policy_and_resume(self):
+        """Test una funzione policy riprende una battaglia già iniziata"""
+        battle = _battle()
+        battle.start_battle()
+        warrior = battle.party.characters[0]
+        battle.execute_player_turn(warrior, "attack")
+        battle.turn_manager.next_turn()
+        calls = []
+
+        def policy(b, character):
+            calls.append(character.name)
+            return "attack", None
+
+        result, _ = auto_battle(battle, policy)
+        assert result.victory
+        assert calls
+
+    def test_messages_not_formatted(self, monkeypatch):
+        """Test nessun messaggio viene formattato durante la risoluzione"""
+        def fail(*args):
+            raise AssertionError("messaggio formattato")
+
+        monkeypatch.setattr("combat.battle.format_message", fail)
+        battle = _battle()
+        auto_battle(battle)
+
+        assert len(battle.battle_log) > 0
+
+    def test_summary_text(self):
+        """Test riga compatta del riepilogo"""
+        summary = AutoBattleSummary(True, 3, 7, 100, 12, [])
+
+        assert str(summary).startswith("⚡ Auto-battaglia: VITTORIA in 3 round")
+        assert "KO: nessuno" in str(summary)
+
+
+class TestAutoBattleEngine:
+    """Test suite per l'attivazione dal motore testuale"""
+
+    def test_command(self):
+        """Test il comando auto e i suoi alias"""
+        manager = InputManager()
+
+        assert manager.parse("auto").action == "auto"
+        assert manager.parse("automatico").action == "auto"
+
+    def test_toggle_and_resolve(self, monkeypatch):
+        """Test con l'auto-battaglia attiva l'incontro si risolve senza input"""
+        engine = GameEngine(seed=3)
+        engine.party = Party([Character("Warrior", "guerriero"), Character("Mage", "mago")])
+        engine._handle_auto(None)
+        assert engine.auto_battle
+
+        def no_input(prompt=""):
+            raise AssertionError("input() non atteso")
+
+        monkeypatch.setattr("builtins.input", no_input)
+        engine.running = True
+        engine._start_combat()
+
+        assert not engine.in_combat
+        assert engine.current_battle is None or not engine.current_battle.is_active
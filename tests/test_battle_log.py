@@ -0,0 +1,125 @@
+"""
+Test per il registro compatto delle azioni di battaglia
+"""
+
+import pytest
+from models.character import Character
+from models.party import Party
+from combat.enemy import Enemy
+from combat.battle import Battle, BattleAction
+from combat.battle_log import BattleLog, format_message
+from utils.rng import GameRNG
+
+
+def _attack(i: int) -> BattleAction:
+    """Azione d'attacco numerata"""
+    return BattleAction("attack", f"A{i % 3}", "Goblin", i, template="attack")
+
+
+class TestBattleLog:
+    """Test suite per BattleLog"""
+
+    def test_roundtrip(self):
+        """Test un'azione registrata viene ricostruita uguale"""
+        log = BattleLog()
+        log.append(BattleAction("magic", "Mage", "Orc", 22, template="magic",
+                                defeated=True, extra="10"))
+        action = log[0]
+
+        assert (action.action_type, action.actor, action.target, action.value) == \
+            ("magic", "Mage", "Orc", 22)
+        assert action.message == ("✨ Mage lancia un incantesimo su Orc per 22 danni! (-10 MP)"
+                                  "\n💀 Orc è stato sconfitto!")
+
+    def test_ring_buffer_bounded(self):
+        """Test oltre la capacità restano solo le ultime azioni"""
+        log = BattleLog(capacity=4)
+        for i in range(10):
+            log.append(_attack(i))
+
+        assert len(log) == 4
+        assert log.total == 10
+        assert [a.value for a in log] == [6, 7, 8, 9]
+        assert log[-1].value == 9
+        with pytest.raises(IndexError):
+            log[4]
+
+    def test_spill_to_disk(self, tmp_path):
+        """Test le azioni uscite dal buffer vengono riversate su file"""
+        log = BattleLog(capacity=3, spill_path=str(tmp_path / "log.bin"))
+        for i in range(8):
+            log.append(_attack(i))
+
+        spilled = [a.value for a in log.read_spilled()]
+        assert spilled == [0, 1, 2, 3, 4]
+        assert spilled + [a.value for a in log] == list(range(8))
+
+    def test_new_log_truncates_spill_file(self, tmp_path):
+        """Test un nuovo registro sullo stesso file non rilegge le azioni del precedente"""
+        path = str(tmp_path / "log.bin")
+        first = BattleLog(capacity=1, spill_path=path)
+        for i in range(3):
+            first.append(BattleAction("attack", "Alice", "Goblin", i, template="attack"))
+        first.flush()
+
+        second = BattleLog(capacity=1, spill_path=path)
+        for i in range(3):
+            second.append(BattleAction("attack", "Zed", "Orc", 10 + i, template="attack"))
+        spilled = list(second.read_spilled())
+        assert [(a.actor, a.target, a.value) for a in spilled] == [("Zed", "Orc", 10),
+                                                                  ("Zed", "Orc", 11)]
+
+    def test_clear_resets_names_and_spill(self, tmp_path):
+        """Test clear svuota anche la tabella dei nomi e il file"""
+        log = BattleLog(capacity=2, spill_path=str(tmp_path / "log.bin"))
+        for i in range(5):
+            log.append(_attack(i))
+        log.clear()
+
+        assert len(log) == 0 and log.spilled == 0
+        assert log._names == []
+        assert list(log.read_spilled()) == []
+        assert (tmp_path / "log.bin").stat().st_size == 0
+        log.append(_attack(7))
+        assert log[0].actor == "A1"
+
+    def test_raw_message_kept(self):
+        """Test i messaggi già formattati vengono conservati"""
+        log = BattleLog()
+        log.append(BattleAction("use_item", "Hero", "Hero", 0, message="Nulla accade"))
+
+        assert log.messages() == ["Nulla accade"]
+
+    def test_invalid_capacity(self):
+        """Test capacità non valida"""
+        with pytest.raises(ValueError):
+            BattleLog(capacity=0)
+
+
+class TestLazyMessages:
+    """Test suite per la formattazione pigra dei messaggi"""
+
+    def test_message_built_on_access(self):
+        """Test il messaggio non esiste finché non viene letto"""
+        action = BattleAction("heal", "Mage", "Warrior", 18, template="heal")
+
+        assert action._message is None
+        assert action.message == "💚 Mage cura Warrior di 18 HP!"
+
+    def test_format_message_defeat(self):
+        """Test suffisso di sconfitta"""
+        message = format_message("attack", "Orc", "Hero", 30, defeated=True)
+
+        assert message.startswith("⚔️  Orc attacca Hero per 30 danni!")
+        assert message.endswith("💀 Hero è stato sconfitto!")
+
+    def test_battle_uses_bounded_log(self):
+        """Test una battaglia lunga non fa crescere il registro oltre la capacità"""
+        party = Party([Character("Hero", "paladino")])
+        enemy = Enemy("dragon", 5)
+        battle = Battle(party, enemy, rng=GameRNG(2), log=BattleLog(capacity=8))
+        for _ in range(20):
+            battle.execute_player_turn(party.characters[0], "heal")
+
+        assert len(battle.battle_log) == 8
+        assert "Azioni totali: 20" in battle.get_battle_summary()
@@ -0,0 +1,123 @@
+"""
+Test per la vista del combattimento (BattleViewModel)
+"""
+
+import pytest
+from models.character import Character
+from models.party import Party
+from combat.enemy import Enemy
+from combat.battle import Battle
+from core.battle_view import (BattleViewModel, HIGHLIGHT_TARGET, HIGHLIGHT_ENEMY,
+                              HIGHLIGHT_DEFEATED, ENEMY_TURN_TEXT)
+from utils.rng import SplitMixRNG
+
+
+def _battle(initiative: bool = False) -> Battle:
+    """Battaglia di un guerriero e un mago contro due nemici"""
+    party = Party([Character("Warrior", "guerriero"), Character("Mage", "mago")])
+    return Battle(party, [Enemy("goblin"), Enemy("orc")], rng=SplitMixRNG(2),
+                  initiative=initiative)
+
+
+class TestBattleVersion:
+    """Test suite per Battle.version"""
+
+    def test_actions_and_turns_bump_version(self):
+        """Test ogni azione e ogni cambio di turno cambiano la versione"""
+        battle = _battle()
+        versions = [battle.version]
+        battle.start_battle()
+        versions.append(battle.version)
+        battle.execute_player_turn(battle.party.characters[0], "attack")
+        versions.append(battle.version)
+        battle.turn_manager.next_turn()
+        versions.append(battle.version)
+        battle.touch()
+        versions.append(battle.version)
+        assert versions == sorted(set(versions))
+
+    def test_restore_bumps_version(self):
+        """Test restore cambia la versione anche tornando a uno stato già visto"""
+        battle = _battle()
+        snap = battle.snapshot()
+        before = battle.version
+        battle.restore(snap)
+        assert battle.version > before
+
+
+class TestBattleViewModel:
+    """Test suite per BattleViewModel"""
+
+    def test_rebuilds_only_on_change(self):
+        """Test la vista si ricalcola solo quando la battaglia cambia"""
+        battle = _battle()
+        view = BattleViewModel()
+        assert view.update(battle)
+        for _ in range(60):
+            assert not view.update(battle)
+        assert view.rebuilds == 1
+
+        battle.execute_player_turn(battle.party.characters[0], "attack")
+        assert view.update(battle)
+        assert view.update(battle, target_index=1)
+        assert view.rebuilds == 3
+
+    def test_update_has_no_side_effects(self):
+        """Test aggiornare la vista non fa avanzare il turno"""
+        battle = _battle()
+        battle.party.characters[0].take_damage(999)
+        tm = battle.turn_manager
+        state = (tm.current_turn_index, tm.round_number, battle.version)
+
+        view = BattleViewModel()
+        view.update(battle)
+        assert (tm.current_turn_index, tm.round_number, battle.version) == state
+        # Il guerriero è KO: tocca al mago
+        assert view.current_name == "Mage"
+
+    def test_fields(self):
+        """Test etichette, barre e comandi del turno del giocatore"""
+        battle = _battle()
+        goblin, orc = battle.enemies
+        goblin.take_damage(goblin.max_hp // 2)
+        view = BattleViewModel()
+        view.update(battle, target_index=1)
+
+        assert view.is_player_turn
+        assert view.current_name == "Warrior"
+        assert [hero.active for hero in view.heroes] == [True, False]
+        assert view.enemies[0].hp_text == f"{goblin.hp}/{goblin.max_hp}"
+        assert view.enemies[0].hp_pct == pytest.approx(goblin.hp / goblin.max_hp)
+        assert view.enemies[0].highlight == HIGHLIGHT_ENEMY
+        assert view.enemies[1].highlight == HIGHLIGHT_TARGET
+        assert view.enemies[1].label == f"▶ {orc.name} ◀"
+        assert "Bersaglio" in view.commands
+        assert view.preview.startswith("🎲 KO")
+
+    def test_enemy_turn(self):
+        """Test nel turno nemico non ci sono comandi né anteprima"""
+        battle = _battle()
+        tm = battle.turn_manager
+        tm.next_turn()
+        tm.next_turn()
+        battle.enemies[1].take_damage(999)
+        battle.touch()
+
+        view = BattleViewModel()
+        view.update(battle)
+        assert not view.is_player_turn
+        assert view.current_name is None
+        assert view.commands == ENEMY_TURN_TEXT
+        assert view.preview is None
+        assert view.enemies[1].highlight == HIGHLIGHT_DEFEATED
+        assert not view.enemies[1].alive
+
+    def test_from_parts(self):
+        """Test costruzione da dati sciolti (senza Battle)"""
+        party = Party([Character("Hero")])
+        enemy = Enemy("goblin")
+        view = BattleViewModel.from_parts(party.characters, [enemy], "Hero", enemy, "riga")
+        assert view.enemies[0].label == enemy.name
+        assert view.enemies[0].highlight == HIGHLIGHT_TARGET
+        assert view.preview == "riga"
+        assert "Bersaglio" not in view.commands
@@ -0,0 +1,77 @@
+"""
+Test per lo sciame di bot esploratori
+"""
+
+import random
+import pytest
+from pathlib import Path
+from models.world import World
+from tools.bot_explorer import (
+    explore_maps, run_bot, SharedMap, _attach, STRATEGIES,
+    RUN_EXIT_STEP, RUN_STUCK
+)
+
+
+@pytest.fixture
+def map_dir(tmp_path):
+    """Cartella con una mappa risolvibile e una con uscita irraggiungibile"""
+    World(grid=[
+        [3, 0, 0, 1],
+        [1, 2, 0, 1],
+        [0, 0, 0, 4]
+    ], name="Aperta").save_to_file(str(tmp_path / "open.json"))
+    World(grid=[
+        [3, 0, 1, 4],
+        [0, 0, 1, 0]
+    ], name="Chiusa").save_to_file(str(tmp_path / "closed.json"))
+    return tmp_path
+
+
+class TestBotExplorer:
+    """Test suite per il bot explorer"""
+
+    def test_all_strategies_reach_exit(self, map_dir):
+        """Test tutte le strategie trovano l'uscita raggiungibile"""
+        report = explore_maps([map_dir / "open.json"], bots=4, max_steps=2000, workers=0)
+        strategies = report["maps"]["open.json"]["strategies"]
+
+        for strategy in STRATEGIES:
+            assert strategies[strategy]["exit_reached"] == 4
+
+    def test_unreachable_exit_reported(self, map_dir):
+        """Test segnalazione di EXIT irraggiungibile"""
+        report = explore_maps([map_dir / "closed.json"], bots=2, max_steps=500, workers=0)
+        data = report["maps"]["closed.json"]
+
+        assert data["info"]["exit_reachable"] is False
+        assert data["strategies"]["random"]["exit_reached"] == 0
+
+    def test_stuck_detection(self, map_dir):
+        """Test un bot che non scopre nuove celle viene segnato come bloccato"""
+        shared = SharedMap(World.load_from_file(str(map_dir / "closed.json")), "closed")
+        try:
+            cells, neighbors = _attach(shared.task_header())
+            record = run_bot("random", cells, neighbors, shared.width, shared.start,
+                             shared.exit, 10_000, random.Random(1), stall_limit=50)
+        finally:
+            shared.close()
+
+        assert record[RUN_STUCK] is True
+        assert record[RUN_EXIT_STEP] == -1
+
+    def test_encounters_counted_once(self, map_dir):
+        """Test ogni nemico conta come un solo incontro"""
+        report = explore_maps([map_dir / "open.json"], ["frontier"], bots=3,
+                              max_steps=2000, workers=0)
+        summary = report["maps"]["open.json"]["strategies"]["frontier"]
+
+        assert summary["mean_coverage"] > 0
+        assert summary["encounters_per_100_steps"] * summary["total_steps"] / 100 <= 3
+
+    def test_reproducible_across_workers(self, map_dir):
+        """Test lo stesso seme produce lo stesso report con o senza pool"""
+        files = sorted(Path(map_dir).glob("*.json"))
+        inline = explore_maps(files, bots=4, max_steps=300, workers=0, seed=7)
+        pooled = explore_maps(files, bots=4, max_steps=300, workers=2, seed=7)
+
+        assert inline["maps"] == pooled["maps"]
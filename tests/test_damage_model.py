@@ -0,0 +1,129 @@
+"""
+Test per le distribuzioni esatte dei danni
+"""
+
+import pytest
+from models.character import Character
+from models.party import Party
+from combat.enemy import Enemy
+from combat.battle import Battle
+from combat.damage_model import (uniform_pmf, convolve, pmf_mean, KillTable, kill_table,
+                                 kill_chance, enemy_kill_chance, expected_rounds_to_win,
+                                 combat_preview, format_preview, physical_roll)
+
+
+@pytest.fixture
+def battle():
+    """Battaglia con un guerriero, un mago e due nemici"""
+    party = Party([Character("Warrior", "guerriero"), Character("Mage", "mago")])
+    return Battle(party, [Enemy("orc", 2), Enemy("goblin")])
+
+
+class TestPmf:
+    """Test suite per PMF e convoluzioni"""
+
+    def test_uniform(self):
+        """Test randint(10, 25) + 5 ha 16 valori equiprobabili"""
+        low, probs = uniform_pmf(10, 25, 5)
+
+        assert low == 15
+        assert len(probs) == 16
+        assert sum(probs) == pytest.approx(1.0)
+        assert pmf_mean((low, probs)) == pytest.approx(22.5)
+
+    def test_convolve_two_dice(self):
+        """Test somma di due dadi a sei facce"""
+        low, probs = convolve(uniform_pmf(1, 6), uniform_pmf(1, 6))
+
+        assert low == 2
+        assert len(probs) == 11
+        assert probs[5] == pytest.approx(6 / 36)
+        assert sum(probs) == pytest.approx(1.0)
+
+
+class TestKillTable:
+    """Test suite per KillTable"""
+
+    def test_single_hit_chance(self):
+        """Test P(danno >= hp) di un tiro uniforme 10..25"""
+        table = KillTable(uniform_pmf(10, 25), 100)
+
+        assert table.kill_chance(10) == 1.0
+        assert table.kill_chance(20) == pytest.approx(6 / 16)
+        assert table.kill_chance(26) == 0.0
+        assert table.kill_chance(0) == 1.0
+
+    def test_two_hits_chance(self):
+        """Test due colpi confrontati con l'enumerazione diretta"""
+        table = KillTable(uniform_pmf(10, 25), 100)
+        rolls = range(10, 26)
+        exact = sum(1 for a in rolls for b in rolls if a + b >= 40) / 256
+
+        assert table.kill_chance(40, hits=2) == pytest.approx(exact)
+
+    def test_expected_hits(self):
+        """Test colpi attesi: esatti per danno fisso, monotoni negli HP"""
+        fixed = KillTable(uniform_pmf(10, 10), 100)
+        table = KillTable(uniform_pmf(10, 25), 100)
+
+        assert fixed.expected_hits(35) == pytest.approx(4.0)
+        assert table.expected_hits(1) == pytest.approx(1.0)
+        assert table.expected_hits(60) > table.expected_hits(30)
+
+    def test_cached_per_roll(self):
+        """Test la tabella si costruisce una volta per tiro e HP massimi"""
+        char = Character("Warrior", "guerriero")
+
+        assert kill_table(physical_roll(char), 120) is kill_table(physical_roll(char), 120)
+
+
+class TestPreview:
+    """Test suite per l'anteprima della UI"""
+
+    def test_kill_chance(self, battle):
+        """Test probabilità di KO per azione e bersaglio"""
+        warrior = battle.party.characters[0]
+        goblin = battle.enemies[1]
+        goblin.hp = 30
+
+        # randint(10, 25) + 10 >= 30: 6 tiri su 16
+        assert kill_chance(warrior, "attack", goblin) == pytest.approx(6 / 16)
+        assert kill_chance(warrior, "heal", goblin) == 0.0
+        warrior.mp = 0
+        assert kill_chance(warrior, "magic", goblin) == 0.0
+
+    def test_enemy_danger(self, battle):
+        """Test un personaggio quasi morto è in pericolo"""
+        mage = battle.party.characters[1]
+        orc = battle.enemies[0]
+        mage.hp = 1
+
+        assert enemy_kill_chance(orc, mage) == pytest.approx(1.0)
+
+    def test_expected_rounds(self, battle):
+        """Test i round attesi crescono con gli HP dei nemici"""
+        before = expected_rounds_to_win(battle)
+        battle.enemies[0].hp = battle.enemies[0].max_hp // 4
+
+        assert 0 < expected_rounds_to_win(battle) < before
+
+    def test_preview_fields(self, battle):
+        """Test chiavi dell'anteprima e riga di testo"""
+        mage = battle.party.characters[1]
+        preview = combat_preview(battle, mage, battle.enemies[1])
+
+        assert preview['target'] == battle.enemies[1].name
+        assert preview['magic_kill'] is not None
+        assert "🎲" in format_preview(preview)
+
+        mage.mp = 0
+        preview = combat_preview(battle, mage)
+        assert preview['magic_kill'] is None
+        assert "magia —" in format_preview(preview)
+
+    def test_preview_does_not_touch_rng(self, battle):
+        """Test l'anteprima non consuma tiri"""
+        state = battle.rng.getstate()
+        combat_preview(battle, battle.party.characters[0])
+
+        assert battle.rng.getstate() == state
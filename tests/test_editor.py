@@ -0,0 +1,116 @@
+"""
+Unit tests per gli strumenti dell'editor di mappe
+"""
+
+import pytest
+from models.world import World, CellType
+from core.editor import MapEditor, CellDiff
+
+
+class TestMapEditor:
+    """Test suite per MapEditor"""
+
+    @pytest.fixture
+    def editor(self):
+        """Editor su una mappa 6x4 con un muro verticale"""
+        grid = [
+            [3, 0, 1, 0, 0, 0],
+            [0, 0, 1, 0, 0, 0],
+            [0, 0, 1, 0, 0, 0],
+            [0, 0, 0, 0, 0, 4]
+        ]
+        return MapEditor(World(grid=grid, name="Editor"))
+
+    def test_paint_single_cell(self, editor):
+        """Test pennello di raggio 0"""
+        diff = editor.paint(4, 1, CellType.WALL.value)
+
+        assert editor.world.grid[1][4] == 1
+        assert diff.cell_count() == 1
+
+    def test_paint_radius_clipped(self, editor):
+        """Test pennello ritagliato ai bordi"""
+        diff = editor.paint(0, 3, CellType.TREASURE.value, radius=1)
+
+        assert diff.cell_count() == 4
+        assert editor.world.grid[2][0] == 5
+        assert editor.world.grid[3][1] == 5
+
+    def test_fill_rect(self, editor):
+        """Test rettangolo con angoli invertiti"""
+        editor.fill_rect(5, 2, 3, 0, CellType.DANGER.value)
+
+        assert all(editor.world.grid[y][x] == 2 for y in range(3) for x in range(3, 6))
+
+    def test_noop_not_recorded(self, editor):
+        """Test un'operazione senza effetti non entra nella storia"""
+        assert editor.paint(2, 0, CellType.WALL.value) is None
+        assert editor.undo_stack == []
+
+    def test_flood_fill_region(self, editor):
+        """Test riempimento limitato dai muri e 4-connesso"""
+        editor.world.grid[3][2] = 1
+        diff = editor.flood_fill(0, 1, CellType.DANGER.value)
+
+        assert diff.cell_count() == 7
+        assert editor.world.grid[0][0] == 3
+        assert editor.world.grid[0][3] == 0
+
+    def test_flood_fill_spans_compact(self, editor):
+        """Test il diff del riempimento registra span orizzontali, non celle"""
+        diff = editor.flood_fill(3, 0, CellType.DANGER.value)
+
+        assert len(diff.spans) // 3 == 7
+        assert diff.cell_count() == 19
+
+    def test_undo_redo(self, editor):
+        """Test annulla e ripeti ripristinano la griglia"""
+        original = [row[:] for row in editor.world.grid]
+        editor.flood_fill(3, 0, CellType.DANGER.value)
+        filled = [row[:] for row in editor.world.grid]
+
+        assert editor.undo() is True
+        assert editor.world.grid == original
+        assert editor.redo() is True
+        assert editor.world.grid == filled
+
+    def test_new_edit_clears_redo(self, editor):
+        """Test una nuova modifica svuota la pila di ripetizione"""
+        editor.paint(4, 1, 1)
+        editor.undo()
+        editor.paint(4, 2, 1)
+
+        assert editor.redo() is False
+
+    def test_history_limit(self):
+        """Test la storia è limitata"""
+        editor = MapEditor(World(grid=[[0] * 5]), max_history=2)
+        for x in range(5):
+            editor.paint(x, 0, 1)
+
+        assert len(editor.undo_stack) == 2
+
+    def test_dirty_region(self, editor):
+        """Test la regione sporca unisce le operazioni"""
+        editor.paint(1, 1, 1)
+        editor.paint(4, 3, 1)
+
+        assert editor.consume_dirty() == (1, 1, 4, 3)
+        assert editor.consume_dirty() is None
+
+    def test_start_position_updated(self, editor):
+        """Test spostare lo START aggiorna la posizione di partenza"""
+        editor.paint(0, 0, CellType.EMPTY.value)
+        editor.paint(3, 3, CellType.START.value)
+
+        assert editor.world.start_position == (3, 3)
+        editor.undo()
+        assert editor.world.start_position is None
+
+    def test_diff_old_values_are_bytes(self):
+        """Test i valori precedenti occupano un byte per cella"""
+        diff = CellDiff(1)
+        diff.add_span(0, 0, 2, [0, 2, 5])
+
+        assert bytes(diff.old_values) == bytes([0, 2, 5])
+        assert diff.bounds == (0, 0, 2, 0)
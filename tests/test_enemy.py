@@ -2,8 +2,10 @@
 Unit tests per la classe Enemy (Sprint 2)
 """
 
+import json
 import pytest
-from combat.enemy import Enemy
+from combat.enemy import Enemy, ENEMY_REGISTRY
+from combat.enemy_registry import EnemyRegistry
 
 
 class TestEnemy:
@@ -178,4 +180,64 @@ class TestEnemy:
         
         str_repr = str(enemy)
         
-        assert "💀" in str_repr
\ No newline at end of file
+        assert "💀" in str_repr
+
+
+
+class TestEnemyRegistry:
+    """Test suite per le righe di statistiche condivise"""
+    
+    def test_same_type_and_level_share_row(self):
+        """Test nemici uguali condividono la stessa riga"""
+        a = Enemy("troll", 2)
+        b = Enemy("troll", 2)
+        
+        assert a.stats is b.stats
+        assert a.stats is not Enemy("troll", 3).stats
+        assert Enemy("invalid_type").stats is Enemy("goblin").stats
+    
+    def test_scaling_matches_templates(self):
+        """Test HP e danni scalati come da template"""
+        row = ENEMY_REGISTRY.stats("goblin", 3)
+        
+        assert row.max_hp == int(40 * 1.6)
+        assert row.min_damage == int(5 * 1.4)
+        assert row.max_damage == int(12 * 1.4)
+    
+    def test_override_is_per_instance(self):
+        """Test modificare una statistica non tocca gli altri nemici"""
+        boss = Enemy("dragon", 5)
+        other = Enemy("dragon", 5)
+        boss.max_hp = 300
+        boss.ai = "boss"
+        
+        assert boss.max_hp == 300 and boss.ai == "boss"
+        assert other.max_hp == ENEMY_REGISTRY.stats("dragon", 5).max_hp
+        assert other.stats is ENEMY_REGISTRY.stats("dragon", 5)
+    
+    def test_instances_are_slotted(self):
+        """Test lo stato per istanza vive negli slot"""
+        enemy = Enemy("orc")
+        
+        assert "hp" in Enemy.__slots__
+        assert not hasattr(enemy, '__dict__')
+        enemy.xp_reward = 5000
+        with pytest.raises(AttributeError):
+            enemy.unknown = 1
+    
+    def test_load_from_file(self, tmp_path):
+        """Test caricamento di un file di template"""
+        path = tmp_path / "enemies.json"
+        path.write_text(json.dumps({
+            "level_scaling": {"hp": 1.0, "damage": 0.0},
+            "enemies": {"slime": {"name": "Slime", "hp": 10, "min_damage": 1,
+                                  "max_damage": 2, "speed": 5, "ai": "easy",
+                                  "description": "Gelatina"}},
+        }), encoding="utf-8")
+        registry = EnemyRegistry.load(str(path))
+        
+        assert registry.types == ("slime",)
+        assert registry.stats("slime", 3).max_hp == 30
+        assert registry.stats("slime", 3).max_damage == 2
+        with pytest.raises(FileNotFoundError):
+            EnemyRegistry.load(str(tmp_path / "missing.json"))
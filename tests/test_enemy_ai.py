@@ -0,0 +1,137 @@
+"""
+Test per le IA dei nemici
+"""
+
+import pytest
+from models.character import Character
+from models.party import Party
+from combat.enemy import Enemy
+from combat.battle import Battle
+from combat.enemy_ai import (SearchAI, RandomAI, SearchModel, get_enemy_ai,
+                             DIFFICULTY_PRESETS)
+from combat.replay import ReplayRecorder
+from utils.rng import GameRNG
+
+
+@pytest.fixture
+def party():
+    """Party di tre personaggi"""
+    return Party([Character("Warrior", "guerriero"), Character("Mage", "mago"),
+                  Character("Thief", "ladro")])
+
+
+class TestPresets:
+    """Test suite per le difficoltà per tipo di nemico"""
+
+    def test_enemy_types_have_difficulty(self):
+        """Test ogni tipo di nemico ha una difficoltà valida"""
+        for enemy_type in Enemy.ENEMY_TEMPLATES:
+            assert Enemy(enemy_type).ai in DIFFICULTY_PRESETS
+        assert Enemy("dragon").ai == "hard"
+
+    def test_get_enemy_ai(self):
+        """Test istanze per difficoltà"""
+        assert isinstance(get_enemy_ai("easy"), RandomAI)
+        assert isinstance(get_enemy_ai("boss"), SearchAI)
+        assert get_enemy_ai("hard") is get_enemy_ai("hard")
+        with pytest.raises(ValueError):
+            get_enemy_ai("impossibile")
+
+    def test_presets_are_deterministic(self):
+        """Test i preset non hanno limiti di tempo: stesso seme, stessa battaglia"""
+        assert all("time_budget" not in preset for preset in DIFFICULTY_PRESETS.values())
+
+        logs = []
+        for _ in range(2):
+            party = Party([Character("Warrior", "guerriero"), Character("Mage", "mago")])
+            battle = Battle(party, [Enemy("troll", 2), Enemy("orc")], rng=GameRNG(8),
+                            enemy_ai="hard")
+            tm = battle.turn_manager
+            while tm.is_battle_active():
+                current = tm.get_current_combatant()
+                if current.is_player:
+                    battle.execute_player_turn(current.entity, "attack")
+                else:
+                    battle.execute_enemy_turn()
+                tm.next_turn()
+            logs.append(battle.battle_log.messages())
+        assert logs[0] == logs[1]
+
+    def test_battle_override(self, party):
+        """Test l'IA della battaglia sostituisce quella dei nemici"""
+        enemy = Enemy("goblin")
+        battle = Battle(party, enemy, enemy_ai="hard")
+
+        assert battle.get_enemy_ai(enemy) is get_enemy_ai("hard")
+        assert Battle(party, enemy).get_enemy_ai(enemy) is get_enemy_ai("easy")
+
+
+class TestSearchAI:
+    """Test suite per SearchAI"""
+
+    def test_finishes_wounded_player(self, party):
+        """Test l'IA sceglie il colpo che mette KO"""
+        party.characters[1].hp = 8
+        enemy = Enemy("troll", 2)
+        battle = Battle(party, enemy, rng=GameRNG(1))
+        battle.turn_manager.current_turn_index = 3
+
+        assert SearchAI(depth=2).choose_target(battle, enemy) is party.characters[1]
+
+    def test_does_not_touch_battle(self, party):
+        """Test la ricerca non modifica la battaglia né consuma tiri"""
+        enemy = Enemy("dragon", 3)
+        battle = Battle(party, enemy, rng=GameRNG(4), initiative=True)
+        hps = [c.hp for c in party.characters]
+        rng_state = battle.rng.getstate()
+        SearchAI(depth=4).choose_target(battle, enemy)
+
+        assert [c.hp for c in party.characters] == hps
+        assert battle.rng.getstate() == rng_state
+
+    def test_node_budget(self, party):
+        """Test il budget di nodi limita la ricerca"""
+        enemy = Enemy("dragon", 3)
+        battle = Battle(party, [enemy, Enemy("orc")], initiative=True)
+        ai = SearchAI(depth=8, node_budget=50)
+        target = ai.choose_target(battle, enemy)
+
+        assert target in party.characters
+        assert ai.nodes <= 51
+        assert ai.completed_depth < 8
+
+    def test_deeper_with_more_budget(self, party):
+        """Test con più budget l'approfondimento arriva più in là"""
+        enemy = Enemy("troll")
+        battle = Battle(party, enemy)
+        small = SearchAI(depth=4, node_budget=30)
+        large = SearchAI(depth=4, node_budget=100_000)
+        small.choose_target(battle, enemy)
+        large.choose_target(battle, enemy)
+
+        assert large.completed_depth == 4
+        assert small.completed_depth < large.completed_depth
+
+    def test_model_evaluation(self, party):
+        """Test la valutazione premia i danni al party"""
+        model = SearchModel(Battle(party, Enemy("orc")))
+        player_hp, player_mp, enemy_hp = model.state
+        hurt = ((player_hp[0] - 50,) + player_hp[1:], player_mp, enemy_hp)
+
+        assert model.evaluate(hurt) > model.evaluate(model.state)
+
+    def test_search_battle_replays(self, party):
+        """Test le scelte dell'IA vengono registrate e riprodotte"""
+        enemies = [Enemy("troll", 2), Enemy("dragon")]
+        battle = Battle(party, enemies, rng=GameRNG(3))
+        recorder = ReplayRecorder(battle, seed=11)
+        tm = battle.turn_manager
+        while tm.is_battle_active():
+            current = tm.get_current_combatant()
+            if current.is_player:
+                battle.execute_player_turn(current.entity, "attack")
+            else:
+                battle.execute_enemy_turn()
+            tm.next_turn()
+
+        recorder.detach().play()
@@ -0,0 +1,148 @@
+"""
+Test per il bus degli eventi di battaglia
+"""
+
+import pytest
+from models.character import Character
+from models.party import Party
+from combat.enemy import Enemy
+from combat.battle import Battle
+from combat.auto_battle import auto_battle
+from combat.events import (EventBus, BattleEvent, TurnStarted, DamageDealt, Healed,
+                           ItemUsed, CombatantDefeated, BattleEnded, BattleStatsCollector)
+from utils.rng import SplitMixRNG
+
+
+def _battle(initiative: bool = False) -> Battle:
+    """Battaglia di un guerriero e un mago contro due nemici"""
+    party = Party([Character("Warrior", "guerriero"), Character("Mage", "mago")])
+    party.inventory.add_item("bomb")
+    party.inventory.add_item("health_potion")
+    return Battle(party, [Enemy("goblin"), Enemy("orc")], rng=SplitMixRNG(4),
+                  initiative=initiative)
+
+
+class TestEventBus:
+    """Test suite per EventBus"""
+
+    def test_inactive_without_subscribers(self):
+        """Test senza iscritti il bus è inattivo e non costruisce eventi"""
+        bus = EventBus()
+        built = []
+
+        class Probe(TurnStarted):
+            __slots__ = ()
+
+            def __init__(self, *args):
+                built.append(args)
+
+        assert not bus.active
+        bus.emit(Probe, None, 1)
+        assert built == []
+
+    def test_subscribe_and_unsubscribe(self):
+        """Test consegna per tipo e per tutti gli eventi"""
+        bus = EventBus()
+        typed, everything = [], []
+        handler = bus.subscribe(Healed, typed.append)
+        bus.subscribe(BattleEvent, everything.append)
+
+        bus.emit(Healed, None, Character("Hero"), 5, "heal")
+        bus.emit(BattleEnded, None)
+        assert len(typed) == 1 and typed[0].amount == 5
+        assert [type(e) for e in everything] == [Healed, BattleEnded]
+
+        bus.unsubscribe(Healed, handler)
+        bus.unsubscribe(BattleEvent, everything.append)
+        assert not bus.active
+        assert not bus.wants(Healed)
+
+    def test_unknown_type(self):
+        """Test non ci si può iscrivere a tipi che non sono eventi"""
+        with pytest.raises(ValueError):
+            EventBus().subscribe(int, print)
+
+
+class TestBattleEvents:
+    """Test suite per gli eventi pubblicati da Battle e TurnManager"""
+
+    def test_full_battle_events(self):
+        """Test una battaglia completa pubblica tutti i tipi di evento"""
+        battle = _battle()
+        events = []
+        battle.events.subscribe(BattleEvent, events.append)
+        battle.start_battle()
+        auto_battle(battle)
+
+        kinds = {type(e) for e in events}
+        assert {TurnStarted, DamageDealt, CombatantDefeated, BattleEnded} <= kinds
+        assert isinstance(events[0], TurnStarted)
+        assert isinstance(events[-1], BattleEnded)
+        assert sum(isinstance(e, BattleEnded) for e in events) == 1
+        defeated = [e.entity for e in events if isinstance(e, CombatantDefeated)]
+        assert set(defeated) == set(battle.enemies)
+
+    def test_damage_before_defeat(self):
+        """Test il colpo finale arriva prima della notifica di KO"""
+        battle = _battle()
+        events = []
+        battle.events.subscribe(BattleEvent, events.append)
+        goblin = battle.enemies[0]
+        goblin.hp = 1
+        battle.execute_player_turn(battle.party.characters[0], "attack", goblin)
+
+        assert [type(e) for e in events] == [DamageDealt, CombatantDefeated]
+        assert events[0].source is battle.party.characters[0]
+        assert events[1].entity is goblin and not events[1].is_player
+
+    def test_items_and_heals(self):
+        """Test oggetti e cure pubblicano ItemUsed e Healed"""
+        battle = _battle()
+        events = []
+        battle.events.subscribe(BattleEvent, events.append)
+        warrior, mage = battle.party.characters
+        warrior.hp -= 60
+        battle.execute_player_turn(mage, "use_item", warrior, "health_potion")
+        battle.execute_player_turn(mage, "use_item", battle.enemies[1], "bomb")
+        battle.execute_player_turn(mage, "heal", warrior)
+
+        assert [type(e) for e in events] == [ItemUsed, Healed, ItemUsed, DamageDealt, Healed]
+        assert events[1].amount == 50 and events[1].kind == "item"
+        assert events[3].target is battle.enemies[1] and events[3].amount == 40
+
+    def test_periodic_effects(self):
+        """Test danno nel tempo e rigenerazione pubblicano eventi senza sorgente"""
+        party = Party([Character("Warrior", "guerriero")])
+        troll = Enemy("troll")
+        battle = Battle(party, troll, rng=SplitMixRNG(1))
+        events = []
+        battle.events.subscribe(Healed, events.append)
+        troll.hp -= 20
+        battle.execute_enemy_turn(troll)
+
+        assert events[0].source is None and events[0].kind == "regen"
+
+    @pytest.mark.parametrize("initiative", [False, True])
+    def test_turn_started(self, initiative):
+        """Test TurnStarted a ogni cambio di turno, con il round"""
+        battle = _battle(initiative)
+        turns = []
+        battle.events.subscribe(TurnStarted, turns.append)
+        tm = battle.turn_manager
+        tm.next_turn()
+        tm.next_turn()
+
+        assert len(turns) == 2
+        assert turns[-1].combatant is tm.turn_order[tm.current_turn_index]
+        assert all(e.round_number >= 1 for e in turns)
+
+    def test_stats_collector(self):
+        """Test il raccoglitore somma danni, cure e KO"""
+        battle = _battle()
+        stats = BattleStatsCollector(battle.events)
+        auto_battle(battle)
+
+        assert sum(stats.damage_taken[e.name] for e in battle.enemies) == \
+            sum(e.max_hp for e in battle.enemies)
+        assert stats.turns > 0
+        assert set(stats.defeated) >= {e.name for e in battle.enemies}
@@ -0,0 +1,201 @@
+"""
+Test per gli incontri contro le orde
+"""
+
+from models.character import Character
+from models.party import Party
+from models.world import World
+from combat.enemy import ENEMY_REGISTRY
+from combat.horde import Horde, HordeBattle, horde_policy, resolve_horde
+from core.game_engine import GameEngine
+from core.movement import MovementManager
+from core.triggers import DEFAULT_REGISTRY, TriggerType
+from utils.rng import SplitMixRNG
+
+
+def _party() -> Party:
+    """Party di un guerriero e un mago"""
+    return Party([Character("Warrior", "guerriero"), Character("Mage", "mago")])
+
+
+class TestHorde:
+    """Test suite per le colonne dell'orda"""
+
+    def test_spawn_shares_rows(self):
+        """Test un'orda tiene una riga di statistiche per tipo e livello"""
+        horde = Horde.spawn({'goblin': 300, 'troll': 200}, level=2)
+        assert len(horde) == 500
+        assert horde.alive_count == 500
+        assert horde.kinds == [ENEMY_REGISTRY.stats('goblin', 2), ENEMY_REGISTRY.stats('troll', 2)]
+        assert horde.hp[0] == horde.max_hp[0] == ENEMY_REGISTRY.stats('goblin', 2).max_hp
+        assert horde.name(300).startswith(ENEMY_REGISTRY.stats('troll', 2).name)
+
+    def test_damage_all_processes_deaths(self):
+        """Test il danno ad area aggiorna HP, flag e conteggio dei vivi"""
+        horde = Horde.spawn({'goblin': 3, 'orc': 2})
+        goblin_hp = horde.max_hp[0]
+        orc_hp = horde.max_hp[3]
+
+        total, killed = horde.damage_all(goblin_hp)
+        assert killed == 3
+        assert total == 3 * goblin_hp + 2 * goblin_hp
+        assert horde.alive_count == 2
+        assert list(horde.alive) == [0, 0, 0, 1, 1]
+        assert horde.alive_indices() == [3, 4]
+        assert horde.first_alive() == 3
+
+        # Un nemico già a 0 HP non conta più nel danno
+        total, killed = horde.damage_all(orc_hp)
+        assert total == 2 * (orc_hp - goblin_hp)
+        assert killed == 2
+        assert horde.alive_count == 0
+        assert horde.first_alive() is None
+
+    def test_damage_one_and_many(self):
+        """Test danno a un bersaglio e a un'area di vivi consecutivi"""
+        horde = Horde.spawn({'goblin': 10})
+        hp = horde.max_hp[0]
+        assert horde.damage_one(0, hp + 50) == hp
+        assert not horde.alive[0]
+        assert horde.alive_count == 9
+
+        area = horde.alive_indices(3, start=0)
+        assert area == [1, 2, 3]
+        total, killed = horde.damage_many(area, 5)
+        assert total == 15 and killed == 0
+        assert horde.alive_indices(2, start=4) == [4, 5]
+
+    def test_regenerate(self):
+        """Test i troll dell'orda si rigenerano fino agli HP massimi"""
+        horde = Horde.spawn({'troll': 2, 'goblin': 1})
+        regen = horde.kinds[0].regen
+        horde.damage_one(0, 3)
+        horde.damage_one(1, regen + 10)
+        assert horde.regenerate() == 3 + regen
+        assert horde.hp[0] == horde.max_hp[0]
+
+
+class TestHordeBattle:
+    """Test suite per HordeBattle"""
+
+    def test_bomb_hits_whole_horde(self):
+        """Test una bomba colpisce tutti i nemici dell'orda"""
+        party = _party()
+        party.inventory.add_item("bomb")
+        horde = Horde.spawn({'goblin': 50})
+        battle = HordeBattle(party, horde, rng=SplitMixRNG(1))
+
+        action = battle.execute_player_turn(party.characters[0], "use_item", item_id="bomb")
+        assert action.template == "area_item"
+        assert action.value == 50 * min(40, horde.max_hp[0])
+        assert horde.alive_count == 0
+        assert not party.inventory.has_item("bomb")
+
+    def test_magic_hits_an_area(self):
+        """Test la magia colpisce AREA_SIZE nemici dal bersaglio in poi"""
+        party = _party()
+        horde = Horde.spawn({'troll': 20})
+        battle = HordeBattle(party, horde, rng=SplitMixRNG(2))
+        mage = party.characters[1]
+
+        battle.execute_player_turn(mage, "magic", 4)
+        damaged = [i for i in range(len(horde)) if horde.hp[i] < horde.max_hp[i]]
+        assert damaged == list(range(4, 4 + HordeBattle.AREA_SIZE))
+
+    def test_only_front_line_attacks(self):
+        """Test il danno dell'orda è limitato dalla prima linea"""
+        party = _party()
+        horde = Horde.spawn({'goblin': 500})
+        battle = HordeBattle(party, horde, rng=SplitMixRNG(3))
+        before = sum(c.hp for c in party.characters)
+
+        battle.execute_horde_turn()
+        taken = before - sum(c.hp for c in party.characters)
+        front = HordeBattle.FRONT_PER_HERO * len(party.characters)
+        assert 0 < taken <= front * horde.max_damage[0]
+
+    def test_unusable_items_are_not_consumed(self):
+        """Test i buff non si usano contro un'orda e restano nell'inventario"""
+        party = _party()
+        party.inventory.add_item("strength_tonic")
+        battle = HordeBattle(party, Horde.spawn({'goblin': 5}))
+
+        action = battle.execute_player_turn(party.characters[0], "use_item", item_id="strength_tonic")
+        assert action.action_type == "skip"
+        assert party.inventory.has_item("strength_tonic")
+
+    def test_policy_prefers_bombs_against_big_hordes(self):
+        """Test la policy usa le bombe contro un'orda numerosa"""
+        party = _party()
+        party.inventory.add_item("bomb")
+        battle = HordeBattle(party, Horde.spawn({'goblin': 20}))
+        assert horde_policy(battle, party.characters[0]) == ("use_item", None, "bomb")
+
+        battle = HordeBattle(party, Horde.spawn({'goblin': 2}))
+        assert horde_policy(battle, party.characters[1])[0] == "magic"
+
+
+class TestResolveHorde:
+    """Test suite per resolve_horde"""
+
+    def test_victory_applies_bonus_once(self):
+        """Test una piccola orda viene sconfitta e il bonus è applicato una volta"""
+        party = _party()
+        max_hp = [c.max_hp for c in party.characters]
+        result, summary = resolve_horde(party, Horde.spawn({'goblin': 4}), rng=SplitMixRNG(5))
+
+        assert result.victory and summary.victory
+        assert summary.damage_dealt == 4 * ENEMY_REGISTRY.stats('goblin', 1).max_hp
+        for char, before in zip(party.characters, max_hp):
+            if char.is_alive:
+                assert char.max_hp == before + 10
+
+    def test_large_horde_terminates(self):
+        """Test un'orda di 500 nemici si risolve senza superare il limite di round"""
+        party = _party()
+        for _ in range(3):
+            party.inventory.add_item("bomb")
+        result, summary = resolve_horde(party, Horde.spawn({'goblin': 500}),
+                                        rng=SplitMixRNG(6), max_rounds=50)
+        assert result.rounds <= 51
+        assert summary.turns > 0
+        assert summary.damage_dealt > 0
+
+    def test_horde_trigger(self):
+        """Test il trigger 'horde' dei metadati della mappa"""
+        handler = DEFAULT_REGISTRY.build_script_handler(
+            {"x": 1, "y": 1, "type": "horde", "count": 120, "level": 2, "enemies": ["goblin"]})
+
+        class Manager:
+            def get_position(self):
+                return (1, 1)
+
+        result = handler(Manager(), 0, 1)
+        assert result.trigger == TriggerType.HORDE
+        assert result.data == {"count": 120, "level": 2, "enemies": ["goblin"]}
+
+    def test_defeated_horde_is_consumed(self, monkeypatch):
+        """Test vinta l'orda, ripassare sulla cella non ne genera un'altra"""
+        import combat.horde
+
+        resolved = []
+
+        def counting_resolve(*args, **kwargs):
+            outcome = resolve_horde(*args, **kwargs)
+            resolved.append(outcome[0].victory)
+            return outcome
+
+        monkeypatch.setattr(combat.horde, "resolve_horde", counting_resolve)
+        world = World([[0, 0, 0]], triggers=[
+            {"x": 1, "y": 0, "type": "horde", "count": 3, "enemies": ["goblin"]}])
+        engine = GameEngine(seed=4)
+        engine.party = _party()
+        engine.world = world
+        engine.movement_manager = MovementManager(world)
+        engine.running = True
+
+        for direction in ("d", "a", "d", "d"):
+            engine._handle_movement_wasd(direction)
+        assert resolved == [True]
+        assert world.triggers == []
+        assert engine.running
@@ -0,0 +1,166 @@
+"""
+Test per lo scheduler dei turni basato sulla velocità
+"""
+
+import pytest
+from models.character import Character
+from models.party import Party
+from combat.enemy import Enemy
+from combat.battle import Battle
+from combat.turn_manager import TurnManager, Combatant
+from combat.initiative import InitiativeScheduler, HASTE, SLOW
+from utils.rng import GameRNG
+
+
+def _combatants(*speeds):
+    """Crea combattenti nemici con le velocità indicate"""
+    result = []
+    for i, speed in enumerate(speeds):
+        enemy = Enemy("orc")
+        enemy.name = f"E{i}"
+        enemy.speed = speed
+        result.append(Combatant(enemy, is_player=False))
+    return result
+
+
+def _take_turns(scheduler, turns, cost=1.0):
+    """Esegue alcuni turni e ritorna gli indici degli attori"""
+    order = []
+    for _ in range(turns):
+        index = scheduler.peek()
+        order.append(index)
+        scheduler.advance(index, cost)
+    return order
+
+
+class TestInitiativeScheduler:
+    """Test suite per InitiativeScheduler"""
+
+    def test_faster_acts_first_and_more_often(self):
+        """Test il più veloce agisce prima e con frequenza proporzionale"""
+        scheduler = InitiativeScheduler(_combatants(10, 20))
+        order = _take_turns(scheduler, 30)
+
+        assert order[0] == 1
+        assert order.count(1) == 2 * order.count(0)
+
+    def test_ties_keep_list_order(self):
+        """Test a parità di velocità vale l'ordine della lista"""
+        scheduler = InitiativeScheduler(_combatants(10, 10, 10))
+
+        assert _take_turns(scheduler, 6) == [0, 1, 2, 0, 1, 2]
+
+    def test_dead_combatants_skipped(self):
+        """Test i combattenti KO vengono scartati pigramente"""
+        combatants = _combatants(10, 12, 8)
+        scheduler = InitiativeScheduler(combatants)
+        combatants[1].entity.take_damage(999)
+
+        assert 1 not in _take_turns(scheduler, 6)
+
+    def test_haste_and_slow(self):
+        """Test haste e slow cambiano l'ordine dei turni"""
+        scheduler = InitiativeScheduler(_combatants(10, 10))
+        scheduler.set_modifier(1, HASTE)
+        scheduler.set_modifier(0, SLOW)
+        order = _take_turns(scheduler, 8)
+
+        assert order[0] == 1
+        assert order.count(1) == 3 * order.count(0)
+
+    def test_action_cost_delays_next_turn(self):
+        """Test un'azione costosa ritarda il turno successivo"""
+        scheduler = InitiativeScheduler(_combatants(10, 10))
+        scheduler.advance(0, 2.0)
+
+        assert _take_turns(scheduler, 3) == [1, 1, 0]
+
+    def test_preview_does_not_mutate(self):
+        """Test la previsione non consuma turni"""
+        scheduler = InitiativeScheduler(_combatants(10, 15, 7))
+        preview = scheduler.preview(8)
+
+        assert scheduler.time == 0.0
+        assert preview == _take_turns(scheduler, 8)
+
+    def test_revive_requeues(self):
+        """Test un combattente rianimato torna in coda"""
+        combatants = _combatants(10, 10)
+        scheduler = InitiativeScheduler(combatants)
+        combatants[0].entity.is_alive = False
+        _take_turns(scheduler, 2)
+        combatants[0].entity.is_alive = True
+        scheduler.revive(0)
+
+        assert 0 in _take_turns(scheduler, 3)
+
+
+class TestTurnManagerInitiative:
+    """Test suite per il TurnManager con initiative=True"""
+
+    @pytest.fixture
+    def party(self):
+        """Ladro (veloce) e mago (lento)"""
+        return Party([Character("Thief", "ladro"), Character("Mage", "mago")])
+
+    def test_speed_stats(self):
+        """Test velocità di classi e nemici"""
+        assert Character("T", "ladro").speed > Character("W", "guerriero").speed
+        assert Enemy("goblin").speed > Enemy("troll").speed
+
+    def test_fastest_first(self, party):
+        """Test il combattente più veloce apre la battaglia"""
+        tm = TurnManager(party.characters, Enemy("troll"), initiative=True)
+
+        assert tm.get_current_combatant().entity is party.characters[0]
+        assert tm.round_number == 1
+
+    def test_rounds_advance(self, party):
+        """Test il numero di round cresce con il tempo di gioco"""
+        tm = TurnManager(party.characters, Enemy("troll"), initiative=True)
+        for _ in range(12):
+            tm.get_current_combatant()
+            tm.next_turn()
+
+        assert tm.round_number > 1
+
+    def test_preview_matches_play(self, party):
+        """Test preview_turns corrisponde ai turni giocati"""
+        tm = TurnManager(party.characters, Enemy("goblin"), initiative=True)
+        preview = [c.name for c in tm.preview_turns(6)]
+        played = []
+        for _ in range(6):
+            played.append(tm.get_current_combatant().name)
+            tm.next_turn()
+
+        assert preview == played
+
+    def test_reset_restarts_scheduler(self, party):
+        """Test reset riporta lo scheduler all'inizio"""
+        tm = TurnManager(party.characters, Enemy("goblin"), initiative=True)
+        first = tm.get_current_combatant().name
+        for _ in range(5):
+            tm.next_turn()
+        tm.reset()
+
+        assert tm.get_current_combatant().name == first
+        assert tm.scheduler.time == 0.0
+
+    def test_classic_mode_unchanged(self, party):
+        """Test senza initiative l'ordine resta fisso"""
+        tm = TurnManager(party.characters, Enemy("troll"))
+
+        assert tm.scheduler is None
+        assert [c.name for c in tm.preview_turns(3)] == ["Thief", "Mage", tm.enemy.name]
+
+    def test_battle_action_cost(self, party):
+        """Test la magia costa più tempo dell'attacco"""
+        enemy = Enemy("troll", 3)
+        battle = Battle(party, enemy, rng=GameRNG(1), initiative=True)
+        tm = battle.turn_manager
+        thief = tm.get_current_combatant()
+        battle.execute_player_turn(thief.entity, "magic")
+        tm.next_turn()
+
+        assert tm.scheduler._next_time[0] == pytest.approx(
+            100.0 / thief.entity.speed * (1 + Battle.ACTION_COSTS["magic"]))
@@ -0,0 +1,122 @@
+"""
+Test per gli effetti degli oggetti compilati
+"""
+
+import pytest
+from models.character import Character
+from models.party import Party
+from models.item import Item, ItemEffect
+from combat.enemy import Enemy
+from combat.battle import Battle
+from combat.events import BattleEvent, CombatantDefeated, DamageDealt, Healed, ItemUsed
+from combat.item_effects import (COMPILED_ITEMS, TARGET_ENEMIES, TARGET_PARTY,
+                                 compile_item, compile_items)
+from utils.rng import SplitMixRNG
+
+
+def _battle() -> Battle:
+    """Battaglia di un guerriero e un mago contro due goblin"""
+    party = Party([Character("Warrior", "guerriero"), Character("Mage", "mago")])
+    return Battle(party, [Enemy("goblin"), Enemy("goblin")], rng=SplitMixRNG(2))
+
+
+class TestCompiledItems:
+    """Test suite per la tabella compilata degli oggetti del gioco"""
+
+    def test_every_item_is_compiled(self):
+        """Test ogni oggetto ha la sua funzione"""
+        assert set(COMPILED_ITEMS) == set(Item.ITEM_TEMPLATES)
+        assert all(callable(use) for use in COMPILED_ITEMS.values())
+
+    def test_elixir_restores_hp_and_mp(self):
+        """Test l'elisir è un effetto composto: HP e MP al massimo"""
+        battle = _battle()
+        mage = battle.party.characters[1]
+        mage.hp, mage.mp = 10, 0
+        battle.party.inventory.add_item("elixir")
+
+        action = battle.execute_player_turn(mage, "use_item", mage, "elixir")
+        assert mage.hp == mage.max_hp and mage.mp == mage.max_mp
+        assert action.value == mage.max_hp - 10
+        assert "HP e MP" in action.message and "Elisir" in action.message
+
+    def test_same_results_as_before(self):
+        """Test pozione e bomba: valori, messaggi e sconfitte"""
+        battle = _battle()
+        warrior = battle.party.characters[0]
+        warrior.hp -= 30
+        battle.party.inventory.add_item("health_potion")
+        battle.party.inventory.add_item("bomb")
+
+        action = battle.execute_player_turn(warrior, "use_item", None, "health_potion")
+        assert action.value == 30 and action.target == "Warrior"
+        assert action.message == "💚 Warrior usa Pozione di Vita su Warrior: +30 HP!"
+
+        goblin = battle.enemies[1]
+        action = battle.execute_player_turn(warrior, "use_item", goblin, "bomb")
+        assert action.target == goblin.name
+        assert action.value == min(40, goblin.max_hp)
+        assert action.defeated == (not goblin.is_alive)
+
+
+class TestCompileItem:
+    """Test suite per compile_item con dati dichiarativi"""
+
+    def test_party_wide_heal(self):
+        """Test una cura di gruppo è un'unica azione con il totale e un evento per bersaglio"""
+        use = compile_item("incense", {'name': 'Incenso', 'effect': ItemEffect.HEAL,
+                                       'value': 20, 'target': TARGET_PARTY})
+        battle = _battle()
+        events = []
+        battle.events.subscribe(BattleEvent, events.append)
+        warrior, mage = battle.party.characters
+        warrior.hp -= 50
+        mage.hp -= 5
+
+        action = use(battle, warrior, None)
+        assert action.value == 25 and action.target == "il party"
+        assert [type(e) for e in events] == [ItemUsed, Healed, Healed]
+        assert events[0].target is None and events[0].value == 25
+        assert [e.amount for e in events[1:]] == [20, 5]
+
+    def test_area_damage(self):
+        """Test un danno ad area colpisce tutti i nemici vivi"""
+        use = compile_item("flask", {'name': 'Fiasca', 'effect': ItemEffect.DAMAGE,
+                                     'value': 100, 'target': TARGET_ENEMIES})
+        battle = _battle()
+        events = []
+        battle.events.subscribe(BattleEvent, events.append)
+
+        action = use(battle, battle.party.characters[0], None)
+        assert action.value == sum(e.max_hp for e in battle.enemies)
+        assert action.target == "tutti i nemici" and not action.defeated
+        assert all(not e.is_alive for e in battle.enemies)
+        assert [type(e) for e in events] == [ItemUsed, DamageDealt, CombatantDefeated,
+                                             DamageDealt, CombatantDefeated]
+
+    def test_composite_steps(self):
+        """Test passi con bersagli, quantità e durata propri"""
+        use = compile_item("war_horn", {
+            'name': 'Corno', 'effect': ItemEffect.BUFF_ATK, 'value': 4,
+            'steps': [
+                {'effect': ItemEffect.BUFF_ATK, 'target': TARGET_PARTY, 'duration': 1},
+                {'effect': ItemEffect.DAMAGE, 'amount': 7},
+            ]})
+        battle = _battle()
+        goblin = battle.enemies[0]
+
+        action = use(battle, battle.party.characters[0], None)
+        assert action.value == 8 and action.extra == "Corno"
+        assert goblin.hp == goblin.max_hp - 7
+        round_number = battle.turn_manager.round_number
+        for char in battle.party.characters:
+            assert battle.effects.modifier(char, "atk") == 4
+            assert [e.expires for e in battle.effects.effects_on(char)] == [round_number + 1]
+
+    def test_invalid_data(self):
+        """Test effetti e bersagli sconosciuti sono rifiutati alla compilazione"""
+        with pytest.raises(ValueError):
+            compile_item("x", {'name': 'X', 'effect': 'teleport', 'value': 1})
+        with pytest.raises(ValueError):
+            compile_items({"y": {'name': 'Y', 'effect': ItemEffect.HEAL, 'value': 1,
+                                 'target': 'everyone'}})
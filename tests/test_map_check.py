@@ -0,0 +1,115 @@
+"""
+Test per il validatore/convertitore batch delle mappe
+"""
+
+import json
+from pathlib import Path
+from tools.map_check import check_map, check_maps, main
+
+
+def _write(path: Path, data) -> str:
+    path.write_text(json.dumps(data) if not isinstance(data, str) else data)
+    return str(path)
+
+
+def _codes(report, kind="errors"):
+    return [issue["code"] for issue in report[kind]]
+
+
+class TestMapCheck:
+    """Test suite per tools.map_check"""
+
+    def test_valid_map(self, tmp_path):
+        """Test mappa valida con statistiche"""
+        path = _write(tmp_path / "ok.json", {"name": "Ok", "grid": [[3, 0, 4]]})
+        report = check_map(path)
+
+        assert report["valid"] is True
+        assert report["stats"]["reachable_cells"] == 3
+
+    def test_invalid_json(self, tmp_path):
+        """Test file JSON non valido"""
+        report = check_map(_write(tmp_path / "bad.json", "{grid: ["))
+
+        assert _codes(report) == ["invalid_json"]
+
+    def test_not_rectangular(self, tmp_path):
+        """Test righe di lunghezza diversa"""
+        report = check_map(_write(tmp_path / "r.json", {"grid": [[3, 0], [4]]}))
+
+        assert "not_rectangular" in _codes(report)
+
+    def test_invalid_cell_value(self, tmp_path):
+        """Test valori di cella fuori da CellType"""
+        report = check_map(_write(tmp_path / "c.json", {"grid": [[3, 9, 4]]}))
+
+        assert "cell_value" in _codes(report)
+
+    def test_size_mismatch(self, tmp_path):
+        """Test width/height incoerenti con la griglia"""
+        report = check_map(_write(tmp_path / "s.json", {"width": 5, "height": 1, "grid": [[3, 4]]}))
+
+        assert "size_mismatch" in _codes(report)
+
+    def test_missing_start_and_exit(self, tmp_path):
+        """Test START ed EXIT mancanti"""
+        report = check_map(_write(tmp_path / "m.json", {"grid": [[0, 0]]}))
+
+        assert set(_codes(report)) == {"no_start", "no_exit"}
+
+    def test_unreachable_exit(self, tmp_path):
+        """Test EXIT murata"""
+        report = check_map(_write(tmp_path / "u.json", {"grid": [[3, 1, 4], [0, 1, 2]]}))
+
+        assert "exit_unreachable" in _codes(report)
+        assert "content_unreachable" in _codes(report, "warnings")
+
+    def test_teleport_makes_exit_reachable(self, tmp_path):
+        """Test i teletrasporti contano per la raggiungibilità"""
+        data = {
+            "grid": [[3, 0, 1, 4]],
+            "triggers": [{"x": 1, "y": 0, "type": "teleport", "target": [3, 0]}]
+        }
+        report = check_map(_write(tmp_path / "t.json", data))
+
+        assert report["valid"] is True
+
+    def test_unknown_trigger(self, tmp_path):
+        """Test trigger di tipo sconosciuto"""
+        data = {"grid": [[3, 0, 4]], "triggers": [{"x": 1, "y": 0, "type": "lava"}]}
+        report = check_map(_write(tmp_path / "x.json", data))
+
+        assert "trigger" in _codes(report)
+
+    def test_convert_compact(self, tmp_path):
+        """Test conversione in JSON compatto"""
+        path = _write(tmp_path / "ok.json", {"name": "Ok", "grid": [[3, 0, 4]]})
+        out_dir = tmp_path / "out"
+        report = check_map(path, "json-compact", str(out_dir))
+
+        converted = Path(report["converted"])
+        assert converted.parent == out_dir
+        assert json.loads(converted.read_text())["grid"] == [[3, 0, 4]]
+
+    def test_batch_with_pool(self, tmp_path):
+        """Test batch parallelo con riepilogo"""
+        _write(tmp_path / "a.json", {"grid": [[3, 0, 4]]})
+        _write(tmp_path / "b.json", {"grid": [[3, 1, 4]]})
+        report = check_maps(sorted(tmp_path.glob("*.json")), workers=2)
+
+        assert report["summary"]["total"] == 2
+        assert report["summary"]["valid"] == 1
+
+    def test_cli_exit_code(self, tmp_path, capsys):
+        """Test il codice di uscita segnala mappe non valide"""
+        _write(tmp_path / "b.json", {"grid": [[3, 1, 4]]})
+
+        assert main([str(tmp_path), "--workers", "0"]) == 1
+
+    def test_repo_maps_are_valid(self, project_root_dir):
+        """Test tutte le mappe del gioco sono valide"""
+        maps = sorted((project_root_dir.parent / "data" / "maps").glob("*.json"))
+        report = check_maps(maps, workers=0)
+
+        assert report["summary"]["total"] == len(maps) > 0
+        assert report["summary"]["invalid"] == 0
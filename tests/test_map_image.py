@@ -0,0 +1,91 @@
+"""
+Test per l'import/export delle mappe come immagini
+"""
+
+import json
+import pytest
+from models.world import World, CellType
+from tools.map_image import (
+    rgb_to_cells, cells_to_rgb, read_ppm, image_to_world,
+    world_to_image, load_palette, DEFAULT_PALETTE
+)
+
+
+class TestMapImage:
+    """Test suite per tools.map_image"""
+
+    @pytest.fixture
+    def sample_world(self):
+        """Mondo con tutti i tipi di cella"""
+        grid = [
+            [3, 0, 1],
+            [2, 5, 4]
+        ]
+        return World(grid=grid, name="Immagine")
+
+    def test_exact_palette_colors(self):
+        """Test i colori della palette vengono classificati esattamente"""
+        rgb = b''.join(bytes(color) for color in DEFAULT_PALETTE.values())
+        cells = rgb_to_cells(rgb)
+
+        assert list(cells) == [cell.value for cell in DEFAULT_PALETTE]
+
+    def test_nearest_color_matching(self):
+        """Test colori non esatti vengono assegnati al più vicino"""
+        cells = rgb_to_cells(bytes([10, 10, 10, 240, 20, 20, 250, 250, 240]))
+
+        assert list(cells) == [
+            CellType.WALL.value, CellType.DANGER.value, CellType.EMPTY.value
+        ]
+
+    def test_cells_to_rgb(self):
+        """Test conversione celle -> RGB"""
+        rgb = cells_to_rgb(bytes([CellType.WALL.value, CellType.EXIT.value]))
+
+        assert rgb == bytes(DEFAULT_PALETTE[CellType.WALL]) + bytes(DEFAULT_PALETTE[CellType.EXIT])
+
+    def test_ppm_roundtrip(self, sample_world, tmp_path):
+        """Test export e re-import tramite PPM"""
+        path = tmp_path / "map.ppm"
+        world_to_image(sample_world, str(path))
+        world = image_to_world(str(path), name="Immagine")
+
+        assert world.grid == sample_world.grid
+        assert world.width == 3
+        assert world.height == 2
+
+    def test_png_export_signature(self, sample_world, tmp_path):
+        """Test export PNG senza pygame"""
+        path = tmp_path / "map.png"
+        world_to_image(sample_world, str(path))
+
+        assert path.read_bytes()[:8] == b'\x89PNG\r\n\x1a\n'
+
+    def test_read_ascii_ppm(self, tmp_path):
+        """Test lettura PPM testuale con commenti"""
+        path = tmp_path / "ascii.ppm"
+        path.write_text("P3\n# commento\n2 1\n255\n0 0 0  255 255 255\n")
+
+        width, height, rgb = read_ppm(str(path))
+
+        assert (width, height) == (2, 1)
+        assert rgb == bytes([0, 0, 0, 255, 255, 255])
+
+    def test_custom_palette(self, tmp_path):
+        """Test caricamento palette personalizzata"""
+        path = tmp_path / "palette.json"
+        path.write_text(json.dumps({"wall": [10, 20, 30], "EMPTY": [200, 200, 200]}))
+
+        palette = load_palette(str(path))
+        cells = rgb_to_cells(bytes([12, 22, 28]), palette)
+
+        assert palette[CellType.WALL] == (10, 20, 30)
+        assert cells[0] == CellType.WALL.value
+
+    def test_invalid_palette_name(self, tmp_path):
+        """Test palette con tipo di cella sconosciuto"""
+        path = tmp_path / "palette.json"
+        path.write_text(json.dumps({"LAVA": [255, 100, 0]}))
+
+        with pytest.raises(ValueError):
+            load_palette(str(path))
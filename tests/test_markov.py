@@ -0,0 +1,113 @@
+"""
+Test per la valutazione esatta dei duelli (catena di Markov)
+"""
+
+import json
+import pytest
+from combat.markov import (HeroProfile, FoeProfile, solve, evaluate, balance_matrix,
+                           hero_profile, foe_profile)
+from models.character import Character
+from combat.enemy import Enemy
+from combat.simulator import simulate
+from tools.balance_matrix import main as balance_main
+
+
+class TestExactDuels:
+    """Test suite per i casi calcolabili a mano"""
+
+    def test_one_or_two_hits(self):
+        """Test un nemico da 11 HP muore al primo colpo con probabilità 15/16"""
+        hero = HeroProfile(max_hp=100, hp=100, casts=0, atk_bonus=0, mag_bonus=0)
+        foe = FoeProfile(max_hp=11, min_damage=1, max_damage=1, regen=0)
+        solution = solve(hero, foe, "attack")
+
+        assert solution.win_probability() == pytest.approx(1.0)
+        assert solution.expected_rounds() == pytest.approx(1 + 1 / 16)
+
+    def test_hopeless(self):
+        """Test un personaggio che muore al primo colpo non vince mai"""
+        hero = HeroProfile(max_hp=10, hp=10, casts=0, atk_bonus=0, mag_bonus=0)
+        foe = FoeProfile(max_hp=100, min_damage=10, max_damage=10, regen=3)
+        solution = solve(hero, foe, "attack")
+
+        assert solution.win_probability() == 0.0
+        assert solution.expected_rounds() == pytest.approx(1.0)
+
+    def test_state_lookup(self):
+        """Test lookup da uno stato intermedio e stati terminali"""
+        solution = solve(hero_profile("guerriero"), foe_profile("orc", 2))
+        assert solution.win_probability(enemy_hp=0) == 1.0
+        assert solution.win_probability(hp=0) == 0.0
+        assert solution.expected_rounds(enemy_hp=0) == 0.0
+        # Un nemico quasi morto è più facile di uno intatto
+        assert solution.win_probability(hp=20, enemy_hp=5) > solution.win_probability(hp=20)
+
+
+class TestAgainstSimulator:
+    """Test suite: i valori esatti coincidono con le stime Monte Carlo"""
+
+    def test_without_regeneration(self):
+        """Test ladro contro orco"""
+        exact = evaluate("ladro", "orc", 2)
+        sim = simulate(["ladro"], "orc", 2, battles=20000, seed=11)
+
+        assert exact.win_probability == pytest.approx(sim.win_rate, abs=0.005)
+        assert exact.expected_rounds == pytest.approx(sim.mean_rounds, abs=0.05)
+
+    def test_with_regeneration(self):
+        """Test mago contro troll (rigenerazione: iterazione dei valori)"""
+        exact = evaluate("mago", "troll", 3)
+        sim = simulate(["mago"], "troll", 3, battles=20000, seed=11)
+
+        assert exact.sweeps > 1
+        assert exact.win_probability == pytest.approx(sim.win_rate, abs=0.005)
+        assert exact.expected_rounds == pytest.approx(sim.mean_rounds, abs=0.1)
+
+
+class TestBalanceMatrix:
+    """Test suite per balance_matrix e il comando"""
+
+    def test_keys_and_cache(self):
+        """Test chiavi della matrice e soluzioni condivise in cache"""
+        matrix = balance_matrix(["guerriero", "mago"], ["goblin"], levels=(1, 2))
+        assert set(matrix) == {(cls, "goblin", level)
+                               for cls in ("guerriero", "mago") for level in (1, 2)}
+        assert all(0.0 <= r.win_probability <= 1.0 for r in matrix.values())
+
+        hits = solve.cache_info().hits
+        evaluate("guerriero", "goblin", 1)
+        assert solve.cache_info().hits == hits + 1
+
+    def test_cells_are_lazy(self):
+        """Test la matrice completa non risolve nulla finché non si leggono le celle"""
+        matrix = balance_matrix()
+        assert len(matrix) == len(Character.CLASSES) * len(Enemy.get_enemy_types()) * 5
+        assert matrix.solved == 0
+
+        result = matrix[("ladro", "goblin", 1)]
+        assert matrix.solved == 1
+        assert matrix[("ladro", "goblin", 1)] is result
+        with pytest.raises(KeyError):
+            matrix[("ladro", "goblin", 9)]
+        with pytest.raises(ValueError):
+            balance_matrix(policy="nessuna")
+
+    def test_solve_all_with_workers(self):
+        """Test solve_all in più processi dà gli stessi esiti del calcolo diretto"""
+        matrix = balance_matrix(["mago"], ["goblin", "orc"], levels=(1,)).solve_all(workers=2)
+        assert matrix.solved == 2
+        for (cls, enemy, level), result in matrix.items():
+            expected = evaluate(cls, enemy, level)
+            assert result.win_probability == pytest.approx(expected.win_probability)
+            assert result.expected_rounds == pytest.approx(expected.expected_rounds)
+
+    def test_cli_json(self, tmp_path, capsys):
+        """Test il comando stampa la tabella e salva il JSON"""
+        path = tmp_path / "matrix.json"
+        assert balance_main(["--classes", "guerriero", "--enemies", "goblin",
+                             "--levels", "1,2", "--workers", "0", "--json", str(path)]) == 0
+
+        assert "guerriero vs goblin" in capsys.readouterr().out
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert set(data) == {"guerriero/goblin/1", "guerriero/goblin/2"}
+        assert data["guerriero/goblin/1"]["win_probability"] == pytest.approx(1.0)
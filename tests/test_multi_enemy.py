@@ -0,0 +1,139 @@
+"""
+Test per gli incontri con più nemici e i contatori dei vivi
+"""
+
+import pytest
+from models.character import Character
+from models.party import Party
+from combat.enemy import Enemy
+from combat.battle import Battle
+from combat.turn_manager import TurnManager
+from utils.rng import GameRNG
+
+
+@pytest.fixture
+def party():
+    """Party guerriero + mago"""
+    return Party([Character("Warrior", "guerriero"), Character("Mage", "mago")])
+
+
+@pytest.fixture
+def enemies():
+    """Due goblin e un orco"""
+    return [Enemy("goblin"), Enemy("goblin"), Enemy("orc")]
+
+
+class TestAliveCounters:
+    """Test suite per i contatori O(1) del TurnManager"""
+
+    def test_initial_counts(self, party, enemies):
+        """Test conteggi iniziali e ordine dei turni"""
+        tm = TurnManager(party.characters, enemies)
+
+        assert tm.players_alive == 2
+        assert tm.enemies_alive == 3
+        assert len(tm.turn_order) == 5
+        assert tm.enemy is enemies[0]
+
+    def test_death_notifications(self, party, enemies):
+        """Test take_damage aggiorna i contatori"""
+        tm = TurnManager(party.characters, enemies)
+        enemies[0].take_damage(999)
+        party.characters[1].take_damage(999)
+
+        assert tm.enemies_alive == 2
+        assert tm.players_alive == 1
+        assert tm.is_battle_active() is True
+
+    def test_direct_assignment_and_revive(self, party, enemies):
+        """Test anche l'assegnazione diretta di is_alive notifica"""
+        tm = TurnManager(party.characters, enemies)
+        for char in party.characters:
+            char.is_alive = False
+
+        assert tm.is_battle_active() is False
+        party.characters[0].is_alive = True
+        assert tm.players_alive == 1
+
+    def test_repeated_assignment_counts_once(self, party, enemies):
+        """Test assegnare lo stesso stato due volte non altera i contatori"""
+        tm = TurnManager(party.characters, enemies)
+        enemies[2].is_alive = False
+        enemies[2].is_alive = False
+
+        assert tm.enemies_alive == 2
+
+    def test_release_stops_updates(self, party, enemies):
+        """Test dopo release il TurnManager non è più notificato"""
+        tm = TurnManager(party.characters, enemies)
+        tm.release()
+        enemies[0].take_damage(999)
+
+        assert tm.enemies_alive == 3
+        assert enemies[0].alive_listeners == []
+
+    def test_skip_dead_enemies(self, party, enemies):
+        """Test i nemici KO vengono saltati"""
+        tm = TurnManager(party.characters, enemies)
+        enemies[0].take_damage(999)
+        tm.current_turn_index = 2
+
+        assert tm.get_current_combatant().entity is enemies[1]
+
+
+class TestMultiEnemyBattle:
+    """Test suite per Battle con più nemici"""
+
+    def test_attack_chosen_target(self, party, enemies):
+        """Test l'attacco colpisce il nemico scelto"""
+        battle = Battle(party, enemies, rng=GameRNG(1))
+        action = battle.execute_player_turn(party.characters[0], "attack", enemies[2])
+
+        assert action.target == enemies[2].name
+        assert enemies[2].hp < enemies[2].max_hp
+        assert enemies[0].hp == enemies[0].max_hp
+
+    def test_dead_target_falls_back(self, party, enemies):
+        """Test un bersaglio KO viene sostituito dal primo nemico vivo"""
+        battle = Battle(party, enemies, rng=GameRNG(1))
+        enemies[0].take_damage(999)
+
+        assert battle.resolve_enemy_target(enemies[0]) is enemies[1]
+        assert battle.resolve_enemy_target(party.characters[0]) is enemies[1]
+
+    def test_enemy_turn_uses_current_enemy(self, party, enemies):
+        """Test il turno nemico usa il nemico di turno"""
+        battle = Battle(party, enemies, rng=GameRNG(1))
+        battle.turn_manager.current_turn_index = 4
+
+        assert battle.execute_enemy_turn().actor == enemies[2].name
+
+    def test_victory_requires_all_enemies(self, party, enemies):
+        """Test la vittoria arriva solo quando tutti i nemici sono KO"""
+        battle = Battle(party, enemies, rng=GameRNG(1))
+        enemies[0].take_damage(999)
+        enemies[1].take_damage(999)
+        assert battle.check_battle_end() is None
+
+        enemies[2].take_damage(999)
+        result = battle.check_battle_end()
+        assert result.victory is True
+        assert result.enemy_defeated is True
+
+    def test_state_lists_enemies(self, party, enemies):
+        """Test lo stato della battaglia elenca tutti i nemici"""
+        state = Battle(party, enemies).get_current_state()
+
+        assert len(state['enemies']) == 3
+
+
+class TestCreateGroup:
+    """Test suite per Enemy.create_group"""
+
+    def test_duplicate_names_get_suffix(self):
+        """Test i nemici con lo stesso nome sono distinguibili"""
+        group = Enemy.create_group(6, rng=GameRNG(3))
+        names = [e.name for e in group]
+
+        assert len(group) == 6
+        assert len(set(names)) == 6
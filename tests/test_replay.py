@@ -0,0 +1,178 @@
+"""
+Test per la registrazione e la riproduzione binaria delle battaglie
+"""
+
+import pytest
+from models.character import Character
+from models.party import Party
+from combat.enemy import Enemy
+from combat.battle import Battle
+from combat.enemy_ai import RandomAI, SearchAI
+from combat.replay import (BattleReplay, ReplayRecorder, ReplayMismatchError,
+                           state_hash, RECORD)
+from tools.replay_check import check_replays, main
+from utils.rng import GameRNG
+
+
+def _recorded_battle(seed: int = 5, initiative: bool = False):
+    """Gioca una battaglia completa registrandola"""
+    party = Party([Character("Warrior", "guerriero"), Character("Mage", "mago")])
+    party.inventory.add_item("health_potion", 2)
+    party.inventory.add_item("bomb", 1)
+    enemies = [Enemy("orc", 2), Enemy("goblin", 2)]
+    battle = Battle(party, enemies, rng=GameRNG(99), initiative=initiative)
+    recorder = ReplayRecorder(battle, seed)
+
+    tm = battle.turn_manager
+    turn = 0
+    while tm.is_battle_active():
+        current = tm.get_current_combatant()
+        if current.is_player:
+            char = current.entity
+            if turn == 1:
+                battle.execute_player_turn(char, "use_item", enemies[1], "bomb")
+            elif char.hp < 50 and party.inventory.has_item("health_potion"):
+                battle.execute_player_turn(char, "use_item", char, "health_potion")
+            elif char.mp >= 10 and char.character_class == "mago":
+                battle.execute_player_turn(char, "magic", enemies[-1])
+            else:
+                battle.execute_player_turn(char, "attack", enemies[0])
+        else:
+            battle.execute_enemy_turn()
+        turn += 1
+        if battle.check_battle_end():
+            break
+        tm.next_turn()
+    return battle, recorder.detach()
+
+
+class TestReplay:
+    """Test suite per BattleReplay e ReplayRecorder"""
+
+    def test_record_and_play(self):
+        """Test la riproduzione raggiunge lo stesso stato finale"""
+        battle, replay = _recorded_battle()
+        played = replay.play()
+
+        assert len(replay.records) > 0
+        assert [e.hp for e in played.enemies] == [e.hp for e in battle.enemies]
+        assert [c.is_alive for c in played.party.characters] == \
+            [c.is_alive for c in battle.party.characters]
+        assert state_hash(played) == replay.records[-1][4]
+
+    def test_timed_buff_expires_in_replay(self):
+        """Test i round avanzano anche nella riproduzione: il tonico scade allo stesso turno"""
+        party = Party([Character("Warrior", "guerriero")])
+        party.inventory.add_item("strength_tonic")
+        battle = Battle(party, [Enemy("troll", 3)], rng=GameRNG(7))
+        recorder = ReplayRecorder(battle, 7)
+        warrior = party.characters[0]
+
+        tm = battle.turn_manager
+        battle.execute_player_turn(warrior, "use_item", warrior, "strength_tonic")
+        while tm.is_battle_active() and tm.round_number <= 6:
+            tm.next_turn()
+            current = tm.get_current_combatant()
+            if current.is_player:
+                battle.execute_player_turn(warrior, "attack", battle.enemies[0])
+            else:
+                battle.execute_enemy_turn()
+        replay = recorder.detach()
+        assert battle.effects.modifier(warrior, "atk") == 0
+
+        played = replay.play()
+        assert played.turn_manager.round_number == tm.round_number
+        assert state_hash(played) == state_hash(battle)
+
+    def test_binary_roundtrip(self, tmp_path):
+        """Test salvataggio e caricamento del formato binario"""
+        _, replay = _recorded_battle(initiative=True)
+        path = tmp_path / "battle.rpl"
+        replay.save(str(path))
+        loaded = BattleReplay.load(str(path))
+
+        assert loaded.to_bytes() == replay.to_bytes()
+        assert loaded.initiative is True
+        assert loaded.items == replay.items
+        loaded.play()
+
+    def test_mixed_enemy_ais_round_trip(self):
+        """Test IA diverse per nemico (o un'istanza per tutti) si riproducono dal file"""
+        for enemy_ai in (None, RandomAI()):
+            party = Party([Character("Warrior", "guerriero"), Character("Mage", "mago")])
+            enemies = [Enemy("troll", 2), Enemy("goblin")]
+            battle = Battle(party, enemies, rng=GameRNG(4), enemy_ai=enemy_ai)
+            assert isinstance(battle.get_enemy_ai(enemies[0]), RandomAI if enemy_ai else SearchAI)
+            recorder = ReplayRecorder(battle, 21)
+
+            tm = battle.turn_manager
+            while tm.is_battle_active():
+                current = tm.get_current_combatant()
+                if current.is_player:
+                    battle.execute_player_turn(current.entity, "attack", enemies[0])
+                else:
+                    battle.execute_enemy_turn()
+                if tm.is_battle_active():
+                    tm.next_turn()
+            replay = BattleReplay.from_bytes(recorder.detach().to_bytes())
+
+            assert [e[-1] for e in replay.enemies] == [enemy_ai is not None, True]
+            played = replay.play()
+            assert state_hash(played) == state_hash(battle)
+
+    def test_records_are_compact(self):
+        """Test ogni turno occupa un record a dimensione fissa"""
+        _, replay = _recorded_battle()
+        data = replay.to_bytes()
+
+        assert RECORD.size == 8
+        assert data.endswith(b"".join(RECORD.pack(*r) for r in replay.records))
+
+    def test_tampered_replay_detected(self):
+        """Test uno stato divergente viene segnalato con il turno"""
+        _, replay = _recorded_battle()
+        actor, action, target, item, expected = replay.records[2]
+        replay.records[2] = (actor, action, target, item, expected ^ 1)
+
+        with pytest.raises(ReplayMismatchError) as info:
+            replay.play()
+        assert info.value.turn == 3
+
+    def test_invalid_data(self):
+        """Test dati non validi o troncati"""
+        with pytest.raises(ValueError):
+            BattleReplay.from_bytes(b"XXXX" + bytes(20))
+        data = _recorded_battle()[1].to_bytes()
+        with pytest.raises(ValueError):
+            BattleReplay.from_bytes(data[:-3])
+
+    def test_seed_changes_outcome(self):
+        """Test semi diversi producono battaglie diverse"""
+        a = _recorded_battle(seed=1)[1]
+        b = _recorded_battle(seed=2)[1]
+
+        assert a.records != b.records
+
+    def test_state_hash_tracks_inventory(self):
+        """Test l'hash cambia quando cambia l'inventario"""
+        party = Party([Character("Hero")])
+        battle = Battle(party, Enemy("goblin"))
+        before = state_hash(battle)
+        party.inventory.add_item("elixir")
+
+        assert state_hash(battle) != before
+
+
+class TestReplayCheck:
+    """Test suite per lo strumento di verifica in batch"""
+
+    def test_check_directory(self, tmp_path):
+        """Test verifica di una cartella di replay"""
+        for seed in range(3):
+            _recorded_battle(seed)[1].save(str(tmp_path / f"b{seed}.rpl"))
+        (tmp_path / "broken.rpl").write_bytes(b"BRPL")
+
+        report = check_replays(sorted(tmp_path.glob("*.rpl")))
+        assert report["summary"]["passed"] == 3
+        assert report["summary"]["failed"] == 1
+        assert main([str(tmp_path)]) == 1
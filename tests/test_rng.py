@@ -0,0 +1,133 @@
+"""
+Unit tests per i generatori casuali iniettabili
+"""
+
+import random
+from models.character import Character
+from models.party import Party
+from combat.enemy import Enemy
+from combat.battle import Battle
+from utils.rng import GameRNG, SplitMixRNG, derive_seed, DEFAULT_RNG
+
+
+class FixedRNG(random.Random):
+    """RNG di test: randint ritorna sempre il minimo"""
+
+    def randint(self, a, b):
+        return a
+
+
+def _play(seed: int):
+    """Gioca una battaglia completa e ritorna il log dei valori"""
+    party = Party([Character("A", "guerriero"), Character("B", "mago")])
+    battle = Battle(party, Enemy("troll", 2), rng=GameRNG(seed))
+    tm = battle.turn_manager
+    while tm.is_battle_active():
+        current = tm.get_current_combatant()
+        if current.is_player:
+            battle.execute_player_turn(current.entity, "attack")
+        else:
+            battle.execute_enemy_turn()
+        tm.next_turn()
+    return [(a.actor, a.target, a.value) for a in battle.battle_log]
+
+
+class TestGameRNG:
+    """Test suite per GameRNG"""
+
+    def test_rolls_in_range(self):
+        """Test i tiri a blocchi restano nell'intervallo"""
+        rolls = GameRNG(1).rolls(10, 25, 5000)
+
+        assert len(rolls) == 5000
+        assert min(rolls) == 10
+        assert max(rolls) == 25
+
+    def test_spawn_is_reproducible(self):
+        """Test i flussi figli dipendono solo da seme e chiavi"""
+        a = GameRNG(42).spawn(3, 1)
+        b = GameRNG(42).spawn(3, 1)
+        c = GameRNG(42).spawn(3, 2)
+
+        assert a.rolls(0, 1000, 10) == b.rolls(0, 1000, 10)
+        assert a.random() != c.random()
+
+    def test_derive_seed(self):
+        """Test derivazione dei semi"""
+        assert derive_seed(7, 1, 2) == derive_seed(7, 1, 2)
+        assert derive_seed(7, 1, 2) != derive_seed(7, 2, 1)
+
+
+class TestSplitMixRNG:
+    """Test suite per SplitMixRNG"""
+
+    def test_state_is_one_int(self):
+        """Test lo stato è un intero e ripristina la sequenza"""
+        rng = SplitMixRNG(5)
+        state = rng.getstate()
+        values = [rng.randint(1, 100) for _ in range(20)]
+        rng.setstate(state)
+
+        assert isinstance(state, int)
+        assert [rng.randint(1, 100) for _ in range(20)] == values
+
+    def test_random_api(self):
+        """Test random, randint, choice e getrandbits restano nei limiti"""
+        rng = SplitMixRNG(9)
+        rolls = [rng.randint(10, 25) for _ in range(3000)]
+
+        assert min(rolls) == 10 and max(rolls) == 25
+        assert 0.0 <= rng.random() < 1.0
+        assert rng.choice("abc") in "abc"
+        assert rng.getrandbits(130) < 2 ** 130
+
+    def test_seeded_and_spawn(self):
+        """Test riproducibilità e flussi figli dello stesso tipo"""
+        assert SplitMixRNG(1).random() == SplitMixRNG(1).random()
+        assert SplitMixRNG(1).random() != SplitMixRNG(2).random()
+        assert isinstance(SplitMixRNG(1).spawn(2), SplitMixRNG)
+
+
+class TestInjectedRNG:
+    """Test suite per l'RNG iniettato in Character, Enemy e Battle"""
+
+    def test_character_uses_injected_rng(self):
+        """Test i danni usano l'RNG del personaggio"""
+        char = Character("Hero", "guerriero", rng=FixedRNG())
+
+        assert char.calculate_physical_damage() == 10 + char.atk_bonus
+        assert char.calculate_magic_damage() == 15 + char.mag_bonus
+
+    def test_default_rng_shared(self):
+        """Test senza RNG si usa quello condiviso"""
+        assert Character("Hero").rng is DEFAULT_RNG
+        assert Enemy("orc").rng is DEFAULT_RNG
+
+    def test_enemy_attack_uses_injected_rng(self):
+        """Test l'attacco del nemico usa il suo RNG"""
+        enemy = Enemy("orc", rng=FixedRNG())
+
+        assert enemy.attack() == enemy.min_damage
+
+    def test_create_random_reproducible(self):
+        """Test create_random con lo stesso seme"""
+        a = Enemy.create_random(1, 5, rng=GameRNG(9))
+        b = Enemy.create_random(1, 5, rng=GameRNG(9))
+
+        assert (a.enemy_type, a.level) == (b.enemy_type, b.level)
+
+    def test_battle_binds_rng(self):
+        """Test la battaglia propaga il suo RNG ai combattenti"""
+        rng = GameRNG(1)
+        party = Party([Character("A", "guerriero")])
+        enemy = Enemy("goblin")
+        battle = Battle(party, enemy, rng=rng)
+
+        assert battle.rng is rng
+        assert party.characters[0].rng is rng
+        assert enemy.rng is rng
+
+    def test_battle_reproducible(self):
+        """Test stessa battaglia con lo stesso seme"""
+        assert _play(123) == _play(123)
+        assert _play(123) != _play(124)
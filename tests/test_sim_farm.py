@@ -0,0 +1,102 @@
+"""
+Test per la sim farm e le policy del party
+"""
+
+import pytest
+from models.character import Character
+from models.party import Party
+from combat.enemy import Enemy
+from combat.battle import Battle
+from combat.policies import balanced_policy, magic_policy, get_policy
+from combat.simulator import simulate
+from tools.sim_farm import Scenario, fight, run_farm, build_scenarios, chunk_seed, main
+
+
+class TestPartyPolicies:
+    """Test suite per combat.policies"""
+
+    @pytest.fixture
+    def battle(self):
+        """Battaglia guerriero + mago contro un goblin"""
+        party = Party([Character("Warrior", "guerriero"), Character("Mage", "mago")])
+        return Battle(party, Enemy("goblin"))
+
+    def test_balanced_heals_wounded_ally(self, battle):
+        """Test la policy bilanciata cura l'alleato più ferito"""
+        warrior, mage = battle.party.characters
+        warrior.hp = 20
+
+        assert balanced_policy(battle, mage) == ("heal", warrior)
+
+    def test_balanced_prefers_class_attack(self, battle):
+        """Test il mago usa la magia, il guerriero attacca"""
+        warrior, mage = battle.party.characters
+
+        assert balanced_policy(battle, mage) == ("magic", None)
+        assert balanced_policy(battle, warrior) == ("attack", None)
+
+    def test_magic_falls_back_to_attack(self, battle):
+        """Test senza MP si attacca"""
+        mage = battle.party.characters[1]
+        mage.mp = 5
+
+        assert magic_policy(battle, mage) == ("attack", None)
+
+    def test_unknown_policy(self):
+        """Test nome di policy sconosciuto"""
+        with pytest.raises(ValueError):
+            get_policy("berserk")
+
+
+class TestSimFarm:
+    """Test suite per tools.sim_farm"""
+
+    def test_fight_easy_victory(self):
+        """Test una battaglia facile con il codice reale di Battle"""
+        victory, rounds, hp_left = fight(["guerriero", "paladino"], "goblin", 1,
+                                         get_policy("attack"))
+
+        assert victory is True
+        assert rounds >= 1
+        assert 0 < hp_left <= 1
+
+    def test_chunk_seed_is_stable(self):
+        """Test i semi dipendono solo da radice, scenario e blocco"""
+        assert chunk_seed(1, 2, 3) == chunk_seed(1, 2, 3)
+        assert chunk_seed(1, 2, 3) != chunk_seed(1, 2, 4)
+
+    def test_results_independent_of_workers(self):
+        """Test stessi risultati in linea e con il pool"""
+        scenarios = build_scenarios([["ladro"]], ["orc", "troll"], [1], ["balanced"])
+
+        inline = run_farm(scenarios, battles=60, workers=0, seed=5, chunk_size=16)
+        pooled = run_farm(scenarios, battles=60, workers=2, seed=5, chunk_size=16)
+
+        assert inline["scenarios"] == pooled["scenarios"]
+        assert inline["total_battles"] == 120
+
+    def test_scenario_key(self):
+        """Test identificativo dello scenario"""
+        assert Scenario(["mago", "ladro"], "orc", 2).key == "mago+ladro vs orc Lv.2 [balanced]"
+
+    def test_default_ai_matches_simulator(self):
+        """Test con l'IA 'easy' la farm e il simulatore danno le stesse probabilità"""
+        scenarios = build_scenarios([["ladro", "ranger"]], ["dragon"], [3], ["balanced"])
+        report = run_farm(scenarios, battles=1000, workers=0, seed=2)
+        farm = report["scenarios"][scenarios[0].key]["win_rate"]
+
+        sim = simulate(["ladro", "ranger"], "dragon", 3, battles=5000, seed=2).win_rate
+        assert farm == pytest.approx(sim, abs=0.04)
+
+    def test_enemy_ai_by_type(self):
+        """Test con 'type' i nemici usano l'IA del loro tipo, come nel gioco"""
+        scenario = Scenario(["ladro", "ranger"], "dragon", 3, enemy_ai="type")
+        assert scenario.key == "ladro+ranger vs dragon Lv.3 [balanced] IA:type"
+
+        report = run_farm([scenario], battles=20, workers=0, seed=2)
+        assert report["scenarios"][scenario.key]["battles"] == 20
+
+    def test_cli_rejects_unknown_class(self):
+        """Test la CLI rifiuta classi inesistenti"""
+        with pytest.raises(SystemExit):
+            main(["--party", "cuoco", "--workers", "0"])
@@ -0,0 +1,95 @@
+"""
+Unit tests per il simulatore headless di battaglie
+"""
+
+import pytest
+from combat.simulator import (
+    BattleSimulator, SimulationStats, SimAction, simulate, MAGIC_COST
+)
+
+
+class TestBattleSimulator:
+    """Test suite per BattleSimulator"""
+
+    def test_seed_is_reproducible(self):
+        """Test stesso seme, stesse statistiche"""
+        a = simulate(['guerriero', 'mago'], 'orc', 2, battles=500, seed=7)
+        b = simulate(['guerriero', 'mago'], 'orc', 2, battles=500, seed=7)
+
+        assert a.to_dict() == b.to_dict()
+
+    def test_histograms_cover_all_battles(self):
+        """Test gli istogrammi contano tutte le battaglie"""
+        stats = simulate(['ladro'], 'troll', 1, battles=300, seed=1)
+
+        assert stats.battles == 300
+        assert sum(stats.rounds_histogram.values()) == 300
+        assert sum(stats.hp_left_histogram) == stats.victories
+
+    def test_easy_and_hopeless_fights(self):
+        """Test esiti estremi coerenti con le regole di Battle"""
+        easy = simulate(['guerriero', 'paladino'], 'goblin', 1, battles=200, seed=3)
+        hopeless = simulate(['mago'], 'dragon', 3, battles=200, policy="attack", seed=3)
+
+        assert easy.win_rate == 1.0
+        assert hopeless.win_rate == 0.0
+
+    def test_magic_policy_spends_mp(self):
+        """Test la magia consuma MP a multipli del costo senza scendere sotto zero"""
+        sim = BattleSimulator(['mago'], 'dragon', 5, policy="magic", seed=2)
+        sim.run(50)
+
+        assert all(0 <= mp <= 50 - MAGIC_COST for mp in sim.mp[0])
+        assert all(mp % MAGIC_COST == 0 for mp in sim.mp[0])
+
+    def test_only_easy_ai_is_modelled(self):
+        """Test il simulatore rifiuta le IA che non modella"""
+        assert simulate(['ladro'], 'dragon', 1, battles=10, seed=1, enemy_ai="easy").battles == 10
+        with pytest.raises(ValueError):
+            BattleSimulator(['ladro'], 'dragon', 1, enemy_ai="hard")
+
+    def test_custom_policy(self):
+        """Test policy passata come funzione"""
+        calls = []
+
+        def heal_only(sim, slot, battles):
+            calls.append(len(battles))
+            return [SimAction.HEAL] * len(battles)
+
+        stats = BattleSimulator(['paladino'], 'goblin', 1, policy=heal_only,
+                                seed=1, max_rounds=5).run(20)
+
+        assert calls
+        assert stats.victories == 0
+
+    def test_timeouts_counted(self):
+        """Test le battaglie oltre max_rounds sono sconfitte per timeout"""
+        def idle(sim, slot, battles):
+            return [-1] * len(battles)
+
+        stats = BattleSimulator(['guerriero'], 'goblin', 1, policy=idle,
+                                seed=1, max_rounds=1).run(10)
+
+        assert stats.victories == 0
+        assert stats.timeouts == 10
+
+
+class TestSimulationStats:
+    """Test suite per SimulationStats"""
+
+    def test_merge(self):
+        """Test unione di statistiche parziali"""
+        a = SimulationStats()
+        a.record(True, 3, 0.55)
+        b = SimulationStats()
+        b.record(False, 3, 0.0)
+        b.record(True, 4, 1.0)
+
+        merged = a.merge(b)
+
+        assert merged.battles == 3
+        assert merged.victories == 2
+        assert merged.rounds_histogram == {3: 2, 4: 1}
+        assert merged.hp_left_histogram[5] == 1
+        assert merged.hp_left_histogram[10] == 1
+        assert merged.win_rate == pytest.approx(2 / 3)
@@ -0,0 +1,132 @@
+"""
+Test per snapshot e restore della battaglia
+"""
+
+import time
+import pytest
+from models.character import Character
+from models.party import Party
+from combat.enemy import Enemy
+from combat.battle import Battle
+from utils.rng import SplitMixRNG, GameRNG
+
+
+def _battle(rng=None, initiative: bool = False) -> Battle:
+    """Battaglia con inventario e due nemici"""
+    party = Party([Character("Warrior", "guerriero"), Character("Mage", "mago")])
+    party.inventory.add_item("bomb", 1)
+    party.inventory.add_item("health_potion", 2)
+    enemies = [Enemy("orc", 2), Enemy("goblin")]
+    return Battle(party, enemies, rng=rng or SplitMixRNG(7), initiative=initiative)
+
+
+def _play(battle: Battle, turns: int) -> list:
+    """Gioca alcuni turni e ritorna (attore, bersaglio, valore) di ciascuno"""
+    tm = battle.turn_manager
+    log = []
+    for _ in range(turns):
+        current = tm.get_current_combatant()
+        if current is None:
+            break
+        if current.is_player:
+            action = battle.execute_player_turn(current.entity, "magic")
+        else:
+            action = battle.execute_enemy_turn()
+        log.append((action.actor, action.target, action.value))
+        tm.next_turn()
+    return log
+
+
+def _state(battle: Battle) -> tuple:
+    """Stato osservabile della battaglia"""
+    tm = battle.turn_manager
+    return (
+        [(c.hp, c.mp, c.is_alive) for c in battle.party.characters],
+        [(e.hp, e.is_alive) for e in battle.enemies],
+        battle.party.inventory.to_dict()['items'],
+        tm.current_turn_index, tm.round_number, tm.players_alive, tm.enemies_alive,
+    )
+
+
+class TestSnapshot:
+    """Test suite per Battle.snapshot/restore"""
+
+    @pytest.mark.parametrize("initiative", [False, True])
+    def test_restore_replays_identically(self, initiative):
+        """Test dopo restore i turni successivi si ripetono uguali"""
+        battle = _battle(initiative=initiative)
+        _play(battle, 3)
+        snap = battle.snapshot()
+        before = _state(battle)
+
+        first = _play(battle, 6)
+        battle.restore(snap)
+        assert _state(battle) == before
+        assert _play(battle, 6) == first
+
+    def test_snapshot_is_flat_tuple(self):
+        """Test lo snapshot è una tupla immutabile"""
+        snap = _battle().snapshot()
+
+        assert isinstance(snap, tuple)
+        assert len(snap) == Battle.SNAPSHOT_HEADER + 2 * 3 + 2 * 2
+
+    def test_restore_revives_and_counts(self):
+        """Test restore riporta in vita i nemici e i contatori"""
+        battle = _battle()
+        snap = battle.snapshot()
+        for foe in battle.enemies:
+            foe.take_damage(999)
+        assert not battle.turn_manager.is_battle_active()
+
+        battle.restore(snap)
+        assert battle.turn_manager.enemies_alive == 2
+        assert all(foe.is_alive for foe in battle.enemies)
+        assert battle.turn_manager.is_battle_active()
+
+    def test_restore_after_victory(self):
+        """Test snapshot, vittoria, restore e di nuovo vittoria: i contatori seguono le morti"""
+        from combat.auto_battle import auto_battle
+
+        battle = _battle()
+        snap = battle.snapshot()
+        first = auto_battle(battle)[0]
+        assert first.victory
+
+        battle.restore(snap)
+        assert battle.turn_manager.enemies_alive == 2
+        second = auto_battle(battle)[0]
+        assert second.victory
+        assert second.rounds == first.rounds
+        assert battle.turn_manager.enemies_alive == 0
+
+    def test_restore_used_up_items(self):
+        """Test un oggetto esaurito torna nell'inventario"""
+        battle = _battle()
+        snap = battle.snapshot()
+        battle.execute_player_turn(battle.party.characters[0], "use_item", battle.enemies[0], "bomb")
+        assert not battle.party.inventory.has_item("bomb")
+
+        battle.restore(snap)
+        assert battle.party.inventory.get_item_count("bomb") == 1
+        assert battle.party.inventory.get_item("bomb").name == "Bomba"
+
+    def test_works_with_mersenne_twister(self):
+        """Test anche con GameRNG (stato più grande) il restore è esatto"""
+        battle = _battle(rng=GameRNG(3))
+        snap = battle.snapshot()
+        first = _play(battle, 5)
+        battle.restore(snap)
+
+        assert _play(battle, 5) == first
+
+    def test_fast(self):
+        """Test migliaia di cicli snapshot/restore al secondo"""
+        battle = _battle(initiative=True)
+        cycles = 2000
+        start = time.perf_counter()
+        for _ in range(cycles):
+            battle.restore(battle.snapshot())
+        per_cycle = (time.perf_counter() - start) / cycles
+
+        assert per_cycle < 40e-6
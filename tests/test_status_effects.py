@@ -0,0 +1,155 @@
+"""
+Test per gli effetti di stato a tempo
+"""
+
+import pytest
+from models.character import Character
+from models.party import Party
+from combat.enemy import Enemy
+from combat.battle import Battle
+from combat.status_effects import StatusEffects, EffectKind, ITEM_BUFF_ROUNDS
+from utils.rng import SplitMixRNG
+
+
+class TestStatusEffects:
+    """Test suite per StatusEffects"""
+
+    def test_modifier_totals(self):
+        """Test i modificatori si sommano per statistica"""
+        effects = StatusEffects()
+        hero = Character("Hero")
+        effects.add(hero, "Forza", EffectKind.MODIFIER, 5, "atk", rounds=3)
+        effects.add(hero, "Debolezza", EffectKind.MODIFIER, -2, "atk", rounds=1)
+        effects.add(hero, "Scudo", EffectKind.MODIFIER, 4, "def")
+
+        assert effects.modifier(hero, "atk") == 3
+        assert effects.modifier(hero, "def") == 4
+        assert effects.modifier(hero, "mag") == 0
+        assert effects.modifier(Character("Other"), "atk") == 0
+
+    def test_expiry_order(self):
+        """Test gli effetti scadono al loro round, i permanenti restano"""
+        effects = StatusEffects()
+        hero = Character("Hero")
+        short = effects.add(hero, "Breve", EffectKind.MODIFIER, 1, "atk", rounds=1, now=1)
+        long = effects.add(hero, "Lungo", EffectKind.MODIFIER, 10, "atk", rounds=3, now=1)
+        effects.add(hero, "Veleno", EffectKind.DOT, 2)
+
+        assert effects.advance(1) == []
+        assert effects.advance(2) == [short]
+        assert effects.modifier(hero, "atk") == 10
+        assert effects.advance(4) == [long]
+        assert effects.modifier(hero, "atk") == 0
+        assert effects.count == 1
+
+    def test_advance_touches_only_expired(self):
+        """Test advance estrae solo le voci scadute dal heap"""
+        effects = StatusEffects()
+        heroes = [Character(f"H{i}") for i in range(200)]
+        for i, hero in enumerate(heroes):
+            effects.add(hero, "Buff", EffectKind.MODIFIER, 1, "atk", rounds=1 + i % 50)
+
+        assert len(effects.advance(2)) == 4
+        assert effects.count == 196
+        assert len(effects._expiry) == 196
+
+    def test_remove_and_invalid(self):
+        """Test rimozione anticipata e parametri non validi"""
+        effects = StatusEffects()
+        hero = Character("Hero")
+        buff = effects.add(hero, "Forza", EffectKind.MODIFIER, 5, "atk", rounds=2)
+        effects.remove(buff)
+
+        assert effects.modifier(hero, "atk") == 0
+        assert effects.advance(10) == []
+        with pytest.raises(ValueError):
+            effects.add(hero, "X", EffectKind.MODIFIER, 1, "speed")
+        with pytest.raises(ValueError):
+            effects.add(hero, "X", "curse", 1)
+
+
+def _battle(enemy=None) -> Battle:
+    """Battaglia di un guerriero contro un nemico"""
+    party = Party([Character("Warrior", "guerriero")])
+    return Battle(party, enemy or Enemy("goblin"), rng=SplitMixRNG(2))
+
+
+class TestBattleEffects:
+    """Test suite per gli effetti nella battaglia"""
+
+    def test_strength_tonic_buffs_attack(self):
+        """Test il Tonico della Forza aumenta i danni per 3 round"""
+        battle = _battle(Enemy("dragon", 5))
+        warrior = battle.party.characters[0]
+        battle.party.inventory.add_item("strength_tonic")
+
+        action = battle.execute_player_turn(warrior, "use_item", warrior, "strength_tonic")
+        assert "+5 ATK" in action.message
+        assert battle.effects.modifier(warrior, "atk") == 5
+
+        state = battle.rng.getstate()
+        buffed = battle.execute_player_turn(warrior, "attack").value
+        battle.rng.setstate(state)
+        battle.effects.advance(1 + ITEM_BUFF_ROUNDS)
+        plain = battle.execute_player_turn(warrior, "attack").value
+        assert buffed == plain + 5
+
+    def test_buff_expires_with_rounds(self):
+        """Test il buff scade dopo ITEM_BUFF_ROUNDS round"""
+        battle = _battle(Enemy("dragon", 5))
+        warrior = battle.party.characters[0]
+        tm = battle.turn_manager
+        battle.party.inventory.add_item("strength_tonic")
+        battle.execute_player_turn(warrior, "use_item", warrior, "strength_tonic")
+
+        tm.round_number += ITEM_BUFF_ROUNDS - 1
+        battle.execute_player_turn(warrior, "attack")
+        assert battle.effects.modifier(warrior, "atk") == 5
+        tm.round_number += 1
+        battle.execute_player_turn(warrior, "attack")
+        assert battle.effects.modifier(warrior, "atk") == 0
+
+    def test_defense_buff_reduces_damage(self):
+        """Test un buff di difesa riduce i danni subiti"""
+        battle = _battle()
+        warrior = battle.party.characters[0]
+        battle.add_effect(warrior, "Muro", EffectKind.MODIFIER, 100, "def", rounds=5)
+
+        action = battle.execute_enemy_turn(battle.enemies[0], warrior)
+        assert action.value == 0
+
+    def test_troll_regenerates(self):
+        """Test il troll recupera HP alla fine del suo turno"""
+        troll = Enemy("troll")
+        battle = _battle(troll)
+        troll.hp -= 30
+
+        battle.execute_enemy_turn(troll)
+        assert troll.hp == troll.max_hp - 30 + troll.regen
+        assert "recupera" in battle.battle_log[-1].message
+
+    def test_damage_over_time(self):
+        """Test il danno nel tempo colpisce chi agisce e può sconfiggerlo"""
+        goblin = Enemy("goblin")
+        battle = _battle(goblin)
+        goblin.hp = 3
+        battle.add_effect(goblin, "Veleno", EffectKind.DOT, 5, rounds=2)
+
+        battle.execute_enemy_turn(goblin)
+        assert not goblin.is_alive
+        assert battle.turn_manager.enemies_alive == 0
+
+    def test_snapshot_restores_effects(self):
+        """Test snapshot/restore includono gli effetti"""
+        battle = _battle()
+        warrior = battle.party.characters[0]
+        snap = battle.snapshot()
+        battle.add_effect(warrior, "Forza", EffectKind.MODIFIER, 5, "atk", rounds=3)
+
+        battle.restore(snap)
+        assert battle.effects.modifier(warrior, "atk") == 0
+        battle.add_effect(warrior, "Forza", EffectKind.MODIFIER, 5, "atk", rounds=3)
+        snap = battle.snapshot()
+        battle.effects.advance(10)
+        battle.restore(snap)
+        assert battle.effects.modifier(warrior, "atk") == 5
@@ -0,0 +1,126 @@
+"""
+Unit tests per il registro dei trigger
+"""
+
+import pytest
+from models.world import World, CellType
+from core.movement import MovementManager, MovementResult
+from core.triggers import TriggerRegistry, TriggerType, create_default_registry
+
+
+class TestTriggerRegistry:
+    """Test suite per TriggerRegistry"""
+
+    @pytest.fixture
+    def scripted_world(self):
+        """Mondo con trigger scriptati per coordinata"""
+        grid = [
+            [3, 0, 0, 0],
+            [0, 1, 1, 0],
+            [0, 0, 0, 4]
+        ]
+        triggers = [
+            {"x": 1, "y": 0, "type": "trap", "damage": 15},
+            {"x": 0, "y": 1, "type": "teleport", "target": [3, 1]},
+            {"x": 2, "y": 0, "type": "door", "message": "Una porta cigola"}
+        ]
+        return World(grid=grid, name="Scripted", triggers=triggers)
+
+    def test_compile_table_size(self, scripted_world):
+        """Test la tabella ha una voce per cella"""
+        table = create_default_registry().compile(scripted_world)
+
+        assert len(table) == scripted_world.width * scripted_world.height
+
+    def test_cell_type_triggers(self):
+        """Test trigger standard per tipo di cella"""
+        world = World(grid=[[3, 2, 5, 4]])
+        manager = MovementManager(world)
+
+        assert manager.move('d').trigger == TriggerType.DANGER
+        assert manager.move('d').trigger == TriggerType.TREASURE
+        assert manager.move('d').trigger == TriggerType.EXIT
+        assert manager.move('a').trigger == TriggerType.TREASURE
+
+    def test_trap_trigger(self, scripted_world):
+        """Test trappola con danno nei dati"""
+        manager = MovementManager(scripted_world)
+        result = manager.move('d')
+
+        assert result.trigger == TriggerType.TRAP
+        assert result.data == {"damage": 15}
+
+    def test_teleport_trigger(self, scripted_world):
+        """Test teletrasporto verso la cella di destinazione"""
+        manager = MovementManager(scripted_world)
+        result = manager.move('s')
+
+        assert result.trigger == TriggerType.TELEPORT
+        assert manager.get_position() == (3, 1)
+        assert result.new_position == (3, 1)
+
+    @pytest.mark.parametrize("target", [[4, 1], [-1, 0], [1, 1]])
+    def test_invalid_teleport_target(self, target):
+        """Test destinazione fuori mappa o su un muro rifiutata alla compilazione"""
+        world = World(grid=[[3, 0, 0, 0], [0, 1, 1, 0]], name="Bad",
+                      triggers=[{"x": 0, "y": 1, "type": "teleport", "target": target}])
+
+        with pytest.raises(ValueError):
+            create_default_registry().compile(world)
+
+    def test_door_trigger_message(self, scripted_world):
+        """Test porta con messaggio personalizzato"""
+        manager = MovementManager(scripted_world)
+        manager.move('d')
+        result = manager.move('d')
+
+        assert result.trigger == TriggerType.DOOR
+        assert result.message == "Una porta cigola"
+
+    def test_unknown_script_type(self):
+        """Test tipo di trigger sconosciuto"""
+        world = World(grid=[[3, 0]], triggers=[{"x": 1, "y": 0, "type": "boh"}])
+
+        with pytest.raises(ValueError):
+            MovementManager(world)
+
+    def test_custom_cell_handler(self):
+        """Test registrazione di un gestore personalizzato"""
+        registry = create_default_registry()
+        registry.register_cell(
+            CellType.DANGER,
+            lambda manager, old_x, old_y: MovementResult(
+                True, manager.get_position(), "Custom", "CUSTOM"
+            )
+        )
+        manager = MovementManager(World(grid=[[3, 2]]), registry=registry)
+
+        assert manager.move('d').trigger == "CUSTOM"
+
+    def test_set_cell_updates_table(self):
+        """Test set_cell aggiorna la tabella dei trigger"""
+        world = World(grid=[[3, 2]])
+        manager = MovementManager(world)
+        manager.set_cell(1, 0, CellType.EMPTY.value)
+
+        assert world.grid[0][1] == 0
+        assert manager.move('d').trigger is None
+
+    def test_set_cell_keeps_scripted_trigger(self, scripted_world):
+        """Test set_cell non rimuove i trigger scriptati"""
+        manager = MovementManager(scripted_world)
+        manager.set_cell(1, 0, CellType.EMPTY.value)
+
+        assert manager.move('d').trigger == TriggerType.TRAP
+
+    def test_triggers_roundtrip(self, scripted_world):
+        """Test i trigger sopravvivono a to_dict/from_dict"""
+        world = World.from_dict(scripted_world.to_dict())
+
+        assert world.triggers == scripted_world.triggers
+
+    def test_registry_starts_empty(self):
+        """Test un registro vuoto non ha gestori"""
+        registry = TriggerRegistry()
+
+        assert registry.get_cell_handler(CellType.DANGER.value) is None
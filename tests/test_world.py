@@ -175,4 +175,25 @@ class TestWorld:
         assert world.get_cell_type_name(2, 0) == "DANGER"
         assert world.get_cell_type_name(0, 1) == "START"
         assert world.get_cell_type_name(1, 1) == "EXIT"
-        assert world.get_cell_type_name(2, 1) == "TREASURE"
\ No newline at end of file
+        assert world.get_cell_type_name(2, 1) == "TREASURE"
+
+    def test_reachable_cells(self):
+        """Test calcolo celle raggiungibili dallo START"""
+        grid = [
+            [3, 0, 1, 4],
+            [0, 1, 1, 0]
+        ]
+        world = World(grid=grid)
+
+        assert world.get_reachable_cells() == {(0, 0), (1, 0), (0, 1)}
+
+    def test_reachable_cells_with_teleport(self):
+        """Test i teletrasporti estendono le celle raggiungibili"""
+        grid = [
+            [3, 0, 1, 4],
+            [0, 1, 1, 0]
+        ]
+        triggers = [{"x": 1, "y": 0, "type": "teleport", "target": [3, 1]}]
+        world = World(grid=grid, triggers=triggers)
+
+        assert (3, 0) in world.get_reachable_cells()
@@ -0,0 +1,118 @@
+"""
+Balance Matrix - Probabilità di vittoria esatte di ogni classe contro ogni nemico
+
+Usa combat.markov: nessun campionamento, i valori sono esatti per le regole
+del simulatore (un personaggio contro un nemico, policy fissa).
+
+I duelli sono divisi tra più processi (--workers). Tutti i livelli 1-5
+richiedono circa 42 s su una CPU, per tre quarti contro il troll: vedi la
+docstring di combat.markov.
+
+Uso:
+    python -m tools.balance_matrix --levels 1-5 --policy balanced --workers 4
+"""
+
+import argparse
+import json
+import time
+from typing import Iterator, List, Mapping, Sequence, Tuple
+
+from models.character import Character
+from combat.enemy import Enemy
+from combat.markov import POLICIES, MarkovResult, balance_matrix
+
+
+def _parse_levels(text: str) -> List[int]:
+    """Interpreta '1-5' o '1,3,5'"""
+    if "-" in text:
+        low, high = text.split("-", 1)
+        return list(range(int(low), int(high) + 1))
+    return [int(v) for v in text.split(",") if v.strip()]
+
+
+def matrix_lines(matrix: Mapping[Tuple[str, str, int], MarkovResult],
+                 levels: Sequence[int]) -> Iterator[str]:
+    """
+    Righe della tabella, calcolando le celle di una riga solo quando serve
+
+    Args:
+        matrix: Risultato di balance_matrix
+        levels: Livelli (colonne)
+
+    Yields:
+        Righe di testo (intestazione, una riga per classe e nemico, chiusura)
+    """
+    pairs = list(dict.fromkeys((cls, enemy) for cls, enemy, _ in matrix))
+    width = 22 + 16 * len(levels)
+    yield "=" * width
+    yield "⚖️  BALANCE MATRIX (win% / round attesi)"
+    yield "=" * width
+    yield f"{'':<22}" + "".join(f"{'Lv.' + str(level):>16}" for level in levels)
+    for cls, enemy in pairs:
+        cells = []
+        for level in levels:
+            result = matrix[(cls, enemy, level)]
+            cells.append(f"{result.win_probability * 100:8.1f}% {result.expected_rounds:6.2f}")
+        yield f"{cls + ' vs ' + enemy:<22}" + "".join(cells)
+    yield "=" * width
+
+
+def format_matrix(matrix: Mapping[Tuple[str, str, int], MarkovResult],
+                  levels: Sequence[int]) -> str:
+    """
+    Formatta la matrice come tabella (una riga per classe e nemico)
+
+    Args:
+        matrix: Risultato di balance_matrix
+        levels: Livelli (colonne)
+
+    Returns:
+        Tabella testuale
+    """
+    return "\n".join(matrix_lines(matrix, levels))
+
+
+def main(argv=None):
+    """Entry point da riga di comando"""
+    parser = argparse.ArgumentParser(description="Matrice di bilanciamento esatta")
+    parser.add_argument("--classes", default="all", help="Classi separate da virgola o 'all'")
+    parser.add_argument("--enemies", default="all", help="Nemici separati da virgola o 'all'")
+    parser.add_argument("--levels", default="1-5", help="Livelli, es. '1-5' o '1,3,5'")
+    parser.add_argument("--policy", default="balanced", help="Policy del personaggio")
+    parser.add_argument("--workers", type=int, default=None, help="Processi (0 = nessun pool)")
+    parser.add_argument("--json", dest="json_path", help="Salva la matrice in JSON")
+    args = parser.parse_args(argv)
+
+    classes = (list(Character.CLASSES) if args.classes == "all"
+               else [c.strip() for c in args.classes.split(",") if c.strip()])
+    for cls in classes:
+        if cls not in Character.CLASSES:
+            parser.error(f"Classe non valida: '{cls}'")
+
+    enemies = (Enemy.get_enemy_types() if args.enemies == "all"
+               else [e.strip() for e in args.enemies.split(",") if e.strip()])
+    for enemy in enemies:
+        if enemy not in Enemy.ENEMY_TEMPLATES:
+            parser.error(f"Nemico non valido: '{enemy}'")
+
+    if args.policy not in POLICIES:
+        parser.error(f"Policy non valida: '{args.policy}'")
+
+    levels = _parse_levels(args.levels)
+    start = time.perf_counter()
+    matrix = balance_matrix(classes, enemies, levels, args.policy).solve_all(args.workers)
+    print(format_matrix(matrix, levels))
+    elapsed = time.perf_counter() - start
+    print(f"{len(matrix)} duelli in {elapsed:.2f}s")
+
+    if args.json_path:
+        data = {f"{cls}/{enemy}/{level}": result.to_dict()
+                for (cls, enemy, level), result in matrix.items()}
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,431 @@
+"""
+Bot Explorer - Sciame di bot headless per il QA delle mappe
+
+Lancia molti party-bot (random walk, frontier, greedy) su tutte le mappe di
+una cartella, in parallelo con un pool di processi. Le griglie, di sola
+lettura, sono condivise tramite multiprocessing.shared_memory invece di
+essere serializzate per ogni task.
+
+Uso:
+    python -m tools.bot_explorer --maps data/maps --bots 64 --steps 5000
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from models.world import World, CellType
+
+
+STRATEGIES = ("random", "frontier", "greedy")
+
+# Indici dei campi nel record compatto di una singola corsa
+RUN_STEPS, RUN_EXIT_STEP, RUN_VISITED, RUN_ENCOUNTERS, RUN_TREASURES, RUN_STUCK = range(6)
+
+# Segmenti di memoria condivisa già collegati in questo processo (nome -> dati)
+_ATTACHED: Dict[str, Tuple[shared_memory.SharedMemory, Tuple]] = {}
+
+
+class SharedMap:
+    """Griglia di una mappa pubblicata in memoria condivisa (un byte per cella)"""
+
+    def __init__(self, world: World, key: str):
+        """
+        Pubblica la griglia del mondo in un segmento di memoria condivisa
+
+        Args:
+            world: Mondo da pubblicare
+            key: Identificativo della mappa nel report
+        """
+        self.key = key
+        self.name = world.name
+        self.width = world.width
+        self.height = world.height
+        self.teleports = {
+            y * world.width + x: ty * world.width + tx
+            for (x, y), (tx, ty) in world.get_teleport_targets().items()
+        }
+
+        cells = bytes(cell for row in world.grid for cell in row)
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, len(cells)))
+        self.shm.buf[:len(cells)] = cells
+
+        start = world.start_position
+        exit_pos = world._find_cell_type(CellType.EXIT)
+        self.start = start[1] * world.width + start[0] if start else None
+        self.exit = exit_pos[1] * world.width + exit_pos[0] if exit_pos else None
+
+        walkable = sum(1 for c in cells if c != CellType.WALL.value)
+        reachable = world.get_reachable_cells() if start else set()
+        self.info = {
+            "name": world.name,
+            "size": f"{world.width}x{world.height}",
+            "walkable_cells": walkable,
+            "reachable_cells": len(reachable),
+            "has_start": start is not None,
+            "has_exit": exit_pos is not None,
+            "exit_reachable": exit_pos in reachable,
+        }
+
+    def task_header(self) -> Tuple:
+        """Ritorna i dati (piccoli) che un worker usa per collegarsi alla mappa"""
+        return (self.shm.name, self.width, self.height, self.teleports)
+
+    def close(self):
+        """Chiude e rimuove il segmento condiviso"""
+        attached = _ATTACHED.pop(self.shm.name, None)
+        if attached is not None:
+            shm, (cells, _) = attached
+            cells.release()
+            shm.close()
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _attach(header: Tuple) -> Tuple:
+    """
+    Collega (una sola volta per processo) la griglia condivisa e ne
+    precompila la tabella dei vicini
+
+    Args:
+        header: Tupla (nome_shm, width, height, teleports)
+
+    Returns:
+        Tupla (celle, vicini) con celle come memoryview di byte
+    """
+    shm_name, width, height, teleports = header
+    cached = _ATTACHED.get(shm_name)
+    if cached is not None:
+        return cached[1]
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    cells = shm.buf[:width * height]
+    wall = CellType.WALL.value
+
+    neighbors = []
+    for idx in range(width * height):
+        x, y = idx % width, idx // width
+        dests = []
+        for nx, ny in ((x, y - 1), (x, y + 1), (x - 1, y), (x + 1, y)):
+            if 0 <= nx < width and 0 <= ny < height:
+                n = ny * width + nx
+                if cells[n] != wall:
+                    dest = teleports.get(n, n)
+                    if cells[dest] != wall:
+                        dests.append(dest)
+        neighbors.append(tuple(dests))
+
+    data = (cells, tuple(neighbors))
+    _ATTACHED[shm_name] = (shm, data)
+    return data
+
+
+def _bfs_path(neighbors: Tuple, source: int, visited: bytearray) -> List[int]:
+    """Percorso più breve verso la cella non visitata più vicina (vuoto se nessuna)"""
+    parents = {source: source}
+    queue = deque([source])
+    while queue:
+        idx = queue.popleft()
+        for n in neighbors[idx]:
+            if n in parents:
+                continue
+            parents[n] = idx
+            if not visited[n]:
+                path = [n]
+                while parents[path[-1]] != source:
+                    path.append(parents[path[-1]])
+                path.reverse()
+                return path
+            queue.append(n)
+    return []
+
+
+def run_bot(strategy: str, cells, neighbors: Tuple, width: int, start: int,
+            exit_idx: Optional[int], max_steps: int, rng: random.Random,
+            stall_limit: int = 2000) -> Tuple:
+    """
+    Esegue un singolo bot fino all'uscita o al limite di passi
+
+    Args:
+        strategy: "random", "frontier" o "greedy"
+        cells: Griglia piatta (sequenza di byte)
+        neighbors: Tabella dei vicini percorribili per cella
+        width: Larghezza della mappa
+        start: Indice della cella di partenza
+        exit_idx: Indice dell'uscita (None se assente)
+        max_steps: Numero massimo di passi
+        rng: Generatore casuale del bot
+        stall_limit: Passi senza nuove celle prima di considerare il bot bloccato
+
+    Returns:
+        Record compatto (passi, passo_uscita, celle_visitate, incontri, tesori, bloccato)
+    """
+    danger = CellType.DANGER.value
+    treasure = CellType.TREASURE.value
+
+    visited = bytearray(len(cells))
+    visits = [0] * len(cells) if strategy == "greedy" else None
+    visited[start] = 1
+    visited_count = 1
+    encounters = treasures = 0
+    exit_step = -1
+    stuck = False
+    since_new = 0
+    path: List[int] = []
+    pos = start
+    ex, ey = (exit_idx % width, exit_idx // width) if exit_idx is not None else (0, 0)
+
+    steps = 0
+    while steps < max_steps:
+        options = neighbors[pos]
+        if not options:
+            stuck = True
+            break
+
+        if strategy == "random":
+            pos = options[rng.randrange(len(options))]
+        elif strategy == "frontier":
+            if not path:
+                fresh = [n for n in options if not visited[n]]
+                path = [fresh[rng.randrange(len(fresh))]] if fresh else _bfs_path(neighbors, pos, visited)
+                if not path:
+                    break  # Mappa raggiungibile esplorata completamente
+            pos = path.pop(0)
+        else:
+            # Greedy verso l'uscita con penalità sulle celle già percorse
+            visits[pos] += 1
+            best = None
+            best_score = None
+            for n in options:
+                score = 2 * visits[n]
+                if exit_idx is not None:
+                    score += abs(n % width - ex) + abs(n // width - ey)
+                if best_score is None or score < best_score or (score == best_score and rng.random() < 0.5):
+                    best, best_score = n, score
+            pos = best
+
+        steps += 1
+
+        if not visited[pos]:
+            visited[pos] = 1
+            visited_count += 1
+            since_new = 0
+            # Nemici e tesori vengono rimossi dopo il primo incontro
+            if cells[pos] == danger:
+                encounters += 1
+            elif cells[pos] == treasure:
+                treasures += 1
+        else:
+            since_new += 1
+            if since_new >= stall_limit:
+                stuck = True
+                break
+
+        if pos == exit_idx:
+            exit_step = steps
+            break
+
+    return (steps, exit_step, visited_count, encounters, treasures, stuck)
+
+
+def _run_batch(header: Tuple, strategy: str, start: int, exit_idx: Optional[int],
+               seeds: List[int], max_steps: int, stall_limit: int) -> List[Tuple]:
+    """Task del pool: esegue un lotto di bot sulla stessa mappa"""
+    cells, neighbors = _attach(header)
+    width = header[1]
+    return [
+        run_bot(strategy, cells, neighbors, width, start, exit_idx,
+                max_steps, random.Random(seed), stall_limit)
+        for seed in seeds
+    ]
+
+
+def _summarize(runs: List[Tuple], reachable: int) -> Dict:
+    """Aggrega i record compatti di una coppia (mappa, strategia)"""
+    total_steps = sum(r[RUN_STEPS] for r in runs)
+    exit_steps = sorted(r[RUN_EXIT_STEP] for r in runs if r[RUN_EXIT_STEP] >= 0)
+    encounters = sum(r[RUN_ENCOUNTERS] for r in runs)
+
+    summary = {
+        "runs": len(runs),
+        "total_steps": total_steps,
+        "exit_reached": len(exit_steps),
+        "exit_rate": len(exit_steps) / len(runs) if runs else 0.0,
+        "stuck_runs": sum(1 for r in runs if r[RUN_STUCK]),
+        "mean_coverage": (
+            statistics.mean(r[RUN_VISITED] / reachable for r in runs)
+            if runs and reachable else 0.0
+        ),
+        "encounters_per_100_steps": 100 * encounters / total_steps if total_steps else 0.0,
+        "treasures_found": sum(r[RUN_TREASURES] for r in runs),
+        "steps_to_exit": None,
+    }
+
+    if exit_steps:
+        summary["steps_to_exit"] = {
+            "min": exit_steps[0],
+            "p50": exit_steps[len(exit_steps) // 2],
+            "p90": exit_steps[min(len(exit_steps) - 1, int(len(exit_steps) * 0.9))],
+            "max": exit_steps[-1],
+            "mean": statistics.mean(exit_steps),
+        }
+
+    return summary
+
+
+def explore_maps(map_files: List[Path], strategies=STRATEGIES, bots: int = 32,
+                 max_steps: int = 5000, workers: Optional[int] = None,
+                 seed: int = 0, batch_size: int = 8, stall_limit: int = 2000) -> Dict:
+    """
+    Esplora un insieme di mappe con uno sciame di bot
+
+    Args:
+        map_files: File JSON delle mappe
+        strategies: Strategie da usare
+        bots: Numero di bot per (mappa, strategia)
+        max_steps: Passi massimi per bot
+        workers: Processi del pool (None = numero di CPU, 0 = nello stesso processo)
+        seed: Seme radice per la riproducibilità
+        batch_size: Bot per task del pool
+        stall_limit: Passi senza nuove celle prima di considerare un bot bloccato
+
+    Returns:
+        Report con statistiche per mappa e strategia
+    """
+    shared: List[SharedMap] = []
+    report = {"maps": {}, "total_steps": 0, "elapsed_s": 0.0, "steps_per_minute": 0.0}
+    began = time.perf_counter()
+
+    try:
+        jobs = []
+        for m_index, path in enumerate(map_files):
+            world = World.load_from_file(str(path))
+            shared_map = SharedMap(world, Path(path).name)
+            shared.append(shared_map)
+            report["maps"][shared_map.key] = {"info": shared_map.info, "strategies": {}}
+
+            if shared_map.start is None:
+                continue
+
+            for s_index, strategy in enumerate(strategies):
+                # Semi derivati da (radice, mappa, strategia, bot): indipendenti dai worker
+                base = ((seed * 1_000_003 + m_index) * 101 + s_index) * 1_000_003
+                seeds = [base + i for i in range(bots)]
+                for i in range(0, bots, batch_size):
+                    jobs.append((shared_map, strategy, seeds[i:i + batch_size]))
+
+        results: Dict[Tuple[str, str], List[Tuple]] = {}
+
+        def submit_args(job):
+            shared_map, strategy, seeds = job
+            return (shared_map.task_header(), strategy, shared_map.start,
+                    shared_map.exit, seeds, max_steps, stall_limit)
+
+        if workers == 0:
+            outputs = [_run_batch(*submit_args(job)) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(_run_batch, *submit_args(job)) for job in jobs]
+                outputs = [f.result() for f in futures]
+
+        for (shared_map, strategy, _), runs in zip(jobs, outputs):
+            results.setdefault((shared_map.key, strategy), []).extend(runs)
+
+        for shared_map in shared:
+            reachable = shared_map.info["reachable_cells"]
+            for strategy in strategies:
+                runs = results.get((shared_map.key, strategy))
+                if runs is None:
+                    continue
+                summary = _summarize(runs, reachable)
+                report["maps"][shared_map.key]["strategies"][strategy] = summary
+                report["total_steps"] += summary["total_steps"]
+    finally:
+        for shared_map in shared:
+            shared_map.close()
+
+    elapsed = time.perf_counter() - began
+    report["elapsed_s"] = elapsed
+    report["steps_per_minute"] = report["total_steps"] / elapsed * 60 if elapsed else 0.0
+    return report
+
+
+def format_report(report: Dict) -> str:
+    """Genera una rappresentazione testuale del report"""
+    lines = []
+    lines.append("=" * 60)
+    lines.append("🤖 BOT EXPLORER - REPORT")
+    lines.append("=" * 60)
+
+    for key, data in report["maps"].items():
+        info = data["info"]
+        lines.append(f"\n🗺️  {info['name']} ({key}, {info['size']})")
+        lines.append(f"   Celle raggiungibili: {info['reachable_cells']}/{info['walkable_cells']}")
+        if not info["has_start"]:
+            lines.append("   ⚠️  START mancante")
+        if not info["has_exit"]:
+            lines.append("   ⚠️  EXIT mancante")
+        elif not info["exit_reachable"]:
+            lines.append("   ⚠️  EXIT non raggiungibile")
+
+        for strategy, s in data["strategies"].items():
+            exit_info = ""
+            if s["steps_to_exit"]:
+                d = s["steps_to_exit"]
+                exit_info = f" | passi uscita p50={d['p50']} p90={d['p90']} max={d['max']}"
+            lines.append(
+                f"   [{strategy:8}] uscita {s['exit_reached']}/{s['runs']}"
+                f" | copertura {s['mean_coverage'] * 100:.0f}%"
+                f" | bloccati {s['stuck_runs']}"
+                f" | incontri/100 passi {s['encounters_per_100_steps']:.2f}"
+                f"{exit_info}"
+            )
+
+    lines.append("\n" + "=" * 60)
+    lines.append(
+        f"Passi totali: {report['total_steps']} in {report['elapsed_s']:.2f}s "
+        f"({report['steps_per_minute']:,.0f} passi/min)"
+    )
+    lines.append("=" * 60)
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Entry point da riga di comando"""
+    parser = argparse.ArgumentParser(description="Sciame di bot per il QA delle mappe")
+    parser.add_argument("--maps", default="data/maps", help="Cartella delle mappe JSON")
+    parser.add_argument("--bots", type=int, default=32, help="Bot per mappa e strategia")
+    parser.add_argument("--steps", type=int, default=5000, help="Passi massimi per bot")
+    parser.add_argument("--workers", type=int, default=None, help="Processi (0 = nessun pool)")
+    parser.add_argument("--strategies", default=",".join(STRATEGIES),
+                        help="Strategie separate da virgola")
+    parser.add_argument("--seed", type=int, default=0, help="Seme radice")
+    parser.add_argument("--json", dest="json_path", help="Salva il report in JSON")
+    args = parser.parse_args(argv)
+
+    strategies = [s.strip() for s in args.strategies.split(",") if s.strip()]
+    for strategy in strategies:
+        if strategy not in STRATEGIES:
+            parser.error(f"Strategia non valida: '{strategy}'")
+
+    map_files = sorted(Path(args.maps).glob("*.json"))
+    report = explore_maps(map_files, strategies, bots=args.bots, max_steps=args.steps,
+                          workers=args.workers, seed=args.seed)
+    print(format_report(report))
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
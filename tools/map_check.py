@@ -0,0 +1,322 @@
+"""
+Map Check - Validazione e conversione in batch delle mappe
+
+Processa una cartella di mappe con un pool di processi: valida schema,
+rettangolarità e valori delle celle, presenza e raggiungibilità di START/EXIT
+e dei trigger scriptati; opzionalmente converte ogni mappa valida in un altro
+formato. Produce un report JSON leggibile dalla CI.
+
+Uso:
+    python -m tools.map_check data/maps --report map_report.json
+    python -m tools.map_check data/maps --convert json-compact --out-dir build/maps
+"""
+
+import argparse
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from models.world import World, CellType
+from core.triggers import DEFAULT_REGISTRY
+
+
+CONVERT_FORMATS = {
+    "json": ".json",
+    "json-compact": ".json",
+    "ppm": ".ppm",
+    "png": ".png",
+}
+
+VALID_CELLS = frozenset(cell.value for cell in CellType)
+
+
+class MapReport:
+    """Risultato della validazione di una singola mappa"""
+
+    def __init__(self, filepath: str):
+        """
+        Inizializza il report
+
+        Args:
+            filepath: Percorso della mappa
+        """
+        self.file = filepath
+        self.errors: List[Dict] = []
+        self.warnings: List[Dict] = []
+        self.stats: Dict = {}
+        self.converted: Optional[str] = None
+
+    def error(self, code: str, message: str):
+        """Aggiunge un errore bloccante"""
+        self.errors.append({"code": code, "message": message})
+
+    def warning(self, code: str, message: str):
+        """Aggiunge un avviso non bloccante"""
+        self.warnings.append({"code": code, "message": message})
+
+    @property
+    def valid(self) -> bool:
+        """True se la mappa non ha errori"""
+        return not self.errors
+
+    def to_dict(self) -> Dict:
+        """Converte il report in dizionario"""
+        return {
+            "file": self.file,
+            "valid": self.valid,
+            "errors": self.errors,
+            "warnings": self.warnings,
+            "stats": self.stats,
+            "converted": self.converted,
+        }
+
+
+def _check_schema(data, report: MapReport) -> bool:
+    """Controlla struttura, rettangolarità e valori delle celle"""
+    if not isinstance(data, dict):
+        report.error("schema", "La mappa deve essere un oggetto JSON")
+        return False
+
+    name = data.get("name")
+    if name is not None and not isinstance(name, str):
+        report.error("schema", "'name' deve essere una stringa")
+
+    grid = data.get("grid")
+    if not isinstance(grid, list) or not grid:
+        report.error("schema", "'grid' deve essere una lista di righe non vuota")
+        return False
+
+    width = None
+    for y, row in enumerate(grid):
+        if not isinstance(row, list) or not row:
+            report.error("schema", f"Riga {y} non è una lista non vuota")
+            return False
+        if width is None:
+            width = len(row)
+        elif len(row) != width:
+            report.error("not_rectangular", f"Riga {y} lunga {len(row)}, attesa {width}")
+            return False
+        if not VALID_CELLS.issuperset(row):
+            bad = sorted({c for c in row if c not in VALID_CELLS}, key=repr)
+            report.error("cell_value", f"Valori di cella non validi alla riga {y}: {bad[:5]}")
+            return False
+
+    height = len(grid)
+    if data.get("width", width) != width or data.get("height", height) != height:
+        report.error(
+            "size_mismatch",
+            f"width/height dichiarati {data.get('width')}x{data.get('height')}, "
+            f"griglia {width}x{height}"
+        )
+
+    triggers = data.get("triggers", [])
+    if not isinstance(triggers, list):
+        report.error("schema", "'triggers' deve essere una lista")
+        return False
+    for i, spec in enumerate(triggers):
+        if not isinstance(spec, dict) or not all(k in spec for k in ("x", "y", "type")):
+            report.error("trigger", f"Trigger {i} senza x/y/type")
+            return False
+
+    return report.valid
+
+
+def _check_content(world: World, report: MapReport):
+    """Controlla START/EXIT, raggiungibilità e trigger su una griglia valida"""
+    grid = world.grid
+    counts = {cell.value: sum(row.count(cell.value) for row in grid) for cell in CellType}
+
+    report.stats = {
+        "name": world.name,
+        "width": world.width,
+        "height": world.height,
+        "cells": {cell.name: counts[cell.value] for cell in CellType},
+    }
+
+    if counts[CellType.START.value] == 0:
+        report.error("no_start", "Nessuna cella START")
+    elif counts[CellType.START.value] > 1:
+        report.warning("multiple_start", f"{counts[CellType.START.value]} celle START, usata la prima")
+    if counts[CellType.EXIT.value] == 0:
+        report.error("no_exit", "Nessuna cella EXIT")
+
+    for i, spec in enumerate(world.triggers):
+        x, y, kind = spec["x"], spec["y"], spec["type"]
+        if not DEFAULT_REGISTRY.has_script(kind):
+            report.error("trigger", f"Trigger {i}: tipo sconosciuto '{kind}'")
+        elif not world.is_walkable(x, y):
+            report.error("trigger", f"Trigger {i} in ({x}, {y}) non è su una cella percorribile")
+        elif kind == "teleport":
+            target = spec.get("target")
+            if not (isinstance(target, list) and len(target) == 2 and world.is_walkable(*target)):
+                report.error("trigger", f"Teletrasporto {i}: destinazione non valida {target}")
+
+    if not report.valid or world.start_position is None:
+        return
+
+    reachable = world.get_reachable_cells()
+    walkable = world.width * world.height - counts[CellType.WALL.value]
+    report.stats["reachable_cells"] = len(reachable)
+    report.stats["walkable_cells"] = walkable
+
+    unreachable_exits = 0
+    unreachable_content = 0
+    for y, row in enumerate(grid):
+        for x, cell in enumerate(row):
+            if cell == CellType.EXIT.value and (x, y) not in reachable:
+                unreachable_exits += 1
+            elif cell in (CellType.DANGER.value, CellType.TREASURE.value) and (x, y) not in reachable:
+                unreachable_content += 1
+
+    if unreachable_exits == counts[CellType.EXIT.value]:
+        report.error("exit_unreachable", "Nessuna EXIT raggiungibile dallo START")
+    elif unreachable_exits:
+        report.warning("exit_unreachable", f"{unreachable_exits} EXIT non raggiungibili")
+    if unreachable_content:
+        report.warning("content_unreachable", f"{unreachable_content} nemici/tesori non raggiungibili")
+    if len(reachable) < walkable:
+        report.warning("dead_cells", f"{walkable - len(reachable)} celle percorribili non raggiungibili")
+
+
+def convert_world(world: World, fmt: str, out_path: Path) -> None:
+    """
+    Scrive un World nel formato richiesto
+
+    Args:
+        world: Mondo da convertire
+        fmt: Formato (json, json-compact, ppm, png)
+        out_path: File di destinazione
+    """
+    if fmt == "json":
+        world.save_to_file(str(out_path))
+    elif fmt == "json-compact":
+        world.save_to_file(str(out_path), compact=True)
+    else:
+        from tools.map_image import world_to_image
+        world_to_image(world, str(out_path))
+
+
+def check_map(filepath: str, convert: Optional[str] = None,
+              out_dir: Optional[str] = None) -> Dict:
+    """
+    Valida (e opzionalmente converte) una singola mappa
+
+    Args:
+        filepath: Percorso della mappa JSON
+        convert: Formato di conversione o None
+        out_dir: Cartella di destinazione delle conversioni
+
+    Returns:
+        Report della mappa come dizionario
+    """
+    report = MapReport(filepath)
+
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        report.error("invalid_json", str(e))
+        return report.to_dict()
+
+    if _check_schema(data, report):
+        world = World.from_dict(data)
+        _check_content(world, report)
+
+        if convert and report.valid:
+            out_path = Path(out_dir or ".") / (Path(filepath).stem + CONVERT_FORMATS[convert])
+            try:
+                convert_world(world, convert, out_path)
+                report.converted = str(out_path)
+            except Exception as e:
+                report.error("convert", str(e))
+
+    return report.to_dict()
+
+
+def _check_map_args(args) -> Dict:
+    """Adattatore per ProcessPoolExecutor.map"""
+    return check_map(*args)
+
+
+def check_maps(paths: List[str], convert: Optional[str] = None, out_dir: Optional[str] = None,
+               workers: Optional[int] = None) -> Dict:
+    """
+    Valida un insieme di mappe in parallelo
+
+    Args:
+        paths: File delle mappe
+        convert: Formato di conversione o None
+        out_dir: Cartella di destinazione delle conversioni
+        workers: Processi del pool (None = numero di CPU, 0 = nello stesso processo)
+
+    Returns:
+        Report complessivo con riepilogo
+    """
+    began = time.perf_counter()
+    jobs = [(str(p), convert, out_dir) for p in paths]
+
+    if workers == 0 or len(jobs) <= 1:
+        results = [_check_map_args(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(jobs) // ((workers or 4) * 4))
+            results = list(pool.map(_check_map_args, jobs, chunksize=chunksize))
+
+    return {
+        "maps": results,
+        "summary": {
+            "total": len(results),
+            "valid": sum(1 for r in results if r["valid"]),
+            "invalid": sum(1 for r in results if not r["valid"]),
+            "warnings": sum(len(r["warnings"]) for r in results),
+            "converted": sum(1 for r in results if r["converted"]),
+            "elapsed_s": time.perf_counter() - began,
+        },
+    }
+
+
+def main(argv=None):
+    """Entry point da riga di comando"""
+    parser = argparse.ArgumentParser(description="Valida e converte mappe in batch")
+    parser.add_argument("paths", nargs="+", help="File o cartelle di mappe JSON")
+    parser.add_argument("--workers", type=int, default=None, help="Processi (0 = nessun pool)")
+    parser.add_argument("--convert", choices=sorted(CONVERT_FORMATS), help="Formato di conversione")
+    parser.add_argument("--out-dir", default="converted_maps", help="Cartella per le conversioni")
+    parser.add_argument("--report", help="Salva il report JSON (\"-\" per stdout)")
+    parser.add_argument("--strict", action="store_true", help="Gli avvisi fanno fallire il controllo")
+    args = parser.parse_args(argv)
+
+    files = []
+    for entry in args.paths:
+        path = Path(entry)
+        files.extend(sorted(path.rglob("*.json")) if path.is_dir() else [path])
+
+    report = check_maps(files, args.convert, args.out_dir, args.workers)
+
+    if args.report == "-":
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        for result in report["maps"]:
+            icon = "✅" if result["valid"] else "❌"
+            print(f"{icon} {result['file']}")
+            for issue in result["errors"]:
+                print(f"   ERRORE [{issue['code']}] {issue['message']}")
+            for issue in result["warnings"]:
+                print(f"   avviso [{issue['code']}] {issue['message']}")
+        summary = report["summary"]
+        print(f"\n{summary['valid']}/{summary['total']} mappe valide, "
+              f"{summary['warnings']} avvisi in {summary['elapsed_s']:.2f}s")
+        if args.report:
+            with open(args.report, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+
+    failed = report["summary"]["invalid"] > 0
+    if args.strict and report["summary"]["warnings"] > 0:
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
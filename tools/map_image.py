@@ -0,0 +1,324 @@
+"""
+Map Image - Importa ed esporta mappe come immagini
+
+Ogni pixel corrisponde a una cella. I colori sono convertiti in CellType
+tramite una palette con ricerca del colore più vicino; la distanza viene
+calcolata una sola volta per colore distinto e la conversione dell'intera
+immagine avviene con operazioni bulk su bytes (slicing e map in C), senza
+cicli Python per pixel.
+
+Formati supportati:
+    - PPM (P6/P3): lettura e scrittura in Python puro
+    - PNG: lettura tramite pygame.image.load, scrittura in Python puro (zlib)
+
+Uso:
+    python -m tools.map_image import mappa.png data/maps/mappa.json --name "Nuova Mappa"
+    python -m tools.map_image export data/maps/map_01.json map_01.png
+"""
+
+import argparse
+import json
+import struct
+import sys
+import zlib
+from pathlib import Path
+from typing import Dict, Tuple
+
+from models.world import World, CellType
+
+
+RGB = Tuple[int, int, int]
+
+DEFAULT_PALETTE: Dict[CellType, RGB] = {
+    CellType.EMPTY: (255, 255, 255),
+    CellType.WALL: (0, 0, 0),
+    CellType.DANGER: (255, 0, 0),
+    CellType.START: (0, 255, 0),
+    CellType.EXIT: (0, 0, 255),
+    CellType.TREASURE: (255, 255, 0),
+}
+
+
+class _NearestColorTable(dict):
+    """
+    Cache colore -> valore di cella. Le chiavi sono pixel RGBX impacchettati
+    in un intero a 32 bit (ordine dei byte nativo); il colore più vicino viene
+    cercato solo la prima volta che un colore compare.
+    """
+
+    def __init__(self, palette: Dict[CellType, RGB]):
+        super().__init__()
+        self.entries = [(cell.value, rgb) for cell, rgb in palette.items()]
+
+    def __missing__(self, packed: int) -> int:
+        r, g, b, _ = packed.to_bytes(4, sys.byteorder)
+        best_value, best_dist = 0, None
+        for value, (pr, pg, pb) in self.entries:
+            dist = (r - pr) ** 2 + (g - pg) ** 2 + (b - pb) ** 2
+            if best_dist is None or dist < best_dist:
+                best_value, best_dist = value, dist
+        self[packed] = best_value
+        return best_value
+
+
+def load_palette(filepath: str) -> Dict[CellType, RGB]:
+    """
+    Carica una palette da file JSON ({"WALL": [r, g, b], ...})
+
+    Args:
+        filepath: Percorso del file JSON
+
+    Returns:
+        Palette CellType -> colore RGB
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    palette = {}
+    for name, rgb in data.items():
+        try:
+            cell = CellType[name.upper()]
+        except KeyError:
+            raise ValueError(f"Tipo di cella non valido nella palette: '{name}'")
+        palette[cell] = tuple(int(c) for c in rgb)
+    return palette
+
+
+def rgb_to_cells(rgb: bytes, palette: Dict[CellType, RGB] = None) -> bytes:
+    """
+    Classifica un buffer RGB (3 byte per pixel) in valori di cella
+
+    Args:
+        rgb: Pixel RGB consecutivi
+        palette: Palette da usare (default: DEFAULT_PALETTE)
+
+    Returns:
+        Un byte per pixel con il valore CellType più vicino
+    """
+    count = len(rgb) // 3
+    rgbx = bytearray(count * 4)
+    rgbx[0::4] = rgb[0::3]
+    rgbx[1::4] = rgb[1::3]
+    rgbx[2::4] = rgb[2::3]
+    return rgbx_to_cells(rgbx, palette)
+
+
+def rgbx_to_cells(rgbx, palette: Dict[CellType, RGB] = None) -> bytes:
+    """
+    Classifica un buffer RGBX (4 byte per pixel, quarto byte ignorato)
+
+    Args:
+        rgbx: Pixel RGBX consecutivi
+        palette: Palette da usare (default: DEFAULT_PALETTE)
+
+    Returns:
+        Un byte per pixel con il valore CellType più vicino
+    """
+    rgbx = bytearray(rgbx)
+    rgbx[3::4] = bytes(len(rgbx) // 4)  # Azzera il canale extra/alpha
+    pixels = memoryview(rgbx).cast('I')
+    table = _NearestColorTable(palette or DEFAULT_PALETTE)
+    return bytes(map(table.__getitem__, pixels))
+
+
+def cells_to_rgb(cells: bytes, palette: Dict[CellType, RGB] = None) -> bytes:
+    """
+    Converte i valori di cella in pixel RGB
+
+    Args:
+        cells: Un byte per cella
+        palette: Palette da usare (default: DEFAULT_PALETTE)
+
+    Returns:
+        Pixel RGB consecutivi (3 byte per cella)
+    """
+    palette = palette or DEFAULT_PALETTE
+    channels = [bytearray(256) for _ in range(3)]
+    for cell, rgb in palette.items():
+        for channel, value in zip(channels, rgb):
+            channel[cell.value] = value
+
+    rgb = bytearray(len(cells) * 3)
+    for offset, channel in enumerate(channels):
+        rgb[offset::3] = cells.translate(channel)
+    return bytes(rgb)
+
+
+def read_ppm(filepath: str) -> Tuple[int, int, bytes]:
+    """
+    Legge un'immagine PPM (P6 binario o P3 testuale)
+
+    Args:
+        filepath: Percorso del file
+
+    Returns:
+        Tupla (width, height, pixel RGB)
+    """
+    data = Path(filepath).read_bytes()
+    tokens = []
+    pos = 0
+    # Header: magic, width, height, maxval (con eventuali commenti '#')
+    while len(tokens) < 4:
+        while pos < len(data) and data[pos:pos + 1].isspace():
+            pos += 1
+        if data[pos:pos + 1] == b'#':
+            while pos < len(data) and data[pos:pos + 1] not in (b'\n', b'\r'):
+                pos += 1
+            continue
+        end = pos
+        while end < len(data) and not data[end:end + 1].isspace():
+            end += 1
+        if end == pos:
+            raise ValueError(f"Header PPM incompleto: {filepath}")
+        tokens.append(data[pos:end])
+        pos = end
+
+    magic, width, height, maxval = tokens[0], int(tokens[1]), int(tokens[2]), int(tokens[3])
+    size = width * height * 3
+
+    if magic == b'P6':
+        if maxval > 255:
+            raise ValueError("PPM a 16 bit non supportato")
+        pixels = data[pos + 1:pos + 1 + size]
+    elif magic == b'P3':
+        pixels = bytes(int(v) for v in data[pos:].split()[:size])
+    else:
+        raise ValueError(f"Formato PPM non supportato: {magic!r}")
+
+    if len(pixels) != size:
+        raise ValueError(f"Dati PPM troncati: {filepath}")
+
+    if maxval != 255:
+        scale = bytes(min(255, v * 255 // maxval) for v in range(256))
+        pixels = pixels.translate(scale)
+
+    return width, height, pixels
+
+
+def write_ppm(filepath: str, width: int, height: int, rgb: bytes) -> None:
+    """Scrive un'immagine PPM binaria (P6)"""
+    path = Path(filepath)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(f"P6\n{width} {height}\n255\n".encode('ascii'))
+        f.write(rgb)
+
+
+def write_png(filepath: str, width: int, height: int, rgb: bytes) -> None:
+    """Scrive un PNG RGB a 8 bit (senza dipendenze esterne)"""
+    def chunk(kind: bytes, payload: bytes) -> bytes:
+        return (struct.pack('>I', len(payload)) + kind + payload
+                + struct.pack('>I', zlib.crc32(kind + payload) & 0xFFFFFFFF))
+
+    stride = width * 3
+    raw = bytearray((stride + 1) * height)
+    for y in range(height):
+        # Byte di filtro 0 (None) all'inizio di ogni riga
+        start = y * (stride + 1) + 1
+        raw[start:start + stride] = rgb[y * stride:(y + 1) * stride]
+
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    path = Path(filepath)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', header))
+        f.write(chunk(b'IDAT', zlib.compress(bytes(raw), 1)))
+        f.write(chunk(b'IEND', b''))
+
+
+def read_image_cells(filepath: str, palette: Dict[CellType, RGB] = None) -> Tuple[int, int, bytes]:
+    """
+    Legge un'immagine e la classifica in celle
+
+    Args:
+        filepath: File PPM o PNG (PNG richiede pygame)
+        palette: Palette da usare
+
+    Returns:
+        Tupla (width, height, celle)
+    """
+    if Path(filepath).suffix.lower() in ('.ppm', '.pnm'):
+        width, height, rgb = read_ppm(filepath)
+        return width, height, rgb_to_cells(rgb, palette)
+
+    try:
+        import pygame
+    except ImportError:
+        raise RuntimeError("pygame è necessario per leggere immagini diverse da PPM")
+
+    surface = pygame.image.load(filepath)
+    width, height = surface.get_size()
+    rgb = pygame.image.tostring(surface, 'RGB')
+    return width, height, rgb_to_cells(rgb, palette)
+
+
+def image_to_world(filepath: str, name: str = None,
+                   palette: Dict[CellType, RGB] = None) -> World:
+    """
+    Crea un World da un'immagine
+
+    Args:
+        filepath: Percorso dell'immagine
+        name: Nome della mappa (default: nome del file)
+        palette: Palette da usare
+
+    Returns:
+        Istanza di World
+    """
+    width, height, cells = read_image_cells(filepath, palette)
+    grid = [list(cells[y * width:(y + 1) * width]) for y in range(height)]
+    return World(grid=grid, name=name or Path(filepath).stem)
+
+
+def world_to_image(world: World, filepath: str, palette: Dict[CellType, RGB] = None) -> None:
+    """
+    Esporta un World come immagine (PNG o PPM in base all'estensione)
+
+    Args:
+        world: Mondo da esportare
+        filepath: File di destinazione
+        palette: Palette da usare
+    """
+    cells = b''.join(map(bytes, world.grid))
+    rgb = cells_to_rgb(cells, palette)
+
+    if Path(filepath).suffix.lower() in ('.ppm', '.pnm'):
+        write_ppm(filepath, world.width, world.height, rgb)
+    else:
+        write_png(filepath, world.width, world.height, rgb)
+
+
+def main(argv=None):
+    """Entry point da riga di comando"""
+    parser = argparse.ArgumentParser(description="Importa/esporta mappe come immagini")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    imp = sub.add_parser("import", help="Immagine -> mappa JSON")
+    imp.add_argument("image")
+    imp.add_argument("output")
+    imp.add_argument("--name", help="Nome della mappa")
+    imp.add_argument("--palette", help="Palette JSON personalizzata")
+
+    exp = sub.add_parser("export", help="Mappa JSON -> immagine")
+    exp.add_argument("map")
+    exp.add_argument("output")
+    exp.add_argument("--palette", help="Palette JSON personalizzata")
+
+    args = parser.parse_args(argv)
+    palette = load_palette(args.palette) if args.palette else None
+
+    if args.command == "import":
+        world = image_to_world(args.image, args.name, palette)
+        world.save_to_file(args.output, compact=True)
+        print(f"✅ {world} salvato in: {args.output}")
+    else:
+        world = World.load_from_file(args.map)
+        world_to_image(world, args.output, palette)
+        print(f"✅ {world} esportato in: {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,95 @@
+"""
+Replay Check - Riesecuzione in batch delle battaglie registrate
+
+Carica i replay binari (.rpl) prodotti da combat.replay, li riesegue senza
+interfaccia e verifica l'hash dello stato dopo ogni turno: una suite di
+regressione composta da battaglie registrate.
+
+Uso:
+    python -m tools.replay_check replays/
+    python -m tools.replay_check bug_1234.rpl --verbose
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from combat.replay import BattleReplay, ReplayMismatchError
+
+
+def check_replay(filepath: Path) -> Dict:
+    """
+    Riesegue un replay e ne verifica gli stati
+
+    Args:
+        filepath: File .rpl
+
+    Returns:
+        Dizionario con file, esito, turni ed eventuale errore
+    """
+    result = {"file": str(filepath), "ok": False, "turns": 0, "error": None}
+    try:
+        replay = BattleReplay.load(str(filepath))
+        result["turns"] = len(replay.records)
+        replay.play(verify=True)
+        result["ok"] = True
+    except ReplayMismatchError as e:
+        result["error"] = str(e)
+    except (OSError, ValueError, IndexError, KeyError) as e:
+        result["error"] = f"Replay non leggibile: {e}"
+    return result
+
+
+def check_replays(files: List[Path]) -> Dict:
+    """
+    Riesegue un insieme di replay
+
+    Args:
+        files: File .rpl
+
+    Returns:
+        Report con i risultati e un riepilogo
+    """
+    start = time.perf_counter()
+    results = [check_replay(path) for path in files]
+    failed = sum(1 for r in results if not r["ok"])
+    return {
+        "replays": results,
+        "summary": {
+            "total": len(results),
+            "passed": len(results) - failed,
+            "failed": failed,
+            "turns": sum(r["turns"] for r in results),
+            "elapsed_s": time.perf_counter() - start,
+        },
+    }
+
+
+def main(argv=None):
+    """Entry point da riga di comando"""
+    parser = argparse.ArgumentParser(description="Riesegue e verifica replay di battaglia")
+    parser.add_argument("paths", nargs="+", help="File .rpl o cartelle di replay")
+    parser.add_argument("--verbose", action="store_true", help="Mostra anche i replay corretti")
+    args = parser.parse_args(argv)
+
+    files = []
+    for entry in args.paths:
+        path = Path(entry)
+        files.extend(sorted(path.rglob("*.rpl")) if path.is_dir() else [path])
+
+    report = check_replays(files)
+    for result in report["replays"]:
+        if not result["ok"]:
+            print(f"❌ {result['file']}: {result['error']}")
+        elif args.verbose:
+            print(f"✅ {result['file']} ({result['turns']} turni)")
+
+    summary = report["summary"]
+    print(f"\n{summary['passed']}/{summary['total']} replay verificati, "
+          f"{summary['turns']} turni in {summary['elapsed_s']:.2f}s")
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,269 @@
+"""
+Sim Farm - Simulazione di battaglie in parallelo con semi riproducibili
+
+Distribuisce scenari (composizione del party, nemico, livello, policy) su un
+pool di processi. Ogni scenario è diviso in blocchi di battaglie; ogni blocco
+ha un seme derivato da (seme radice, scenario, blocco), quindi i risultati
+sono identici con qualsiasi numero di worker. I worker eseguono il codice
+reale di Battle/TurnManager e rimandano solo aggregati parziali
+(SimulationStats), uniti poi nel processo principale.
+
+L'IA dei nemici è un parametro dello scenario. Il default è 'easy' (bersaglio
+casuale, come combat.simulator): è il più veloce. Con 'type' ogni nemico usa
+l'IA del suo tipo (chiave 'ai' di data/enemies.json), come nel gioco: contro
+troll e drago la ricerca rende le battaglie due ordini di grandezza più lente.
+
+Uso:
+    python -m tools.sim_farm --party guerriero,mago --enemies all --levels 1-3
+    python -m tools.sim_farm --party ladro,ranger --enemies dragon --enemy-ai type
+"""
+
+import argparse
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from models.character import Character
+from models.party import Party
+from combat.enemy import Enemy
+from combat.battle import Battle
+from combat.enemy_ai import DIFFICULTY_PRESETS
+from combat.policies import PARTY_POLICIES, get_policy
+from combat.simulator import SIMULATED_AI, SimulationStats
+from utils.rng import GameRNG, derive_seed
+
+
+# IA dei nemici di default (la stessa del simulatore) e valore per l'IA del tipo
+DEFAULT_ENEMY_AI = SIMULATED_AI
+ENEMY_AI_BY_TYPE = "type"
+
+class Scenario:
+    """Scenario di simulazione: party contro un nemico di un certo livello"""
+
+    def __init__(self, party: Sequence[str], enemy: str, level: int = 1,
+                 policy: str = "balanced", enemy_ai: str = DEFAULT_ENEMY_AI):
+        """
+        Inizializza lo scenario
+
+        Args:
+            party: Classi dei personaggi
+            enemy: Tipo di nemico
+            level: Livello del nemico
+            policy: Nome della policy del party
+            enemy_ai: Chiave di DIFFICULTY_PRESETS o ENEMY_AI_BY_TYPE
+        """
+        self.party = tuple(party)
+        self.enemy = enemy
+        self.level = level
+        self.policy = policy
+        self.enemy_ai = enemy_ai
+
+    @property
+    def key(self) -> str:
+        """Identificativo leggibile dello scenario"""
+        key = f"{'+'.join(self.party)} vs {self.enemy} Lv.{self.level} [{self.policy}]"
+        if self.enemy_ai != DEFAULT_ENEMY_AI:
+            key += f" IA:{self.enemy_ai}"
+        return key
+
+    def to_args(self) -> Tuple:
+        """Argomenti (piccoli e serializzabili) per i task del pool"""
+        return (self.party, self.enemy, self.level, self.policy, self.enemy_ai)
+
+
+def fight(party_classes: Sequence[str], enemy_type: str, level: int, policy,
+          max_rounds: int = 200, rng=None,
+          enemy_ai: str = DEFAULT_ENEMY_AI) -> Tuple[bool, int, float]:
+    """
+    Esegue una battaglia completa con Battle/TurnManager
+
+    Args:
+        party_classes: Classi dei personaggi
+        enemy_type: Tipo di nemico
+        level: Livello del nemico
+        policy: Funzione policy(battle, character)
+        max_rounds: Round oltre i quali la battaglia conta come sconfitta
+        rng: Generatore casuale della battaglia
+        enemy_ai: Chiave di DIFFICULTY_PRESETS o ENEMY_AI_BY_TYPE
+
+    Returns:
+        (vittoria, round, frazione di HP del party rimasta)
+    """
+    party = Party([Character(f"P{i + 1}", cls) for i, cls in enumerate(party_classes)])
+    enemy = Enemy(enemy_type, level)
+    battle = Battle(party, enemy, rng=rng,
+                    enemy_ai=None if enemy_ai == ENEMY_AI_BY_TYPE else enemy_ai)
+    turn_manager = battle.turn_manager
+    battle.is_active = True
+
+    while turn_manager.round_number <= max_rounds:
+        combatant = turn_manager.get_current_combatant()
+        if combatant is None:
+            break
+        if combatant.is_player:
+            action, target = policy(battle, combatant.entity)
+            battle.execute_player_turn(combatant.entity, action, target)
+        else:
+            battle.execute_enemy_turn()
+        if not turn_manager.is_battle_active():
+            break
+        turn_manager.next_turn()
+
+    victory = not enemy.is_alive
+    hp_left = sum(c.hp for c in party.characters) / sum(c.max_hp for c in party.characters)
+    return victory, min(turn_manager.round_number, max_rounds), hp_left
+
+
+def _run_chunk(scenario_args: Tuple, seed: int, battles: int,
+               max_rounds: int) -> SimulationStats:
+    """Task del pool: simula un blocco di battaglie di uno scenario"""
+    party, enemy, level, policy_name, enemy_ai = scenario_args
+    policy = get_policy(policy_name)
+    rng = GameRNG(seed)
+
+    stats = SimulationStats()
+    for _ in range(battles):
+        victory, rounds, hp_left = fight(party, enemy, level, policy, max_rounds, rng, enemy_ai)
+        stats.record(victory, rounds, hp_left)
+        if not victory and rounds >= max_rounds and hp_left > 0:
+            stats.timeouts += 1
+    return stats
+
+
+def chunk_seed(root_seed: int, scenario_index: int, chunk_index: int) -> int:
+    """Seme di un blocco, indipendente dal numero di worker"""
+    return derive_seed(root_seed, scenario_index, chunk_index)
+
+
+def run_farm(scenarios: List[Scenario], battles: int = 1000, workers: Optional[int] = None,
+             seed: int = 0, chunk_size: int = 250, max_rounds: int = 200) -> Dict:
+    """
+    Simula tutti gli scenari in parallelo
+
+    Args:
+        scenarios: Scenari da simulare
+        battles: Battaglie per scenario
+        workers: Processi del pool (None = numero di CPU, 0 = nello stesso processo)
+        seed: Seme radice
+        chunk_size: Battaglie per task del pool
+        max_rounds: Limite di round per battaglia
+
+    Returns:
+        Report con le statistiche per scenario
+    """
+    began = time.perf_counter()
+
+    jobs = []
+    for s_index, scenario in enumerate(scenarios):
+        for c_index, start in enumerate(range(0, battles, chunk_size)):
+            jobs.append((s_index, scenario.to_args(), chunk_seed(seed, s_index, c_index),
+                         min(chunk_size, battles - start)))
+
+    if workers == 0:
+        partials = [_run_chunk(args, chunk, count, max_rounds) for _, args, chunk, count in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_chunk, args, chunk, count, max_rounds)
+                       for _, args, chunk, count in jobs]
+            partials = [f.result() for f in futures]
+
+    # Unione nell'ordine dei job: stesso risultato con qualsiasi numero di worker
+    merged = [SimulationStats() for _ in scenarios]
+    for (s_index, _, _, _), partial in zip(jobs, partials):
+        merged[s_index].merge(partial)
+
+    elapsed = time.perf_counter() - began
+    total = sum(stats.battles for stats in merged)
+    return {
+        "scenarios": {
+            scenario.key: stats.to_dict() for scenario, stats in zip(scenarios, merged)
+        },
+        "total_battles": total,
+        "elapsed_s": elapsed,
+        "battles_per_second": total / elapsed if elapsed else 0.0,
+    }
+
+
+def build_scenarios(parties: List[List[str]], enemies: List[str], levels: List[int],
+                    policies: List[str], enemy_ai: str = DEFAULT_ENEMY_AI) -> List[Scenario]:
+    """Prodotto cartesiano di party, nemici, livelli e policy (con la stessa IA)"""
+    return [
+        Scenario(party, enemy, level, policy, enemy_ai)
+        for party in parties
+        for enemy in enemies
+        for level in levels
+        for policy in policies
+    ]
+
+
+def _parse_levels(text: str) -> List[int]:
+    """Interpreta '1-3' o '1,2,5'"""
+    if "-" in text:
+        low, high = text.split("-", 1)
+        return list(range(int(low), int(high) + 1))
+    return [int(v) for v in text.split(",") if v.strip()]
+
+
+def format_report(report: Dict) -> str:
+    """Formatta il report come tabella testuale"""
+    lines = ["=" * 72, "⚔️  SIM FARM", "=" * 72]
+    for key, stats in report["scenarios"].items():
+        lines.append(f"{key:<52} win {stats['win_rate'] * 100:5.1f}%  "
+                     f"round {stats['mean_rounds']:5.2f}")
+    lines.append("-" * 72)
+    lines.append(f"{report['total_battles']} battaglie in {report['elapsed_s']:.2f}s "
+                 f"({report['battles_per_second']:.0f}/s)")
+    lines.append("=" * 72)
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Entry point da riga di comando"""
+    parser = argparse.ArgumentParser(description="Simulazione di battaglie in parallelo")
+    parser.add_argument("--party", action="append", default=None,
+                        help="Classi del party separate da virgola (ripetibile)")
+    parser.add_argument("--enemies", default="all", help="Nemici separati da virgola o 'all'")
+    parser.add_argument("--levels", default="1", help="Livelli, es. '1-3' o '1,5'")
+    parser.add_argument("--policies", default="balanced", help="Policy separate da virgola")
+    parser.add_argument("--enemy-ai", default=DEFAULT_ENEMY_AI,
+                        choices=list(DIFFICULTY_PRESETS) + [ENEMY_AI_BY_TYPE],
+                        help="IA dei nemici ('type' = quella di ogni tipo, più lenta)")
+    parser.add_argument("--battles", type=int, default=1000, help="Battaglie per scenario")
+    parser.add_argument("--workers", type=int, default=None, help="Processi (0 = nessun pool)")
+    parser.add_argument("--seed", type=int, default=0, help="Seme radice")
+    parser.add_argument("--json", dest="json_path", help="Salva il report in JSON")
+    args = parser.parse_args(argv)
+
+    parties = [[c.strip() for c in p.split(",") if c.strip()]
+               for p in (args.party or ["guerriero,mago"])]
+    for party in parties:
+        for cls in party:
+            if cls not in Character.CLASSES:
+                parser.error(f"Classe non valida: '{cls}'")
+
+    enemies = (Enemy.get_enemy_types() if args.enemies == "all"
+               else [e.strip() for e in args.enemies.split(",") if e.strip()])
+    for enemy in enemies:
+        if enemy not in Enemy.ENEMY_TEMPLATES:
+            parser.error(f"Nemico non valido: '{enemy}'")
+
+    policies = [p.strip() for p in args.policies.split(",") if p.strip()]
+    for policy in policies:
+        if policy not in PARTY_POLICIES:
+            parser.error(f"Policy non valida: '{policy}'")
+
+    scenarios = build_scenarios(parties, enemies, _parse_levels(args.levels), policies,
+                                args.enemy_ai)
+    report = run_farm(scenarios, battles=args.battles, workers=args.workers, seed=args.seed)
+    print(format_report(report))
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,130 @@
+"""
+RNG - Generatori casuali iniettabili per combattimento e simulazioni
+
+Battle, Character, Enemy e gli engine accettano qualsiasi oggetto compatibile
+con random.Random (usano solo random, randint e choice). GameRNG aggiunge i
+tiri a blocchi per i simulatori e la derivazione di flussi indipendenti;
+SplitMixRNG ha uno stato di un solo intero, da usare quando lo stato va
+salvato e ripristinato spesso (Battle.snapshot/restore).
+"""
+
+import os
+import random
+from typing import List
+
+MASK64 = 0xFFFFFFFFFFFFFFFF
+
+
+def derive_seed(root: int, *keys: int) -> int:
+    """
+    Deriva un seme da un seme radice e da una sequenza di indici
+
+    Il risultato dipende solo dagli argomenti (non dallo stato di altri
+    generatori), quindi flussi derivati con chiavi diverse sono riproducibili
+    in qualsiasi ordine e in qualsiasi processo.
+
+    Args:
+        root: Seme radice
+        keys: Indici (es. scenario, blocco, battaglia)
+
+    Returns:
+        Seme a 48 bit
+    """
+    seed = root
+    for key in keys:
+        seed = (seed * 1_000_003 + key) & 0xFFFFFFFFFFFF
+    return seed
+
+
+class GameRNG(random.Random):
+    """random.Random con tiri a blocchi e flussi derivati"""
+
+    def __init__(self, seed=None):
+        """
+        Inizializza il generatore
+
+        Args:
+            seed: Seme (None = casuale)
+        """
+        super().__init__(seed)
+        self.initial_seed = seed
+
+    def roll(self, low: int, high: int) -> int:
+        """Tiro uniforme in [low, high] (più rapido di randint)"""
+        return low + int(self.random() * (high - low + 1))
+
+    def rolls(self, low: int, high: int, count: int) -> List[int]:
+        """
+        Estrae un blocco di tiri uniformi in [low, high]
+
+        Args:
+            low: Valore minimo
+            high: Valore massimo (incluso)
+            count: Numero di tiri
+
+        Returns:
+            Lista di tiri
+        """
+        span = high - low + 1
+        rand = self.random
+        return [low + int(rand() * span) for _ in range(count)]
+
+    def spawn(self, *keys: int) -> 'GameRNG':
+        """
+        Crea un flusso figlio indipendente, derivato dal seme iniziale e dalle chiavi
+
+        Args:
+            keys: Indici del flusso figlio
+
+        Returns:
+            Nuovo GameRNG
+        """
+        if isinstance(self.initial_seed, int):
+            return type(self)(derive_seed(self.initial_seed, *keys))
+        # Senza seme intero il figlio è solo un flusso distinto, non riproducibile
+        return type(self)(self.getrandbits(48))
+
+
+class SplitMixRNG(GameRNG):
+    """
+    GameRNG basato su SplitMix64: getstate/setstate copiano un solo intero
+    (il Mersenne Twister di random.Random ne copia 625), a costo di tiri
+    singoli più lenti perché calcolati in Python.
+    """
+
+    def seed(self, a=None, version=2):
+        """Imposta lo stato (None = casuale dal sistema operativo)"""
+        if a is None:
+            a = int.from_bytes(os.urandom(8), 'little')
+        elif not isinstance(a, int):
+            a = hash(a)
+        self._state = a & MASK64
+        self.gauss_next = None
+
+    def _next64(self) -> int:
+        """Prossimo valore a 64 bit"""
+        self._state = z = (self._state + 0x9E3779B97F4A7C15) & MASK64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+        return z ^ (z >> 31)
+
+    def random(self) -> float:
+        return (self._next64() >> 11) * (1.0 / 9007199254740992.0)
+
+    def getrandbits(self, k: int) -> int:
+        if k <= 64:
+            return self._next64() >> (64 - k)
+        bits = 0
+        for shift in range(0, k, 64):
+            bits |= self._next64() << shift
+        return bits & ((1 << k) - 1)
+
+    def getstate(self):
+        return self._state
+
+    def setstate(self, state):
+        self._state = state
+
+
+# Generatore condiviso usato quando non ne viene iniettato uno
+DEFAULT_RNG = GameRNG()